@@ -15,28 +15,39 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.common.app_schema import AppConfig, AppEnvironment, AppInfo
+from app.auth.password_hasher import PasswordHasher
+from app.common.app_schema import AppArchitecture, AppConfig, AppEnvironment, AppInfo
 from app.common.PropertiesManager import PropertiesManager
+from app.database import database_indexes
 from app.database.DatabaseConnectionManager import DatabaseConnectionManager
 from app.logging.logging_constants import LOGGING_MAIN
 from app.logging.logging_schema import SpotifyElectronLogger
+from app.middleware.CheckJwtAuthMiddleware import CheckJwtAuthMiddleware
 from app.middleware.cors_middleware_config import (
     allow_credentials,
     allowed_headers,
     allowed_methods,
     allowed_origins,
+    exposed_headers,
     max_age,
 )
+from app.middleware.RequestScopeMiddleware import RequestScopeMiddleware
 from app.spotify_electron.genre import genre_controller
 from app.spotify_electron.health import health_controller
 from app.spotify_electron.login import login_controller
+from app.spotify_electron.metrics import metrics_controller
 from app.spotify_electron.playlist import playlist_controller
-from app.spotify_electron.search import search_controller
-from app.spotify_electron.song import song_controller
+from app.spotify_electron.search import search_controller, search_service
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.song import base_song_service, song_controller
+from app.spotify_electron.song.blob.song_data_cache_loader import SongDataCacheLoader
 from app.spotify_electron.song.providers.song_service_provider import SongServiceProvider
+from app.spotify_electron.song.serverless import song_upload_controller
+from app.spotify_electron.song.song_streams_buffer import SongStreamsBuffer
 from app.spotify_electron.stream import stream_controller
 from app.spotify_electron.user import user_controller
-from app.spotify_electron.user.artist import artist_controller
+from app.spotify_electron.user.artist import artist_controller, artist_service
+from app.spotify_electron.utils.audio_management.audio_management_utils import AudioDecoder
 
 main_logger = SpotifyElectronLogger(LOGGING_MAIN).getLogger()
 
@@ -56,10 +67,19 @@ async def lifespan_handler(app: FastAPI) -> AsyncGenerator[None, Any]:
     DatabaseConnectionManager.init_database_connection(
         environment=environment, connection_uri=connection_uri
     )
+    database_indexes.create_indexes()
     SongServiceProvider.init_service()
+    artist_service.init_artists_total_streams()
+    search_service.init_search_engine()
+    SongStreamsBuffer.start(base_song_service.store_songs_streams)
 
     app.include_router(playlist_controller.router)
     app.include_router(song_controller.router)
+    if (
+        getattr(PropertiesManager, AppEnvironment.ARCHITECTURE_ENV_NAME)
+        == AppArchitecture.ARCH_SERVERLESS
+    ):
+        app.include_router(song_upload_controller.router)
     app.include_router(genre_controller.router)
     app.include_router(user_controller.router)
     app.include_router(artist_controller.router)
@@ -67,7 +87,13 @@ async def lifespan_handler(app: FastAPI) -> AsyncGenerator[None, Any]:
     app.include_router(search_controller.router)
     app.include_router(stream_controller.router)
     app.include_router(health_controller.router)
+    app.include_router(metrics_controller.router)
     yield
+    SongStreamsBuffer.stop()
+    SearchEngine.stop()
+    PasswordHasher.shutdown()
+    AudioDecoder.shutdown()
+    SongDataCacheLoader.shutdown()
     main_logger.info("Spotify Electron Backend Stopped")
 
 
@@ -87,6 +113,8 @@ app = FastAPI(
     lifespan=lifespan_handler,
 )
 
+if int(getattr(PropertiesManager, AppConfig.GLOBAL_AUTH_ENABLED, 0) or 0):
+    app.add_middleware(CheckJwtAuthMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -94,7 +122,9 @@ app.add_middleware(
     allow_methods=allowed_methods,
     max_age=max_age,
     allow_headers=allowed_headers,
+    expose_headers=exposed_headers,
 )
+app.add_middleware(RequestScopeMiddleware)
 
 if __name__ == "__main__":
     uvicorn.run(
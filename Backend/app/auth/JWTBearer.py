@@ -14,7 +14,6 @@ from app.auth.auth_schema import (
     JWTValidationException,
     TokenData,
 )
-from app.auth.auth_service import get_jwt_token_data
 from app.logging.logging_constants import LOGGING_JWT_BEARER_AUTH
 from app.logging.logging_schema import SpotifyElectronLogger
 
@@ -43,8 +42,8 @@ class JWTBearer(HTTPBearer):
         # instead of b'bearer eyJhbGciOiJIUzI'
         # replacing " with white space for all headers can be deleted if it's solved
         if len(request.cookies) == 0 or not request.cookies.get(JWT_COOKIE_HEADER_FIELD_NAME):
-            jwt_bearer_logger.warning(
-                f"Request with no cookies {request}, getting JWT from Authentication Header"
+            jwt_bearer_logger.debug(
+                "Request with no cookies, getting JWT from Authentication Header"
             )
             jwt_raw = self._get_authorization_bearer_from_headers(request.headers.raw)
         else:
@@ -57,11 +56,11 @@ class JWTBearer(HTTPBearer):
         if not credentials or credentials.scheme != BEARER_SCHEME_NAME:
             raise BadJWTTokenProvidedException
         try:
-            jwt_raw = credentials.credentials
-            auth_service.validate_jwt(jwt_raw)
-            jwt_token_data = get_jwt_token_data(credentials.credentials)
+            jwt_token_data = auth_service.get_verified_jwt_token_data(credentials.credentials)
         except (JWTValidationException, Exception):
-            jwt_bearer_logger.exception(f"Request with invalid JWT {jwt_raw} {request}")
+            jwt_bearer_logger.exception(
+                f"Request with invalid JWT {request.method} {request.url.path}"
+            )
             raise BadJWTTokenProvidedException
         else:
             return jwt_token_data
@@ -21,6 +21,55 @@ class TokenData:
     token_type: str
 
 
+@dataclass
+class VerifiedToken:
+    """Class that contains the data of a JWT Token with a verified signature"""
+
+    token_data: TokenData
+    expiration_time: float
+    """Token expiration as a POSIX timestamp"""
+
+
+@dataclass
+class VerifiedTokenCacheStats:
+    """Usage stats of the verified token cache"""
+
+    hits: int
+    """Tokens served without verifying their signature"""
+    misses: int
+    """Tokens whose signature was verified"""
+    hit_rate: float
+    """Share of token lookups served from the cache"""
+    entries: int
+    """Tokens currently cached"""
+    max_entries: int
+    """Max tokens cached"""
+    verifications: int
+    """Token signature verifications"""
+    verify_time_ms: float
+    """Total milliseconds spent verifying token signatures"""
+
+
+@dataclass
+class PasswordHasherStats:
+    """Usage stats of the password hasher"""
+
+    executor: str
+    """Kind of executor running the hashing jobs"""
+    workers: int
+    """Workers of the executor"""
+    pending: int
+    """Hashing jobs queued or running"""
+    max_queue_depth: int
+    """Max hashing jobs queued or running"""
+    completed: int
+    """Hashing jobs finished"""
+    rejected: int
+    """Hashing jobs rejected because the queue was full"""
+    rehashed: int
+    """Stored passwords upgraded to the configured hash cost"""
+
+
 class FakeRequest:
     """Fake Request Object for bypassing authentication token HTTP incoming format"""
 
@@ -111,6 +160,15 @@ class VerifyPasswordException(SpotifyElectronException):
         super().__init__(self.ERROR)
 
 
+class PasswordHasherBusyException(SpotifyElectronException):
+    """Password hasher queue is full"""
+
+    ERROR = "Too many passwords waiting to be hashed"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
+
+
 class UnexpectedGetJWTTokenException(SpotifyElectronException):
     """Unexpected error getting JWT token data"""
 
@@ -2,10 +2,11 @@
 Authentication service for handling business logic
 """
 
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 
-import bcrypt
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
@@ -19,11 +20,15 @@ from app.auth.auth_schema import (
     JWTMissingCredentialsException,
     JWTNotProvidedException,
     JWTValidationException,
+    PasswordHasherBusyException,
     TokenData,
     UnexpectedLoginUserException,
     UserUnauthorizedException,
+    VerifiedToken,
     VerifyPasswordException,
 )
+from app.auth.password_hasher import PasswordHasher
+from app.auth.verified_token_cache import VerifiedTokenCache
 from app.common.app_schema import AppEnvironment
 from app.common.PropertiesManager import PropertiesManager
 from app.exceptions.base_exceptions_schema import BadParameterException
@@ -101,13 +106,69 @@ def get_jwt_token_data(
         TokenData: the data provided by the JWT Token
 
     """
-    validate_token_exists(token_raw_data)
     try:
+        verified_token = verify_jwt(token_raw_data)
+    except JWTValidationException as exception:
+        raise BadJWTTokenProvidedException from exception
+    else:
+        return verified_token.token_data
+
+
+def get_verified_jwt_token_data(token: str) -> TokenData:
+    """Get the data of a JWT Token, verifying its signature only if the token\
+        is not cached as verified yet
+
+    Args:
+    ----
+        token (str): the raw JWT Token
+
+    Raises:
+    ------
+        JWTValidationException: if the token is not valid or has expired
+
+    Returns:
+    -------
+        TokenData: the data provided by the JWT Token
+
+    """
+    cached_token_data = VerifiedTokenCache.get(token) if token else None
+    if cached_token_data is not None:
+        return cached_token_data
+
+    start = time.perf_counter()
+    try:
+        verified_token = verify_jwt(token)
+    finally:
+        VerifiedTokenCache.record_verification(time.perf_counter() - start)
+    VerifiedTokenCache.set(token, verified_token)
+    return verified_token.token_data
+
+
+def verify_jwt(token: str) -> VerifiedToken:
+    """Decode a JWT Token once, verifying its signature, expiration and credentials
+
+    Args:
+    ----
+        token (str): the raw JWT Token
+
+    Raises:
+    ------
+        JWTValidationException: if the token is not valid or has expired
+
+    Returns:
+    -------
+        VerifiedToken: the token data and expiration
+
+    """
+    try:
+        validate_token_exists(token)
         payload = jwt.decode(
-            token_raw_data,  # type: ignore
+            token,
             getattr(PropertiesManager, AppEnvironment.SECRET_KEY_SIGN_ENV_NAME),
             algorithms=[ALGORITHM],
         )
+        validate_token_is_expired(payload)
+
         username = payload.get("access_token")
         role = payload.get("role")
         token_type = payload.get("token_type")
@@ -118,21 +179,23 @@ def get_jwt_token_data(
 
     except JWTNotProvidedException as exception:
         auth_service_logger.exception("No JWT Token was provided")
-        raise BadJWTTokenProvidedException from exception
+        raise JWTValidationException from exception
+    except JWTError as exception:
+        auth_service_logger.exception("Error decoding JWT Token")
+        raise JWTValidationException from exception
+    except JWTExpiredException as exception:
+        auth_service_logger.exception("JWT Token is expired")
+        raise JWTValidationException from exception
     except JWTMissingCredentialsException as exception:
         auth_service_logger.exception(
             f"One or more credentials obtained from JWT are missing: {credentials}"
         )
-        raise BadJWTTokenProvidedException from exception
-    except JWTError as exception:
-        auth_service_logger.exception("Error decoding JWT Token")
-        raise BadJWTTokenProvidedException from exception
+        raise JWTValidationException from exception
     except Exception as exception:
-        auth_service_logger.exception("Unexpected error getting data from JWT Token")
-        raise BadJWTTokenProvidedException from exception
+        auth_service_logger.exception("Unexpected error validating JWT Token")
+        raise JWTValidationException from exception
     else:
-        auth_service_logger.info(f"Token data: {token_data}")
-        return token_data
+        return VerifiedToken(token_data=token_data, expiration_time=float(payload["exp"]))
 
 
 def get_current_user(
@@ -168,18 +231,22 @@ def get_current_user(
 
 
 def hash_password(plain_password: str) -> bytes:
-    """Hash a password with a randomly-generated salt
+    """Hash a password with a randomly-generated salt in the password hasher executor
 
     Args:
     ----
         plain_password (str): plain text password
 
+    Raises:
+    ------
+        PasswordHasherBusyException: if too many passwords are waiting to be hashed
+
     Returns:
     -------
         bytes: the hashed password
 
     """
-    return bcrypt.hashpw(plain_password.encode(), bcrypt.gensalt())
+    return PasswordHasher.hash_password(plain_password)
 
 
 def verify_password(plain_password: str, hashed_password: bytes) -> None:
@@ -193,12 +260,55 @@ def verify_password(plain_password: str, hashed_password: bytes) -> None:
     Raises:
     ------
         VerifyPasswordException: if passwords don't match
+        PasswordHasherBusyException: if too many passwords are waiting to be hashed
+
+    """
+    if not PasswordHasher.verify_password(plain_password, hashed_password):
+        raise VerifyPasswordException
+
+
+async def verify_password_async(plain_password: str, hashed_password: bytes) -> None:
+    """Verifies if plan text password is the same as a hashed password without\
+        blocking the event loop
+
+    Args:
+    ----
+        plain_password (str): plain text password
+        hashed_password (bytes): hashed password
+
+    Raises:
+    ------
+        VerifyPasswordException: if passwords don't match
+        PasswordHasherBusyException: if too many passwords are waiting to be hashed
 
     """
-    if not bcrypt.checkpw(plain_password.encode(), hashed_password):
+    if not await PasswordHasher.verify_password_async(plain_password, hashed_password):
         raise VerifyPasswordException
 
 
+async def rehash_password(user_name: str, plain_password: str, hashed_password: bytes) -> None:
+    """Upgrade a stored password hash if it was created with another cost than\
+        the configured one. Failures are logged and don't affect the login
+
+    Args:
+    ----
+        user_name (str): user name
+        plain_password (str): the verified plain text password
+        hashed_password (bytes): the stored hashed password
+
+    """
+    if not PasswordHasher.needs_rehash(hashed_password):
+        return
+    try:
+        new_hashed_password = await PasswordHasher.hash_password_async(plain_password)
+        await asyncio.to_thread(
+            base_user_service.update_user_password, user_name, new_hashed_password
+        )
+        PasswordHasher.record_rehash()
+    except Exception:
+        auth_service_logger.exception(f"Error upgrading password hash of user {user_name}")
+
+
 def get_token_expire_date() -> datetime:
     """Returns expire date for new token
 
@@ -211,7 +321,7 @@ def get_token_expire_date() -> datetime:
     return current_utc_datetime + timedelta(days=DAYS_TO_EXPIRE_COOKIE)
 
 
-def login_user(name: str, password: str) -> str:
+async def login_user(name: str, password: str) -> str:
     """Checks user credentials and return a jwt token
 
     Args:
@@ -223,6 +333,7 @@ def login_user(name: str, password: str) -> str:
     ------
         InvalidCredentialsLoginException: bad user credentials
         VerifyPasswordException: failing authenticating user and password
+        PasswordHasherBusyException: too many passwords are waiting to be hashed
         UserNotFoundException: user doesn't exists
         UnexpectedLoginUserException: unexpected error during user login
 
@@ -234,16 +345,15 @@ def login_user(name: str, password: str) -> str:
     try:
         validate_parameter(name)
         validate_parameter(password)
-        base_user_service_validations.validate_user_should_exists(name)
 
-        user_type = base_user_service.get_user_type(user_name=name)
-        user_password = base_user_service.get_user_password(user_name=name)
+        credentials = await asyncio.to_thread(base_user_service.get_user_credentials, name)
 
-        verify_password(password, user_password)
+        await verify_password_async(password, credentials.password)
+        await rehash_password(name, password, credentials.password)
 
         jwt_data = {
             "access_token": name,
-            "role": user_type.value,
+            "role": credentials.user_type.value,
             "token_type": "bearer",
         }
         access_token_data = create_access_token(jwt_data)
@@ -254,6 +364,9 @@ def login_user(name: str, password: str) -> str:
     except VerifyPasswordException as exception:
         auth_service_logger.exception("Passwords Validation failed: passwords don't match")
         raise VerifyPasswordException from exception
+    except PasswordHasherBusyException as exception:
+        auth_service_logger.exception(f"Password hasher busy while login user: {name}")
+        raise PasswordHasherBusyException from exception
     except CreateJWTException as exception:
         auth_service_logger.exception(f"Error creating JWT Token from data: {jwt_data}")
         raise VerifyPasswordException from exception
@@ -285,13 +398,11 @@ def login_user_with_token(raw_token: str) -> None:
         UnexpectedLoginUserException: unexpected error during user login
     """
     try:
-        validate_jwt(raw_token)
-
-        token_data = get_jwt_token_data(raw_token)
+        token_data = get_verified_jwt_token_data(raw_token)
         base_user_service_validations.validate_user_should_exists(token_data.username)
 
-    except (JWTValidationException, BadJWTTokenProvidedException) as exception:
-        auth_service_logger.exception(f"Error validating jwt token data: {raw_token}")
+    except JWTValidationException as exception:
+        auth_service_logger.exception("Error validating jwt token data")
         raise JWTValidationException from exception
     except UserNotFoundException as exception:
         auth_service_logger.exception(f"User {token_data.username} not found")
@@ -320,25 +431,7 @@ def validate_jwt(token: str) -> None:
         JWTValidationException: if the validation was not succesfull
 
     """
-    try:
-        decoded_token = jwt.decode(
-            token,
-            getattr(PropertiesManager, AppEnvironment.SECRET_KEY_SIGN_ENV_NAME),
-            ALGORITHM,
-        )
-        validate_token_is_expired(decoded_token)
-
-    except JWTError as exception:
-        auth_service_logger.exception(f"Error decoding token: {token}")
-        raise JWTValidationException from exception
-
-    except JWTExpiredException as exception:
-        auth_service_logger.exception(f"Token is expired: {token}")
-        raise JWTValidationException from exception
-
-    except Exception as exception:
-        auth_service_logger.exception(f"Unexpected error validating token: {token}")
-        raise JWTValidationException from exception
+    verify_jwt(token)
 
 
 def validate_jwt_user_matches_user(token: TokenData, user_name: str) -> None:
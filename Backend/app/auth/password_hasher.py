@@ -0,0 +1,250 @@
+"""
+Password hashing off the request threads
+
+bcrypt hashes are CPU bound and take tens of milliseconds. They run in a dedicated\
+    thread or process pool so they don't hold the event loop or the threads serving\
+    other requests. The number of queued hashing jobs is bounded, jobs beyond it are\
+    rejected instead of piling up behind a login spike
+
+Declares PasswordHasher global object to be accessed from across the app
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Any
+
+import bcrypt
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.auth.auth_schema import PasswordHasherBusyException, PasswordHasherStats
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_PASSWORD_HASHER
+from app.logging.logging_schema import SpotifyElectronLogger
+
+password_hasher_logger = SpotifyElectronLogger(LOGGING_PASSWORD_HASHER).getLogger()
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
+DEFAULT_HASH_ROUNDS = 12
+
+
+class _PasswordHasher:
+    """Hashes and verifies passwords in a bounded executor"""
+
+    def __init__(self, rounds: int, executor: str, workers: int, max_queue_depth: int) -> None:
+        self.rounds = rounds
+        """bcrypt cost of new password hashes"""
+        if executor not in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+            password_hasher_logger.warning(
+                f"Unknown password hasher executor {executor}, using {THREAD_EXECUTOR}"
+            )
+            executor = THREAD_EXECUTOR
+        self.executor = executor
+        """Kind of executor running the hashing jobs"""
+        self.workers = workers if workers > 0 else os.cpu_count() or 1
+        """Workers of the executor"""
+        self.max_queue_depth = max_queue_depth
+        """Max hashing jobs queued or running, 0 disables the limit"""
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._rehashed = 0
+        self._lock = threading.Lock()
+
+    def hash_password(self, plain_password: str) -> bytes:
+        """Hash a password with a randomly-generated salt, waiting for the executor
+
+        Args:
+            plain_password (str): plain text password
+
+        Raises:
+            PasswordHasherBusyException: if the hashing queue is full
+
+        Returns:
+            bytes: the hashed password
+        """
+        return self._submit_hash(plain_password).result()
+
+    async def hash_password_async(self, plain_password: str) -> bytes:
+        """Hash a password with a randomly-generated salt without blocking the event loop
+
+        Args:
+            plain_password (str): plain text password
+
+        Raises:
+            PasswordHasherBusyException: if the hashing queue is full
+
+        Returns:
+            bytes: the hashed password
+        """
+        return await asyncio.wrap_future(self._submit_hash(plain_password))
+
+    def verify_password(self, plain_password: str, hashed_password: bytes) -> bool:
+        """Check a password against a hash, waiting for the executor
+
+        Args:
+            plain_password (str): plain text password
+            hashed_password (bytes): hashed password
+
+        Raises:
+            PasswordHasherBusyException: if the hashing queue is full
+
+        Returns:
+            bool: if the password matches the hash
+        """
+        return self._submit_verify(plain_password, hashed_password).result()
+
+    async def verify_password_async(self, plain_password: str, hashed_password: bytes) -> bool:
+        """Check a password against a hash without blocking the event loop
+
+        Args:
+            plain_password (str): plain text password
+            hashed_password (bytes): hashed password
+
+        Raises:
+            PasswordHasherBusyException: if the hashing queue is full
+
+        Returns:
+            bool: if the password matches the hash
+        """
+        return await asyncio.wrap_future(self._submit_verify(plain_password, hashed_password))
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """Get if a hash was created with a cost other than the configured one
+
+        Args:
+            hashed_password (bytes): hashed password
+
+        Returns:
+            bool: if the hash has to be upgraded
+        """
+        try:
+            hash_rounds = int(hashed_password.split(b"$")[2])
+        except (IndexError, ValueError):
+            return True
+        return hash_rounds != self.rounds
+
+    def record_rehash(self) -> None:
+        """Record a stored password upgraded to the configured cost"""
+        with self._lock:
+            self._rehashed += 1
+
+    def shutdown(self) -> None:
+        """Stop the executor, waiting for the running hashing jobs"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_stats(self) -> PasswordHasherStats:
+        """Get password hasher usage stats
+
+        Returns:
+            PasswordHasherStats: the password hasher stats
+        """
+        with self._lock:
+            return PasswordHasherStats(
+                executor=self.executor,
+                workers=self.workers,
+                pending=self._pending,
+                max_queue_depth=self.max_queue_depth,
+                completed=self._completed,
+                rejected=self._rejected,
+                rehashed=self._rehashed,
+            )
+
+    def _submit_hash(self, plain_password: str) -> Future[bytes]:
+        """Submit the hashing of a password
+
+        Args:
+            plain_password (str): plain text password
+
+        Returns:
+            Future[bytes]: the hashed password
+        """
+        return self._submit(
+            bcrypt.hashpw, plain_password.encode(), bcrypt.gensalt(self.rounds)
+        )
+
+    def _submit_verify(self, plain_password: str, hashed_password: bytes) -> Future[bool]:
+        """Submit the check of a password against a hash
+
+        Args:
+            plain_password (str): plain text password
+            hashed_password (bytes): hashed password
+
+        Returns:
+            Future[bool]: if the password matches the hash
+        """
+        return self._submit(bcrypt.checkpw, plain_password.encode(), hashed_password)
+
+    def _submit(self, function: Any, *args: Any) -> Future[Any]:
+        """Submit a hashing job to the executor if the queue is not full
+
+        Args:
+            function (Any): the hashing function, must be picklable for process executors
+            args (Any): the function arguments
+
+        Raises:
+            PasswordHasherBusyException: if the hashing queue is full
+
+        Returns:
+            Future[Any]: the job result
+        """
+        with self._lock:
+            if 0 < self.max_queue_depth <= self._pending:
+                self._rejected += 1
+                raise PasswordHasherBusyException
+            if self._executor is None:
+                self._executor = self._create_executor()
+            future = self._executor.submit(function, *args)
+            self._pending += 1
+        future.add_done_callback(self._on_job_done)
+        return future
+
+    def _on_job_done(self, _: Future[Any]) -> None:
+        """Release the queue slot of a finished hashing job"""
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    def _create_executor(self) -> Executor:
+        """Create the configured executor
+
+        Returns:
+            Executor: the executor
+        """
+        password_hasher_logger.info(
+            f"Starting password hasher {self.executor} executor with {self.workers} workers"
+        )
+        if self.executor == PROCESS_EXECUTOR:
+            return ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hasher"
+        )
+
+
+PasswordHasher = _PasswordHasher(
+    rounds=int(
+        getattr(PropertiesManager, AppConfig.PASSWORD_HASH_ROUNDS, 0) or DEFAULT_HASH_ROUNDS
+    ),
+    executor=getattr(PropertiesManager, AppConfig.PASSWORD_HASHER_EXECUTOR, None)
+    or THREAD_EXECUTOR,
+    workers=int(getattr(PropertiesManager, AppConfig.PASSWORD_HASHER_WORKERS, 0) or 0),
+    max_queue_depth=int(
+        getattr(PropertiesManager, AppConfig.PASSWORD_HASHER_MAX_QUEUE_DEPTH, 0) or 0
+    ),
+)
+
+metrics_service.register_metrics_provider(
+    "password_hasher", lambda: asdict(PasswordHasher.get_stats())
+)
@@ -0,0 +1,133 @@
+"""
+Cache of verified JWT Tokens
+
+Verifying the signature of a JWT Token costs an HMAC computation on every authenticated\
+    request. Tokens whose signature was already verified are cached by their digest with\
+    their data until they expire, so the raw token is never stored
+
+Declares VerifiedTokenCache global object to be accessed from across the app
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.auth.auth_schema import TokenData, VerifiedToken, VerifiedTokenCacheStats
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_VERIFIED_TOKEN_CACHE
+from app.logging.logging_schema import SpotifyElectronLogger
+
+verified_token_cache_logger = SpotifyElectronLogger(LOGGING_VERIFIED_TOKEN_CACHE).getLogger()
+
+
+class _VerifiedTokenCache:
+    """Bounded LRU cache of verified token data by token digest"""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        """Max tokens cached, 0 disables the cache"""
+        self._entries: OrderedDict[bytes, VerifiedToken] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._verifications = 0
+        self._verify_time_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> TokenData | None:
+        """Get the data of a verified token
+
+        Args:
+            token (str): the raw token
+
+        Returns:
+            TokenData | None: the token data or None if it's not cached or has expired
+        """
+        digest = self._get_digest(token)
+        with self._lock:
+            verified_token = self._entries.get(digest)
+            if verified_token is None:
+                self._misses += 1
+                return None
+            if verified_token.expiration_time < time.time():
+                del self._entries[digest]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return verified_token.token_data
+
+    def set(self, token: str, verified_token: VerifiedToken) -> None:
+        """Cache a verified token
+
+        Args:
+            token (str): the raw token
+            verified_token (VerifiedToken): the verified token data and expiration
+        """
+        if self.max_entries <= 0:
+            return
+        digest = self._get_digest(token)
+        with self._lock:
+            self._entries[digest] = verified_token
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_verification(self, elapsed_seconds: float) -> None:
+        """Record the time spent verifying a token signature
+
+        Args:
+            elapsed_seconds (float): seconds spent verifying the token
+        """
+        with self._lock:
+            self._verifications += 1
+            self._verify_time_seconds += elapsed_seconds
+
+    def clear(self) -> None:
+        """Remove all cached tokens"""
+        with self._lock:
+            self._entries.clear()
+        verified_token_cache_logger.debug("Verified tokens cleared")
+
+    def get_stats(self) -> VerifiedTokenCacheStats:
+        """Get cache usage stats
+
+        Returns:
+            VerifiedTokenCacheStats: the cache stats
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return VerifiedTokenCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                hit_rate=self._hits / lookups if lookups else 0.0,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                verifications=self._verifications,
+                verify_time_ms=self._verify_time_seconds * 1000,
+            )
+
+    def _get_digest(self, token: str) -> bytes:
+        """Get the cache key of a token
+
+        Args:
+            token (str): the raw token
+
+        Returns:
+            bytes: the token digest
+        """
+        return hashlib.sha256(token.encode()).digest()
+
+
+VerifiedTokenCache = _VerifiedTokenCache(
+    max_entries=int(
+        getattr(PropertiesManager, AppConfig.VERIFIED_TOKEN_CACHE_MAX_ENTRIES, 0) or 0
+    ),
+)
+
+metrics_service.register_metrics_provider(
+    "verified_token_cache", lambda: asdict(VerifiedTokenCache.get_stats())
+)
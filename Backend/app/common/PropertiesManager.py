@@ -28,7 +28,15 @@ class _PropertiesManager:
         properties_manager_logger.info("Initializing PropertiesManager")
         load_dotenv()
         self.current_directory = os.getcwd()
-        self.config_sections = [AppConfig.APP_INI_SECTION]
+        self.config_sections = [
+            AppConfig.APP_INI_SECTION,
+            AppConfig.STREAM_INI_SECTION,
+            AppConfig.SONG_INI_SECTION,
+            AppConfig.USER_INI_SECTION,
+            AppConfig.SEARCH_INI_SECTION,
+            AppConfig.DATABASE_INI_SECTION,
+            AppConfig.AUTH_INI_SECTION,
+        ]
         self.env_variables = [
             AppEnvironment.MONGO_URI_ENV_NAME,
             AppEnvironment.SECRET_KEY_SIGN_ENV_NAME,
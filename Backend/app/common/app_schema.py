@@ -39,6 +39,42 @@ class AppConfig:
     HOST_INI_KEY = "host"
     PORT_INI_KEY = "port"
     WORKERS = "workers"
+    # stream
+    STREAM_INI_SECTION = "stream"
+    SONG_DATA_CACHE_MAX_BYTES = "song_data_cache_max_bytes"
+    SONG_DATA_CACHE_MAX_ENTRY_BYTES = "song_data_cache_max_entry_bytes"
+    SONG_DATA_DISK_CACHE_MAX_BYTES = "song_data_disk_cache_max_bytes"
+    SONG_DATA_DISK_CACHE_DIRECTORY = "song_data_disk_cache_dir"
+    # song
+    SONG_INI_SECTION = "song"
+    SONG_STREAMS_FLUSH_INTERVAL_MS = "song_streams_flush_interval_ms"
+    SONG_STREAMS_FLUSH_MAX_EVENTS = "song_streams_flush_max_events"
+    SONG_DURATION_DECODER_WORKERS = "song_duration_decoder_workers"
+    SONG_UPLOAD_MAX_BYTES = "song_upload_max_bytes"
+    SONG_UPLOAD_CHUNK_BYTES = "song_upload_chunk_bytes"
+    SONG_UPLOAD_PART_BYTES = "song_upload_part_bytes"
+    SONG_UPLOAD_EXPIRATION_SECONDS = "song_upload_expiration_seconds"
+    # user
+    USER_INI_SECTION = "user"
+    USER_TYPE_CACHE_TTL_SECONDS = "user_type_cache_ttl_seconds"
+    USER_TYPE_CACHE_MAX_ENTRIES = "user_type_cache_max_entries"
+    # search
+    SEARCH_INI_SECTION = "search"
+    SEARCH_ENGINE_ENABLED = "search_engine_enabled"
+    SEARCH_ENGINE_MIN_SIMILARITY = "search_engine_min_similarity"
+    SEARCH_ENGINE_STREAMS_WEIGHT = "search_engine_streams_weight"
+    SEARCH_ENGINE_REFRESH_INTERVAL_SECONDS = "search_engine_refresh_interval_seconds"
+
+    DATABASE_INI_SECTION = "database"
+    DATABASE_ASYNC_WORKERS = "database_async_workers"
+
+    AUTH_INI_SECTION = "auth"
+    GLOBAL_AUTH_ENABLED = "global_auth_enabled"
+    VERIFIED_TOKEN_CACHE_MAX_ENTRIES = "verified_token_cache_max_entries"
+    PASSWORD_HASH_ROUNDS = "password_hash_rounds"
+    PASSWORD_HASHER_EXECUTOR = "password_hasher_executor"
+    PASSWORD_HASHER_WORKERS = "password_hasher_workers"
+    PASSWORD_HASHER_MAX_QUEUE_DEPTH = "password_hasher_max_queue_depth"
 
 
 class AppEnvironmentMode(StrEnum):
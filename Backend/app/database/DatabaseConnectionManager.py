@@ -1,14 +1,20 @@
 """Database connection provider"""
 
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 from pymongo.collection import Collection
 
 from app.common.app_schema import AppEnvironmentMode
+from app.database.async_database_schema import AsyncCollection, run_in_executor
 from app.database.database_schema import BaseDatabaseConnection, DatabaseCollection
 from app.database.DatabaseProductionConnection import DatabaseProductionConnection
 from app.database.DatabaseTestingConnection import DatabaseTestingConnection
 from app.logging.logging_constants import LOGGING_DATABASE_MANAGER
 from app.logging.logging_schema import SpotifyElectronLogger
 
+ResultT = TypeVar("ResultT")
+
 
 class DatabaseConnectionManager:
     """Manages the unique database connection and exposes it to the app"""
@@ -37,6 +43,42 @@ class DatabaseConnectionManager:
 
         return cls.connection.get_collection_connection(collection_name)
 
+    @classmethod
+    def get_async_collection_connection(
+        cls, collection_name: DatabaseCollection
+    ) -> AsyncCollection:
+        """Get a connection to a collection for async code
+
+        Args:
+            collection_name (DatabaseCollection): collection name
+
+        Returns:
+            AsyncCollection: the async connection to the selected collection
+        """
+        assert cls.connection is not None, "DatabaseConnectionManager connection is not init"
+
+        return cls.connection.get_async_collection_connection(collection_name)
+
+    @classmethod
+    async def run_async(
+        cls, function: Callable[..., ResultT], *args: Any, **kwargs: Any
+    ) -> ResultT:
+        """Run blocking database code from async code in the database executor, so\
+            async endpoints reuse the sync services without blocking the event loop
+
+        Args:
+            function (Callable[..., ResultT]): the blocking function
+            args (Any): the function arguments
+            kwargs (Any): the function keyword arguments
+
+        Returns:
+            ResultT: the function result
+        """
+        assert cls.connection is not None, "DatabaseConnectionManager connection is not init"
+        assert cls.connection.async_executor is not None, "Database connection is not init"
+
+        return await run_in_executor(cls.connection.async_executor, function, *args, **kwargs)
+
     @classmethod
     def init_database_connection(
         cls, environment: AppEnvironmentMode, connection_uri: str
@@ -7,6 +7,7 @@ class DatabaseTestingConnection(BaseDatabaseConnection):
     """Database connection for testing. Uses an in-memory database"""
 
     TESTING_COLLECTION_NAME_PREFIX = "test."
+    supports_union_with = False
 
     @classmethod
     def _get_mongo_client(cls):  # noqa: ANN202
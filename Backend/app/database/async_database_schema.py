@@ -0,0 +1,282 @@
+"""
+Async database access for the event loop
+
+Collections and GridFS buckets are wrapped so every blocking driver call runs in the\
+    database executor, a thread pool dedicated to database I/O, the same way Motor wraps\
+    PyMongo. Async endpoints await the results instead of blocking the event loop or\
+    holding a thread of the Starlette thread pool while waiting for the database.\
+    The wrappers only depend on the PyMongo API, so they work with PyMongo and mongomock
+"""
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any, TypeVar
+
+from gridfs import GridFS, GridIn
+from pymongo.collection import Collection
+from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
+
+ResultT = TypeVar("ResultT")
+
+DEFAULT_CURSOR_BATCH_SIZE = 100
+"""Documents fetched from a cursor on every executor call"""
+
+
+async def run_in_executor(
+    executor: Executor, function: Callable[..., ResultT], *args: Any, **kwargs: Any
+) -> ResultT:
+    """Run a blocking function in an executor and wait for it without blocking the event\
+        loop. The function sees the context variables of the caller, like request scopes
+
+    Args:
+        executor (Executor): the executor
+        function (Callable[..., ResultT]): the blocking function
+        args (Any): the function arguments
+        kwargs (Any): the function keyword arguments
+
+    Returns:
+        ResultT: the function result
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor, functools.partial(context.run, function, *args, **kwargs)
+    )
+
+
+class AsyncCursor:
+    """Async iterator over the documents of a query, fetched in batches"""
+
+    def __init__(
+        self,
+        create_cursor: Callable[[], Iterator[dict[str, Any]]],
+        executor: Executor,
+        batch_size: int = DEFAULT_CURSOR_BATCH_SIZE,
+    ) -> None:
+        self._create_cursor = create_cursor
+        self._executor = executor
+        self._batch_size = batch_size
+        self._cursor: Iterator[dict[str, Any]] | None = None
+        self._batch: list[dict[str, Any]] = []
+        self._is_exhausted = False
+
+    def __aiter__(self) -> "AsyncCursor":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        if not self._batch:
+            if self._is_exhausted:
+                raise StopAsyncIteration
+            self._batch = await run_in_executor(self._executor, self._fetch_batch)
+            self._batch.reverse()
+            if not self._batch:
+                raise StopAsyncIteration
+        return self._batch.pop()
+
+    async def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        """Get the remaining documents of the query
+
+        Args:
+            length (int | None, optional): max documents returned, None returns all of them
+
+        Returns:
+            list[dict[str, Any]]: the documents
+        """
+        documents: list[dict[str, Any]] = []
+        async for document in self:
+            documents.append(document)
+            if length is not None and len(documents) >= length:
+                break
+        return documents
+
+    def _fetch_batch(self) -> list[dict[str, Any]]:
+        """Get the next batch of documents, runs in the executor
+
+        Returns:
+            list[dict[str, Any]]: the documents, empty when the query is exhausted
+        """
+        if self._cursor is None:
+            self._cursor = iter(self._create_cursor())
+        batch = list(islice(self._cursor, self._batch_size))
+        self._is_exhausted = len(batch) < self._batch_size
+        return batch
+
+
+class AsyncCollection:
+    """Collection whose operations run in the database executor"""
+
+    def __init__(self, collection: Collection, executor: Executor) -> None:
+        self.collection = collection
+        """The wrapped collection"""
+        self._executor = executor
+
+    @property
+    def name(self) -> str:
+        """The collection name"""
+        return self.collection.name
+
+    async def find_one(self, *args: Any, **kwargs: Any) -> dict[str, Any] | None:
+        """Get a single document
+
+        Returns:
+            dict[str, Any] | None: the document or None if no document matched
+        """
+        return await run_in_executor(self._executor, self.collection.find_one, *args, **kwargs)
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncCursor:
+        """Query the collection, the query is sent when the cursor is iterated
+
+        Returns:
+            AsyncCursor: the query documents
+        """
+        return AsyncCursor(
+            functools.partial(self.collection.find, *args, **kwargs), self._executor
+        )
+
+    def aggregate(self, pipeline: list[dict[str, Any]], **kwargs: Any) -> AsyncCursor:
+        """Run an aggregation, the aggregation is sent when the cursor is iterated
+
+        Args:
+            pipeline (list[dict[str, Any]]): the aggregation pipeline
+
+        Returns:
+            AsyncCursor: the aggregation documents
+        """
+        return AsyncCursor(
+            functools.partial(self.collection.aggregate, pipeline, **kwargs), self._executor
+        )
+
+    async def count_documents(self, *args: Any, **kwargs: Any) -> int:
+        """Count the documents matching a filter
+
+        Returns:
+            int: the number of documents
+        """
+        return await run_in_executor(
+            self._executor, self.collection.count_documents, *args, **kwargs
+        )
+
+    async def insert_one(self, *args: Any, **kwargs: Any) -> InsertOneResult:
+        """Insert a document
+
+        Returns:
+            InsertOneResult: the insertion result
+        """
+        return await run_in_executor(
+            self._executor, self.collection.insert_one, *args, **kwargs
+        )
+
+    async def update_one(self, *args: Any, **kwargs: Any) -> UpdateResult:
+        """Update a single document
+
+        Returns:
+            UpdateResult: the update result
+        """
+        return await run_in_executor(
+            self._executor, self.collection.update_one, *args, **kwargs
+        )
+
+    async def update_many(self, *args: Any, **kwargs: Any) -> UpdateResult:
+        """Update every document matching a filter
+
+        Returns:
+            UpdateResult: the update result
+        """
+        return await run_in_executor(
+            self._executor, self.collection.update_many, *args, **kwargs
+        )
+
+    async def delete_one(self, *args: Any, **kwargs: Any) -> DeleteResult:
+        """Delete a single document
+
+        Returns:
+            DeleteResult: the deletion result
+        """
+        return await run_in_executor(
+            self._executor, self.collection.delete_one, *args, **kwargs
+        )
+
+
+class AsyncGridFS:
+    """GridFS collection whose operations run in the database executor"""
+
+    def __init__(self, gridfs: GridFS, executor: Executor) -> None:
+        self.gridfs = gridfs
+        """The wrapped GridFS collection"""
+        self._executor = executor
+
+    async def put(self, data: Any, **kwargs: Any) -> Any:
+        """Store a file
+
+        Args:
+            data (Any): the file content, bytes or a file-like object
+
+        Returns:
+            Any: the id of the stored file
+        """
+        return await run_in_executor(self._executor, self.gridfs.put, data, **kwargs)
+
+    async def new_file(self, **kwargs: Any) -> "AsyncGridIn":
+        """Open a file to be written in chunks, it's stored when closed
+
+        Returns:
+            AsyncGridIn: the file
+        """
+        return AsyncGridIn(
+            await run_in_executor(self._executor, self.gridfs.new_file, **kwargs),
+            self._executor,
+        )
+
+    async def find_one(self, *args: Any, **kwargs: Any) -> Any:
+        """Get a single file
+
+        Returns:
+            Any: the file or None if no file matched
+        """
+        return await run_in_executor(self._executor, self.gridfs.find_one, *args, **kwargs)
+
+    async def delete(self, file_id: Any) -> None:
+        """Delete a file
+
+        Args:
+            file_id (Any): the id of the file
+        """
+        await run_in_executor(self._executor, self.gridfs.delete, file_id)
+
+
+class AsyncGridIn:
+    """GridFS file being written whose operations run in the database executor"""
+
+    def __init__(self, grid_in: GridIn, executor: Executor) -> None:
+        self.grid_in = grid_in
+        """The wrapped GridFS file"""
+        self._executor = executor
+
+    async def write(self, data: bytes) -> None:
+        """Write data to the file, full chunks are stored as they are completed
+
+        Args:
+            data (bytes): the data
+        """
+        await run_in_executor(self._executor, self.grid_in.write, data)
+
+    async def set(self, name: str, value: Any) -> None:
+        """Set a field of the file document, stored when the file is closed
+
+        Args:
+            name (str): the field name
+            value (Any): the field value
+        """
+        await run_in_executor(self._executor, setattr, self.grid_in, name, value)
+
+    async def close(self) -> None:
+        """Store the last chunk and the file document"""
+        await run_in_executor(self._executor, self.grid_in.close)
+
+    async def abort(self) -> None:
+        """Delete the stored chunks of the file"""
+        await run_in_executor(self._executor, self.grid_in.abort)
@@ -0,0 +1,315 @@
+"""
+Index registry of the database collections
+
+Every index the repositories rely on is declared here by collection and created\
+    at startup. Creating them is idempotent, indexes already present are left as is\
+    and indexes whose options changed, such as a name index becoming unique, are\
+    rebuilt. An index is only rebuilt as unique if its values are not duplicated and\
+    the previous index is restored if the rebuild fails. Indexes found in the database\
+    but not declared are only reported
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import ASCENDING
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.database.database_schema import (
+    DatabaseCollection,
+    DatabaseIndexDuplicatedValuesException,
+)
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.logging.logging_constants import LOGGING_DATABASE_INDEXES
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.utils.pagination.pagination_utils import PAGE_SORT_FIELD
+from app.spotify_electron.utils.search.search_utils import (
+    SEARCH_NAME_FIELD,
+    SEARCH_TOKENS_FIELD,
+)
+
+database_indexes_logger = SpotifyElectronLogger(LOGGING_DATABASE_INDEXES).getLogger()
+
+ID_INDEX_NAME = "_id_"
+"""Index MongoDB creates on every collection"""
+INDEX_INFORMATION_FIELDS = {"key", "v", "ns"}
+"""Index information fields that are not index creation options"""
+
+
+@dataclass(frozen=True)
+class DatabaseIndex:
+    """Ascending index over one or more fields"""
+
+    fields: tuple[str, ...]
+    unique: bool = False
+    expire_after_seconds: int | None = None
+    """Seconds after the date stored in the field a document is deleted, None keeps it"""
+
+    @property
+    def name(self) -> str:
+        """Index name, the same MongoDB gives to an unnamed index"""
+        return "_".join(f"{index_field}_{ASCENDING}" for index_field in self.fields)
+
+    def get_keys(self) -> list[tuple[str, int]]:
+        """Get the index keys
+
+        Returns:
+            list[tuple[str, int]]: the fields and their sort direction
+        """
+        return [(index_field, ASCENDING) for index_field in self.fields]
+
+    def matches(self, index_information: dict[str, Any]) -> bool:
+        """Get if an existing index has the keys and options of this index
+
+        Args:
+            index_information (dict[str, Any]): the existing index information
+
+        Returns:
+            bool: if the existing index matches
+        """
+        return (
+            list(index_information["key"]) == self.get_keys()
+            and self.unique == bool(index_information.get("unique", False))
+            and self.expire_after_seconds == index_information.get("expireAfterSeconds")
+        )
+
+    def get_options(self) -> dict[str, Any]:
+        """Get the index creation options
+
+        Returns:
+            dict[str, Any]: the options
+        """
+        options: dict[str, Any] = {"unique": self.unique, "name": self.name}
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return options
+
+
+@dataclass
+class DatabaseIndexesDrift:
+    """Differences between the declared and the existing indexes of a collection"""
+
+    collection: str
+    missing: list[str] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+
+    @property
+    def has_drift(self) -> bool:
+        """If the existing indexes differ from the declared ones"""
+        return bool(self.missing or self.extra)
+
+
+NAME_INDEX = DatabaseIndex((PAGE_SORT_FIELD,), unique=True)
+"""Serves the lookups by name, keeps names unique and sorts the list pages"""
+SEARCH_INDEXES = (
+    DatabaseIndex((SEARCH_TOKENS_FIELD,)),
+    DatabaseIndex((SEARCH_NAME_FIELD,)),
+)
+USER_INDEXES = (
+    NAME_INDEX,
+    DatabaseIndex(("saved_playlists",)),
+    DatabaseIndex(("playlists",)),
+    *SEARCH_INDEXES,
+)
+SONG_UPLOAD_EXPIRATION_SECONDS = int(
+    getattr(PropertiesManager, AppConfig.SONG_UPLOAD_EXPIRATION_SECONDS, 0) or 86400
+)
+"""Seconds a song upload can stay pending before it's deleted"""
+SONG_INDEXES = (
+    NAME_INDEX,
+    DatabaseIndex(("genre", PAGE_SORT_FIELD)),
+    DatabaseIndex(("artist",)),
+    *SEARCH_INDEXES,
+)
+
+DATABASE_INDEXES: dict[DatabaseCollection, tuple[DatabaseIndex, ...]] = {
+    DatabaseCollection.USER: USER_INDEXES,
+    DatabaseCollection.ARTIST: USER_INDEXES,
+    DatabaseCollection.PLAYLIST: (NAME_INDEX, *SEARCH_INDEXES),
+    DatabaseCollection.SONG_STREAMING: SONG_INDEXES,
+    DatabaseCollection.SONG_UPLOAD: (
+        NAME_INDEX,
+        DatabaseIndex(("created_at",), expire_after_seconds=SONG_UPLOAD_EXPIRATION_SECONDS),
+    ),
+    DatabaseCollection.SONG_BLOB_FILE: (
+        *SONG_INDEXES,
+        DatabaseIndex(("filename", "uploadDate")),
+    ),
+    DatabaseCollection.SONG_BLOB_CHUNKS: (DatabaseIndex(("files_id", "n"), unique=True),),
+}
+"""Declared indexes by collection. GridFS indexes are declared because GridFS\
+    creates them on the first write"""
+
+
+def create_indexes() -> None:
+    """Create the declared indexes of every collection, rebuilding the ones whose\
+        options changed. Indexes that cannot be built, such as a unique index over\
+        duplicated values, are logged and reported as missing"""
+    for collection_name, indexes in DATABASE_INDEXES.items():
+        collection = DatabaseConnectionManager.get_collection_connection(collection_name)
+        existing_indexes = collection.index_information()
+        for index in indexes:
+            existing_index = existing_indexes.get(index.name)
+            if existing_index is not None and index.matches(existing_index):
+                continue
+            try:
+                create_index(collection, index, existing_index)
+            except (OperationFailure, DatabaseIndexDuplicatedValuesException):
+                database_indexes_logger.exception(
+                    f"Error creating index {index.name} in collection {collection.name}"
+                )
+
+    for indexes_drift in get_indexes_drift():
+        if indexes_drift.has_drift:
+            database_indexes_logger.warning(f"Database indexes drift: {indexes_drift}")
+    database_indexes_logger.info("Database indexes created")
+
+
+def create_index(
+    collection: Collection, index: DatabaseIndex, existing_index: dict[str, Any] | None
+) -> None:
+    """Create an index in a collection, replacing the existing index with the same name.\
+        The existing index is kept if the new one cannot be built
+
+    Args:
+        collection (Collection): the collection
+        index (DatabaseIndex): the index
+        existing_index (dict[str, Any] | None): information of the index with the same\
+            name but other options, None if there is no such index
+
+    Raises:
+        DatabaseIndexDuplicatedValuesException: the values of the unique index are\
+            duplicated
+        OperationFailure: the index cannot be built
+    """
+    if existing_index is None:
+        collection.create_index(index.get_keys(), **index.get_options())
+        return
+
+    if index.unique:
+        validate_index_values_unique(collection, index)
+    database_indexes_logger.info(
+        f"Rebuilding index {index.name} in collection {collection.name}"
+    )
+    # an index can't be built next to another one with the same keys, so the existing
+    # index is dropped first and restored if the new one fails
+    collection.drop_index(index.name)
+    try:
+        collection.create_index(index.get_keys(), **index.get_options())
+    except OperationFailure:
+        collection.create_index(
+            list(existing_index["key"]),
+            name=index.name,
+            **{
+                option: value
+                for option, value in existing_index.items()
+                if option not in INDEX_INFORMATION_FIELDS
+            },
+        )
+        raise
+
+
+def validate_index_values_unique(collection: Collection, index: DatabaseIndex) -> None:
+    """Raises an exception if the values of the index fields are duplicated
+
+    Args:
+        collection (Collection): the collection
+        index (DatabaseIndex): the unique index
+
+    Raises:
+        DatabaseIndexDuplicatedValuesException: the index values are duplicated
+    """
+    duplicated_values = list(
+        collection.aggregate(
+            [
+                {
+                    "$group": {
+                        "_id": {
+                            index_field: f"${index_field}" for index_field in index.fields
+                        },
+                        "count": {"$sum": 1},
+                    }
+                },
+                {"$match": {"count": {"$gt": 1}}},
+                {"$limit": 1},
+            ]
+        )
+    )
+    if duplicated_values:
+        database_indexes_logger.warning(
+            f"Duplicated values {duplicated_values[0]['_id']} prevent building unique "
+            f"index {index.name} in collection {collection.name}"
+        )
+        raise DatabaseIndexDuplicatedValuesException
+
+
+def get_indexes_drift() -> list[DatabaseIndexesDrift]:
+    """Get the differences between the declared and the existing indexes
+
+    Returns:
+        list[DatabaseIndexesDrift]: the differences of every collection
+    """
+    indexes_drift: list[DatabaseIndexesDrift] = []
+    for collection_name, indexes in DATABASE_INDEXES.items():
+        collection = DatabaseConnectionManager.get_collection_connection(collection_name)
+        existing_indexes = collection.index_information()
+        declared_indexes = {index.name: index for index in indexes}
+        indexes_drift.append(
+            DatabaseIndexesDrift(
+                collection=collection_name,
+                missing=[
+                    name
+                    for name, index in declared_indexes.items()
+                    if name not in existing_indexes
+                    or not index.matches(existing_indexes[name])
+                ],
+                extra=[
+                    name
+                    for name in existing_indexes
+                    if name not in declared_indexes and name != ID_INDEX_NAME
+                ],
+            )
+        )
+    return indexes_drift
+
+
+def get_query_index(
+    collection_name: DatabaseCollection, query: dict[str, Any]
+) -> DatabaseIndex | None:
+    """Get the declared index that serves a query, the first index whose leading field\
+        is filtered by the query
+
+    Args:
+        collection_name (DatabaseCollection): the queried collection
+        query (dict[str, Any]): the query filter
+
+    Returns:
+        DatabaseIndex | None: the index or None if the query scans the collection
+    """
+    query_fields = get_query_fields(query)
+    for index in DATABASE_INDEXES.get(collection_name, ()):
+        if index.fields[0] in query_fields:
+            return index
+    return None
+
+
+def get_query_fields(query: dict[str, Any]) -> set[str]:
+    """Get the fields filtered by a query, including the ones inside $and
+
+    Args:
+        query (dict[str, Any]): the query filter
+
+    Returns:
+        set[str]: the filtered fields
+    """
+    query_fields: set[str] = set()
+    for key, value in query.items():
+        if key == "$and":
+            for subquery in value:
+                query_fields |= get_query_fields(subquery)
+        elif not key.startswith("$"):
+            query_fields.add(key)
+    return query_fields
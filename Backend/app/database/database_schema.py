@@ -2,6 +2,7 @@
 
 import sys
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 
 from gridfs import GridFS
@@ -10,12 +11,16 @@ from pymongo.database import Database
 from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
 
-from app.common.app_schema import AppEnvironment
+from app.common.app_schema import AppConfig, AppEnvironment
 from app.common.PropertiesManager import PropertiesManager
+from app.database.async_database_schema import AsyncCollection, AsyncGridFS
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
 from app.logging.logging_constants import LOGGING_DATABASE_CONNECTION
 from app.logging.logging_schema import SpotifyElectronLogger
 
+DEFAULT_DATABASE_ASYNC_WORKERS = 32
+"""Threads running async database operations when they are not configured"""
+
 
 class DatabaseCollection(StrEnum):
     """Collection names present in database"""
@@ -24,8 +29,10 @@ class DatabaseCollection(StrEnum):
     ARTIST = "artists"
     PLAYLIST = "playlists"
     SONG_STREAMING = "songs.streaming"
+    SONG_UPLOAD = "songs.uploads"
     SONG_BLOB_FILE = "songs.files"
     SONG_BLOB_DATA = "songs"
+    SONG_BLOB_CHUNKS = "songs.chunks"
 
 
 class BaseDatabaseConnection:
@@ -37,6 +44,10 @@ class BaseDatabaseConnection:
     """Database connection"""
     collection_name_prefix: str = ""
     """Database collection prefix applied to all collections"""
+    supports_union_with: bool = True
+    """Whether aggregations can combine collections with $unionWith"""
+    async_executor: ThreadPoolExecutor | None = None
+    """Executor running the operations of the async collections"""
     _logger = SpotifyElectronLogger(LOGGING_DATABASE_CONNECTION).getLogger()
 
     @classmethod
@@ -52,6 +63,10 @@ class BaseDatabaseConnection:
             client = cls._get_mongo_client()(uri, server_api=ServerApi("1"))
             client.admin.command("ping")
             cls.connection = client[cls.DATABASE_NAME]
+            if cls.async_executor is None:
+                cls.async_executor = ThreadPoolExecutor(
+                    max_workers=cls._get_async_workers(), thread_name_prefix="database"
+                )
         except Exception as exception:
             cls._logger.critical(f"Error establishing connection with database: {exception}")
             sys.exit("Database connection failed, stopping server")
@@ -76,6 +91,18 @@ class BaseDatabaseConnection:
         """
         pass
 
+    @classmethod
+    def _get_async_workers(cls) -> int:
+        """Returns the number of threads running async database operations
+
+        Returns:
+            int: the number of threads
+        """
+        return int(
+            getattr(PropertiesManager, AppConfig.DATABASE_ASYNC_WORKERS, 0)
+            or DEFAULT_DATABASE_ASYNC_WORKERS
+        )
+
     @classmethod
     def get_collection_connection(cls, collection_name: DatabaseCollection) -> Collection:
         """Returns the connection with a collection
@@ -105,6 +132,42 @@ class BaseDatabaseConnection:
             collection=cls.collection_name_prefix + collection_name,
         )
 
+    @classmethod
+    def get_async_collection_connection(
+        cls, collection_name: DatabaseCollection
+    ) -> AsyncCollection:
+        """Returns the connection with a collection for async code
+
+        Args:
+            collection_name (DatabaseCollection): the collection name
+
+        Returns:
+            AsyncCollection: the async connection to the collection
+        """
+        assert cls.async_executor is not None, "Database connection is not init"
+
+        return AsyncCollection(
+            cls.get_collection_connection(collection_name), cls.async_executor
+        )
+
+    @classmethod
+    def get_async_gridfs_collection_connection(
+        cls, collection_name: DatabaseCollection
+    ) -> AsyncGridFS:
+        """Returns the connection with gridfs collection for async code
+
+        Args:
+            collection_name (DatabaseCollection): the collection name
+
+        Returns:
+            AsyncGridFS: the async gridfs collection connection
+        """
+        assert cls.async_executor is not None, "Database connection is not init"
+
+        return AsyncGridFS(
+            cls.get_gridfs_collection_connection(collection_name), cls.async_executor
+        )
+
 
 class DatabasePingFailed(SpotifyElectronException):
     """Database ping failure"""
@@ -122,3 +185,12 @@ class UnexpectedDatabasePingFailed(SpotifyElectronException):
 
     def __init__(self):
         super().__init__(self.ERROR)
+
+
+class DatabaseIndexDuplicatedValuesException(SpotifyElectronException):
+    """Duplicated values prevent building a unique index"""
+
+    ERROR = "Duplicated values prevent building a unique index"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
@@ -18,6 +18,7 @@ LOGGING_PROPERTIES_MESSAGES_MANAGER = "PROPERTIES_MESSAGES_MANAGER"
 # Database
 LOGGING_DATABASE_CONNECTION = "DATABASE_CONNECTION"
 LOGGING_DATABASE_MANAGER = "DATABASE_MANAGER"
+LOGGING_DATABASE_INDEXES = "DATABASE_INDEXES"
 
 
 # Middleware
@@ -37,6 +38,8 @@ LOGGING_GENRE_CONTROLLER = "GENRE_CONTROLLER"
 LOGGING_SONG_SERVICE_PROVIDER = "SONG_SERVICE_PROVIDER"
 LOGGING_BASE_SONG_SERVICE = "BASE_SONG_SERVICE"
 LOGGING_BASE_SONG_REPOSITORY = "BASE_SONG_REPOSITORY"
+LOGGING_SONG_STREAMS_BUFFER = "SONG_STREAMS_BUFFER"
+LOGGING_SONG_UPLOAD = "SONG_UPLOAD"
 
 LOGGING_SONG_SERVERLESS_REPOSITORY = "SONG_SERVERLESS_REPOSITORY"
 LOGGING_SONG_SERVERLESS_SERVICE = "SONG_SERVERLESS_SERVICE"
@@ -45,6 +48,9 @@ LOGGING_SONG_SERVERLESS_SERVICE_VALIDATIONS = "SONG_SERVERLESS_SERVICE_VALIDATIO
 LOGGING_SONG_BLOB_REPOSITORY = "SONG_BLOB_REPOSITORY"
 LOGGING_SONG_BLOB_SERVICE = "SONG_BLOB_SERVICE"
 LOGGING_SONG_BLOB_SERVICE_VALIDATIONS = "SONG_BLOB_SERVICE_VALIDATIONS"
+LOGGING_SONG_BLOB_DATA_CACHE = "SONG_BLOB_DATA_CACHE"
+LOGGING_SONG_BLOB_DATA_DISK_CACHE = "SONG_BLOB_DATA_DISK_CACHE"
+LOGGING_SONG_BLOB_DATA_CACHE_LOADER = "SONG_BLOB_DATA_CACHE_LOADER"
 
 # Stream
 LOGGING_STREAM_SERVICE = "STREAM_SERVICE"
@@ -53,17 +59,22 @@ LOGGING_STREAM_SERVICE = "STREAM_SERVICE"
 # Auth
 LOGGING_AUTH_SERVICE = "AUTH_SERVICE"
 LOGGING_JWT_BEARER_AUTH = "JWT_BEARER_AUTH"
+LOGGING_VERIFIED_TOKEN_CACHE = "VERIFIED_TOKEN_CACHE"
+LOGGING_PASSWORD_HASHER = "PASSWORD_HASHER"
 
 
 # Search
 LOGGING_SEARCH_SERVICE = "SEARCH_SERVICE"
 LOGGING_SEARCH_CONTROLLER = "SEARCH_CONTROLLER"
+LOGGING_SEARCH_REPOSITORY = "SEARCH_REPOSITORY"
+LOGGING_SEARCH_ENGINE = "SEARCH_ENGINE"
 
 # Base user
 LOGGING_BASE_USERS_SERVICE = "BASE_USER_SERVICE"
 LOGGING_BASE_USERS_REPOSITORY = "BASE_USER_REPOSITORY"
 LOGGING_USER_SERVICE_PROVIDER = "USER_SERVICE_PROVIDER"
 LOGGING_USER_COLLECTION_PROVIDER = "USER_COLLECTION_PROVIDER"
+LOGGING_USER_TYPE_CACHE = "USER_TYPE_CACHE"
 
 # User
 LOGGING_USER_REPOSITORY = "USER_REPOSITORY"
@@ -73,5 +84,8 @@ LOGGING_USER_SERVICE = "USER_SERVICE"
 LOGGING_ARTIST_REPOSITORY = "ARTIST_REPOSITORY"
 LOGGING_ARTIST_SERVICE = "ARTIST_SERVICE"
 
+# Metrics
+LOGGING_METRICS_SERVICE = "METRICS_SERVICE"
+
 # Utilities
 LOGGING_AUDIO_MANAGEMENT_UTILS = "AUDIO_MANAGEMENT_UTILS"
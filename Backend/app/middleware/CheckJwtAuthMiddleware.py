@@ -1,14 +1,16 @@
-"""Middleware for authenticate incoming HTTP Requests using JWT Token"""
+"""Middleware for authenticate incoming HTTP Requests using JWT Token
 
-from collections.abc import Callable
-from typing import Any
+Implemented as a raw ASGI middleware, the request and response messages are passed\
+    through untouched so streaming responses don't pay an extra task and memory\
+    stream hop per chunk
+"""
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
 from starlette.status import HTTP_403_FORBIDDEN
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 import app.auth.auth_service as auth_service
-from app.auth.auth_schema import JWTValidationException
+from app.auth.auth_schema import JWT_COOKIE_HEADER_FIELD_NAME, JWTValidationException
 from app.common.PropertiesMessagesManager import PropertiesMessagesManager
 from app.logging.logging_constants import LOGGIN_CHECK_AUTH_JWT_MIDDLEWARE
 from app.logging.logging_schema import SpotifyElectronLogger
@@ -17,104 +19,133 @@ check_jwt_auth_middleware_logger = SpotifyElectronLogger(
     LOGGIN_CHECK_AUTH_JWT_MIDDLEWARE
 ).getLogger()
 
+AUTHORIZATION_HEADER_NAME = b"authorization"
+COOKIE_HEADER_NAME = b"cookie"
+BEARER_SCHEME_NAME = b"bearer"
+JWT_COOKIE_NAME = JWT_COOKIE_HEADER_FIELD_NAME.encode()
 
-class CheckJwtAuthMiddleware(BaseHTTPMiddleware):
+
+class CheckJwtAuthMiddleware:
     """Middleware for authenticating user credentials"""
 
-    bypass_urls = {
-        "GET": [
-            "/docs",
-            "/docs/",
-            "/openapi.json",
-            "/health/",
-        ],
-        "POST": [
-            "/users/",
-            "/users",
-            "/login/",
-            "/login",
-            "/artists/",
-            "/artists",
-            "/token",
-        ],
+    bypass_urls: dict[str, frozenset[str]] = {
+        "GET": frozenset(
+            [
+                "/docs",
+                "/docs/",
+                "/docs/oauth2-redirect",
+                "/redoc",
+                "/openapi.json",
+                "/health/",
+            ]
+        ),
+        "POST": frozenset(
+            [
+                "/users/",
+                "/users",
+                "/login/",
+                "/login",
+                "/artists/",
+                "/artists",
+                "/token",
+            ]
+        ),
     }
     """HTTP Urls that wont be checked"""
-    bypass_methods = ["DELETE"]
+    bypass_url_prefixes: dict[str, tuple[str, ...]] = {
+        "POST": ("/login/token/",),
+    }
+    """HTTP Url prefixes that wont be checked"""
+    bypass_methods = frozenset(["DELETE", "OPTIONS"])
     """"HTTP Methods that wont be checked"""
 
-    def bypass_request(self, request: Request) -> bool:
-        """Returns if the request has to be bypassed or not
-
-        Args:
-        ----
-            request (Request): the incoming request
-
-        Returns:
-        -------
-            bool: if the return has to be bypassed
-
-        """
-        check_jwt_auth_middleware_logger.debug(
-            f"Request method {request.method}\n Request URL {request.url}\n"
-        )
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        return request.method in self.bypass_methods or (
-            request.method in self.bypass_urls
-            and request.url.path in self.bypass_urls[request.method]
-        )
-
-    async def dispatch(self, request: Request, call_next: Callable[[Any], Any]) -> Any:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Manages the incoming HTTP request and decides wheter or not it has to be blocked
 
         Args:
-            request (Request): the incoming request
-            call_next (_type_): the method to call next
-
-        Returns:
-            _type_: the call next output if request was not blocked
+            scope (Scope): the ASGI connection scope
+            receive (Receive): receives ASGI messages
+            send (Send): sends ASGI messages
         """
+        if scope["type"] != "http" or self.bypass_request(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        jwt = self._get_jwt_from_headers(scope["headers"])
         try:
-            if self.bypass_request(request):
-                check_jwt_auth_middleware_logger.debug(
-                    f"Bypassed request: {request.method} {request.url}"
-                )
-                return await call_next(request)
-
-            jwt = request.headers["authorization"]
-            return await self._handle_jwt_validation(jwt, request, call_next)
-        except Exception:
-            return Response(
+            auth_service.get_verified_jwt_token_data(jwt)  # type: ignore
+        except (JWTValidationException, Exception):
+            check_jwt_auth_middleware_logger.exception(
+                f"Request with invalid JWT {scope['method']} {scope['path']}"
+            )
+            response = Response(
                 content=PropertiesMessagesManager.tokenInvalidCredentials,
                 status_code=HTTP_403_FORBIDDEN,
             )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
 
-    async def _handle_jwt_validation(
-        self, jwt: str, request: Request, call_next: Callable[[Any], Any]
-    ) -> Response:
-        """Handles JWT validation, sends HTTP_403_FORBIDDEN if jwt is not valid or\
-            continues the workflow
+    def bypass_request(self, method: str, path: str) -> bool:
+        """Returns if the request has to be bypassed or not
 
         Args:
-        ----
-            jwt (str): the jwt token
-            request (Request): the incoming request
-            call_next (Callable[[Any], Any]): the method for continuing the workflow
+            method (str): the request HTTP method
+            path (str): the request url path
 
         Returns:
-        -------
-            Response: the Response that's gonna be sended to the client,\
-                HTTP_403_FORBIDDEN if jwt is not valid
+            bool: if the request has to be bypassed
+        """
+        if method in self.bypass_methods:
+            return True
+        bypass_urls = self.bypass_urls.get(method)
+        if bypass_urls is not None and path in bypass_urls:
+            return True
+        bypass_url_prefixes = self.bypass_url_prefixes.get(method)
+        return bypass_url_prefixes is not None and path.startswith(bypass_url_prefixes)
+
+    def _get_jwt_from_headers(self, headers: list[tuple[bytes, bytes]]) -> str | None:
+        """Get the JWT Token from the jwt cookie or the authorization header,\
+            the cookie takes precedence as in JWTBearer
 
+        Args:
+            headers (list[tuple[bytes, bytes]]): the raw ASGI headers
+
+        Returns:
+            str | None: the JWT Token or None if it was not provided
         """
-        try:
-            auth_service.validate_jwt(jwt)
-        except (JWTValidationException, Exception):
-            check_jwt_auth_middleware_logger.exception(
-                f"Request with invalid JWT {jwt} {request}"
-            )
-            return Response(
-                content=PropertiesMessagesManager.tokenInvalidCredentials,
-                status_code=HTTP_403_FORBIDDEN,
-            )
-        else:
-            return await call_next(request)
+        authorization = None
+        jwt_cookie = None
+        for key, value in headers:
+            if key == AUTHORIZATION_HEADER_NAME:
+                authorization = value
+            elif key == COOKIE_HEADER_NAME and jwt_cookie is None:
+                jwt_cookie = self._get_jwt_cookie(value)
+
+        credentials = jwt_cookie or authorization
+        if not credentials:
+            return None
+        # Frontend sends the bearer value surrounded by quotes
+        scheme, _, jwt = credentials.strip(b'" ').partition(b" ")
+        if scheme.lower() != BEARER_SCHEME_NAME or not jwt:
+            return None
+        return jwt.decode("latin-1")
+
+    def _get_jwt_cookie(self, cookie_header: bytes) -> bytes | None:
+        """Get the jwt cookie value from the cookie header
+
+        Args:
+            cookie_header (bytes): the raw cookie header
+
+        Returns:
+            bytes | None: the jwt cookie value or None if it's not present
+        """
+        for cookie in cookie_header.split(b";"):
+            name, _, value = cookie.partition(b"=")
+            if name.strip() == JWT_COOKIE_NAME:
+                return value
+        return None
@@ -0,0 +1,30 @@
+"""Middleware for starting request scoped caches on every incoming HTTP Request"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.spotify_electron.user.user_type_cache import UserTypeCache
+
+
+class RequestScopeMiddleware:
+    """Middleware for memoizing lookups during a single request"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Runs the request inside a new request scope
+
+        Args:
+            scope (Scope): the ASGI connection scope
+            receive (Receive): receives ASGI messages
+            send (Send): sends ASGI messages
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = UserTypeCache.start_request_scope()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            UserTypeCache.end_request_scope(token)
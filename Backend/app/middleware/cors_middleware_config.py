@@ -2,6 +2,8 @@
 CORS Middleware configurations
 """
 
+from app.spotify_electron.utils.pagination.pagination_utils import NEXT_CURSOR_HEADER
+
 allowed_origins = [
     "http://localhost/",
     "http://localhost:1212",
@@ -17,3 +19,4 @@ allow_credentials = True
 allowed_methods = ["POST", "GET", "PUT", "DELETE", "PATCH"]
 max_age = 3600
 allowed_headers = ["*"]
+exposed_headers = [NEXT_CURSOR_HEADER]
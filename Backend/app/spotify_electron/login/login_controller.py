@@ -13,6 +13,7 @@ from starlette.status import (
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 import app.auth.auth_service as auth_service
@@ -20,6 +21,7 @@ import app.spotify_electron.utils.json_converter.json_converter_utils as json_co
 from app.auth.auth_schema import (
     CreateJWTException,
     JWTValidationException,
+    PasswordHasherBusyException,
     UnexpectedLoginUserException,
     VerifyPasswordException,
 )
@@ -34,7 +36,7 @@ router = APIRouter(
 
 
 @router.post("/")
-def login_user(
+async def login_user(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> Response:
     """Login user
@@ -45,7 +47,7 @@ def login_user(
 
     """
     try:
-        jwt = auth_service.login_user(form_data.username, form_data.password)
+        jwt = await auth_service.login_user(form_data.username, form_data.password)
 
         access_token_json = json_converter_utils.get_json_from_model(jwt)
         expiration_date = auth_service.get_token_expire_date()
@@ -65,6 +67,11 @@ def login_user(
             status_code=HTTP_404_NOT_FOUND,
             content=PropertiesMessagesManager.userNotFound,
         )
+    except PasswordHasherBusyException:
+        return Response(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            content=PropertiesMessagesManager.loginBusy,
+        )
     except (UnexpectedLoginUserException, Exception):
         return Response(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
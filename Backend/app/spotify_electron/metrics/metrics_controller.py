@@ -0,0 +1,38 @@
+"""
+Metrics controller for handling incoming HTTP Requests
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from starlette.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+import app.spotify_electron.utils.json_converter.json_converter_utils as json_converter_utils
+from app.auth.auth_schema import TokenData
+from app.auth.JWTBearer import JWTBearer
+from app.common.PropertiesMessagesManager import PropertiesMessagesManager
+from app.exceptions.base_exceptions_schema import JsonEncodeException
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/")
+def get_metrics(token: Annotated[TokenData, Depends(JWTBearer())]) -> Response:
+    """Get in-process runtime metrics such as cache hit rates and buffer sizes"""
+    try:
+        metrics = metrics_service.get_metrics()
+        metrics_json = json_converter_utils.get_json_from_model(metrics)
+
+        return Response(metrics_json, media_type="application/json", status_code=HTTP_200_OK)
+    except JsonEncodeException:
+        return Response(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=PropertiesMessagesManager.commonEncodingError,
+        )
+    except Exception:
+        return Response(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=PropertiesMessagesManager.commonInternalServerError,
+        )
@@ -0,0 +1,37 @@
+"""
+Metrics service for collecting in-process runtime metrics
+
+Components register a provider that returns a snapshot of their counters,
+providers are only called when the metrics are requested
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from app.logging.logging_constants import LOGGING_METRICS_SERVICE
+from app.logging.logging_schema import SpotifyElectronLogger
+
+metrics_service_logger = SpotifyElectronLogger(LOGGING_METRICS_SERVICE).getLogger()
+
+metrics_providers: dict[str, Callable[[], dict[str, Any]]] = {}
+"""Registered metrics providers by component name"""
+
+
+def register_metrics_provider(name: str, provider: Callable[[], dict[str, Any]]) -> None:
+    """Register a metrics provider, replacing any previous one with the same name
+
+    Args:
+        name (str): the component name the metrics will be grouped under
+        provider (Callable[[], dict[str, Any]]): returns the current component metrics
+    """
+    metrics_providers[name] = provider
+    metrics_service_logger.debug(f"Metrics provider registered: {name}")
+
+
+def get_metrics() -> dict[str, dict[str, Any]]:
+    """Get the current metrics of all registered components
+
+    Returns:
+        dict[str, dict[str, Any]]: the metrics grouped by component name
+    """
+    return {name: provider() for name, provider in metrics_providers.items()}
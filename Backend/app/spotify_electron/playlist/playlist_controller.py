@@ -4,7 +4,7 @@ Playlist controller for handling incoming HTTP Requests
 
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Header
 from fastapi.responses import Response
 from starlette.status import (
     HTTP_200_OK,
@@ -26,7 +26,7 @@ from app.auth.auth_schema import (
 )
 from app.auth.JWTBearer import JWTBearer
 from app.common.PropertiesMessagesManager import PropertiesMessagesManager
-from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.exceptions.base_exceptions_schema import BadParameterException, JsonEncodeException
 from app.logging.logging_constants import LOGGING_PLAYLIST_CONTROLLER
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.playlist.playlist_schema import (
@@ -35,6 +35,7 @@ from app.spotify_electron.playlist.playlist_schema import (
     PlaylistNotFoundException,
     PlaylistServiceException,
 )
+from app.spotify_electron.utils.pagination.pagination_utils import DEFAULT_PAGE_LIMIT
 
 router = APIRouter(
     prefix="/playlists",
@@ -45,7 +46,7 @@ playlist_controller_logger = SpotifyElectronLogger(LOGGING_PLAYLIST_CONTROLLER).
 
 
 @router.get("/{name}")
-def get_playlist(
+async def get_playlist(
     name: str,
     token: Annotated[TokenData, Depends(JWTBearer())],
 ) -> Response:
@@ -55,7 +56,7 @@ def get_playlist(
         name (str): playlist name
     """
     try:
-        playlist = playlist_service.get_playlist(name)
+        playlist = await playlist_service.get_playlist_async(name)
         playlist_json = json_converter_utils.get_json_from_model(playlist)
 
         return Response(playlist_json, media_type="application/json", status_code=HTTP_200_OK)
@@ -206,15 +207,47 @@ def delete_playlist(name: str) -> Response:
 
 
 @router.get("/")
-def get_playlists(token: Annotated[TokenData, Depends(JWTBearer())]) -> Response:
-    """Get all playlists"""
+def get_playlists(
+    token: Annotated[TokenData, Depends(JWTBearer())],
+    limit: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get a page of playlists sorted by name
+
+    Args:
+        limit (int | None): max playlists returned, every playlist is returned if\
+            neither a limit nor a cursor are requested
+        cursor (str | None): cursor of the page, returned in the X-Next-Cursor header\
+            of the previous page
+        stream (bool): stream every playlist after the cursor instead of a page,\
+            as newline delimited json if accepted by the client
+    """
     try:
-        playlists = playlist_service.get_all_playlist()
+        if stream or (limit is None and cursor is None):
+            return json_converter_utils.get_streaming_response_from_models(
+                playlist_service.get_all_playlist_stream(cursor), "playlists", accept
+            )
+
+        playlists = playlist_service.get_all_playlist(
+            DEFAULT_PAGE_LIMIT if limit is None else limit, cursor
+        )
         playlist_json = json_converter_utils.get_json_with_iterable_field_from_model(
-            playlists, "playlists"
+            playlists.items, "playlists"
         )
 
-        return Response(playlist_json, media_type="application/json", status_code=HTTP_200_OK)
+        return Response(
+            playlist_json,
+            media_type="application/json",
+            status_code=HTTP_200_OK,
+            headers=playlists.get_headers(),
+        )
+    except BadParameterException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.commonBadParameter,
+        )
     except PlaylistBadNameException:
         return Response(
             status_code=HTTP_400_BAD_REQUEST,
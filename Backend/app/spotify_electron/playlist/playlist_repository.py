@@ -2,9 +2,15 @@
 Playlist repository for managing persisted data
 """
 
+from collections.abc import Iterator
+
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+
 from app.logging.logging_constants import LOGGING_PLAYLIST_REPOSITORY
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.playlist.playlist_schema import (
+    PlaylistAlreadyExistsException,
     PlaylistCreateException,
     PlaylistDAO,
     PlaylistDeleteException,
@@ -21,6 +27,15 @@ from app.spotify_electron.playlist.validations.playlist_repository_validations i
     validate_playlist_exists,
     validate_playlist_update,
 )
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    PAGE_SORT_FIELD,
+    get_keyset_query,
+)
+from app.spotify_electron.utils.search.search_utils import (
+    DEFAULT_SEARCH_LIMIT,
+    get_search_fields,
+    get_search_query,
+)
 
 playlist_repository_logger = SpotifyElectronLogger(LOGGING_PLAYLIST_REPOSITORY).getLogger()
 
@@ -116,6 +131,7 @@ def create_playlist(  # noqa: PLR0913
 
     Raises:
     ------
+        PlaylistAlreadyExistsException: a playlist with the same name already exists
         PlaylistRepositoryException: an error occurred while inserting playlist in database
 
     """
@@ -129,8 +145,11 @@ def create_playlist(  # noqa: PLR0913
             "owner": owner,
             "song_names": song_names,
         }
-        result = collection.insert_one(playlist)
+        result = collection.insert_one({**playlist, **get_search_fields(name)})
         validate_playlist_create(result)
+    except DuplicateKeyError as exception:
+        playlist_repository_logger.exception(f"Playlist {name} already exists in database")
+        raise PlaylistAlreadyExistsException from exception
     except PlaylistCreateException as exception:
         playlist_repository_logger.exception(
             f"Error inserting Playlist {playlist} in database"
@@ -175,32 +194,38 @@ def delete_playlist(
         raise PlaylistRepositoryException from exception
 
 
-def get_all_playlists() -> list[PlaylistDAO]:
-    """Get all playlist
+def get_all_playlists(
+    limit: int | None, after_name: str | None = None
+) -> Iterator[PlaylistDAO]:
+    """Get playlists sorted by name. Playlists are read lazily from the database
 
+    Args:
+        limit (int | None): max playlists returned, None returns every playlist
+        after_name (str | None, optional): only return playlists whose name comes after\
+            this one. Defaults to None.
 
     Raises
     ------
         PlaylistRepositoryException: an error occurred while\
               getting all playlists from database
 
-    Returns
-    -------
-        list[PlaylistDAO]: the list whith all the playlists
+    Yields
+    ------
+        PlaylistDAO: the playlists
 
     """
     try:
         collection = get_playlist_collection()
-        playlists_files = collection.find()
-        playlists = [
-            get_playlist_dao_from_document(playlist_file) for playlist_file in playlists_files
-        ]
+        playlists_files = collection.find(get_keyset_query({}, after_name)).sort(
+            PAGE_SORT_FIELD, ASCENDING
+        )
+        if limit is not None:
+            playlists_files = playlists_files.limit(limit)
+        for playlist_file in playlists_files:
+            yield get_playlist_dao_from_document(playlist_file)
     except Exception as exception:
         playlist_repository_logger.exception("Error getting all Playlists from database")
         raise PlaylistRepositoryException from exception
-    else:
-        playlist_repository_logger.info(f"All playlists obtained: {playlists}")
-        return playlists
 
 
 def get_selected_playlists(
@@ -239,12 +264,14 @@ def get_selected_playlists(
 
 def get_playlist_search_by_name(
     name: str,
+    limit: int = DEFAULT_SEARCH_LIMIT,
 ) -> list[PlaylistDAO]:
     """Gets the playlist with similar name
 
     Args:
     ----
         name (str): the matching name
+        limit (int, optional): max playlists returned. Defaults to DEFAULT_SEARCH_LIMIT.
 
 
     Raises:
@@ -259,7 +286,7 @@ def get_playlist_search_by_name(
     """
     try:
         collection = get_playlist_collection()
-        documents = collection.find({"name": {"$regex": name, "$options": "i"}})
+        documents = collection.find(get_search_query(name)).limit(limit)
         playlists = [get_playlist_dao_from_document(document) for document in documents]
     except Exception as exception:
         playlist_repository_logger.exception(
@@ -300,6 +327,7 @@ def update_playlist(
                     "description": description,
                     "photo": photo,
                     "song_names": list(set(song_names)),
+                    **get_search_fields(new_name),
                 }
             },
         )
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
 @dataclass
@@ -20,6 +21,7 @@ class PlaylistDAO:
     song_names: list[str]
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class PlaylistDTO:
     """Represents playlist data in the endpoints transfer layer"""
@@ -2,6 +2,8 @@
 Playlist service for handling business logic
 """
 
+from collections.abc import Iterator
+
 import app.auth.auth_service as auth_service
 import app.spotify_electron.playlist.playlist_repository as playlist_repository
 import app.spotify_electron.user.base_user_service as base_user_service
@@ -10,6 +12,8 @@ from app.auth.auth_schema import (
     TokenData,
     UserUnauthorizedException,
 )
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.exceptions.base_exceptions_schema import BadParameterException
 from app.logging.logging_constants import LOGGING_PLAYLIST_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.playlist.playlist_schema import (
@@ -26,8 +30,17 @@ from app.spotify_electron.playlist.validations.playlist_service_validations impo
     validate_playlist_should_exists,
     validate_playlist_should_not_exists,
 )
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.user.user.user_schema import UserNotFoundException
 from app.spotify_electron.utils.date.date_utils import get_current_iso8601_date
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    DEFAULT_PAGE_LIMIT,
+    Page,
+    get_cursor_after_name,
+    get_page,
+    validate_page_limit,
+)
 
 playlist_service_logger = SpotifyElectronLogger(LOGGING_PLAYLIST_SERVICE).getLogger()
 
@@ -90,6 +103,24 @@ def get_playlist(name: str) -> PlaylistDTO:
         return playlist_dto
 
 
+async def get_playlist_async(name: str) -> PlaylistDTO:
+    """Returns the playlist without blocking the event loop, running get_playlist in\
+        the database executor
+
+    Args:
+        name (str): name of the playlist
+
+    Raises:
+        PlaylistBadNameException: invalid playlist name
+        PlaylistNotFoundException: playlist not found
+        PlaylistServiceException: unexpected error while getting playlist
+
+    Returns:
+        PlaylistDTO: the playlist
+    """
+    return await DatabaseConnectionManager.run_async(get_playlist, name)
+
+
 def create_playlist(
     name: str, photo: str, description: str, song_names: list[str], token: TokenData
 ) -> None:
@@ -128,6 +159,7 @@ def create_playlist(
             owner,
             song_names,
         )
+        SearchEngine.add(SearchItemType.PLAYLIST, name)
         base_user_service.add_playlist_to_owner(
             user_name=owner, playlist_name=name, token=token
         )
@@ -202,6 +234,7 @@ def update_playlist(  # noqa: PLR0913
             description,
             song_names,
         )
+        SearchEngine.rename(SearchItemType.PLAYLIST, name, new_name)
 
         base_user_service.update_playlist_name(name, new_name)
     except PlaylistBadNameException as exception:
@@ -246,6 +279,7 @@ def delete_playlist(name: str) -> None:
         validate_playlist_should_exists(name)
         base_user_service.delete_playlist_from_owner(playlist_name=name)
         playlist_repository.delete_playlist(name)
+        SearchEngine.remove(SearchItemType.PLAYLIST, name)
     except PlaylistBadNameException as exception:
         playlist_service_logger.exception(f"Bad Playlist Name Parameter: {name}")
         raise PlaylistBadNameException from exception
@@ -269,21 +303,39 @@ def delete_playlist(name: str) -> None:
         playlist_service_logger.info(f"Playlist {name} deleted successfully")
 
 
-def get_all_playlist() -> list[PlaylistDTO]:
-    """Gets all playlists
+def get_all_playlist(
+    limit: int = DEFAULT_PAGE_LIMIT, cursor: str | None = None
+) -> Page[PlaylistDTO]:
+    """Gets a page of playlists sorted by name
+
+    Args:
+    ----
+        limit (int, optional): max playlists returned. Defaults to DEFAULT_PAGE_LIMIT.
+        cursor (str | None, optional): cursor of the page, None for the first page.\
+            Defaults to None.
 
     Raises
     ------
+        BadParameterException: invalid limit or cursor
         PlaylistServiceException: unexpected error while getting all playlists
 
     Returns
     -------
-        list[PlaylistDTO]: the list of playlists
+        Page[PlaylistDTO]: the page of playlists
 
     """
     try:
-        playlists = playlist_repository.get_all_playlists()
-        playlists_dto = [get_playlist_dto_from_dao(playlist) for playlist in playlists]
+        validate_page_limit(limit)
+        after_name = get_cursor_after_name(cursor)
+        playlists = playlist_repository.get_all_playlists(limit + 1, after_name)
+        playlists_page = get_page(
+            (get_playlist_dto_from_dao(playlist) for playlist in playlists),
+            limit,
+            lambda playlist: {"after": playlist.name},
+        )
+    except BadParameterException as exception:
+        playlist_service_logger.exception(f"Bad playlists page parameter: {limit}, {cursor}")
+        raise BadParameterException from exception
     except PlaylistRepositoryException as exception:
         playlist_service_logger.exception(
             "Unexpected error in Playlist Repository getting all playlists"
@@ -295,8 +347,35 @@ def get_all_playlist() -> list[PlaylistDTO]:
         )
         raise PlaylistServiceException from exception
     else:
-        playlist_service_logger.info("All Playlists retrieved successfully")
-        return playlists_dto
+        playlist_service_logger.info("Playlists page retrieved successfully")
+        return playlists_page
+
+
+def get_all_playlist_stream(cursor: str | None = None) -> Iterator[PlaylistDTO]:
+    """Gets every playlist after the cursor sorted by name. Playlists are read lazily\
+        from the database while the iterator is consumed
+
+    Args:
+    ----
+        cursor (str | None, optional): cursor of the first page, None to start from the\
+            first playlist. Defaults to None.
+
+    Raises
+    ------
+        BadParameterException: invalid cursor
+
+    Returns
+    -------
+        Iterator[PlaylistDTO]: the playlists
+
+    """
+    try:
+        after_name = get_cursor_after_name(cursor)
+    except BadParameterException as exception:
+        playlist_service_logger.exception(f"Bad playlists cursor: {cursor}")
+        raise BadParameterException from exception
+    playlists = playlist_repository.get_all_playlists(None, after_name)
+    return (get_playlist_dto_from_dao(playlist) for playlist in playlists)
 
 
 def get_selected_playlists(playlist_names: list[str]) -> list[PlaylistDTO]:
@@ -22,8 +22,11 @@ from app.logging.logging_constants import LOGGING_SEARCH_CONTROLLER
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.search.search_schema import (
     BadSearchParameterException,
+    SearchItemType,
+    SearchPage,
     SearchServiceException,
 )
+from app.spotify_electron.utils.search.search_utils import DEFAULT_SEARCH_LIMIT
 
 router = APIRouter(
     prefix="/search",
@@ -34,18 +37,40 @@ search_controller_logger = SpotifyElectronLogger(LOGGING_SEARCH_CONTROLLER).getL
 
 
 @router.get("/")
-async def get_search_name(
+async def get_search_name(  # noqa: PLR0913
     name: str,
     token: Annotated[TokenData | None, Depends(JWTBearer())],
+    songs_limit: int = DEFAULT_SEARCH_LIMIT,
+    songs_cursor: str | None = None,
+    playlists_limit: int = DEFAULT_SEARCH_LIMIT,
+    playlists_cursor: str | None = None,
+    artists_limit: int = DEFAULT_SEARCH_LIMIT,
+    artists_cursor: str | None = None,
+    users_limit: int = DEFAULT_SEARCH_LIMIT,
+    users_cursor: str | None = None,
 ) -> Response:
     """Search for items that partially match name
 
     Args:
     ----
         name (str): name to match
+        songs_limit (int): max songs returned
+        songs_cursor (str | None): cursor of the songs page, returned in `next_cursors`
+        playlists_limit (int): max playlists returned
+        playlists_cursor (str | None): cursor of the playlists page
+        artists_limit (int): max artists returned
+        artists_cursor (str | None): cursor of the artists page
+        users_limit (int): max users returned
+        users_cursor (str | None): cursor of the users page
     """
     try:
-        items = await search_service.search_by_name(name=name)
+        pages = {
+            SearchItemType.SONG: SearchPage(songs_limit, songs_cursor),
+            SearchItemType.PLAYLIST: SearchPage(playlists_limit, playlists_cursor),
+            SearchItemType.ARTIST: SearchPage(artists_limit, artists_cursor),
+            SearchItemType.USER: SearchPage(users_limit, users_cursor),
+        }
+        items = await search_service.search_by_name(name=name, pages=pages)
         items_json = json_converter_utils.get_json_from_model(items)
 
         return Response(items_json, media_type="application/json", status_code=HTTP_200_OK)
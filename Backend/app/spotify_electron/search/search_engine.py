@@ -0,0 +1,545 @@
+"""
+In-memory trigram search engine
+
+Item names are split in trigrams and stored in an inverted index with array backed\
+    posting lists, one index per item type. A search counts how many of the query\
+    trigrams are found in each name, so names with typos still match as long as\
+    most of their trigrams do. Results are ranked by trigram similarity and streams.
+The index is built from the database on startup and kept up to date by the services\
+    that create, rename and delete items. Each app process keeps its own index, so a\
+    background thread rebuilds it from the database every configured interval to find\
+    the items changed by other app processes
+
+Declares SearchEngine global object to be accessed from across the app
+"""
+
+import heapq
+import math
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_SEARCH_ENGINE
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.search.search_schema import SearchEngineStats, SearchItemType
+from app.spotify_electron.utils.search.search_utils import normalize_search_name
+
+search_engine_logger = SpotifyElectronLogger(LOGGING_SEARCH_ENGINE).getLogger()
+
+SEARCH_WORD_PATTERN = re.compile(r"\w+")
+"""Words of a name, everything else separates words"""
+MAX_TRIGRAM_COUNT = 2**16 - 1
+"""Max trigram count stored per item"""
+COMPACTION_MIN_REMOVED_ITEMS = 1000
+"""Removed items that have to accumulate before the posting lists are compacted"""
+
+
+def get_name_trigrams(name: str, is_prefix: bool = False) -> list[str]:
+    """Get the distinct trigrams of a name. Every word is padded with two leading\
+        spaces and a trailing one so word starts and short words have their own trigrams
+
+    Args:
+        name (str): the name
+        is_prefix (bool, optional): whether the last word may be incomplete, its end\
+            is not padded. Defaults to False.
+
+    Returns:
+        list[str]: the distinct trigrams
+    """
+    words = SEARCH_WORD_PATTERN.findall(normalize_search_name(name))
+    is_last_word_incomplete = is_prefix and not name[-1:].isspace()
+    trigrams: dict[str, None] = {}
+    for position, word in enumerate(words):
+        padded_word = f"  {word} "
+        if is_last_word_incomplete and position == len(words) - 1:
+            padded_word = f"  {word}"
+        for start in range(len(padded_word) - 2):
+            trigrams[padded_word[start : start + 3]] = None
+    return list(trigrams)
+
+
+class _SearchIndex:
+    """Trigram inverted index over the names of one item type. Items are identified\
+        by their position, removed items are skipped until the index is compacted"""
+
+    def __init__(self) -> None:
+        self._names: list[str | None] = []
+        self._ids: dict[str, int] = {}
+        self._trigram_counts = array("H")
+        self._streams = array("q")
+        self._postings: dict[str, array] = {}
+        self._max_streams = 0
+        self.removed_items = 0
+        """Removed items still present in the posting lists"""
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    @property
+    def trigrams(self) -> int:
+        """Distinct trigrams indexed"""
+        return len(self._postings)
+
+    @property
+    def postings(self) -> int:
+        """Item ids stored across all posting lists"""
+        return sum(len(posting) for posting in self._postings.values())
+
+    def add(self, name: str, streams: int) -> None:
+        """Add an item, replacing its streams if it's already indexed
+
+        Args:
+            name (str): item name
+            streams (int): item streams
+        """
+        item_id = self._ids.get(name)
+        self._max_streams = max(self._max_streams, streams)
+        if item_id is not None:
+            self._streams[item_id] = streams
+            return
+
+        item_id = len(self._names)
+        trigrams = get_name_trigrams(name)
+        self._names.append(name)
+        self._ids[name] = item_id
+        self._trigram_counts.append(min(len(trigrams), MAX_TRIGRAM_COUNT))
+        self._streams.append(streams)
+        for trigram in trigrams:
+            posting = self._postings.get(trigram)
+            if posting is None:
+                posting = self._postings[trigram] = array("I")
+            posting.append(item_id)
+
+    def remove(self, name: str) -> int:
+        """Remove an item
+
+        Args:
+            name (str): item name
+
+        Returns:
+            int: the streams of the removed item, 0 if it wasn't indexed
+        """
+        item_id = self._ids.pop(name, None)
+        if item_id is None:
+            return 0
+
+        streams = self._streams[item_id]
+        self._names[item_id] = None
+        self.removed_items += 1
+        if self.removed_items >= COMPACTION_MIN_REMOVED_ITEMS and self.removed_items > len(
+            self._ids
+        ):
+            self._compact()
+        return streams
+
+    def add_streams(self, name: str, streams: int) -> None:
+        """Add streams to an item
+
+        Args:
+            name (str): item name
+            streams (int): streams to add
+        """
+        item_id = self._ids.get(name)
+        if item_id is not None:
+            self._streams[item_id] += streams
+            self._max_streams = max(self._max_streams, self._streams[item_id])
+
+    def search(  # noqa: PLR0913
+        self,
+        query_trigrams: list[str],
+        limit: int,
+        offset: int,
+        min_similarity: float,
+        streams_weight: float,
+    ) -> list[str]:
+        """Get the best ranked item names for the query trigrams. Items are ranked\
+            by the share of query trigrams they contain, how close their trigrams\
+            are to the query ones and their streams
+
+        Args:
+            query_trigrams (list[str]): the distinct query trigrams
+            limit (int): max names returned
+            offset (int): best ranked names skipped
+            min_similarity (float): min share of query trigrams an item has to contain
+            streams_weight (float): score added to the most streamed item, the score\
+                of the rest grows with the logarithm of their streams
+
+        Returns:
+            list[str]: the item names, best ranked first
+        """
+        hits: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            posting = self._postings.get(trigram)
+            if posting is not None:
+                hits.update(posting)
+
+        query_size = len(query_trigrams)
+        min_hits = max(1, math.ceil(query_size * min_similarity))
+        names = self._names
+        trigram_counts = self._trigram_counts
+        streams = self._streams
+        streams_scale = (
+            streams_weight / math.log1p(self._max_streams) if self._max_streams > 0 else 0.0
+        )
+        log1p = math.log1p
+        # similarity is the mean of the share of query trigrams found in the name
+        # and the jaccard index between the query and the name trigrams
+        scored_candidates = [
+            (
+                (
+                    item_hits / query_size
+                    + item_hits / (query_size + trigram_counts[item_id] - item_hits)
+                )
+                / 2
+                + streams_scale * log1p(streams[item_id]),
+                item_id,
+            )
+            for item_id, item_hits in hits.items()
+            if item_hits >= min_hits and names[item_id] is not None
+        ]
+        best_candidates = heapq.nlargest(offset + limit, scored_candidates)
+        return [names[item_id] for _, item_id in best_candidates[offset:]]  # type: ignore
+
+    def _compact(self) -> None:
+        """Rebuild the posting lists without the removed items"""
+        compacted_index = _SearchIndex()
+        for name, item_id in self._ids.items():
+            compacted_index.add(name, self._streams[item_id])
+
+        self._names = compacted_index._names
+        self._ids = compacted_index._ids
+        self._trigram_counts = compacted_index._trigram_counts
+        self._streams = compacted_index._streams
+        self._postings = compacted_index._postings
+        self._max_streams = compacted_index._max_streams
+        self.removed_items = 0
+
+
+class _SearchEngine:
+    """Trigram search engine over the names of every searchable item type"""
+
+    def __init__(
+        self,
+        is_enabled: bool,
+        min_similarity: float,
+        streams_weight: float,
+        refresh_interval_seconds: float = 0,
+    ) -> None:
+        self.is_enabled = is_enabled
+        """Whether searches are answered from the engine instead of the database"""
+        self.min_similarity = min_similarity
+        """Min share of the query trigrams a name has to contain to match"""
+        self.streams_weight = streams_weight
+        """Max score added to the most streamed matching item"""
+        self.refresh_interval_seconds = refresh_interval_seconds
+        """Seconds between rebuilds from the stored items, 0 never rebuilds"""
+        self._indexes = {item_type: _SearchIndex() for item_type in SearchItemType}
+        self._is_ready = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._loader: Callable[[], dict[SearchItemType, list[tuple[str, int]]]] | None = None
+        self._thread: threading.Thread | None = None
+        self._is_stopping = False
+        self._wake_up = threading.Event()
+        self._changes: list[tuple[str, SearchItemType, tuple[Any, ...]]] | None = None
+        self._build_time_ms = 0.0
+        self._refreshes = 0
+        self._failed_refreshes = 0
+        self._searches = 0
+        self._total_search_latency_ms = 0.0
+        self._max_search_latency_ms = 0.0
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the engine was built and answers searches"""
+        return self.is_enabled and self._is_ready
+
+    def start(self, loader: Callable[[], dict[SearchItemType, list[tuple[str, int]]]]) -> None:
+        """Start rebuilding the engine in background every refresh interval
+
+        Args:
+            loader (Callable[[], dict[SearchItemType, list[tuple[str, int]]]]): gets the\
+                names and streams of the stored items by type
+        """
+        self._loader = loader
+        if not self.is_enabled or self.refresh_interval_seconds <= 0 or self._thread:
+            return
+        self._is_stopping = False
+        self._wake_up.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="search-engine-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background rebuilds"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._is_stopping = True
+        self._wake_up.set()
+        thread.join()
+        self._thread = None
+
+    def refresh(self) -> bool:
+        """Rebuild the engine from the stored items, keeping the changes made by this\
+            app process while they were loaded
+
+        Returns:
+            bool: if the engine was rebuilt
+        """
+        loader = self._loader
+        if not self.is_enabled or loader is None:
+            return False
+
+        with self._refresh_lock:
+            with self._lock:
+                self._changes = []
+            try:
+                items = loader()
+            except Exception:
+                search_engine_logger.exception("Unexpected error rebuilding search engine")
+                with self._lock:
+                    self._changes = None
+                    self._failed_refreshes += 1
+                return False
+            self.build(items)
+            with self._lock:
+                self._refreshes += 1
+        return True
+
+    def build(self, items: dict[SearchItemType, list[tuple[str, int]]]) -> None:
+        """Build the engine from scratch, replacing every indexed item
+
+        Args:
+            items (dict[SearchItemType, list[tuple[str, int]]]): names and streams\
+                of the items by type
+        """
+        if not self.is_enabled:
+            return
+
+        start = time.perf_counter()
+        indexes = {item_type: _SearchIndex() for item_type in SearchItemType}
+        for item_type, type_items in items.items():
+            index = indexes[item_type]
+            for name, streams in type_items:
+                index.add(name, streams)
+        build_time_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            if self._changes is not None:
+                self._apply_changes(indexes, self._changes)
+                self._changes = None
+            self._indexes = indexes
+            self._is_ready = True
+            self._build_time_ms = build_time_ms
+        search_engine_logger.info(
+            f"Search engine built with {sum(len(index) for index in indexes.values())} "
+            f"items in {build_time_ms:.2f} ms"
+        )
+
+    def contains(self, item_type: SearchItemType, name: str) -> bool:
+        """Returns if an item is indexed. Items added by other app processes are only\
+            indexed after the next refresh
+
+        Args:
+            item_type (SearchItemType): item type
+            name (str): item name
+
+        Returns:
+            bool: if the engine is ready and the item is indexed
+        """
+        if not self.is_ready:
+            return False
+        with self._lock:
+            return name in self._indexes[item_type]
+
+    def add(self, item_type: SearchItemType, name: str, streams: int = 0) -> None:
+        """Add an item
+
+        Args:
+            item_type (SearchItemType): item type
+            name (str): item name
+            streams (int, optional): item streams. Defaults to 0.
+        """
+        if not self.is_enabled:
+            return
+        with self._lock:
+            self._indexes[item_type].add(name, streams)
+            self._record_change("add", item_type, name, streams)
+
+    def remove(self, item_type: SearchItemType, name: str) -> None:
+        """Remove an item
+
+        Args:
+            item_type (SearchItemType): item type
+            name (str): item name
+        """
+        if not self.is_enabled:
+            return
+        with self._lock:
+            self._indexes[item_type].remove(name)
+            self._record_change("remove", item_type, name)
+
+    def rename(self, item_type: SearchItemType, name: str, new_name: str) -> None:
+        """Rename an item keeping its streams
+
+        Args:
+            item_type (SearchItemType): item type
+            name (str): current item name
+            new_name (str): new item name
+        """
+        if not self.is_enabled or name == new_name:
+            return
+        with self._lock:
+            index = self._indexes[item_type]
+            index.add(new_name, index.remove(name))
+            self._record_change("rename", item_type, name, new_name)
+
+    def add_streams(self, item_type: SearchItemType, items_streams: dict[str, int]) -> None:
+        """Add streams to items
+
+        Args:
+            item_type (SearchItemType): item type
+            items_streams (dict[str, int]): streams to add by item name
+        """
+        if not self.is_enabled:
+            return
+        with self._lock:
+            index = self._indexes[item_type]
+            for name, streams in items_streams.items():
+                index.add_streams(name, streams)
+
+    def search(
+        self,
+        name: str,
+        limits: dict[SearchItemType, int],
+        offsets: dict[SearchItemType, int] | None = None,
+    ) -> dict[SearchItemType, list[str]]:
+        """Get the item names that best match a name
+
+        Args:
+            name (str): the name to match, its last word may be incomplete
+            limits (dict[SearchItemType, int]): max names returned by item type,\
+                item types without limit are not searched
+            offsets (dict[SearchItemType, int] | None, optional): best ranked names\
+                skipped by item type. Defaults to None.
+
+        Returns:
+            dict[SearchItemType, list[str]]: the item names by type, best ranked first
+        """
+        start = time.perf_counter()
+        offsets = offsets or {}
+        query_trigrams = get_name_trigrams(name, is_prefix=True)
+        with self._lock:
+            results = {
+                item_type: self._indexes[item_type].search(
+                    query_trigrams,
+                    limit,
+                    offsets.get(item_type, 0),
+                    self.min_similarity,
+                    self.streams_weight,
+                )
+                if query_trigrams
+                else []
+                for item_type, limit in limits.items()
+            }
+            search_latency_ms = (time.perf_counter() - start) * 1000
+            self._searches += 1
+            self._total_search_latency_ms += search_latency_ms
+            self._max_search_latency_ms = max(self._max_search_latency_ms, search_latency_ms)
+        return results
+
+    def get_stats(self) -> SearchEngineStats:
+        """Get the engine state and query counters
+
+        Returns:
+            SearchEngineStats: the engine stats
+        """
+        with self._lock:
+            return SearchEngineStats(
+                is_ready=self.is_ready,
+                items=sum(len(index) for index in self._indexes.values()),
+                removed_items=sum(index.removed_items for index in self._indexes.values()),
+                trigrams=sum(index.trigrams for index in self._indexes.values()),
+                postings=sum(index.postings for index in self._indexes.values()),
+                build_time_ms=self._build_time_ms,
+                searches=self._searches,
+                average_search_latency_ms=self._total_search_latency_ms / self._searches
+                if self._searches
+                else 0.0,
+                max_search_latency_ms=self._max_search_latency_ms,
+                refreshes=self._refreshes,
+                failed_refreshes=self._failed_refreshes,
+            )
+
+    def _record_change(self, operation: str, item_type: SearchItemType, *args: Any) -> None:
+        """Record a change made while the stored items are loaded for a rebuild.\
+            Must be called holding the lock
+
+        Args:
+            operation (str): the change operation, add, remove or rename
+            item_type (SearchItemType): the changed item type
+            *args (Any): the operation arguments
+        """
+        if self._changes is not None:
+            self._changes.append((operation, item_type, args))
+
+    @staticmethod
+    def _apply_changes(
+        indexes: dict[SearchItemType, _SearchIndex],
+        changes: list[tuple[str, SearchItemType, tuple[Any, ...]]],
+    ) -> None:
+        """Apply to rebuilt indexes the changes made while their items were loaded.\
+            Changes the loaded items already contain are skipped, added streams are not\
+            applied as the next rebuild loads them
+
+        Args:
+            indexes (dict[SearchItemType, _SearchIndex]): the rebuilt indexes
+            changes (list[tuple[str, SearchItemType, tuple[Any, ...]]]): the changes\
+                in the order they were made
+        """
+        for operation, item_type, args in changes:
+            index = indexes[item_type]
+            if operation == "add" and args[0] not in index:
+                index.add(*args)
+            elif operation == "remove":
+                index.remove(args[0])
+            elif operation == "rename" and args[0] in index:
+                index.add(args[1], index.remove(args[0]))
+
+    def _run(self) -> None:
+        """Rebuild the engine every refresh interval until stopped"""
+        while not self._is_stopping:
+            self._wake_up.wait(self.refresh_interval_seconds)
+            if not self._is_stopping:
+                self.refresh()
+
+
+SearchEngine = _SearchEngine(
+    is_enabled=bool(int(getattr(PropertiesManager, AppConfig.SEARCH_ENGINE_ENABLED, 0) or 0)),
+    min_similarity=float(
+        getattr(PropertiesManager, AppConfig.SEARCH_ENGINE_MIN_SIMILARITY, 0) or 0
+    ),
+    streams_weight=float(
+        getattr(PropertiesManager, AppConfig.SEARCH_ENGINE_STREAMS_WEIGHT, 0) or 0
+    ),
+    refresh_interval_seconds=float(
+        getattr(PropertiesManager, AppConfig.SEARCH_ENGINE_REFRESH_INTERVAL_SECONDS, 0) or 0
+    ),
+)
+
+metrics_service.register_metrics_provider(
+    "search_engine", lambda: asdict(SearchEngine.get_stats())
+)
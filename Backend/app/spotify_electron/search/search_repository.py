@@ -0,0 +1,220 @@
+"""
+Search repository for managing the search index of the searchable collections
+"""
+
+from typing import Any
+
+from pymongo.collection import Collection
+
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.logging.logging_constants import LOGGING_SEARCH_REPOSITORY
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.playlist.playlist_schema import get_playlist_dao_from_document
+from app.spotify_electron.playlist.providers.playlist_collection_provider import (
+    get_playlist_collection,
+)
+from app.spotify_electron.search.search_schema import (
+    SearchItemsDAO,
+    SearchItemType,
+    SearchRepositoryException,
+)
+from app.spotify_electron.song.base_song_schema import get_song_metadata_dao_from_document
+from app.spotify_electron.user.artist.artist_schema import get_artist_dao_from_document
+from app.spotify_electron.user.user.user_schema import get_user_dao_from_document
+from app.spotify_electron.utils.search.search_utils import (
+    SEARCH_NAME_FIELD,
+    SEARCH_TOKENS_FIELD,
+    backfill_search_fields,
+    get_search_query,
+)
+
+search_repository_logger = SpotifyElectronLogger(LOGGING_SEARCH_REPOSITORY).getLogger()
+
+SEARCH_ITEM_TYPE_FIELD = "search_item_type"
+"""Field added to the matched documents with their item type"""
+
+
+def get_searchable_collections_by_type() -> dict[SearchItemType, tuple[Collection, str]]:
+    """Get the collection and streams field of every searchable item type
+
+    Returns:
+        dict[SearchItemType, tuple[Collection, str]]: the collection and the field\
+            with the item streams by item type
+    """
+    return {
+        SearchItemType.SONG: (song_collection_provider.get_song_collection(), "streams"),
+        SearchItemType.PLAYLIST: (get_playlist_collection(), "streams"),
+        SearchItemType.ARTIST: (
+            user_collection_provider.get_artist_collection(),
+            "total_streams",
+        ),
+        SearchItemType.USER: (user_collection_provider.get_user_collection(), "streams"),
+    }
+
+
+def get_searchable_collections() -> list[Collection]:
+    """Get the collections whose documents can be searched by name
+
+    Returns:
+        list[Collection]: the searchable collections
+    """
+    return [collection for collection, _ in get_searchable_collections_by_type().values()]
+
+
+def get_search_items() -> dict[SearchItemType, list[tuple[str, int]]]:
+    """Get the name and streams of every searchable item. Items without\
+        streams have 0 streams
+
+    Raises:
+        SearchRepositoryException: unexpected error getting the searchable items
+
+    Returns:
+        dict[SearchItemType, list[tuple[str, int]]]: names and streams of the items\
+            by type
+    """
+    try:
+        searchable_collections = get_searchable_collections_by_type()
+        search_items: dict[SearchItemType, list[tuple[str, int]]] = {}
+        for item_type, (collection, streams_field) in searchable_collections.items():
+            documents = collection.find({}, {"_id": 0, "name": 1, streams_field: 1})
+            search_items[item_type] = [
+                (document["name"], document.get(streams_field, 0))
+                for document in documents
+                if "name" in document
+            ]
+    except Exception as exception:
+        search_repository_logger.exception("Unexpected error getting searchable items")
+        raise SearchRepositoryException from exception
+    else:
+        return search_items
+
+
+def get_search_pipeline(
+    item_type: SearchItemType, name: str, limit: int, after_name: str | None
+) -> list[dict[str, Any]]:
+    """Get the aggregation pipeline that matches the documents of an item type.\
+        Documents are sorted by name so the sort and limit only keep the top documents
+
+    Args:
+        item_type (SearchItemType): the item type
+        name (str): the name to match
+        limit (int): max documents matched
+        after_name (str | None): only match documents whose name comes after this one
+
+    Returns:
+        list[dict[str, Any]]: the aggregation pipeline
+    """
+    query = get_search_query(name)
+    if after_name is not None:
+        query["name"] = {"$gt": after_name}
+    return [
+        {"$match": query},
+        {"$sort": {"name": 1}},
+        {"$limit": limit},
+        {"$project": {"_id": 0, SEARCH_NAME_FIELD: 0, SEARCH_TOKENS_FIELD: 0}},
+        {"$addFields": {SEARCH_ITEM_TYPE_FIELD: item_type.value}},
+    ]
+
+
+def search_items_by_name(
+    name: str,
+    limits: dict[SearchItemType, int],
+    after_names: dict[SearchItemType, str | None],
+) -> SearchItemsDAO:
+    """Get the items of every type whose name contains the given name, sorted by name.\
+        Every collection is searched in a single aggregation when the database\
+        supports $unionWith
+
+    Args:
+        name (str): the name to match
+        limits (dict[SearchItemType, int]): max items returned by type
+        after_names (dict[SearchItemType, str | None]): only return items whose name\
+            comes after this one, by type
+
+    Raises:
+        SearchRepositoryException: unexpected error searching items by name
+
+    Returns:
+        SearchItemsDAO: the matched items
+    """
+    try:
+        searchable_collections = get_searchable_collections_by_type()
+        pipelines = {
+            item_type: get_search_pipeline(
+                item_type, name, limits[item_type], after_names.get(item_type)
+            )
+            for item_type in limits
+        }
+
+        documents: list[dict[str, Any]] = []
+        if DatabaseConnectionManager.connection.supports_union_with:
+            first_item_type, *other_item_types = pipelines
+            pipeline = pipelines[first_item_type] + [
+                {
+                    "$unionWith": {
+                        "coll": searchable_collections[item_type][0].name,
+                        "pipeline": pipelines[item_type],
+                    }
+                }
+                for item_type in other_item_types
+            ]
+            documents.extend(searchable_collections[first_item_type][0].aggregate(pipeline))
+        else:
+            for item_type, pipeline in pipelines.items():
+                documents.extend(searchable_collections[item_type][0].aggregate(pipeline))
+
+        documents_by_type: dict[SearchItemType, list[dict[str, Any]]] = {
+            item_type: [] for item_type in SearchItemType
+        }
+        for document in documents:
+            item_type = SearchItemType(document.pop(SEARCH_ITEM_TYPE_FIELD))
+            documents_by_type[item_type].append(document)
+
+        search_items = SearchItemsDAO(
+            artists=[
+                get_artist_dao_from_document(document)
+                for document in documents_by_type[SearchItemType.ARTIST]
+            ],
+            playlists=[
+                get_playlist_dao_from_document(document)
+                for document in documents_by_type[SearchItemType.PLAYLIST]
+            ],
+            users=[
+                get_user_dao_from_document(document)
+                for document in documents_by_type[SearchItemType.USER]
+            ],
+            songs=[
+                get_song_metadata_dao_from_document(document)
+                for document in documents_by_type[SearchItemType.SONG]
+            ],
+        )
+    except Exception as exception:
+        search_repository_logger.exception(f"Unexpected error searching items by name {name}")
+        raise SearchRepositoryException from exception
+    else:
+        return search_items
+
+
+def backfill_search_index() -> int:
+    """Store the search fields on existing documents of every searchable collection
+
+    Raises:
+        SearchRepositoryException: unexpected error backfilling the search index
+
+    Returns:
+        int: the number of updated documents
+    """
+    try:
+        updated_documents = sum(
+            backfill_search_fields(collection) for collection in get_searchable_collections()
+        )
+    except Exception as exception:
+        search_repository_logger.exception("Unexpected error backfilling search index")
+        raise SearchRepositoryException from exception
+    else:
+        search_repository_logger.info(
+            f"Search index backfilled, {updated_documents} documents updated"
+        )
+        return updated_documents
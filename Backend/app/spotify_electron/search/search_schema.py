@@ -2,15 +2,18 @@
 Search schema for domain model
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import StrEnum
 
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
-from app.spotify_electron.playlist.playlist_schema import PlaylistDTO
-from app.spotify_electron.song.base_song_schema import SongMetadataDTO
-from app.spotify_electron.user.artist.artist_schema import ArtistDTO
-from app.spotify_electron.user.user.user_schema import UserDTO
+from app.spotify_electron.playlist.playlist_schema import PlaylistDAO, PlaylistDTO
+from app.spotify_electron.song.base_song_schema import SongMetadataDAO, SongMetadataDTO
+from app.spotify_electron.user.artist.artist_schema import ArtistDAO, ArtistDTO
+from app.spotify_electron.user.user.user_schema import UserDAO, UserDTO
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class SearchResult:
     """Class that contains the outcome of search operation"""
@@ -19,6 +22,71 @@ class SearchResult:
     playlists: list[PlaylistDTO]
     users: list[UserDTO]
     songs: list[SongMetadataDTO]
+    next_cursors: dict[str, str | None] = field(default_factory=dict)
+    """Cursor of the next page of artists, playlists, users and songs,\
+        None when there are no more items"""
+
+
+@dataclass
+class SearchItemsDAO:
+    """Items that matched a search in the persistence layer"""
+
+    artists: list[ArtistDAO]
+    playlists: list[PlaylistDAO]
+    users: list[UserDAO]
+    songs: list[SongMetadataDAO]
+
+
+@dataclass
+class SearchPage:
+    """Page of items requested for an item type"""
+
+    limit: int
+    """Max items returned"""
+    cursor: str | None = None
+    """Cursor returned with the previous page, None for the first page"""
+
+
+class SearchItemType(StrEnum):
+    """Types of items that can be searched by name"""
+
+    SONG = "song"
+    PLAYLIST = "playlist"
+    ARTIST = "artist"
+    USER = "user"
+
+    @property
+    def result_field(self) -> str:
+        """Search result field with the items of this type"""
+        return f"{self.value}s"
+
+
+@dataclass
+class SearchEngineStats:
+    """Search engine state and query counters"""
+
+    is_ready: bool
+    """Whether the search engine was built and answers searches"""
+    items: int
+    """Items that can be found"""
+    removed_items: int
+    """Removed items still present in the posting lists until compaction"""
+    trigrams: int
+    """Distinct trigrams indexed"""
+    postings: int
+    """Item ids stored across all posting lists"""
+    build_time_ms: float
+    """Milliseconds spent on the last bulk build"""
+    searches: int
+    """Searches answered since startup"""
+    average_search_latency_ms: float
+    """Average milliseconds spent answering a search"""
+    max_search_latency_ms: float
+    """Slowest search answered in milliseconds"""
+    refreshes: int
+    """Rebuilds from the stored items since startup"""
+    failed_refreshes: int
+    """Rebuilds that could not load the stored items"""
 
 
 class BadSearchParameterException(SpotifyElectronException):
@@ -37,3 +105,12 @@ class SearchServiceException(SpotifyElectronException):
 
     def __init__(self):
         super().__init__(self.ERROR)
+
+
+class SearchRepositoryException(SpotifyElectronException):
+    """Unexpected error in repository"""
+
+    ERROR = "Unexpected error in search repository"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
@@ -3,32 +3,65 @@ Search service for handling business logic
 """
 
 import asyncio
+from typing import Any, Protocol, TypeVar
 
 import app.spotify_electron.playlist.playlist_service as playlist_service
+import app.spotify_electron.search.search_repository as search_repository
 import app.spotify_electron.song.base_song_service as base_song_service
 import app.spotify_electron.user.artist.artist_service as artist_service
 import app.spotify_electron.user.user.user_service as user_service
 from app.exceptions.base_exceptions_schema import BadParameterException
 from app.logging.logging_constants import LOGGING_SEARCH_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.playlist.playlist_schema import get_playlist_dto_from_dao
+from app.spotify_electron.search.search_engine import SearchEngine
 from app.spotify_electron.search.search_schema import (
     BadSearchParameterException,
+    SearchItemType,
+    SearchPage,
+    SearchRepositoryException,
     SearchResult,
     SearchServiceException,
 )
+from app.spotify_electron.song.base_song_schema import get_song_metadata_dto_from_dao
+from app.spotify_electron.user.artist.artist_schema import get_artist_dto_from_dao
+from app.spotify_electron.user.user.user_schema import (
+    get_user_dto_from_dao,
+)
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    decode_cursor,
+    encode_cursor,
+)
+from app.spotify_electron.utils.search.search_utils import (
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+)
 from app.spotify_electron.utils.validations.validation_utils import validate_parameter
 
 search_service_logger = SpotifyElectronLogger(LOGGING_SEARCH_SERVICE).getLogger()
 
 
-async def search_by_name(name: str) -> SearchResult:
+class NamedItem(Protocol):
+    """Item identified by its name"""
+
+    name: str
+
+
+NamedItemT = TypeVar("NamedItemT", bound=NamedItem)
+
+
+async def search_by_name(
+    name: str, pages: dict[SearchItemType, SearchPage] | None = None
+) -> SearchResult:
     """Return items that partially match the given name
 
     Args:
         name (str): the name to match
+        pages (dict[SearchItemType, SearchPage] | None, optional): the requested page\
+            of every item type. Defaults to None, the first page of every item type.
 
     Raises:
-        BadParameterException: if the name is invalid
+        BadParameterException: if the name, a limit or a cursor are invalid
         SearchServiceException: unexpected error getting items by name
 
     Returns:
@@ -36,19 +69,19 @@ async def search_by_name(name: str) -> SearchResult:
     """
     try:
         validate_parameter(name)
+        if pages is None:
+            pages = {
+                item_type: SearchPage(DEFAULT_SEARCH_LIMIT) for item_type in SearchItemType
+            }
+        positions = get_page_positions(pages)
 
-        songs_future = asyncio.to_thread(base_song_service.search_by_name, name)
-        playlists_future = asyncio.to_thread(playlist_service.search_by_name, name)
-        artists_future = asyncio.to_thread(artist_service.search_by_name, name)
-        users_future = asyncio.to_thread(user_service.search_by_name, name)
-
-        songs = await songs_future
-        playlists = await playlists_future
-        artists = await artists_future
-        users = await users_future
+        if SearchEngine.is_ready:
+            search_results = await search_by_name_from_engine(name, pages, positions)
+        else:
+            search_results = await search_by_name_from_database(name, pages, positions)
 
     except BadParameterException as exception:
-        search_service_logger.exception(f"Bad Search parameter: {name}")
+        search_service_logger.exception(f"Bad Search parameter: {name}, {pages}")
         raise BadSearchParameterException from exception
     except Exception as exception:
         search_service_logger.exception(
@@ -56,8 +89,210 @@ async def search_by_name(name: str) -> SearchResult:
         )
         raise SearchServiceException from exception
     else:
-        search_results = SearchResult(artists, playlists, users, songs)
         search_service_logger.info(
             f"Items searched by name {name} retrieved successfully: {search_results}"
         )
         return search_results
+
+
+def get_page_positions(
+    pages: dict[SearchItemType, SearchPage],
+) -> dict[SearchItemType, dict[str, Any]]:
+    """Validate the requested pages and get the position where each one starts
+
+    Args:
+        pages (dict[SearchItemType, SearchPage]): the requested page of every item type
+
+    Raises:
+        BadParameterException: if a limit or a cursor are invalid
+
+    Returns:
+        dict[SearchItemType, dict[str, Any]]: the page start positions by item type
+    """
+    positions: dict[SearchItemType, dict[str, Any]] = {}
+    for item_type, page in pages.items():
+        if not 1 <= page.limit <= MAX_SEARCH_LIMIT:
+            raise BadParameterException(str(page.limit))
+        positions[item_type] = {} if page.cursor is None else decode_cursor(page.cursor)
+    return positions
+
+
+async def search_by_name_from_engine(
+    name: str,
+    pages: dict[SearchItemType, SearchPage],
+    positions: dict[SearchItemType, dict[str, Any]],
+) -> SearchResult:
+    """Return the items that best match the given name according to the search engine,\
+        best ranked first
+
+    Args:
+        name (str): the name to match
+        pages (dict[SearchItemType, SearchPage]): the requested page of every item type
+        positions (dict[SearchItemType, dict[str, Any]]): the page start positions
+
+    Raises:
+        BadParameterException: if a page position is invalid
+
+    Returns:
+        SearchResult: the items that match the name
+    """
+    offsets: dict[SearchItemType, int] = {}
+    for item_type, position in positions.items():
+        offset = position.get("offset", 0)
+        if not isinstance(offset, int) or offset < 0:
+            raise BadParameterException(str(position))
+        offsets[item_type] = offset
+
+    names = SearchEngine.search(
+        name, {item_type: page.limit + 1 for item_type, page in pages.items()}, offsets
+    )
+    next_cursors: dict[str, str | None] = {}
+    for item_type, page in pages.items():
+        has_next_page = len(names[item_type]) > page.limit
+        names[item_type] = names[item_type][: page.limit]
+        next_cursors[item_type.result_field] = (
+            encode_cursor({"offset": offsets[item_type] + page.limit})
+            if has_next_page
+            else None
+        )
+    for item_type in SearchItemType:
+        names.setdefault(item_type, [])
+
+    songs_future = asyncio.to_thread(
+        base_song_service.get_songs_metadata, names[SearchItemType.SONG]
+    )
+    playlists_future = asyncio.to_thread(
+        playlist_service.get_selected_playlists, names[SearchItemType.PLAYLIST]
+    )
+    artists_future = asyncio.to_thread(
+        artist_service.get_artists, names[SearchItemType.ARTIST]
+    )
+    users_future = asyncio.to_thread(user_service.get_users, names[SearchItemType.USER])
+
+    return SearchResult(
+        artists=get_ranked_items(SearchItemType.ARTIST, await artists_future, names),
+        playlists=get_ranked_items(SearchItemType.PLAYLIST, await playlists_future, names),
+        users=get_ranked_items(SearchItemType.USER, await users_future, names),
+        songs=get_ranked_items(SearchItemType.SONG, await songs_future, names),
+        next_cursors=next_cursors,
+    )
+
+
+async def search_by_name_from_database(
+    name: str,
+    pages: dict[SearchItemType, SearchPage],
+    positions: dict[SearchItemType, dict[str, Any]],
+) -> SearchResult:
+    """Return the items whose name contains the given name, sorted by name
+
+    Args:
+        name (str): the name to match
+        pages (dict[SearchItemType, SearchPage]): the requested page of every item type
+        positions (dict[SearchItemType, dict[str, Any]]): the page start positions
+
+    Raises:
+        BadParameterException: if a page position is invalid
+        SearchRepositoryException: unexpected error searching items by name
+
+    Returns:
+        SearchResult: the items that match the name
+    """
+    after_names: dict[SearchItemType, str | None] = {}
+    for item_type, position in positions.items():
+        after_name = position.get("after")
+        if after_name is not None and not isinstance(after_name, str):
+            raise BadParameterException(str(position))
+        after_names[item_type] = after_name
+
+    search_items = await asyncio.to_thread(
+        search_repository.search_items_by_name,
+        name,
+        {item_type: page.limit + 1 for item_type, page in pages.items()},
+        after_names,
+    )
+
+    next_cursors: dict[str, str | None] = {}
+    for item_type, page in pages.items():
+        items = getattr(search_items, item_type.result_field)
+        has_next_page = len(items) > page.limit
+        del items[page.limit :]
+        next_cursors[item_type.result_field] = (
+            encode_cursor({"after": items[-1].name}) if has_next_page else None
+        )
+
+    return SearchResult(
+        artists=[get_artist_dto_from_dao(artist) for artist in search_items.artists],
+        playlists=[get_playlist_dto_from_dao(playlist) for playlist in search_items.playlists],
+        users=[get_user_dto_from_dao(user) for user in search_items.users],
+        songs=[get_song_metadata_dto_from_dao(song) for song in search_items.songs],
+        next_cursors=next_cursors,
+    )
+
+
+def get_ranked_items(
+    item_type: SearchItemType,
+    items: list[NamedItemT],
+    names: dict[SearchItemType, list[str]],
+) -> list[NamedItemT]:
+    """Sort items in the search engine ranking order. Names without an item were\
+        deleted from another app process and are removed from the search engine
+
+    Args:
+        item_type (SearchItemType): the items type
+        items (list[NamedItemT]): the retrieved items
+        names (dict[SearchItemType, list[str]]): the ranked item names by type
+
+    Returns:
+        list[NamedItemT]: the items in ranking order
+    """
+    items_by_name = {item.name: item for item in items}
+    ranked_items: list[NamedItemT] = []
+    for name in names[item_type]:
+        item = items_by_name.get(name)
+        if item is None:
+            SearchEngine.remove(item_type, name)
+            continue
+        ranked_items.append(item)
+    return ranked_items
+
+
+def init_search_engine() -> None:
+    """Build the search engine from the stored items and start rebuilding it in\
+        background
+
+    Raises:
+        SearchServiceException: unexpected error building the search engine
+    """
+    if not SearchEngine.is_enabled:
+        return
+    try:
+        SearchEngine.build(search_repository.get_search_items())
+    except SearchRepositoryException as exception:
+        search_service_logger.exception(
+            "Unexpected error in Search Repository building search engine"
+        )
+        raise SearchServiceException from exception
+    SearchEngine.start(search_repository.get_search_items)
+
+
+def backfill_search_index() -> int:
+    """Store the search fields on documents created before the search index existed
+
+    Raises:
+        SearchServiceException: unexpected error backfilling the search index
+
+    Returns:
+        int: the number of updated documents
+    """
+    try:
+        updated_documents = search_repository.backfill_search_index()
+    except SearchRepositoryException as exception:
+        search_service_logger.exception(
+            "Unexpected error in Search Repository backfilling search index"
+        )
+        raise SearchServiceException from exception
+    else:
+        search_service_logger.info(
+            f"Search index backfilled, {updated_documents} documents updated"
+        )
+        return updated_documents
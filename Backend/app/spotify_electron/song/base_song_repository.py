@@ -3,6 +3,11 @@ Song repository for managing common persisted data regardless of the current arc
 The repository will only handle Song metadata
 """
 
+from collections.abc import Iterator
+
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
+
 import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
 from app.logging.logging_constants import (
     LOGGING_BASE_SONG_REPOSITORY,
@@ -14,6 +19,8 @@ from app.spotify_electron.song.base_song_schema import (
     SongMetadataDAO,
     SongNotFoundException,
     SongRepositoryException,
+    SongsMetadataByNamesDAO,
+    SongsStreamsIncreaseDAO,
     get_song_metadata_dao_from_document,
 )
 from app.spotify_electron.song.providers.song_collection_provider import (
@@ -23,6 +30,14 @@ from app.spotify_electron.song.validations.base_song_repository_validations impo
     validate_song_delete_count,
     validate_song_exists,
 )
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    PAGE_SORT_FIELD,
+    get_keyset_query,
+)
+from app.spotify_electron.utils.search.search_utils import (
+    DEFAULT_SEARCH_LIMIT,
+    get_search_query,
+)
 
 song_repository_logger = SpotifyElectronLogger(LOGGING_BASE_SONG_REPOSITORY).getLogger()
 
@@ -81,6 +96,48 @@ def get_song_metadata(name: str) -> SongMetadataDAO:
         return song_dao
 
 
+def get_songs_metadata_by_names(names: list[str]) -> SongsMetadataByNamesDAO:
+    """Get multiple songs metadata from database in a single query
+
+    Args:
+        names (list[str]): song names, repeated names are returned repeated
+
+    Raises:
+        SongRepositoryException: unexpected error getting songs metadata
+
+    Returns:
+        SongsMetadataByNamesDAO: the songs metadata in the requested order\
+            and the names that were not found
+    """
+    if not names:
+        return SongsMetadataByNamesDAO(songs=[], missing_names=[])
+    try:
+        collection = song_collection_provider.get_song_collection()
+        songs = collection.find(
+            {"name": {"$in": list(set(names))}},
+            {
+                "_id": 0,
+                "name": 1,
+                "photo": 1,
+                "artist": 1,
+                "duration": 1,
+                "genre": 1,
+                "streams": 1,
+            },
+        )
+        songs_by_name = {
+            song["name"]: get_song_metadata_dao_from_document(song) for song in songs
+        }
+    except Exception as exception:
+        song_repository_logger.exception(f"Error getting Songs metadata {names} from database")
+        raise SongRepositoryException from exception
+    else:
+        return SongsMetadataByNamesDAO(
+            songs=[songs_by_name[name] for name in names if name in songs_by_name],
+            missing_names=[name for name in names if name not in songs_by_name],
+        )
+
+
 def delete_song(name: str) -> None:
     """Deletes a song
 
@@ -127,56 +184,130 @@ def get_artist_from_song(name: str) -> str:
         raise SongRepositoryException from exception
 
 
-def increase_song_streams(name: str) -> None:
-    """Increase number of song streams
+def increase_songs_streams(songs_streams: dict[str, int]) -> SongsStreamsIncreaseDAO:  # noqa: C901
+    """Increase streams of multiple songs in a single bulk write. Song artists are\
+        looked up before writing, so a failed lookup stores nothing, and streams of\
+        songs that don't exist are dropped. Streams of the updates rejected by the\
+        database are returned to be retried, while streams of a write interrupted in\
+        an unknown state are logged and dropped, as retrying them could count them twice
 
     Args:
-        name (str): song name
+        songs_streams (dict[str, int]): streams to add by song name
+
+    Raises:
+        SongRepositoryException: unexpected error increasing songs streams, no\
+            streams were stored
+
+    Returns:
+        SongsStreamsIncreaseDAO: the streams added by artist and the songs streams\
+            that were not stored
     """
+    if not songs_streams:
+        return SongsStreamsIncreaseDAO(artists_streams={}, failed_songs_streams={})
+    song_names = list(songs_streams)
     try:
         collection = song_collection_provider.get_song_collection()
-        collection.update_one({"name": name}, {"$inc": {"streams": 1}})
-    except SongRepositoryException as exception:
+        songs_artists = {
+            song["name"]: song["artist"]
+            for song in collection.find(
+                {"name": {"$in": song_names}}, {"_id": 0, "name": 1, "artist": 1}
+            )
+        }
+    except Exception as exception:
         song_repository_logger.exception(
-            f"Unexpected error increasing stream count for artist {name} in database"
+            f"Unexpected error getting artists of songs {song_names} from database"
         )
         raise SongRepositoryException from exception
 
+    missing_song_names = [name for name in song_names if name not in songs_artists]
+    if missing_song_names:
+        song_repository_logger.warning(
+            f"Dropping streams of songs {missing_song_names} that don't exist in database"
+        )
+        song_names = [name for name in song_names if name in songs_artists]
+        if not song_names:
+            return SongsStreamsIncreaseDAO(artists_streams={}, failed_songs_streams={})
+
+    failed_songs_streams: dict[str, int] = {}
+    try:
+        collection.bulk_write(
+            [
+                UpdateOne({"name": name}, {"$inc": {"streams": songs_streams[name]}})
+                for name in song_names
+            ],
+            ordered=False,
+        )
+    except BulkWriteError as exception:
+        for write_error in exception.details.get("writeErrors", []):
+            name = song_names[write_error["index"]]
+            failed_songs_streams[name] = songs_streams[name]
+        song_repository_logger.exception(
+            f"Stream count of songs {list(failed_songs_streams)} could not be increased "
+            "in database"
+        )
+    except ServerSelectionTimeoutError as exception:
+        song_repository_logger.exception(
+            f"Database unavailable increasing stream count for songs {song_names}"
+        )
+        raise SongRepositoryException from exception
+    except Exception:
+        song_repository_logger.exception(
+            f"Unexpected error increasing stream count for songs {song_names} in database, "
+            f"streams {songs_streams} may have been partially stored and are not retried"
+        )
+        return SongsStreamsIncreaseDAO(artists_streams={}, failed_songs_streams={})
+
+    artists_streams: dict[str, int] = {}
+    for name, artist in songs_artists.items():
+        if name not in failed_songs_streams:
+            artists_streams[artist] = artists_streams.get(artist, 0) + songs_streams[name]
+    return SongsStreamsIncreaseDAO(
+        artists_streams=artists_streams, failed_songs_streams=failed_songs_streams
+    )
+
 
-def get_artist_total_streams(artist_name: str) -> int:
-    """Get artist total streams
+def get_artists_total_streams(artist_names: list[str]) -> dict[str, int]:
+    """Get total streams of multiple artists in a single aggregation
 
     Args:
-        artist_name (str): artist name
+        artist_names (list[str]): artist names
+
+    Raises:
+        SongRepositoryException: unexpected error getting artists total streams
 
     Returns:
-        int: the number of total streams of artist songs
+        dict[str, int]: total streams by artist name, artists without songs have 0 streams
     """
+    if not artist_names:
+        return {}
     try:
         collection = get_song_collection()
         result_total_streams_query = collection.aggregate(
             [
-                {"$match": {"artist": artist_name}},
-                {"$group": {"_id": None, "total": {"$sum": "$streams"}}},
+                {"$match": {"artist": {"$in": list(set(artist_names))}}},
+                {"$group": {"_id": "$artist", "total": {"$sum": "$streams"}}},
             ]
         )
-        result_total_streams_query = next(result_total_streams_query, None)
-
-        if result_total_streams_query is None:
-            return 0
-        return result_total_streams_query["total"]
-    except SongRepositoryException as exception:
+        total_streams = {
+            result["_id"]: result["total"] for result in result_total_streams_query
+        }
+    except Exception as exception:
         song_repository_logger.exception(
-            f"Unexpected error gettig artist {artist_name} total streams in database"
+            f"Unexpected error getting artists {artist_names} total streams in database"
         )
         raise SongRepositoryException from exception
+    else:
+        return {artist_name: total_streams.get(artist_name, 0) for artist_name in artist_names}
 
 
-def get_song_names_search_by_name(song_name: str) -> list[str]:
+def get_song_names_search_by_name(
+    song_name: str, limit: int = DEFAULT_SEARCH_LIMIT
+) -> list[str]:
     """Get song names when searching by name
 
     Args:
         song_name (str): song name to match
+        limit (int, optional): max song names returned. Defaults to DEFAULT_SEARCH_LIMIT.
 
     Returns:
         list[str]: list of song names that matched the song name
@@ -184,8 +315,8 @@ def get_song_names_search_by_name(song_name: str) -> list[str]:
     try:
         collection = song_collection_provider.get_song_collection()
         song_names_response = collection.find(
-            {"name": {"$regex": song_name, "$options": "i"}}, {"_id": 0, "name": 1}
-        )
+            get_search_query(song_name), {"_id": 0, "name": 1}
+        ).limit(limit)
         return [song["name"] for song in song_names_response]  # type: ignore
     except SongRepositoryException as exception:
         song_repository_logger.exception(
@@ -194,23 +325,32 @@ def get_song_names_search_by_name(song_name: str) -> list[str]:
         raise SongRepositoryException from exception
 
 
-def get_songs_metadata_by_genre(genre: str) -> list[SongMetadataDAO]:
-    """Get songs metadata by genre
+def get_songs_metadata_by_genre(
+    genre: str, limit: int | None, after_name: str | None = None
+) -> Iterator[SongMetadataDAO]:
+    """Get songs metadata by genre sorted by name. Songs are read lazily from the database
 
     Args:
         genre (str): genre to match
+        limit (int | None): max songs returned, None returns every song
+        after_name (str | None, optional): only return songs whose name comes after\
+            this one. Defaults to None.
 
     Raises:
         SongRepositoryException: unexpected error getting song metadatas from genre
 
-    Returns:
-        list[SongMetadataDAO]: list of song metadatas with selected genre
+    Yields:
+        SongMetadataDAO: the song metadatas with selected genre
     """
-    collection = song_collection_provider.get_song_collection()
-    result_get_song_by_genre = collection.find({"genre": genre})
     try:
-        return [
-            SongMetadataDAO(
+        collection = song_collection_provider.get_song_collection()
+        result_get_song_by_genre = collection.find(
+            get_keyset_query({"genre": genre}, after_name)
+        ).sort(PAGE_SORT_FIELD, ASCENDING)
+        if limit is not None:
+            result_get_song_by_genre = result_get_song_by_genre.limit(limit)
+        for song_data in result_get_song_by_genre:
+            yield SongMetadataDAO(
                 name=song_data["name"],
                 artist=song_data["artist"],
                 photo=song_data["photo"],
@@ -218,9 +358,7 @@ def get_songs_metadata_by_genre(genre: str) -> list[SongMetadataDAO]:
                 genre=Genre(song_data["genre"]),
                 streams=song_data["streams"],
             )
-            for song_data in result_get_song_by_genre
-        ]
-    except SongRepositoryException as exception:
+    except Exception as exception:
         song_repository_logger.exception(
             f"Unexpected error getting songs metadata by genre {genre} in database"
         )
@@ -10,6 +10,7 @@ from typing import Any
 
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
 from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
 @dataclass
@@ -41,11 +42,53 @@ class SongMetadataDAO(BaseSongDAO):
     """Represents Song metadata in the persistence transfering layer"""
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class SongMetadataDTO(BaseSongDTO):
     """Represents Song metadata in the endpoints transfering layer"""
 
 
+@dataclass
+class SongsMetadataByNamesDAO:
+    """Result of getting multiple songs metadata by name"""
+
+    songs: list[SongMetadataDAO]
+    """Songs metadata found, in the requested names order"""
+    missing_names: list[str]
+    """Requested names without a stored song"""
+
+
+@dataclass
+class SongsStreamsIncreaseDAO:
+    """Result of increasing streams of multiple songs"""
+
+    artists_streams: dict[str, int]
+    """Streams added by artist name"""
+    failed_songs_streams: dict[str, int]
+    """Streams by song name that were not added and can be retried"""
+
+
+@dataclass
+class SongStreamsBufferStats:
+    """Usage stats of the song streams buffer"""
+
+    pending_streams: int
+    """Song streams waiting to be stored"""
+    pending_songs: int
+    """Songs with streams waiting to be stored"""
+    flushed_streams: int
+    """Song streams stored"""
+    flushes: int
+    """Successful flushes"""
+    failed_flushes: int
+    """Flushes that failed fully or partially, their streams that were not stored are\
+        retried on the next flush"""
+    last_flush_latency_ms: float
+    """Duration of the last flush"""
+    max_flush_latency_ms: float
+    """Duration of the slowest flush"""
+
+
 def get_song_metadata_dao_from_document(document: dict[str, Any]) -> SongMetadataDAO:
     """Get SongMetadataDAO from document
 
@@ -166,3 +209,21 @@ class SongUnAuthorizedException(SpotifyElectronException):
 
     def __init__(self):
         super().__init__(self.ERROR)
+
+
+class SongBadFileException(SpotifyElectronException):
+    """Song file is not an audio file"""
+
+    ERROR = "Song file is not a supported audio file"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
+
+
+class SongFileTooLargeException(SpotifyElectronException):
+    """Song file bigger than the upload limit"""
+
+    ERROR = "Song file exceeds the upload size limit"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
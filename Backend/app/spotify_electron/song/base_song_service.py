@@ -5,11 +5,16 @@ Handles common methods between all song architectures
 Redirects to the specific architecture service in case the method is not common
 """
 
+from collections.abc import Iterator
+
 import app.spotify_electron.song.base_song_repository as base_song_repository
-import app.spotify_electron.user.validations.base_user_service_validations as base_user_service_validations  # noqa: E501
+import app.spotify_electron.user.artist.artist_service as artist_service
+from app.exceptions.base_exceptions_schema import BadParameterException
 from app.logging.logging_constants import LOGGING_BASE_SONG_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.genre.genre_schema import Genre, GenreNotValidException
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.song.base_song_schema import (
     SongBadNameException,
     SongMetadataDTO,
@@ -19,11 +24,19 @@ from app.spotify_electron.song.base_song_schema import (
     get_song_metadata_dto_from_dao,
 )
 from app.spotify_electron.song.providers.song_service_provider import get_song_service
+from app.spotify_electron.song.song_streams_buffer import SongStreamsBuffer
 from app.spotify_electron.song.validations.base_song_service_validations import (
     validate_song_name_parameter,
     validate_song_should_exists,
 )
-from app.spotify_electron.user.user.user_schema import UserNotFoundException
+from app.spotify_electron.user.user.user_schema import UserServiceException
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    DEFAULT_PAGE_LIMIT,
+    Page,
+    get_cursor_after_name,
+    get_page,
+    validate_page_limit,
+)
 
 base_song_service_logger = SpotifyElectronLogger(LOGGING_BASE_SONG_SERVICE).getLogger()
 
@@ -91,7 +104,8 @@ def delete_song(name: str) -> None:
 
 
 def get_songs_metadata(song_names: list[str]) -> list[SongMetadataDTO]:
-    """Get multiple songs metadata
+    """Get multiple songs metadata in the requested order. Songs that no longer\
+        exist are skipped
 
     Args:
         song_names (list[str]): list of song names
@@ -103,7 +117,12 @@ def get_songs_metadata(song_names: list[str]) -> list[SongMetadataDTO]:
         list[SongMetadataDTO]: list of songs metadata
     """
     try:
-        return [get_song_metadata(song_name) for song_name in song_names]
+        songs_metadata = base_song_repository.get_songs_metadata_by_names(song_names)
+        if songs_metadata.missing_names:
+            base_song_service_logger.warning(
+                f"Songs not found getting songs metadata: {songs_metadata.missing_names}"
+            )
+        return [get_song_metadata_dto_from_dao(song_dao) for song_dao in songs_metadata.songs]
     except SongRepositoryException as exception:
         base_song_service_logger.exception(
             f"Unexpected error in Song Repository getting songs metadata for: {song_names}"
@@ -117,7 +136,10 @@ def get_songs_metadata(song_names: list[str]) -> list[SongMetadataDTO]:
 
 
 def increase_song_streams(name: str) -> None:
-    """Increase by one the streams of a song
+    """Increase by one the streams of a song. The stream is buffered and stored\
+        later along with its artist total streams. Only songs missing from the search\
+        engine are checked against the database, streams of songs deleted meanwhile\
+        are dropped when stored
 
     Args:
         name (str): song name
@@ -127,8 +149,9 @@ def increase_song_streams(name: str) -> None:
         SongServiceException: unexpected error increasing song streams
     """
     try:
-        validate_song_should_exists(name)
-        base_song_repository.increase_song_streams(name)
+        if not SearchEngine.contains(SearchItemType.SONG, name):
+            validate_song_should_exists(name)
+        SongStreamsBuffer.add(name)
     except SongNotFoundException as exception:
         base_song_service_logger.exception(f"Song not found: {name}")
         raise SongNotFoundException from exception
@@ -144,6 +167,48 @@ def increase_song_streams(name: str) -> None:
         raise SongServiceException from exception
 
 
+def store_songs_streams(songs_streams: dict[str, int]) -> dict[str, int]:
+    """Store buffered song streams and add them to their artists total streams.\
+        Artists total streams that fail to be stored are fixed by the repair job
+
+    Args:
+        songs_streams (dict[str, int]): streams to add by song name
+
+    Raises:
+        SongServiceException: unexpected error storing songs streams, no streams\
+            were stored
+
+    Returns:
+        dict[str, int]: streams by song name that were not stored and can be retried
+    """
+    try:
+        songs_streams_increase = base_song_repository.increase_songs_streams(songs_streams)
+    except SongRepositoryException as exception:
+        base_song_service_logger.exception(
+            f"Unexpected error in Song Repository storing songs {list(songs_streams)} streams"
+        )
+        raise SongServiceException from exception
+
+    failed_songs_streams = songs_streams_increase.failed_songs_streams
+    SearchEngine.add_streams(
+        SearchItemType.SONG,
+        {
+            name: streams
+            for name, streams in songs_streams.items()
+            if name not in failed_songs_streams
+        },
+    )
+    artists_streams = songs_streams_increase.artists_streams
+    try:
+        artist_service.increase_streams_artists(artists_streams)
+    except UserServiceException:
+        base_song_service_logger.exception(
+            f"Unexpected error in Artist Service storing artists {list(artists_streams)} "
+            "streams, run the artist streams repair job"
+        )
+    return failed_songs_streams
+
+
 def search_by_name(name: str) -> list[SongMetadataDTO]:
     """Search song items that match a name
 
@@ -159,59 +224,71 @@ def search_by_name(name: str) -> list[SongMetadataDTO]:
     return get_songs_metadata(song_names)
 
 
-def get_artist_streams(artist_name: str) -> int:
-    """Get artist songs total streams
+def get_artists_streams(artist_names: list[str]) -> dict[str, int]:
+    """Get total streams of multiple artists
 
     Args:
-        artist_name (str): artist name
+        artist_names (list[str]): artist names
 
     Raises:
-        UserNotFoundException: artist doesn't exists
-        SongServiceException: unexpected error getting artist songs total streams
+        SongServiceException: unexpected error getting artists total streams
 
     Returns:
-        int: the number of streams for the artists songs
+        dict[str, int]: total streams by artist name
     """
     try:
-        base_user_service_validations.validate_user_should_exists(artist_name)
-        return base_song_repository.get_artist_total_streams(artist_name)
-    except UserNotFoundException as exception:
-        base_song_service_logger.exception(f"User not found: {artist_name}")
-        raise UserNotFoundException from exception
+        return base_song_repository.get_artists_total_streams(artist_names)
     except SongRepositoryException as exception:
         base_song_service_logger.exception(
             f"Unexpected error in Song Repository while getting "
-            f"total artist {artist_name} streams"
+            f"total artists {artist_names} streams"
         )
         raise SongServiceException from exception
     except Exception as exception:
         base_song_service_logger.exception(
             f"Unexpected error in Song Service while getting "
-            f"total artist {artist_name} streams"
+            f"total artists {artist_names} streams"
         )
         raise SongServiceException from exception
 
 
-def get_songs_by_genre(genre: Genre) -> list[SongMetadataDTO]:
-    """Get songs by genre
+def get_songs_by_genre(
+    genre: Genre, limit: int = DEFAULT_PAGE_LIMIT, cursor: str | None = None
+) -> Page[SongMetadataDTO]:
+    """Get a page of songs by genre sorted by name
 
     Args:
         genre (Genre): the genre
+        limit (int, optional): max songs returned. Defaults to DEFAULT_PAGE_LIMIT.
+        cursor (str | None, optional): cursor of the page, None for the first page.\
+            Defaults to None.
 
     Raises:
         GenreNotValidException: invalid genre
+        BadParameterException: invalid limit or cursor
         SongServiceException: unexpected error getting  songs by genre
 
     Returns:
-        list[SongMetadataDTO]: the list of songs that matched the genre
+        Page[SongMetadataDTO]: the page of songs that matched the genre
     """
     try:
         str_genre = Genre.get_genre_string_value(genre)
-        songs_dao = base_song_repository.get_songs_metadata_by_genre(str_genre)
-        return [get_song_metadata_dto_from_dao(song_dao) for song_dao in songs_dao]
+        validate_page_limit(limit)
+        after_name = get_cursor_after_name(cursor)
+        songs_dao = base_song_repository.get_songs_metadata_by_genre(
+            str_genre, limit + 1, after_name
+        )
+        return get_page(
+            (get_song_metadata_dto_from_dao(song_dao) for song_dao in songs_dao),
+            limit,
+            lambda song: {"after": song.name},
+        )
     except GenreNotValidException as exception:
         base_song_service_logger.exception(f"Bad genre provided {genre}")
         raise GenreNotValidException from exception
+    except BadParameterException as exception:
+        base_song_service_logger.exception(f"Bad songs page parameter: {limit}, {cursor}")
+        raise BadParameterException from exception
     except SongRepositoryException as exception:
         base_song_service_logger.exception(
             f"Unexpected error in Song Repository getting songs by genre: {genre}"
@@ -222,3 +299,34 @@ def get_songs_by_genre(genre: Genre) -> list[SongMetadataDTO]:
             f"Unexpected error in Song Service getting songs by genre: {genre}"
         )
         raise SongServiceException from exception
+
+
+def get_songs_by_genre_stream(
+    genre: Genre, cursor: str | None = None
+) -> Iterator[SongMetadataDTO]:
+    """Get every song by genre after the cursor sorted by name. Songs are read lazily\
+        from the database while the iterator is consumed
+
+    Args:
+        genre (Genre): the genre
+        cursor (str | None, optional): cursor of the first page, None to start from the\
+            first song. Defaults to None.
+
+    Raises:
+        GenreNotValidException: invalid genre
+        BadParameterException: invalid cursor
+
+    Returns:
+        Iterator[SongMetadataDTO]: the songs that matched the genre
+    """
+    try:
+        str_genre = Genre.get_genre_string_value(genre)
+        after_name = get_cursor_after_name(cursor)
+    except GenreNotValidException as exception:
+        base_song_service_logger.exception(f"Bad genre provided {genre}")
+        raise GenreNotValidException from exception
+    except BadParameterException as exception:
+        base_song_service_logger.exception(f"Bad songs cursor: {cursor}")
+        raise BadParameterException from exception
+    songs_dao = base_song_repository.get_songs_metadata_by_genre(str_genre, None, after_name)
+    return (get_song_metadata_dto_from_dao(song_dao) for song_dao in songs_dao)
@@ -0,0 +1,230 @@
+"""
+In-process LRU cache for song data shared across stream requests
+
+Keeps the most recently streamed songs in memory up to a configurable byte budget.
+Concurrent misses for the same song share a single database fetch (single-flight)
+Song data is cached by GridFS file id, a song re-uploaded through another worker gets\
+    a new id so a stale copy is never served
+
+Declares SongDataCache global object to be accessed from across the app
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import asdict
+
+from gridfs import GridOut
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_SONG_BLOB_DATA_CACHE
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.song.blob.song_schema import SongDataCacheStats
+
+song_data_cache_logger = SpotifyElectronLogger(LOGGING_SONG_BLOB_DATA_CACHE).getLogger()
+
+
+class _SongDataCache:
+    """Bounded LRU cache of song data by GridFS file id"""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        """Max bytes of song data stored, 0 disables the cache"""
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        """Max bytes of a single song to be cacheable"""
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._names: dict[str, str] = {}
+        self._key_names: dict[str, str] = {}
+        self._loading: dict[str, Future[bytes]] = {}
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, size: int) -> bool:
+        """Returns if song data of the given size can be stored in the cache
+
+        Args:
+            size (int): song data size in bytes
+
+        Returns:
+            bool: if the song data can be cached
+        """
+        return size <= self.max_entry_bytes
+
+    def get(self, song_data_file: GridOut) -> bytes | None:
+        """Get cached song data
+
+        Args:
+            song_data_file (GridOut): song data file
+
+        Returns:
+            bytes | None: the song data or None if it's not cached
+        """
+        key = str(song_data_file._id)
+        with self._lock:
+            song_data = self._entries.get(key)
+            if song_data is None:
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return song_data
+
+    def get_or_load(
+        self, name: str, song_data_file: GridOut, loader: Callable[[], bytes]
+    ) -> bytes:
+        """Get cached song data or load it. If the song is already being loaded\
+            by another request, waits for it instead of fetching it again
+
+        Args:
+            name (str): song name
+            song_data_file (GridOut): song data file
+            loader (Callable[[], bytes]): loads the song data from database
+
+        Returns:
+            bytes: the song data
+        """
+        key = str(song_data_file._id)
+        with self._lock:
+            song_data = self._entries.get(key)
+            if song_data is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return song_data
+
+            future = self._loading.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self._loading[key] = future
+                self._replace_key(name, key)
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if not is_loader:
+            return future.result()  # type: ignore
+
+        try:
+            song_data = loader()
+        except Exception as exception:
+            with self._lock:
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+            future.set_exception(exception)  # type: ignore
+            raise
+
+        with self._lock:
+            # song could have been invalidated while it was being loaded
+            if self._loading.get(key) is future:
+                del self._loading[key]
+                if len(song_data) == song_data_file.length:
+                    self._store(name, key, song_data)
+        future.set_result(song_data)  # type: ignore
+        return song_data
+
+    def invalidate(self, name: str) -> None:
+        """Remove song data from the cache, in-flight loads won't be stored
+
+        Args:
+            name (str): song name
+        """
+        with self._lock:
+            key = self._names.pop(name, None)
+            if key is None:
+                return
+            self._loading.pop(key, None)
+            if key in self._entries:
+                self._evict(key)
+                song_data_cache_logger.debug(f"Song data {name} invalidated")
+
+    def clear(self) -> None:
+        """Remove all song data from the cache"""
+        with self._lock:
+            self._loading.clear()
+            self._entries.clear()
+            self._names.clear()
+            self._key_names.clear()
+            self._current_bytes = 0
+
+    def get_stats(self) -> SongDataCacheStats:
+        """Get cache usage stats
+
+        Returns:
+            SongDataCacheStats: the cache stats
+        """
+        with self._lock:
+            return SongDataCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _store(self, name: str, key: str, song_data: bytes) -> None:
+        """Store song data evicting the least recently used songs if needed.\
+            Must be called holding the lock
+
+        Args:
+            name (str): song name
+            key (str): GridFS file id of the song data
+            song_data (bytes): song data
+        """
+        if not self.is_cacheable(len(song_data)):
+            return
+        while self._entries and self._current_bytes + len(song_data) > self.max_bytes:
+            evicted_key = next(iter(self._entries))
+            evicted_name = self._key_names.get(evicted_key)
+            self._evict(evicted_key)
+            song_data_cache_logger.debug(f"Song data {evicted_name} evicted")
+            self._evictions += 1
+        self._entries[key] = song_data
+        self._key_names[key] = name
+        self._current_bytes += len(song_data)
+
+    def _replace_key(self, name: str, key: str) -> None:
+        """Set the GridFS file id of a song, dropping the data of its previous file.\
+            Must be called holding the lock
+
+        Args:
+            name (str): song name
+            key (str): GridFS file id of the song data
+        """
+        stale_key = self._names.get(name)
+        self._names[name] = key
+        if stale_key is None or stale_key == key:
+            return
+        self._loading.pop(stale_key, None)
+        if stale_key in self._entries:
+            self._evict(stale_key)
+            song_data_cache_logger.debug(f"Stale song data {name} evicted")
+
+    def _evict(self, key: str) -> None:
+        """Remove song data from the cache. Must be called holding the lock
+
+        Args:
+            key (str): GridFS file id of the song data
+        """
+        song_data = self._entries.pop(key)
+        self._current_bytes -= len(song_data)
+        name = self._key_names.pop(key, None)
+        if name is not None and self._names.get(name) == key:
+            del self._names[name]
+
+
+SongDataCache = _SongDataCache(
+    max_bytes=int(getattr(PropertiesManager, AppConfig.SONG_DATA_CACHE_MAX_BYTES, 0) or 0),
+    max_entry_bytes=int(
+        getattr(PropertiesManager, AppConfig.SONG_DATA_CACHE_MAX_ENTRY_BYTES, 0) or 0
+    ),
+)
+
+metrics_service.register_metrics_provider(
+    "song_data_cache", lambda: asdict(SongDataCache.get_stats())
+)
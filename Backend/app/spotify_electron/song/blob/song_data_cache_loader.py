@@ -0,0 +1,133 @@
+"""
+Background loader filling the song data caches
+
+The first stream of a song is served from the GridFS chunks while the song data is\
+    written to the disk cache and loaded into the memory cache in the background,\
+    so the whole file is never read before the first byte is sent.
+Loads of the same GridFS file are only run once at a time
+
+Declares SongDataCacheLoader global object to be accessed from across the app
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from gridfs import GridOut
+
+import app.spotify_electron.song.blob.song_repository as song_repository
+from app.logging.logging_constants import LOGGING_SONG_BLOB_DATA_CACHE_LOADER
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.song.blob.song_data_cache import SongDataCache
+from app.spotify_electron.song.blob.song_data_disk_cache import SongDataDiskCache
+
+song_data_cache_loader_logger = SpotifyElectronLogger(
+    LOGGING_SONG_BLOB_DATA_CACHE_LOADER
+).getLogger()
+
+SONG_DATA_CACHE_LOADER_WORKERS = 2
+"""Threads filling the song data caches"""
+
+
+class _SongDataCacheLoader:
+    """Fills the song data caches outside the stream requests"""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        """Threads filling the song data caches"""
+        self._executor: ThreadPoolExecutor | None = None
+        self._loading: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, size: int) -> bool:
+        """Returns if song data of the given size can be stored in any cache
+
+        Args:
+            size (int): song data size in bytes
+
+        Returns:
+            bool: if the song data can be cached
+        """
+        return SongDataDiskCache.is_cacheable(size) or (
+            SongDataCache.max_bytes > 0 and SongDataCache.is_cacheable(size)
+        )
+
+    def load(self, name: str, song_data_file: GridOut) -> Future[None]:
+        """Load song data into the caches in the background. If the song is already\
+            being loaded, the in-flight load is returned
+
+        Args:
+            name (str): song name
+            song_data_file (GridOut): song data file
+
+        Returns:
+            Future[None]: the load, done once the song data is cached or cannot be
+        """
+        key = str(song_data_file._id)
+        with self._lock:
+            future = self._loading.get(key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="song_data_cache"
+                )
+            future = self._executor.submit(self._load, name, song_data_file)
+            self._loading[key] = future
+        future.add_done_callback(lambda _: self._on_load_done(key, future))
+        return future
+
+    def shutdown(self) -> None:
+        """Wait for the in-flight loads and stop the loader threads"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _load(self, name: str, song_data_file: GridOut) -> None:
+        """Write song data to the disk cache and store it in the memory cache when\
+            it fits, reading it from disk once it has been written
+
+        Args:
+            name (str): song name
+            song_data_file (GridOut): song data file
+        """
+        try:
+            song_data_mapped = SongDataDiskCache.get_or_load(
+                name,
+                song_data_file,
+                lambda: song_repository.get_song_data_range(
+                    song_data_file, 0, song_data_file.length - 1
+                ),
+            )
+
+            if SongDataCache.max_bytes > 0 and SongDataCache.is_cacheable(
+                song_data_file.length
+            ):
+                SongDataCache.get_or_load(
+                    name,
+                    song_data_file,
+                    lambda: bytes(song_data_mapped)
+                    if song_data_mapped is not None
+                    else b"".join(
+                        song_repository.get_song_data_range(
+                            song_data_file, 0, song_data_file.length - 1
+                        )
+                    ),
+                )
+        except Exception:
+            song_data_cache_loader_logger.exception(f"Error caching song data {name}")
+
+    def _on_load_done(self, key: str, future: Future[None]) -> None:
+        """Forget a finished load
+
+        Args:
+            key (str): GridFS file id
+            future (Future[None]): the finished load
+        """
+        with self._lock:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+
+SongDataCacheLoader = _SongDataCacheLoader(workers=SONG_DATA_CACHE_LOADER_WORKERS)
@@ -0,0 +1,383 @@
+"""
+Local disk cache for song data shared across stream requests
+
+Song files streamed for the first time are written to a local directory and later\
+    requests are served from a memory map of that file instead of reading from database.
+Cached files are named after the GridFS file id, a re-uploaded song gets a new id\
+    so a stale copy is never served. Files are checked against the GridFS length\
+    and checksum (when stored) before being used
+
+Declares SongDataDiskCache global object to be accessed from across the app
+"""
+
+import contextlib
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from dataclasses import asdict
+
+from gridfs import GridOut
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+import app.spotify_electron.song.blob.song_repository as song_repository
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_SONG_BLOB_DATA_DISK_CACHE
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.song.blob.song_schema import (
+    SongDataCacheStats,
+    SongDataDiskCacheException,
+)
+
+song_data_disk_cache_logger = SpotifyElectronLogger(
+    LOGGING_SONG_BLOB_DATA_DISK_CACHE
+).getLogger()
+
+TEMPORARY_FILE_SUFFIX = ".tmp"
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(), "spotify_electron_song_cache")
+
+
+class _SongDataDiskCache:
+    """Bounded LRU cache of song data files by GridFS file id"""
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        """Directory where song data files are stored"""
+        self.max_bytes = max_bytes
+        """Max bytes of song data stored on disk, 0 disables the cache"""
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._names: dict[str, str] = {}
+        self._loading: dict[str, Future[bool]] = {}
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+        if self.max_bytes > 0:
+            self._load_directory()
+
+    def is_cacheable(self, size: int) -> bool:
+        """Returns if song data of the given size can be stored in the cache
+
+        Args:
+            size (int): song data size in bytes
+
+        Returns:
+            bool: if the song data can be cached
+        """
+        return 0 < size <= self.max_bytes
+
+    def get(self, song_data_file: GridOut) -> memoryview | None:
+        """Get song data mapped from disk without writing it when it's not cached
+
+        Args:
+            song_data_file (GridOut): song data file
+
+        Returns:
+            memoryview | None: the mapped song data or None if it's not cached
+        """
+        key = str(song_data_file._id)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        song_data = self._map(key, song_data_file.length)
+        if song_data is None:
+            self._remove(key)
+        return song_data
+
+    def get_or_load(
+        self, name: str, song_data_file: GridOut, loader: Callable[[], Iterator[bytes]]
+    ) -> memoryview | None:
+        """Get song data mapped from disk or write it to disk first. If the song is\
+            already being written by another request, waits for it instead of\
+            fetching it again
+
+        Args:
+            name (str): song name
+            song_data_file (GridOut): song data file
+            loader (Callable[[], Iterator[bytes]]): loads the song data chunks from database
+
+        Returns:
+            memoryview | None: the mapped song data or None if it cannot be cached
+        """
+        if not self.is_cacheable(song_data_file.length):
+            return None
+
+        key = str(song_data_file._id)
+        with self._lock:
+            is_cached = key in self._entries
+            if is_cached:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                future = None
+            else:
+                future = self._loading.get(key)
+                is_loader = future is None
+                if is_loader:
+                    future = Future()
+                    self._loading[key] = future
+                    self._misses += 1
+                else:
+                    self._hits += 1
+
+        if not is_cached:
+            if not is_loader:
+                is_stored = future.result()  # type: ignore
+            else:
+                is_stored = self._load(name, song_data_file, loader, future)  # type: ignore
+            if not is_stored:
+                return None
+
+        song_data = self._map(key, song_data_file.length)
+        if song_data is None:
+            self._remove(key)
+        return song_data
+
+    def invalidate(self, name: str) -> None:
+        """Remove song data from the cache, in-flight writes won't be stored
+
+        Args:
+            name (str): song name
+        """
+        with self._lock:
+            key = self._names.pop(name, None)
+            if key is None:
+                return
+            self._loading.pop(key, None)
+            size = self._entries.pop(key, None)
+            if size is not None:
+                self._current_bytes -= size
+        self._remove_file(key)
+        song_data_disk_cache_logger.debug(f"Song data {name} invalidated")
+
+    def get_stats(self) -> SongDataCacheStats:
+        """Get cache usage stats
+
+        Returns:
+            SongDataCacheStats: the cache stats
+        """
+        with self._lock:
+            return SongDataCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _load(
+        self,
+        name: str,
+        song_data_file: GridOut,
+        loader: Callable[[], Iterator[bytes]],
+        future: Future[bool],
+    ) -> bool:
+        """Write song data to disk and store it in the cache
+
+        Args:
+            name (str): song name
+            song_data_file (GridOut): song data file
+            loader (Callable[[], Iterator[bytes]]): loads the song data chunks from database
+            future (Future[bool]): in-flight load shared with concurrent requests
+
+        Returns:
+            bool: if the song data was stored
+        """
+        key = str(song_data_file._id)
+        is_stored = False
+        try:
+            self._write(key, song_data_file, loader)
+        except Exception:
+            song_data_disk_cache_logger.exception(f"Error writing song data {name} to disk")
+            with self._lock:
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+        else:
+            with self._lock:
+                # song could have been invalidated while it was being written
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+                    self._store(key, song_data_file.length, name)
+                    is_stored = True
+            if not is_stored:
+                self._remove_file(key)
+        future.set_result(is_stored)
+        return is_stored
+
+    def _write(
+        self, key: str, song_data_file: GridOut, loader: Callable[[], Iterator[bytes]]
+    ) -> None:
+        """Atomically write song data into the cache directory, the file only becomes\
+            visible once its length and checksum match the GridFS file
+
+        Args:
+            key (str): GridFS file id
+            song_data_file (GridOut): song data file
+            loader (Callable[[], Iterator[bytes]]): loads the song data chunks from database
+
+        Raises:
+            SongDataDiskCacheException: written song data doesn't match the GridFS file
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=TEMPORARY_FILE_SUFFIX
+        )
+        try:
+            checksum = song_repository.get_song_data_checksum(song_data_file)
+            written_hash = (
+                hashlib.new(checksum[0], usedforsecurity=False) if checksum else None
+            )
+            written_bytes = 0
+            with os.fdopen(file_descriptor, "wb") as file:
+                for chunk in loader():
+                    file.write(chunk)
+                    if written_hash is not None:
+                        written_hash.update(chunk)
+                    written_bytes += len(chunk)
+
+            validate_written_song_data(
+                song_data_file,
+                written_bytes,
+                (written_hash.name, written_hash.hexdigest()) if written_hash else None,
+            )
+            os.replace(temporary_path, os.path.join(self.directory, key))
+        except Exception:
+            self._remove_path(temporary_path)
+            raise
+
+    def _map(self, key: str, length: int) -> memoryview | None:
+        """Memory map a cached song data file
+
+        Args:
+            key (str): GridFS file id
+            length (int): expected song data length
+
+        Returns:
+            memoryview | None: the mapped song data or None if the file is missing\
+                or its length doesn't match
+        """
+        try:
+            with open(os.path.join(self.directory, key), "rb") as file:
+                if os.fstat(file.fileno()).st_size != length:
+                    return None
+                # the map keeps its own file handle and is closed once the view is released
+                return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except OSError:
+            song_data_disk_cache_logger.exception(f"Error mapping song data file {key}")
+            return None
+
+    def _store(self, key: str, size: int, name: str | None = None) -> None:
+        """Store a written song data file evicting the least recently used files\
+            if needed. Must be called holding the lock
+
+        Args:
+            key (str): GridFS file id
+            size (int): song data file size
+            name (str | None, optional): song name, unknown for files adopted from disk.\
+                Defaults to None.
+        """
+        while self._entries and self._current_bytes + size > self.max_bytes:
+            evicted_key, evicted_size = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_size
+            self._evictions += 1
+            self._remove_file(evicted_key)
+            song_data_disk_cache_logger.debug(f"Song data file {evicted_key} evicted")
+        self._entries[key] = size
+        self._current_bytes += size
+        if name is not None:
+            self._names[name] = key
+
+    def _remove(self, key: str) -> None:
+        """Remove a song data file from the cache
+
+        Args:
+            key (str): GridFS file id
+        """
+        with self._lock:
+            size = self._entries.pop(key, None)
+            if size is not None:
+                self._current_bytes -= size
+        self._remove_file(key)
+
+    def _remove_file(self, key: str) -> None:
+        """Remove a song data file from the cache directory. Already mapped files\
+            stay readable until their requests finish
+
+        Args:
+            key (str): GridFS file id
+        """
+        self._remove_path(os.path.join(self.directory, key))
+
+    def _remove_path(self, path: str) -> None:
+        """Remove a file ignoring errors
+
+        Args:
+            path (str): file path
+        """
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+    def _load_directory(self) -> None:
+        """Create the cache directory and adopt song data files from previous runs\
+            or other workers, oldest first. Unfinished writes are removed"""
+        os.makedirs(self.directory, exist_ok=True)
+
+        files: list[tuple[float, str, int]] = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(TEMPORARY_FILE_SUFFIX):
+                self._remove_path(entry.path)
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        with self._lock:
+            for _, key, size in sorted(files):
+                if self.is_cacheable(size):
+                    self._store(key, size)
+                else:
+                    self._remove_file(key)
+
+
+def validate_written_song_data(
+    song_data_file: GridOut, written_bytes: int, written_checksum: tuple[str, str] | None
+) -> None:
+    """Validate song data written to disk matches the GridFS file
+
+    Args:
+        song_data_file (GridOut): song data file
+        written_bytes (int): bytes written to disk
+        written_checksum (tuple[str, str] | None): hash algorithm and hex digest of the\
+            bytes written to disk, None if the GridFS file has no checksum
+
+    Raises:
+        SongDataDiskCacheException: written song data doesn't match the GridFS file
+    """
+    if written_bytes != song_data_file.length:
+        raise SongDataDiskCacheException
+    expected_checksum = song_repository.get_song_data_checksum(song_data_file)
+    if expected_checksum is not None and expected_checksum != written_checksum:
+        raise SongDataDiskCacheException
+
+
+SongDataDiskCache = _SongDataDiskCache(
+    directory=getattr(PropertiesManager, AppConfig.SONG_DATA_DISK_CACHE_DIRECTORY, None)
+    or DEFAULT_DIRECTORY,
+    max_bytes=int(
+        getattr(PropertiesManager, AppConfig.SONG_DATA_DISK_CACHE_MAX_BYTES, 0) or 0
+    ),
+)
+
+metrics_service.register_metrics_provider(
+    "song_data_disk_cache", lambda: asdict(SongDataDiskCache.get_stats())
+)
@@ -7,13 +7,20 @@ Song files are stored as BLOBs in a separated collection from the metadata
 When the song file is not needed, and only the metadata is required use base song services
 """
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+
+from bson import ObjectId
 from gridfs import GridOut
+from gridfs.errors import FileExists
 
 import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+from app.database.async_database_schema import AsyncGridIn
 from app.logging.logging_constants import LOGGING_SONG_BLOB_REPOSITORY
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.genre.genre_schema import Genre
 from app.spotify_electron.song.base_song_schema import (
+    SongAlreadyExistsException,
     SongCreateException,
     SongNotFoundException,
     SongRepositoryException,
@@ -32,6 +39,7 @@ from app.spotify_electron.song.blob.validations.song_service_validations import
 from app.spotify_electron.song.validations.base_song_repository_validations import (
     validate_song_exists,
 )
+from app.spotify_electron.utils.search.search_utils import get_search_fields
 
 song_repository_logger = SpotifyElectronLogger(LOGGING_SONG_BLOB_REPOSITORY).getLogger()
 
@@ -79,8 +87,10 @@ def create_song(  # noqa: PLR0913
         photo (str): song photo
 
     Raises:
+        SongAlreadyExistsException: a song with the same name already exists
         SongRepositoryException: unexpected error creating song
     """
+    song_id = ObjectId()
     try:
         gridfs_collection = song_collection_provider.get_gridfs_song_collection()
         song = {
@@ -94,9 +104,15 @@ def create_song(  # noqa: PLR0913
         }
         result = gridfs_collection.put(
             file,
+            _id=song_id,
             **song,
+            **get_search_fields(name),
         )
         validate_song_create(result)
+    except FileExists as exception:
+        song_repository_logger.exception(f"Song {name} already exists in database")
+        gridfs_collection.delete(song_id)
+        raise SongAlreadyExistsException from exception
     except SongCreateException as exception:
         song_repository_logger.exception(f"Error inserting Song {name} in database")
         raise SongRepositoryException from exception
@@ -107,6 +123,64 @@ def create_song(  # noqa: PLR0913
         song_repository_logger.info(f"Song added to repository: {song}")
 
 
+@asynccontextmanager
+async def open_song_upload_stream_async(
+    name: str, artist: str, genre: Genre, photo: str
+) -> AsyncIterator[AsyncGridIn]:
+    """Open a song file to be written in chunks. The song is created when the context\
+        exits, or its stored chunks are deleted if it exits with an exception
+
+    Args:
+        name (str): song name
+        artist (str): song artist
+        genre (Genre): song genre
+        photo (str): song photo
+
+    Raises:
+        SongAlreadyExistsException: a song with the same name already exists
+        SongRepositoryException: unexpected error creating song
+
+    Yields:
+        AsyncGridIn: the song file, its duration can be set before the context exits
+    """
+    song = {
+        "name": name,
+        "artist": artist,
+        "duration": 0,
+        "genre": str(genre.value),
+        "photo": photo,
+        "streams": 0,
+        "url": f"/stream/{name}",
+    }
+    try:
+        gridfs_collection = song_collection_provider.get_async_gridfs_song_collection()
+        song_file = await gridfs_collection.new_file(
+            _id=ObjectId(), **song, **get_search_fields(name)
+        )
+    except Exception as exception:
+        song_repository_logger.exception(f"Unexpected error opening song {name} file")
+        raise SongRepositoryException from exception
+
+    try:
+        yield song_file
+    except BaseException:
+        await song_file.abort()
+        raise
+
+    try:
+        await song_file.close()
+    except FileExists as exception:
+        song_repository_logger.exception(f"Song {name} already exists in database")
+        await song_file.abort()
+        raise SongAlreadyExistsException from exception
+    except Exception as exception:
+        song_repository_logger.exception(f"Unexpected error inserting song {name} in database")
+        await song_file.abort()
+        raise SongRepositoryException from exception
+    else:
+        song_repository_logger.info(f"Song added to repository: {song}")
+
+
 def get_song_data(name: str) -> GridOut:
     """Get song data
 
@@ -134,3 +208,62 @@ def get_song_data(name: str) -> GridOut:
     else:
         song_repository_logger.info("Song data obtained")
         return song_data  # type: ignore
+
+
+def get_song_data_checksum(song_data: GridOut) -> tuple[str, str] | None:
+    """Get the checksum stored with the song data, sha256 for songs uploaded\
+        through the app and md5 for files uploaded with older drivers
+
+    Args:
+        song_data (GridOut): song data file
+
+    Returns:
+        tuple[str, str] | None: the hash algorithm and hex digest or None if no\
+            checksum is stored
+    """
+    sha256 = getattr(song_data, "sha256", None)
+    if sha256:
+        return "sha256", sha256
+    md5 = song_data.md5
+    if md5:
+        return "md5", md5
+    return None
+
+
+def get_song_data_range(song_data: GridOut, start: int, end: int) -> Iterator[bytes]:
+    """Get song data bytes between start and end reading only the GridFS chunks\
+        that cover the range, one chunk at a time
+
+    Args:
+        song_data (GridOut): song data file
+        start (int): start byte
+        end (int): end byte, inclusive
+
+    Raises:
+        SongRepositoryException: unexpected error getting song data range
+
+    Yields:
+        Iterator[bytes]: the song data bytes of each chunk inside the range
+    """
+    try:
+        chunk_size = song_data.chunk_size
+        chunks_collection = song_collection_provider.get_gridfs_song_chunks_collection()
+        chunks = (
+            chunks_collection.find(
+                {
+                    "files_id": song_data._id,
+                    "n": {"$gte": start // chunk_size, "$lte": end // chunk_size},
+                },
+                {"_id": 0, "n": 1, "data": 1},
+            )
+            .sort("n", 1)
+            .batch_size(1)
+        )
+        for chunk in chunks:
+            chunk_start = chunk["n"] * chunk_size
+            yield chunk["data"][max(start - chunk_start, 0) : end - chunk_start + 1]
+    except Exception as exception:
+        song_repository_logger.exception(
+            f"Error getting Song data range {start}-{end} of {song_data.name} from database"
+        )
+        raise SongRepositoryException from exception
@@ -8,6 +8,7 @@ from typing import Any
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
 from app.spotify_electron.genre.genre_schema import Genre
 from app.spotify_electron.song.base_song_schema import BaseSongDAO, BaseSongDTO
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
 @dataclass
@@ -18,6 +19,7 @@ class SongDAO(BaseSongDAO):
     """The streaming url of the song"""
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class SongDTO(BaseSongDTO):
     """Represents song metadata and payload in the endpoints"""
@@ -26,6 +28,24 @@ class SongDTO(BaseSongDTO):
     """The streaming url of the song"""
 
 
+@dataclass
+class SongDataCacheStats:
+    """Usage stats of the song data cache"""
+
+    hits: int
+    """Song data served from memory"""
+    misses: int
+    """Song data loaded from database"""
+    evictions: int
+    """Song data removed to stay under the byte budget"""
+    entries: int
+    """Songs currently cached"""
+    current_bytes: int
+    """Bytes currently cached"""
+    max_bytes: int
+    """Byte budget of the cache"""
+
+
 def get_song_dao_from_document(document: dict[str, Any]) -> SongDAO:
     """Get SongDAO from document
 
@@ -80,3 +100,12 @@ class SongDataNotFoundException(SpotifyElectronException):
 
     def __init__(self):
         super().__init__(self.ERROR)
+
+
+class SongDataDiskCacheException(SpotifyElectronException):
+    """Exception for song data written to disk not matching the stored song"""
+
+    ERROR = "Error writing song data to disk cache"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
@@ -2,6 +2,11 @@
 Song service for handling business logic
 """
 
+from collections.abc import Iterator
+
+from fastapi import UploadFile
+from gridfs import GridOut
+
 import app.spotify_electron.song.base_song_repository as base_song_repository
 import app.spotify_electron.song.blob.song_repository as song_repository
 import app.spotify_electron.user.artist.artist_service as artist_service
@@ -10,17 +15,25 @@ from app.auth.auth_schema import (
     TokenData,
     UserUnauthorizedException,
 )
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
 from app.logging.logging_constants import LOGGING_SONG_BLOB_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.genre.genre_schema import Genre, GenreNotValidException
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.song.base_song_schema import (
     SongAlreadyExistsException,
+    SongBadFileException,
     SongBadNameException,
+    SongFileTooLargeException,
     SongNotFoundException,
     SongRepositoryException,
     SongServiceException,
     SongUnAuthorizedException,
 )
+from app.spotify_electron.song.blob.song_data_cache import SongDataCache
+from app.spotify_electron.song.blob.song_data_cache_loader import SongDataCacheLoader
+from app.spotify_electron.song.blob.song_data_disk_cache import SongDataDiskCache
 from app.spotify_electron.song.blob.song_schema import (
     SongDataNotFoundException,
     SongDTO,
@@ -29,6 +42,7 @@ from app.spotify_electron.song.blob.song_schema import (
 from app.spotify_electron.song.serverless.song_schema import (
     SongGetUrlStreamingException,
 )
+from app.spotify_electron.song.song_upload import SongUpload
 from app.spotify_electron.song.validations.base_song_service_validations import (
     validate_song_name_parameter,
     validate_song_should_exists,
@@ -42,10 +56,6 @@ from app.spotify_electron.user.user.user_schema import (
     UserNotFoundException,
     UserServiceException,
 )
-from app.spotify_electron.utils.audio_management.audio_management_utils import (
-    EncodingFileException,
-    get_song_duration_seconds,
-)
 
 song_service_logger = SpotifyElectronLogger(LOGGING_SONG_BLOB_SERVICE).getLogger()
 
@@ -92,8 +102,25 @@ def get_song(name: str) -> SongDTO:
         return song_dto
 
 
-async def create_song(  # noqa: C901
-    name: str, genre: Genre, photo: str, file: bytes, token: TokenData
+async def get_song_async(name: str) -> SongDTO:
+    """Get song without blocking the event loop, running get_song in the database executor
+
+    Args:
+        name (str): song name
+
+    Raises:
+        SongBadNameException: invalid song name
+        SongNotFoundException: song not found
+        SongServiceException: unexpected error while getting song
+
+    Returns:
+        SongDTO: the song
+    """
+    return await DatabaseConnectionManager.run_async(get_song, name)
+
+
+async def create_song(  # noqa: C901, PLR0912, PLR0915
+    name: str, genre: Genre, photo: str, file: UploadFile, token: TokenData
 ) -> None:
     """Create song
 
@@ -101,15 +128,16 @@ async def create_song(  # noqa: C901
         name (str): song name
         genre (Genre): song genre
         photo (str): song photo
-        file (bytes): song file
+        file (UploadFile): song file
         token (TokenData): user token
 
     Raises:
         GenreNotValidException: invalid genre
         UserBadNameException: invalid user name
         UserNotFoundException: user doesn't exists
-        EncodingFileException: error encoding file
         SongBadNameException: song bad name
+        SongBadFileException: song file is not an audio file
+        SongFileTooLargeException: song file exceeds the upload size limit
         SongUnAuthorizedException: song created by unauthorized user
     """
     artist = token.username
@@ -119,19 +147,19 @@ async def create_song(  # noqa: C901
         base_user_service_validations.validate_user_name_parameter(artist)
         Genre.check_valid_genre(genre.value)
 
-        validate_song_should_not_exists(name)
-        validate_user_should_be_artist(artist)
-
-        song_duration = get_song_duration_seconds(name, file)
-        song_repository.create_song(
-            name=name,
-            artist=artist,
-            photo=photo,
-            duration=song_duration,
-            genre=genre,
-            file=file,
-        )
-        artist_service.add_song_to_artist(artist, name)
+        await DatabaseConnectionManager.run_async(validate_song_should_not_exists, name)
+        await DatabaseConnectionManager.run_async(validate_user_should_be_artist, artist)
+
+        song_upload = SongUpload(name)
+        async with song_repository.open_song_upload_stream_async(
+            name=name, artist=artist, genre=genre, photo=photo
+        ) as song_file:
+            async for chunk in song_upload.read_chunks(file):
+                await song_file.write(chunk)
+            await song_file.set("duration", await song_upload.get_duration_seconds(file))
+            await song_file.set("sha256", song_upload.content_hash)
+        SearchEngine.add(SearchItemType.SONG, name)
+        await artist_service.add_song_to_artist_async(artist, name)
     except GenreNotValidException as exception:
         song_service_logger.exception(f"Bad genre provided {genre}")
         raise GenreNotValidException from exception
@@ -141,12 +169,15 @@ async def create_song(  # noqa: C901
     except UserNotFoundException as exception:
         song_service_logger.exception(f"Artist {artist} not found")
         raise UserNotFoundException from exception
-    except EncodingFileException as exception:
-        song_service_logger.exception(f"Error encoding file with name {name}")
-        raise EncodingFileException from exception
     except SongBadNameException as exception:
         song_service_logger.exception(f"Bad Song Name Parameter: {name}")
         raise SongBadNameException from exception
+    except SongBadFileException as exception:
+        song_service_logger.exception(f"Song file is not an audio file: {name}")
+        raise SongBadFileException from exception
+    except SongFileTooLargeException as exception:
+        song_service_logger.exception(f"Song file exceeds the upload size limit: {name}")
+        raise SongFileTooLargeException from exception
     except SongAlreadyExistsException as exception:
         song_service_logger.exception(f"Song already exists: {name}")
         raise SongAlreadyExistsException from exception
@@ -196,6 +227,9 @@ def delete_song(name: str) -> None:
             name,
         )
         base_song_repository.delete_song(name)
+        SearchEngine.remove(SearchItemType.SONG, name)
+        SongDataCache.invalidate(name)
+        SongDataDiskCache.invalidate(name)
 
     except SongBadNameException as exception:
         song_service_logger.exception(f"Bad Song Name Parameter: {name}")
@@ -242,7 +276,8 @@ def get_song_data(name: str) -> bytes:
         validate_song_name_parameter(name)
         validate_song_should_exists(name)
 
-        song_data = song_repository.get_song_data(name).read()
+        song_data_file = song_repository.get_song_data(name)
+        song_data = SongDataCache.get_or_load(name, song_data_file, song_data_file.read)
     except SongBadNameException as exception:
         song_service_logger.exception(f"Bad Song Name Parameter: {name}")
         raise SongBadNameException from exception
@@ -264,3 +299,97 @@ def get_song_data(name: str) -> bytes:
         raise SongServiceException from exception
     else:
         return song_data
+
+
+def get_song_data_file(name: str) -> GridOut:
+    """Get song data file without reading its content, only the GridFS file\
+        metadata is fetched from database
+
+    Args:
+        name (str): song name
+
+    Raises:
+        SongBadNameException: invalid song name
+        SongNotFoundException: song not found
+        SongDataNotFoundException: song data doesn't exists
+        SongServiceException: unexpected error getting song data file
+
+    Returns:
+        GridOut: the song data file
+    """
+    try:
+        validate_song_name_parameter(name)
+        validate_song_should_exists(name)
+
+        song_data_file = song_repository.get_song_data(name)
+    except SongBadNameException as exception:
+        song_service_logger.exception(f"Bad Song Name Parameter: {name}")
+        raise SongBadNameException from exception
+    except SongNotFoundException as exception:
+        song_service_logger.exception(f"Song not found: {name}")
+        raise SongNotFoundException from exception
+    except SongDataNotFoundException as exception:
+        song_service_logger.exception(f"Song data not found: {name}")
+        raise SongDataNotFoundException from exception
+    except SongRepositoryException as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Repository getting song data file: {name}"
+        )
+        raise SongServiceException from exception
+    except Exception as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Service getting song data file: {name}"
+        )
+        raise SongServiceException from exception
+    else:
+        return song_data_file
+
+
+def get_song_stream_data(name: str, song_data_file: GridOut) -> bytes | memoryview | GridOut:
+    """Get song data for streaming. Cached songs are returned as bytes shared across\
+        requests or mapped from the song data disk cache, songs not cached yet are\
+        returned as the file to be read lazily while they are cached in the background
+
+    Args:
+        name (str): song name
+        song_data_file (GridOut): song data file
+
+    Raises:
+        SongServiceException: unexpected error getting song stream data
+
+    Returns:
+        bytes | memoryview | GridOut: the cached song data, the song data mapped\
+            from disk or the song data file
+    """
+    try:
+        song_data = SongDataCache.get(song_data_file)
+        if song_data is not None:
+            return song_data
+
+        song_data_mapped = SongDataDiskCache.get(song_data_file)
+        if song_data_mapped is not None:
+            return song_data_mapped
+
+        if SongDataCacheLoader.is_cacheable(song_data_file.length):
+            SongDataCacheLoader.load(name, song_data_file)
+    except Exception as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Service getting song stream data: {name}"
+        )
+        raise SongServiceException from exception
+    else:
+        return song_data_file
+
+
+def get_song_data_range(song_data_file: GridOut, start: int, end: int) -> Iterator[bytes]:
+    """Get song data bytes between start and end without loading the whole song
+
+    Args:
+        song_data_file (GridOut): song data file
+        start (int): start byte
+        end (int): end byte, inclusive
+
+    Returns:
+        Iterator[bytes]: the song data bytes inside the range
+    """
+    return song_repository.get_song_data_range(song_data_file, start, end)
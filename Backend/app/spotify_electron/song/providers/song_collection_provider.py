@@ -8,6 +8,7 @@ from pymongo.collection import Collection
 
 from app.common.app_schema import AppArchitecture, AppEnvironment
 from app.common.PropertiesManager import PropertiesManager
+from app.database.async_database_schema import AsyncGridFS
 from app.database.database_schema import DatabaseCollection
 from app.database.DatabaseConnectionManager import DatabaseConnectionManager
 
@@ -32,6 +33,15 @@ def get_song_collection() -> Collection:
     return repository_map.get(current_architecture, repository_map[AppArchitecture.ARCH_BLOB])
 
 
+def get_song_upload_collection() -> Collection:
+    """Get the collection of the pending uploads of song files to cloud storage
+
+    Returns:
+        Collection: the song upload collection
+    """
+    return DatabaseConnectionManager.get_collection_connection(DatabaseCollection.SONG_UPLOAD)
+
+
 def get_gridfs_song_collection() -> GridFS:
     """Get gridfs collection for managing song files
 
@@ -41,3 +51,25 @@ def get_gridfs_song_collection() -> GridFS:
     return DatabaseConnectionManager.connection.get_gridfs_collection_connection(
         DatabaseCollection.SONG_BLOB_DATA
     )
+
+
+def get_async_gridfs_song_collection() -> AsyncGridFS:
+    """Get gridfs collection for managing song files from async code
+
+    Returns:
+        AsyncGridFS: the async gridfs song collection
+    """
+    return DatabaseConnectionManager.connection.get_async_gridfs_collection_connection(
+        DatabaseCollection.SONG_BLOB_DATA
+    )
+
+
+def get_gridfs_song_chunks_collection() -> Collection:
+    """Get gridfs chunks collection that stores the song files content
+
+    Returns:
+        Collection: the gridfs song chunks collection
+    """
+    return DatabaseConnectionManager.get_collection_connection(
+        DatabaseCollection.SONG_BLOB_CHUNKS
+    )
@@ -5,6 +5,10 @@ Song metadata is stored in database and song files are managed by AWS S3 instanc
 When the song file is not needed, and only the metadata is required use base song services
 """
 
+from datetime import UTC, datetime
+
+from pymongo.errors import DuplicateKeyError
+
 import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
 from app.logging.logging_constants import (
     LOGGING_SONG_SERVERLESS_REPOSITORY,
@@ -12,18 +16,27 @@ from app.logging.logging_constants import (
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.genre.genre_schema import Genre
 from app.spotify_electron.song.base_song_schema import (
+    SongAlreadyExistsException,
     SongCreateException,
     SongNotFoundException,
     SongRepositoryException,
 )
 from app.spotify_electron.song.serverless.song_schema import (
     SongDAO,
+    SongUploadDAO,
+    SongUploadNotFoundException,
     get_song_dao_from_document,
+    get_song_upload_dao_from_document,
+)
+from app.spotify_electron.song.serverless.validations.song_repository_validations import (  # noqa: E501
+    validate_song_upload_delete_count,
+    validate_song_upload_exists,
 )
 from app.spotify_electron.song.validations.base_song_repository_validations import (
     validate_base_song_create,
     validate_song_exists,
 )
+from app.spotify_electron.utils.search.search_utils import get_search_fields
 
 song_repository_logger = SpotifyElectronLogger(LOGGING_SONG_SERVERLESS_REPOSITORY).getLogger()
 
@@ -57,13 +70,7 @@ def get_song(name: str) -> SongDAO:
         return song_dao
 
 
-def create_song(
-    name: str,
-    artist: str,
-    duration: int,
-    genre: Genre,
-    photo: str,
-) -> None:
+def create_song(name: str, artist: str, duration: int, genre: Genre, photo: str) -> None:
     """Create song
 
     Args:
@@ -74,6 +81,7 @@ def create_song(
         photo (str): song photo
 
     Raises:
+        SongAlreadyExistsException: a song with the same name already exists
         SongRepositoryException: unexpected error creating song
     """
     try:
@@ -87,8 +95,11 @@ def create_song(
             "streams": 0,
         }
 
-        result = collection.insert_one(song)
+        result = collection.insert_one({**song, **get_search_fields(name)})
         validate_base_song_create(result)
+    except DuplicateKeyError as exception:
+        song_repository_logger.exception(f"Song {name} already exists in database")
+        raise SongAlreadyExistsException from exception
     except SongCreateException as exception:
         song_repository_logger.exception(f"Error inserting Song {song} in database")
         raise SongRepositoryException from exception
@@ -97,3 +108,105 @@ def create_song(
         raise SongRepositoryException from exception
     else:
         song_repository_logger.info(f"Song added to repository: {song}")
+
+
+def create_song_upload(
+    name: str, artist: str, genre: Genre, photo: str, upload_id: str
+) -> None:
+    """Store a pending upload of a song file, kept apart from the songs so it's not\
+        found until it's completed. Pending uploads expire after the configured time
+
+    Args:
+        name (str): song name
+        artist (str): song artist
+        genre (Genre): song genre
+        photo (str): song photo
+        upload_id (str): id of the upload of the song file
+
+    Raises:
+        SongAlreadyExistsException: a song upload with the same name is pending
+        SongRepositoryException: unexpected error storing the song upload
+    """
+    try:
+        collection = song_collection_provider.get_song_upload_collection()
+        collection.insert_one(
+            {
+                "name": name,
+                "artist": artist,
+                "genre": str(genre.value),
+                "photo": photo,
+                "upload_id": upload_id,
+                "created_at": datetime.now(UTC),
+            }
+        )
+    except DuplicateKeyError as exception:
+        song_repository_logger.exception(f"Song {name} already has a pending upload")
+        raise SongAlreadyExistsException from exception
+    except Exception as exception:
+        song_repository_logger.exception(
+            f"Error inserting upload {upload_id} of Song {name} in database"
+        )
+        raise SongRepositoryException from exception
+    else:
+        song_repository_logger.info(f"Upload {upload_id} of Song {name} added to repository")
+
+
+def get_song_upload(name: str, upload_id: str) -> SongUploadDAO:
+    """Get a pending upload of a song file
+
+    Args:
+        name (str): song name
+        upload_id (str): id of the pending upload
+
+    Raises:
+        SongUploadNotFoundException: the song has no pending upload with the id
+        SongRepositoryException: unexpected error getting the song upload
+
+    Returns:
+        SongUploadDAO: the song upload
+    """
+    try:
+        collection = song_collection_provider.get_song_upload_collection()
+        song_upload = collection.find_one({"name": name, "upload_id": upload_id})
+        validate_song_upload_exists(song_upload)
+        song_upload_dao = get_song_upload_dao_from_document(song_upload)  # type: ignore
+
+    except SongUploadNotFoundException as exception:
+        song_repository_logger.exception(f"Song {name} has no pending upload {upload_id}")
+        raise SongUploadNotFoundException from exception
+    except Exception as exception:
+        song_repository_logger.exception(
+            f"Error getting upload {upload_id} of Song {name} from database"
+        )
+        raise SongRepositoryException from exception
+    else:
+        song_repository_logger.info(f"Get Song upload returned {song_upload_dao}")
+        return song_upload_dao
+
+
+def delete_song_upload(name: str, upload_id: str) -> None:
+    """Delete a pending upload of a song file
+
+    Args:
+        name (str): song name
+        upload_id (str): id of the pending upload
+
+    Raises:
+        SongUploadNotFoundException: the song has no pending upload with the id
+        SongRepositoryException: unexpected error deleting the song upload
+    """
+    try:
+        collection = song_collection_provider.get_song_upload_collection()
+        result = collection.delete_one({"name": name, "upload_id": upload_id})
+        validate_song_upload_delete_count(result)
+
+    except SongUploadNotFoundException as exception:
+        song_repository_logger.exception(f"Song {name} has no pending upload {upload_id}")
+        raise SongUploadNotFoundException from exception
+    except Exception as exception:
+        song_repository_logger.exception(
+            f"Error deleting upload {upload_id} of Song {name} from database"
+        )
+        raise SongRepositoryException from exception
+    else:
+        song_repository_logger.info(f"Upload {upload_id} of Song {name} deleted")
@@ -8,6 +8,7 @@ from typing import Any
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
 from app.spotify_electron.genre.genre_schema import Genre
 from app.spotify_electron.song.base_song_schema import BaseSongDAO, BaseSongDTO
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
 @dataclass
@@ -15,6 +16,7 @@ class SongDAO(BaseSongDAO):
     """Represents song data in the persistence layer"""
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class SongDTO(BaseSongDTO):
     """Represents song metadata and payload in the endpoints"""
@@ -23,6 +25,46 @@ class SongDTO(BaseSongDTO):
     url: str
 
 
+@JsonEncoderRegistry.register
+@dataclass
+class SongUploadDTO:
+    """Represents an upload of a song file straight to cloud storage in the endpoints"""
+
+    upload_id: str
+    """Upload id"""
+    part_size: int
+    """Bytes of every part but the last one"""
+    part_urls: list[str]
+    """Presigned urls to PUT the parts of the file, in order"""
+
+
+@dataclass
+class SongUploadDAO:
+    """Represents a pending upload of a song file in the persistence layer. The song\
+        is only published once the upload is completed"""
+
+    name: str
+    """Song name"""
+    artist: str
+    """Song artist"""
+    genre: Genre
+    """Song genre"""
+    photo: str
+    """Song photo"""
+    upload_id: str
+    """Upload id"""
+
+
+@dataclass
+class SongUploadPart:
+    """Represents an uploaded part of a song file"""
+
+    part_number: int
+    """Part number, starting at 1"""
+    etag: str
+    """ETag returned by cloud storage when the part was uploaded"""
+
+
 def get_song_dao_from_document(document: dict[str, Any]) -> SongDAO:
     """Get SongDAO from document
 
@@ -45,6 +87,24 @@ def get_song_dao_from_document(document: dict[str, Any]) -> SongDAO:
     )
 
 
+def get_song_upload_dao_from_document(document: dict[str, Any]) -> SongUploadDAO:
+    """Get SongUploadDAO from document
+
+    Args:
+        document (dict[str, Any]): song upload document
+
+    Returns:
+        SongUploadDAO: SongUploadDAO Object
+    """
+    return SongUploadDAO(
+        name=document["name"],
+        artist=document["artist"],
+        genre=Genre(document["genre"]),
+        photo=document["photo"],
+        upload_id=document["upload_id"],
+    )
+
+
 def get_song_dto_from_dao(song_dao: SongDAO, url: str) -> SongDTO:
     """Get SongDTO from SongDAO
 
@@ -94,3 +154,12 @@ class SongDeleteSongStreamingException(SpotifyElectronException):
 
     def __init__(self):
         super().__init__(self.ERROR)
+
+
+class SongUploadNotFoundException(SpotifyElectronException):
+    """Song upload not found"""
+
+    ERROR = "Song upload not found"
+
+    def __init__(self):
+        super().__init__(self.ERROR)
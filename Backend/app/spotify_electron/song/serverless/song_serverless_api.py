@@ -2,7 +2,7 @@
 API to comunicate with Serverless function that handles song files in Cloud
 """
 
-from requests import Response, delete, get, post
+from requests import Response, delete, get, post, put
 
 from app.common.app_schema import AppEnvironment
 from app.common.PropertiesManager import PropertiesManager
@@ -23,24 +23,71 @@ def get_song(song_name: str) -> Response:
     return response
 
 
-def create_song(song_name: str, encoded_bytes: str) -> Response:
-    """Create song in cloud
+def create_song_upload(song_name: str, parts: int) -> Response:
+    """Start the upload of a song file to cloud
 
     Args:
         song_name (str): song name
-        encoded_bytes (str): encoded bytes of song
+        parts (int): number of parts of the song file
     """
-    request_data_body = {
-        "file": encoded_bytes,
-    }
     response = post(
         f"{getattr(PropertiesManager,AppEnvironment.SERVERLESS_URL_ENV_NAME)}",
-        json=request_data_body,
-        params={"nombre": song_name},
+        params={"nombre": song_name, "partes": parts},
     )
     return response
 
 
+def upload_song_part(part_url: str, data: bytes) -> Response:
+    """Upload a part of a song file straight to cloud storage
+
+    Args:
+        part_url (str): presigned url of the part
+        data (bytes): the part bytes
+    """
+    response = put(part_url, data=data)
+    return response
+
+
+def complete_song_upload(song_name: str, upload_id: str, parts: list[dict]) -> Response:
+    """Complete the upload of a song file to cloud
+
+    Args:
+        song_name (str): song name
+        upload_id (str): upload id
+        parts (list[dict]): uploaded parts with their part_number and etag
+    """
+    response = put(
+        f"{getattr(PropertiesManager,AppEnvironment.SERVERLESS_URL_ENV_NAME)}",
+        json={"parts": parts},
+        params={"nombre": song_name, "upload_id": upload_id},
+    )
+    return response
+
+
+def abort_song_upload(song_name: str, upload_id: str) -> Response:
+    """Abort the upload of a song file to cloud
+
+    Args:
+        song_name (str): song name
+        upload_id (str): upload id
+    """
+    response = delete(
+        f"{getattr(PropertiesManager,AppEnvironment.SERVERLESS_URL_ENV_NAME)}",
+        params={"nombre": song_name, "upload_id": upload_id},
+    )
+    return response
+
+
+def get_song_file(url: str) -> Response:
+    """Get a song file from cloud storage without reading its content up front
+
+    Args:
+        url (str): presigned url of the song file
+    """
+    response = get(url, stream=True)
+    return response
+
+
 def delete_song(song_name: str) -> Response:
     """Delete song from cloud
 
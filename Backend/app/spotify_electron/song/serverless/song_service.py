@@ -2,6 +2,13 @@
 Song service for handling business logic
 """
 
+import asyncio
+import math
+import os
+from dataclasses import asdict
+
+from fastapi import UploadFile
+
 import app.spotify_electron.song.base_song_repository as base_song_repository
 import app.spotify_electron.song.serverless.song_repository as song_repository
 import app.spotify_electron.user.artist.artist_service as artist_service
@@ -10,12 +17,19 @@ from app.auth.auth_schema import (
     TokenData,
     UserUnauthorizedException,
 )
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
 from app.logging.logging_constants import LOGGING_SONG_SERVERLESS_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.genre.genre_schema import Genre, GenreNotValidException
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.song.base_song_schema import (
     SongAlreadyExistsException,
+    SongBadFileException,
     SongBadNameException,
+    SongFileTooLargeException,
     SongNotFoundException,
     SongRepositoryException,
     SongServiceException,
@@ -27,13 +41,19 @@ from app.spotify_electron.song.serverless.song_schema import (
     SongDeleteSongStreamingException,
     SongDTO,
     SongGetUrlStreamingException,
+    SongUploadDAO,
+    SongUploadDTO,
+    SongUploadNotFoundException,
+    SongUploadPart,
     get_song_dto_from_dao,
 )
 from app.spotify_electron.song.serverless.validations.song_service_validations import (  # noqa: E501
     validate_get_song_url_streaming_response,
     validate_song_creating_streaming_response,
     validate_song_deleting_streaming_response,
+    validate_song_part_uploading_response,
 )
+from app.spotify_electron.song.song_upload import SONG_UPLOAD_MAX_BYTES, SongUpload
 from app.spotify_electron.song.validations.base_song_service_validations import (
     validate_song_name_parameter,
     validate_song_should_exists,
@@ -47,14 +67,33 @@ from app.spotify_electron.user.user.user_schema import (
     UserNotFoundException,
     UserServiceException,
 )
+from app.spotify_electron.utils.audio_management.audio_format_utils import (
+    AUDIO_FORMAT_SNIFF_BYTES,
+    AudioFormat,
+    get_audio_format,
+)
 from app.spotify_electron.utils.audio_management.audio_management_utils import (
-    EncodingFileException,
-    encode_file,
+    AudioDecoder,
+    get_duration_result,
     get_song_duration_seconds,
 )
+from app.spotify_electron.utils.audio_management.mp3_header_utils import (
+    MP3DurationParser,
+)
 
 song_service_logger = SpotifyElectronLogger(LOGGING_SONG_SERVERLESS_SERVICE).getLogger()
 
+MIN_UPLOAD_PART_BYTES = 5 * 1024 * 1024
+"""Min bytes of every part of a cloud storage multipart upload but the last one"""
+MAX_UPLOAD_PARTS = 10000
+"""Max parts of a cloud storage multipart upload"""
+SONG_FILE_READ_CHUNK_BYTES = 64 * 1024
+
+SONG_UPLOAD_PART_BYTES = max(
+    int(getattr(PropertiesManager, AppConfig.SONG_UPLOAD_PART_BYTES, 0) or 0),
+    MIN_UPLOAD_PART_BYTES,
+)
+
 
 def get_song_streaming_url(name: str) -> str:
     """Get song streaming url
@@ -125,25 +164,456 @@ def get_song(name: str) -> SongDTO:
         return song_dto
 
 
-async def create_song(  # noqa: C901
-    name: str, genre: Genre, photo: str, file: bytes, token: TokenData
-) -> None:
-    """Create song
+async def get_song_async(name: str) -> SongDTO:
+    """Get song without blocking the event loop, running get_song in the database executor
+
+    Args:
+        name (str): song name
+
+    Raises:
+        SongBadNameException: invalid song name
+        SongNotFoundException: song not found
+        SongServiceException: unexpected error while getting song
+
+    Returns:
+        SongDTO: the song
+    """
+    return await DatabaseConnectionManager.run_async(get_song, name)
+
+
+def get_song_upload_parts(name: str, size: int) -> int:
+    """Get the number of parts of a song file uploaded to cloud storage
+
+    Args:
+        name (str): song name
+        size (int): song file size in bytes
+
+    Raises:
+        SongBadFileException: invalid song file size
+        SongFileTooLargeException: song file exceeds the upload size limit
+
+    Returns:
+        int: the number of parts, one at least
+    """
+    validate_song_file_size(name, size)
+    parts = max(1, math.ceil(size / SONG_UPLOAD_PART_BYTES))
+    if parts > MAX_UPLOAD_PARTS:
+        song_service_logger.warning(f"Song file {name} exceeds the upload size limit")
+        raise SongFileTooLargeException
+    return parts
+
+
+def validate_song_file_size(name: str, size: int) -> None:
+    """Validate the size of a song file against the upload size limit
+
+    Args:
+        name (str): song name
+        size (int): song file size in bytes
+
+    Raises:
+        SongBadFileException: invalid song file size
+        SongFileTooLargeException: song file exceeds the upload size limit
+    """
+    if size < 0:
+        song_service_logger.warning(f"Song file {name} has an invalid size {size}")
+        raise SongBadFileException
+    if 0 < SONG_UPLOAD_MAX_BYTES < size:
+        song_service_logger.warning(f"Song file {name} exceeds the upload size limit")
+        raise SongFileTooLargeException
+
+
+def get_song_file_format(name: str, head: bytes) -> AudioFormat:
+    """Get the format of a song file from its first bytes
+
+    Args:
+        name (str): song name
+        head (bytes): the first bytes of the song file
+
+    Raises:
+        SongBadFileException: the song file is not an audio file
+
+    Returns:
+        AudioFormat: the song file format
+    """
+    audio_format = get_audio_format(head[:AUDIO_FORMAT_SNIFF_BYTES])
+    if audio_format is None:
+        song_service_logger.warning(f"Song file {name} is not an audio file")
+        raise SongBadFileException
+    return audio_format
+
+
+def validate_song_upload_artist(song_upload: SongUploadDAO, artist: str) -> None:
+    """Validate the user managing a song upload is the song artist
+
+    Args:
+        song_upload (SongUploadDAO): the song upload
+        artist (str): user name
+
+    Raises:
+        SongUnAuthorizedException: the user is not the song artist
+    """
+    if song_upload.artist != artist:
+        song_service_logger.warning(
+            f"User {artist} is not the artist of song {song_upload.name}"
+        )
+        raise SongUnAuthorizedException
+
+
+def start_song_file_upload(name: str, parts: int) -> tuple[str, list[str]]:
+    """Start the upload of a song file to cloud storage
+
+    Args:
+        name (str): song name
+        parts (int): number of parts of the song file
+
+    Raises:
+        SongCreateSongStreamingException: unexpected error starting the upload
+
+    Returns:
+        tuple[str, list[str]]: the upload id and the presigned urls of the parts
+    """
+    response = song_serverless_api.create_song_upload(song_name=name, parts=parts)
+    validate_song_creating_streaming_response(name, response)
+    response_json = response.json()
+    return response_json["upload_id"], response_json["part_urls"]
+
+
+def upload_song_file_part(name: str, part_url: str, data: bytes) -> str:
+    """Upload a part of a song file straight to cloud storage
+
+    Args:
+        name (str): song name
+        part_url (str): presigned url of the part
+        data (bytes): the part bytes
+
+    Raises:
+        SongCreateSongStreamingException: unexpected error uploading the part
+
+    Returns:
+        str: the part ETag
+    """
+    response = song_serverless_api.upload_song_part(part_url=part_url, data=data)
+    validate_song_part_uploading_response(name, response)
+    return response.headers["ETag"]
+
+
+def complete_song_file_upload(
+    name: str, upload_id: str, parts: list[SongUploadPart]
+) -> tuple[str, int]:
+    """Complete the upload of a song file to cloud storage
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+        parts (list[SongUploadPart]): the uploaded parts
+
+    Raises:
+        SongCreateSongStreamingException: unexpected error completing the upload
+
+    Returns:
+        tuple[str, int]: a presigned url to read the song file and its stored size\
+            in bytes
+    """
+    response = song_serverless_api.complete_song_upload(
+        song_name=name, upload_id=upload_id, parts=[asdict(part) for part in parts]
+    )
+    validate_song_creating_streaming_response(name, response)
+    response_json = response.json()
+    return response_json["url"], response_json["size"]
+
+
+def abort_song_file_upload(name: str, upload_id: str) -> None:
+    """Abort the upload of a song file to cloud storage
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+
+    Raises:
+        SongDeleteSongStreamingException: unexpected error aborting the upload
+    """
+    response = song_serverless_api.abort_song_upload(song_name=name, upload_id=upload_id)
+    validate_song_deleting_streaming_response(name, response)
+
+
+def delete_song_file(name: str) -> None:
+    """Delete a song file from cloud storage
+
+    Args:
+        name (str): song name
+
+    Raises:
+        SongDeleteSongStreamingException: unexpected error deleting the song file
+    """
+    response = song_serverless_api.delete_song(name)
+    validate_song_deleting_streaming_response(name, response)
+
+
+def read_song_file_duration_seconds(name: str, url: str, size: int) -> int:
+    """Check the uploaded song file and read its duration. The stored size is checked\
+        against the upload size limit and the format is sniffed from the first bytes,\
+        MP3 files are only read until the duration is known from their headers and\
+        other audio files are decoded
+
+    Args:
+        name (str): song name
+        url (str): presigned url to read the song file
+        size (int): stored song file size in bytes
+
+    Raises:
+        SongFileTooLargeException: song file exceeds the upload size limit
+        SongBadFileException: song file is not an audio file
+        SongGetUrlStreamingException: unexpected error reading the song file
+
+    Returns:
+        int: the duration in seconds, defaulted to 0 if it cannot be read
+    """
+    validate_song_file_size(name, size)
+    if size == 0:
+        return get_duration_result(name, None)
+
+    audio_format: AudioFormat | None = None
+    song_file = bytearray()
+    duration_parser = MP3DurationParser()
+    with song_serverless_api.get_song_file(url) as response:
+        validate_get_song_url_streaming_response(name, response)
+        for chunk in response.iter_content(SONG_FILE_READ_CHUNK_BYTES):
+            if audio_format != AudioFormat.MP3:
+                song_file += chunk
+            if audio_format is None and len(song_file) >= AUDIO_FORMAT_SNIFF_BYTES:
+                audio_format = get_song_file_format(name, bytes(song_file))
+            if audio_format in (None, AudioFormat.MP3):
+                duration_parser.update(chunk)
+                if audio_format == AudioFormat.MP3 and not duration_parser.needs_more_bytes:
+                    break
+    if audio_format is None:
+        audio_format = get_song_file_format(name, bytes(song_file))
+
+    if audio_format != AudioFormat.MP3:
+        return get_song_duration_seconds(name, bytes(song_file))
+    duration = duration_parser.finish()
+    if duration is not None:
+        AudioDecoder.record_header_parsed()
+    return get_duration_result(name, duration)
+
+
+async def register_song_upload(
+    name: str, artist: str, genre: Genre, photo: str, size: int
+) -> SongUploadDTO:
+    """Start the upload of a song file to cloud storage and store the song metadata\
+        as a pending upload, the song is not found until the upload is completed
+
+    Args:
+        name (str): song name
+        artist (str): song artist
+        genre (Genre): song genre
+        photo (str): song photo
+        size (int): song file size in bytes
+
+    Raises:
+        SongBadFileException: invalid song file size
+        SongFileTooLargeException: song file exceeds the upload size limit
+        SongCreateSongStreamingException: unexpected error starting the upload
+        SongAlreadyExistsException: a song or a pending upload with the same name\
+            already exists
+        SongRepositoryException: unexpected error storing the song upload
+
+    Returns:
+        SongUploadDTO: the upload
+    """
+    parts = get_song_upload_parts(name, size)
+    upload_id, part_urls = await asyncio.to_thread(start_song_file_upload, name, parts)
+    try:
+        await asyncio.to_thread(
+            song_repository.create_song_upload,
+            name=name,
+            artist=artist,
+            genre=genre,
+            photo=photo,
+            upload_id=upload_id,
+        )
+    except BaseException:
+        await discard_song_file_upload(name, upload_id)
+        raise
+    try:
+        # a song with the same name may have been published since it was checked
+        await asyncio.to_thread(validate_song_should_not_exists, name)
+    except BaseException:
+        await discard_song_upload(name, upload_id)
+        raise
+    return SongUploadDTO(
+        upload_id=upload_id, part_size=SONG_UPLOAD_PART_BYTES, part_urls=part_urls
+    )
+
+
+async def discard_song_file_upload(name: str, upload_id: str) -> None:
+    """Abort the upload of a song file after a failure, logging instead of raising\
+        any error so the failure is kept
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+    """
+    try:
+        await asyncio.to_thread(abort_song_file_upload, name, upload_id)
+    except Exception:
+        song_service_logger.exception(f"Error aborting upload {upload_id} of song {name}")
+
+
+async def discard_song_upload(name: str, upload_id: str) -> None:
+    """Abort the upload of a song file after a failure and delete the pending upload,\
+        logging instead of raising any error so the failure is kept
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+    """
+    await discard_song_file_upload(name, upload_id)
+    await discard_pending_song_upload(name, upload_id)
+
+
+async def discard_uploaded_song_file(name: str, upload_id: str) -> None:
+    """Delete a completed song file that cannot be published and its pending upload,\
+        logging instead of raising any error so the failure is kept
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+    """
+    try:
+        await asyncio.to_thread(delete_song_file, name)
+    except Exception:
+        song_service_logger.exception(f"Error deleting uploaded file of song {name}")
+    await discard_pending_song_upload(name, upload_id)
+
+
+async def discard_pending_song_upload(name: str, upload_id: str) -> None:
+    """Delete a pending song upload, logging instead of raising any error so the\
+        failure is kept
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+    """
+    try:
+        await asyncio.to_thread(
+            song_repository.delete_song_upload, name=name, upload_id=upload_id
+        )
+    except Exception:
+        song_service_logger.exception(f"Error deleting upload {upload_id} of song {name}")
+
+
+def finish_song_upload(song_upload: SongUploadDAO, duration: int) -> None:
+    """Publish the song of a completed upload and delete the pending upload. The song\
+        is stored first so a song or a pending upload with its name always exists
+
+    Args:
+        song_upload (SongUploadDAO): the completed song upload
+        duration (int): song duration in seconds
+
+    Raises:
+        SongAlreadyExistsException: a song with the same name already exists
+        SongUploadNotFoundException: the song has no pending upload with the id
+        SongRepositoryException: unexpected error publishing the song
+        UserServiceException: unexpected error adding the song to the artist
+    """
+    song_repository.create_song(
+        name=song_upload.name,
+        artist=song_upload.artist,
+        duration=duration,
+        genre=song_upload.genre,
+        photo=song_upload.photo,
+    )
+    song_repository.delete_song_upload(name=song_upload.name, upload_id=song_upload.upload_id)
+    SearchEngine.add(SearchItemType.SONG, song_upload.name)
+    artist_service.add_song_to_artist(song_upload.artist, song_upload.name)
+
+
+async def upload_song_file_parts(
+    name: str, song_upload: SongUpload, file: UploadFile, part_urls: list[str]
+) -> list[SongUploadPart]:
+    """Upload a song file to cloud storage in parts as it's read in chunks
+
+    Args:
+        name (str): song name
+        song_upload (SongUpload): the song upload inspecting the file
+        file (UploadFile): song file
+        part_urls (list[str]): presigned urls of the parts
+
+    Raises:
+        SongFileTooLargeException: song file exceeds the upload size limit
+        SongBadFileException: song file is not an audio file
+        SongCreateSongStreamingException: unexpected error uploading a part
+
+    Returns:
+        list[SongUploadPart]: the uploaded parts
+    """
+    parts: list[SongUploadPart] = []
+    part = bytearray()
+
+    async def upload_part() -> None:
+        if len(parts) >= len(part_urls):
+            song_service_logger.warning(f"Song file {name} is larger than its size")
+            raise SongBadFileException
+        etag = await asyncio.to_thread(
+            upload_song_file_part,
+            name,
+            part_urls[len(parts)],
+            bytes(part[:SONG_UPLOAD_PART_BYTES]),
+        )
+        parts.append(SongUploadPart(part_number=len(parts) + 1, etag=etag))
+        del part[:SONG_UPLOAD_PART_BYTES]
+
+    async for chunk in song_upload.read_chunks(file):
+        part += chunk
+        while len(part) >= SONG_UPLOAD_PART_BYTES:
+            await upload_part()
+    if part or not parts:
+        await upload_part()
+    return parts
+
+
+def get_upload_file_size(file: UploadFile) -> int:
+    """Get the size of an uploaded file
+
+    Args:
+        file (UploadFile): the uploaded file
+
+    Returns:
+        int: the file size in bytes
+    """
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, os.SEEK_END)
+    return file.file.tell()
+
+
+async def create_song_upload(  # noqa: C901, PLR0912
+    name: str, genre: Genre, photo: str, size: int, token: TokenData
+) -> SongUploadDTO:
+    """Create song with its file uploaded by the client straight to cloud storage.\
+        The song is published once the upload is completed
 
     Args:
         name (str): song name
         genre (Genre): song genre
         photo (str): song photo
-        file (bytes): song file
+        size (int): song file size in bytes
         token (TokenData): user token
 
     Raises:
         GenreNotValidException: invalid genre
         UserBadNameException: invalid user name
         UserNotFoundException: user doesn't exists
-        EncodingFileException: error encoding file
         SongBadNameException: song bad name
+        SongBadFileException: invalid song file size
+        SongFileTooLargeException: song file exceeds the upload size limit
+        SongAlreadyExistsException: song already exists
         SongUnAuthorizedException: song created by unauthorized user
+        SongServiceException: unexpected error creating the song upload
+
+    Returns:
+        SongUploadDTO: the upload with the presigned urls to PUT the file parts
     """
     artist = token.username
 
@@ -152,25 +622,232 @@ async def create_song(  # noqa: C901
         base_user_service_validations.validate_user_name_parameter(artist)
         Genre.check_valid_genre(genre.value)
 
-        validate_song_should_not_exists(name)
-        validate_user_should_be_artist(artist)
+        await asyncio.to_thread(validate_song_should_not_exists, name)
+        await asyncio.to_thread(validate_user_should_be_artist, artist)
+
+        song_upload = await register_song_upload(name, artist, genre, photo, size)
+    except GenreNotValidException as exception:
+        song_service_logger.exception(f"Bad genre provided {genre}")
+        raise GenreNotValidException from exception
+    except UserBadNameException as exception:
+        song_service_logger.exception(f"Bad Artist Name Parameter: {artist}")
+        raise UserBadNameException from exception
+    except UserNotFoundException as exception:
+        song_service_logger.exception(f"Artist {artist} not found")
+        raise UserNotFoundException from exception
+    except SongBadNameException as exception:
+        song_service_logger.exception(f"Bad Song Name Parameter: {name}")
+        raise SongBadNameException from exception
+    except SongBadFileException as exception:
+        song_service_logger.exception(f"Bad song file size {size}: {name}")
+        raise SongBadFileException from exception
+    except SongFileTooLargeException as exception:
+        song_service_logger.exception(f"Song file exceeds the upload size limit: {name}")
+        raise SongFileTooLargeException from exception
+    except SongAlreadyExistsException as exception:
+        song_service_logger.exception(f"Song already exists: {name}")
+        raise SongAlreadyExistsException from exception
+    except UserUnauthorizedException as exception:
+        song_service_logger.exception(
+            f"User {artist} cannot create song {name} because hes not artist"
+        )
+        raise SongUnAuthorizedException from exception
+    except SongCreateSongStreamingException as exception:
+        song_service_logger.exception(f"Error creating song upload: {name}")
+        raise SongServiceException from exception
+    except UserServiceException as exception:
+        song_service_logger.exception(
+            f"Unexpected error in User Service while creating song upload: {name}"
+        )
+        raise SongServiceException from exception
+    except SongRepositoryException as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Repository creating song upload: {name}"
+        )
+        raise SongServiceException from exception
+    except Exception as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Service creating song upload: {name}"
+        )
+        raise SongServiceException from exception
+    else:
+        song_service_logger.info(f"Song {name} upload {song_upload.upload_id} created")
+        return song_upload
+
+
+async def complete_song_upload(  # noqa: C901
+    name: str, upload_id: str, parts: list[SongUploadPart], token: TokenData
+) -> None:
+    """Complete the upload of a song file and publish the song, reading its duration\
+        from the uploaded file
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+        parts (list[SongUploadPart]): the uploaded parts
+        token (TokenData): user token
+
+    Raises:
+        SongBadNameException: song bad name
+        SongUnAuthorizedException: the user is not the song artist
+        SongUploadNotFoundException: the song has no pending upload with the id
+        SongAlreadyExistsException: a song with the same name already exists
+        SongBadFileException: uploaded song file is not an audio file
+        SongFileTooLargeException: uploaded song file exceeds the upload size limit
+        SongServiceException: unexpected error completing the upload
+    """
+    artist = token.username
+
+    try:
+        validate_song_name_parameter(name)
+        song_upload = await asyncio.to_thread(song_repository.get_song_upload, name, upload_id)
+        validate_song_upload_artist(song_upload, artist)
+
+        url, size = await asyncio.to_thread(complete_song_file_upload, name, upload_id, parts)
+        try:
+            song_duration = await asyncio.to_thread(
+                read_song_file_duration_seconds, name, url, size
+            )
+        except (SongBadFileException, SongFileTooLargeException):
+            await discard_uploaded_song_file(name, upload_id)
+            raise
+        await asyncio.to_thread(finish_song_upload, song_upload, song_duration)
+    except SongBadNameException as exception:
+        song_service_logger.exception(f"Bad Song Name Parameter: {name}")
+        raise SongBadNameException from exception
+    except SongBadFileException as exception:
+        song_service_logger.exception(f"Uploaded song file is not an audio file: {name}")
+        raise SongBadFileException from exception
+    except SongFileTooLargeException as exception:
+        song_service_logger.exception(f"Uploaded song file exceeds the size limit: {name}")
+        raise SongFileTooLargeException from exception
+    except SongAlreadyExistsException as exception:
+        song_service_logger.exception(f"Song already exists: {name}")
+        raise SongAlreadyExistsException from exception
+    except SongUnAuthorizedException as exception:
+        song_service_logger.exception(f"User {artist} cannot complete upload of song {name}")
+        raise SongUnAuthorizedException from exception
+    except SongUploadNotFoundException as exception:
+        song_service_logger.exception(f"Song upload not found: {name} {upload_id}")
+        raise SongUploadNotFoundException from exception
+    except (SongCreateSongStreamingException, SongGetUrlStreamingException) as exception:
+        song_service_logger.exception(f"Error completing song upload: {name}")
+        raise SongServiceException from exception
+    except SongRepositoryException as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Repository completing song upload: {name}"
+        )
+        raise SongServiceException from exception
+    except Exception as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Service completing song upload: {name}"
+        )
+        raise SongServiceException from exception
+    else:
+        song_service_logger.info(f"Song {name} upload {upload_id} completed")
+
+
+async def abort_song_upload(name: str, upload_id: str, token: TokenData) -> None:
+    """Abort the upload of a song file and delete the pending upload
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+        token (TokenData): user token
+
+    Raises:
+        SongBadNameException: song bad name
+        SongUnAuthorizedException: the user is not the song artist
+        SongUploadNotFoundException: the song has no pending upload with the id
+        SongServiceException: unexpected error aborting the upload
+    """
+    artist = token.username
 
-        song_duration = get_song_duration_seconds(name, file)
-        encoded_bytes = encode_file(name, file)
+    try:
+        validate_song_name_parameter(name)
+        song_upload = await asyncio.to_thread(song_repository.get_song_upload, name, upload_id)
+        validate_song_upload_artist(song_upload, artist)
 
-        response_create_song_request = song_serverless_api.create_song(
-            song_name=name, encoded_bytes=encoded_bytes
+        await asyncio.to_thread(
+            song_repository.delete_song_upload, name=name, upload_id=upload_id
         )
-        validate_song_creating_streaming_response(name, response_create_song_request)
+        await asyncio.to_thread(abort_song_file_upload, name, upload_id)
+    except SongBadNameException as exception:
+        song_service_logger.exception(f"Bad Song Name Parameter: {name}")
+        raise SongBadNameException from exception
+    except SongUnAuthorizedException as exception:
+        song_service_logger.exception(f"User {artist} cannot abort upload of song {name}")
+        raise SongUnAuthorizedException from exception
+    except SongUploadNotFoundException as exception:
+        song_service_logger.exception(f"Song upload not found: {name} {upload_id}")
+        raise SongUploadNotFoundException from exception
+    except SongDeleteSongStreamingException as exception:
+        song_service_logger.exception(f"Error aborting song upload: {name}")
+        raise SongServiceException from exception
+    except SongRepositoryException as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Repository aborting song upload: {name}"
+        )
+        raise SongServiceException from exception
+    except Exception as exception:
+        song_service_logger.exception(
+            f"Unexpected error in Song Service aborting song upload: {name}"
+        )
+        raise SongServiceException from exception
+    else:
+        song_service_logger.info(f"Song {name} upload {upload_id} aborted")
 
-        song_repository.create_song(
-            name=name,
-            artist=artist,
-            photo=photo,
-            duration=song_duration,
-            genre=genre,
+
+async def create_song(  # noqa: C901, PLR0912, PLR0915
+    name: str, genre: Genre, photo: str, file: UploadFile, token: TokenData
+) -> None:
+    """Create song, uploading its file in parts to cloud storage as it's read
+
+    Args:
+        name (str): song name
+        genre (Genre): song genre
+        photo (str): song photo
+        file (UploadFile): song file
+        token (TokenData): user token
+
+    Raises:
+        GenreNotValidException: invalid genre
+        UserBadNameException: invalid user name
+        UserNotFoundException: user doesn't exists
+        SongBadNameException: song bad name
+        SongBadFileException: song file is not an audio file
+        SongFileTooLargeException: song file exceeds the upload size limit
+        SongUnAuthorizedException: song created by unauthorized user
+    """
+    artist = token.username
+
+    try:
+        validate_song_name_parameter(name)
+        base_user_service_validations.validate_user_name_parameter(artist)
+        Genre.check_valid_genre(genre.value)
+
+        await asyncio.to_thread(validate_song_should_not_exists, name)
+        await asyncio.to_thread(validate_user_should_be_artist, artist)
+
+        song_upload = SongUpload(name)
+        upload = await register_song_upload(
+            name, artist, genre, photo, get_upload_file_size(file)
+        )
+        try:
+            parts = await upload_song_file_parts(name, song_upload, file, upload.part_urls)
+            song_duration = await song_upload.get_duration_seconds(file)
+            await asyncio.to_thread(complete_song_file_upload, name, upload.upload_id, parts)
+        except BaseException:
+            await discard_song_upload(name, upload.upload_id)
+            raise
+
+        await asyncio.to_thread(
+            finish_song_upload,
+            SongUploadDAO(
+                name=name, artist=artist, genre=genre, photo=photo, upload_id=upload.upload_id
+            ),
+            song_duration,
         )
-        artist_service.add_song_to_artist(artist, name)
     except GenreNotValidException as exception:
         song_service_logger.exception(f"Bad genre provided {genre}")
         raise GenreNotValidException from exception
@@ -180,12 +857,15 @@ async def create_song(  # noqa: C901
     except UserNotFoundException as exception:
         song_service_logger.exception(f"Artist {artist} not found")
         raise UserNotFoundException from exception
-    except EncodingFileException as exception:
-        song_service_logger.exception(f"Error encoding file with name {name}")
-        raise EncodingFileException from exception
     except SongBadNameException as exception:
         song_service_logger.exception(f"Bad Song Name Parameter: {name}")
         raise SongBadNameException from exception
+    except SongBadFileException as exception:
+        song_service_logger.exception(f"Song file is not an audio file: {name}")
+        raise SongBadFileException from exception
+    except SongFileTooLargeException as exception:
+        song_service_logger.exception(f"Song file exceeds the upload size limit: {name}")
+        raise SongFileTooLargeException from exception
     except SongAlreadyExistsException as exception:
         song_service_logger.exception(f"Song already exists: {name}")
         raise SongAlreadyExistsException from exception
@@ -241,6 +921,7 @@ def delete_song(name: str) -> None:
             name,
         )
         base_song_repository.delete_song(name)
+        SearchEngine.remove(SearchItemType.SONG, name)
 
     except SongNotFoundException as exception:
         song_service_logger.exception(f"Song not found: {name}")
@@ -0,0 +1,234 @@
+"""
+Song upload controller for handling incoming HTTP Requests
+Song files are uploaded by the client straight to cloud storage with presigned urls,\
+    only available in the serverless architecture
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends
+from fastapi.responses import Response
+from starlette.status import (
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_403_FORBIDDEN,
+    HTTP_404_NOT_FOUND,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+)
+
+import app.spotify_electron.song.serverless.song_service as song_service
+import app.spotify_electron.utils.json_converter.json_converter_utils as json_converter_utils
+from app.auth.auth_schema import BadJWTTokenProvidedException, TokenData
+from app.auth.JWTBearer import JWTBearer
+from app.common.PropertiesMessagesManager import PropertiesMessagesManager
+from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.spotify_electron.genre.genre_schema import Genre, GenreNotValidException
+from app.spotify_electron.song.base_song_schema import (
+    SongAlreadyExistsException,
+    SongBadFileException,
+    SongBadNameException,
+    SongFileTooLargeException,
+    SongServiceException,
+    SongUnAuthorizedException,
+)
+from app.spotify_electron.song.serverless.song_schema import (
+    SongUploadNotFoundException,
+    SongUploadPart,
+)
+from app.spotify_electron.user.user.user_schema import (
+    UserBadNameException,
+    UserNotFoundException,
+)
+
+router = APIRouter(
+    prefix="/songs/uploads",
+    tags=["Songs"],
+)
+
+
+@router.post("/")
+async def create_song_upload(  # noqa: C901
+    name: str,
+    genre: Genre,
+    photo: str,
+    size: int,
+    token: Annotated[TokenData | None, Depends(JWTBearer())],
+) -> Response:
+    """Create song with its file uploaded straight to cloud storage. The file parts\
+        are PUT to the returned presigned urls and the upload is completed afterwards
+
+    Args:
+        name (str): song name
+        genre (Genre): genre
+        photo (str): photo
+        size (int): song file size in bytes
+    """
+    try:
+        song_upload = await song_service.create_song_upload(name, genre, photo, size, token)
+        song_upload_json = json_converter_utils.get_json_from_model(song_upload)
+
+        return Response(
+            song_upload_json, media_type="application/json", status_code=HTTP_201_CREATED
+        )
+    except BadJWTTokenProvidedException:
+        return Response(
+            status_code=HTTP_403_FORBIDDEN,
+            content=PropertiesMessagesManager.tokenInvalidCredentials,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except GenreNotValidException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.genreNotValid,
+        )
+    except UserBadNameException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.userBadName,
+        )
+    except SongBadNameException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songBadName,
+        )
+    except SongAlreadyExistsException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songAlreadyExists,
+        )
+    except UserNotFoundException:
+        return Response(
+            status_code=HTTP_404_NOT_FOUND,
+            content=PropertiesMessagesManager.userNotFound,
+        )
+    except SongBadFileException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songBadFile,
+        )
+    except SongFileTooLargeException:
+        return Response(
+            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content=PropertiesMessagesManager.songFileTooLarge,
+        )
+    except SongUnAuthorizedException:
+        return Response(
+            status_code=HTTP_403_FORBIDDEN,
+            content=PropertiesMessagesManager.songCreateUnauthorizedUser,
+        )
+    except JsonEncodeException:
+        return Response(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=PropertiesMessagesManager.commonEncodingError,
+        )
+    except (Exception, SongServiceException):
+        return Response(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=PropertiesMessagesManager.commonInternalServerError,
+        )
+
+
+@router.put("/{name}")
+async def complete_song_upload(
+    name: str,
+    upload_id: str,
+    token: Annotated[TokenData | None, Depends(JWTBearer())],
+    parts: list[SongUploadPart] = Body(...),
+) -> Response:
+    """Complete song upload, publishing the song
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+        parts (list[SongUploadPart]): uploaded parts with the ETag returned by cloud\
+            storage for each of them
+    """
+    try:
+        await song_service.complete_song_upload(name, upload_id, parts, token)
+        return Response(None, HTTP_201_CREATED)
+    except BadJWTTokenProvidedException:
+        return Response(
+            status_code=HTTP_403_FORBIDDEN,
+            content=PropertiesMessagesManager.tokenInvalidCredentials,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except SongBadNameException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songBadName,
+        )
+    except SongAlreadyExistsException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songAlreadyExists,
+        )
+    except SongBadFileException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songBadFile,
+        )
+    except SongFileTooLargeException:
+        return Response(
+            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content=PropertiesMessagesManager.songFileTooLarge,
+        )
+    except SongUploadNotFoundException:
+        return Response(
+            status_code=HTTP_404_NOT_FOUND,
+            content=PropertiesMessagesManager.songUploadNotFound,
+        )
+    except SongUnAuthorizedException:
+        return Response(
+            status_code=HTTP_403_FORBIDDEN,
+            content=PropertiesMessagesManager.userUnauthorized,
+        )
+    except (Exception, SongServiceException):
+        return Response(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=PropertiesMessagesManager.commonInternalServerError,
+        )
+
+
+@router.delete("/{name}")
+async def abort_song_upload(
+    name: str,
+    upload_id: str,
+    token: Annotated[TokenData | None, Depends(JWTBearer())],
+) -> Response:
+    """Abort song upload, deleting the pending song
+
+    Args:
+        name (str): song name
+        upload_id (str): upload id
+    """
+    try:
+        await song_service.abort_song_upload(name, upload_id, token)
+        return Response(None, HTTP_202_ACCEPTED)
+    except BadJWTTokenProvidedException:
+        return Response(
+            status_code=HTTP_403_FORBIDDEN,
+            content=PropertiesMessagesManager.tokenInvalidCredentials,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except SongBadNameException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.songBadName,
+        )
+    except SongUploadNotFoundException:
+        return Response(
+            status_code=HTTP_404_NOT_FOUND,
+            content=PropertiesMessagesManager.songUploadNotFound,
+        )
+    except SongUnAuthorizedException:
+        return Response(
+            status_code=HTTP_403_FORBIDDEN,
+            content=PropertiesMessagesManager.userUnauthorized,
+        )
+    except (Exception, SongServiceException):
+        return Response(
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            content=PropertiesMessagesManager.commonInternalServerError,
+        )
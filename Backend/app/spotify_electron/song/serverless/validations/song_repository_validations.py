@@ -0,0 +1,41 @@
+"""
+Validations for Serverless function Song repository
+"""
+
+from typing import Any
+
+from pymongo.results import DeleteResult
+
+from app.spotify_electron.song.serverless.song_schema import SongUploadNotFoundException
+
+
+def validate_song_upload_exists(song_upload: dict[str, Any] | None) -> None:
+    """Raises an exception if the pending upload was not found
+
+    Args:
+    ----
+        song_upload (dict[str, Any] | None): the song upload document
+
+    Raises:
+    ------
+        SongUploadNotFoundException: if the song has no pending upload
+
+    """
+    if song_upload is None:
+        raise SongUploadNotFoundException
+
+
+def validate_song_upload_delete_count(result: DeleteResult) -> None:
+    """Raises an exception if no pending upload was deleted
+
+    Args:
+    ----
+        result (DeleteResult): the result from the deletion
+
+    Raises:
+    ------
+        SongUploadNotFoundException: if the song has no pending upload
+
+    """
+    if result.deleted_count == 0:
+        raise SongUploadNotFoundException
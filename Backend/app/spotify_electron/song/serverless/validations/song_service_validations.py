@@ -38,6 +38,24 @@ def validate_song_creating_streaming_response(name: str, response: Response) ->
         raise SongCreateSongStreamingException
 
 
+def validate_song_part_uploading_response(name: str, response: Response) -> None:
+    """Validate uploading a part of a song file to cloud storage
+
+    Args:
+        name (str): song name
+        response (Response): incoming response
+
+    Raises:
+        SongCreateSongStreamingException: if the request failed
+    """
+    if response.status_code != HTTP_200_OK or not response.headers.get("ETag"):
+        song_service_logger.error(
+            f"Error uploading a file part of song {name}\n"
+            f"Request Status {response.status_code} with Content {response.content}"
+        )
+        raise SongCreateSongStreamingException
+
+
 def validate_get_song_url_streaming_response(name: str, response: Response) -> None:
     """Validate get url streaming song response
 
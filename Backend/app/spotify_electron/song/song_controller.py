@@ -5,7 +5,7 @@ It uses the base_song_service for handling logic for different song architecture
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, UploadFile
+from fastapi import APIRouter, Depends, Header, UploadFile
 from fastapi.responses import Response
 from starlette.status import (
     HTTP_200_OK,
@@ -15,6 +15,7 @@ from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
@@ -23,11 +24,13 @@ import app.spotify_electron.utils.json_converter.json_converter_utils as json_co
 from app.auth.auth_schema import BadJWTTokenProvidedException, TokenData
 from app.auth.JWTBearer import JWTBearer
 from app.common.PropertiesMessagesManager import PropertiesMessagesManager
-from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.exceptions.base_exceptions_schema import BadParameterException, JsonEncodeException
 from app.spotify_electron.genre.genre_schema import Genre, GenreNotValidException
 from app.spotify_electron.song.base_song_schema import (
     SongAlreadyExistsException,
+    SongBadFileException,
     SongBadNameException,
+    SongFileTooLargeException,
     SongNotFoundException,
     SongServiceException,
     SongUnAuthorizedException,
@@ -37,9 +40,7 @@ from app.spotify_electron.user.user.user_schema import (
     UserBadNameException,
     UserNotFoundException,
 )
-from app.spotify_electron.utils.audio_management.audio_management_utils import (
-    EncodingFileException,
-)
+from app.spotify_electron.utils.pagination.pagination_utils import DEFAULT_PAGE_LIMIT
 
 router = APIRouter(
     prefix="/songs",
@@ -48,7 +49,7 @@ router = APIRouter(
 
 
 @router.get("/{name}")
-def get_song(
+async def get_song(
     name: str,
     token: Annotated[TokenData | None, Depends(JWTBearer())],
 ) -> Response:
@@ -58,7 +59,7 @@ def get_song(
         name (str): song name
     """
     try:
-        song = get_song_service().get_song(name)
+        song = await get_song_service().get_song_async(name)
         song_json = json_converter_utils.get_json_from_model(song)
 
         return Response(song_json, media_type="application/json", status_code=HTTP_200_OK)
@@ -85,7 +86,7 @@ def get_song(
 
 
 @router.post("/")
-async def create_song(
+async def create_song(  # noqa: C901
     name: str,
     genre: Genre,
     photo: str,
@@ -100,10 +101,8 @@ async def create_song(
         photo (str): photo
         file (UploadFile): song file
     """
-    readFile = await file.read()
-
     try:
-        await get_song_service().create_song(name, genre, photo, readFile, token)
+        await get_song_service().create_song(name, genre, photo, file, token)
         return Response(None, HTTP_201_CREATED)
     except BadJWTTokenProvidedException:
         return Response(
@@ -136,11 +135,16 @@ async def create_song(
             status_code=HTTP_404_NOT_FOUND,
             content=PropertiesMessagesManager.userNotFound,
         )
-    except EncodingFileException:
+    except SongBadFileException:
         return Response(
             status_code=HTTP_400_BAD_REQUEST,
             content=PropertiesMessagesManager.songBadFile,
         )
+    except SongFileTooLargeException:
+        return Response(
+            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content=PropertiesMessagesManager.songFileTooLarge,
+        )
     except SongUnAuthorizedException:
         return Response(
             status_code=HTTP_403_FORBIDDEN,
@@ -239,26 +243,53 @@ def increase_song_streams(
 
 
 @router.get("/genres/{genre}")
-def get_songs_by_genre(
+def get_songs_by_genre(  # noqa: PLR0913
     genre: Genre,
     token: Annotated[TokenData | None, Depends(JWTBearer())],
+    limit: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
+    accept: Annotated[str | None, Header()] = None,
 ) -> Response:
-    """Get songs by genre
+    """Get a page of songs by genre sorted by name
 
     Args:
         genre (Genre): the genre to match
+        limit (int | None): max songs returned, every song is returned if\
+            neither a limit nor a cursor are requested
+        cursor (str | None): cursor of the page, returned in the X-Next-Cursor header\
+            of the previous page
+        stream (bool): stream every song after the cursor instead of a page,\
+            as newline delimited json if accepted by the client
     """
     try:
-        songs = base_song_service.get_songs_by_genre(genre)
+        if stream or (limit is None and cursor is None):
+            return json_converter_utils.get_streaming_response_from_models(
+                base_song_service.get_songs_by_genre_stream(genre, cursor), "songs", accept
+            )
+
+        songs = base_song_service.get_songs_by_genre(
+            genre, DEFAULT_PAGE_LIMIT if limit is None else limit, cursor
+        )
         songs_json = json_converter_utils.get_json_with_iterable_field_from_model(
-            songs, "songs"
+            songs.items, "songs"
+        )
+        return Response(
+            songs_json,
+            media_type="application/json",
+            status_code=HTTP_200_OK,
+            headers=songs.get_headers(),
         )
-        return Response(songs_json, media_type="application/json", status_code=HTTP_200_OK)
     except GenreNotValidException:
         return Response(
             status_code=HTTP_400_BAD_REQUEST,
             content=PropertiesMessagesManager.genreNotValid,
         )
+    except BadParameterException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.commonBadParameter,
+        )
     except JsonEncodeException:
         return Response(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,182 @@
+"""
+Write-behind buffer for song streams
+
+Song streams are accumulated per song in memory and stored in batches instead of\
+    updating the song document on every stream. A background thread flushes the pending\
+    streams every configured interval or as soon as enough streams are buffered.
+Pending streams are flushed when the app stops. Streams a flush could not store are\
+    kept and retried on the next one, streams already stored are never retried
+
+Declares SongStreamsBuffer global object to be accessed from across the app
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_SONG_STREAMS_BUFFER
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.song.base_song_schema import SongStreamsBufferStats
+
+song_streams_buffer_logger = SpotifyElectronLogger(LOGGING_SONG_STREAMS_BUFFER).getLogger()
+
+
+class _SongStreamsBuffer:
+    """Accumulates song streams by song name and stores them in batches"""
+
+    def __init__(self, flush_interval_ms: float, flush_max_events: int) -> None:
+        self.flush_interval_ms = flush_interval_ms
+        """Max milliseconds a stream is buffered, 0 stores every stream right away"""
+        self.flush_max_events = flush_max_events
+        """Buffered streams that trigger a flush before the interval ends"""
+        self._pending: dict[str, int] = {}
+        self._pending_streams = 0
+        self._flusher: Callable[[dict[str, int]], dict[str, int]] | None = None
+        self._thread: threading.Thread | None = None
+        self._is_stopping = False
+        self._wake_up = threading.Event()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flushed_streams = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._last_flush_latency_ms = 0.0
+        self._max_flush_latency_ms = 0.0
+
+    def start(self, flusher: Callable[[dict[str, int]], dict[str, int]]) -> None:
+        """Start flushing buffered streams in background
+
+        Args:
+            flusher (Callable[[dict[str, int]], dict[str, int]]): stores streams by song\
+                name, returning the ones that were not stored. Raises if none were stored
+        """
+        self._flusher = flusher
+        if self.flush_interval_ms <= 0 or self._thread is not None:
+            return
+        self._is_stopping = False
+        self._wake_up.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="song-streams-buffer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background flush and store all pending streams"""
+        thread = self._thread
+        if thread is not None:
+            self._is_stopping = True
+            self._wake_up.set()
+            thread.join()
+            self._thread = None
+        if not self.flush():
+            song_streams_buffer_logger.error(
+                f"{self.get_stats().pending_streams} song streams were not stored"
+            )
+
+    def add(self, name: str) -> None:
+        """Buffer a song stream
+
+        Args:
+            name (str): song name
+        """
+        with self._lock:
+            self._pending[name] = self._pending.get(name, 0) + 1
+            self._pending_streams += 1
+            is_full = self._pending_streams >= self.flush_max_events
+
+        if self._thread is None:
+            self.flush()
+        elif is_full:
+            self._wake_up.set()
+
+    def flush(self) -> bool:
+        """Store all pending streams
+
+        Returns:
+            bool: if there are no pending streams left
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return True
+                if self._flusher is None:
+                    return False
+                pending = self._pending
+                pending_streams = self._pending_streams
+                self._pending = {}
+                self._pending_streams = 0
+
+            start_time = time.perf_counter()
+            try:
+                failed_songs_streams = self._flusher(pending)
+            except Exception:
+                song_streams_buffer_logger.exception(
+                    f"Error storing {pending_streams} song streams, retrying on next flush"
+                )
+                failed_songs_streams = pending
+
+            failed_streams = sum(failed_songs_streams.values())
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            with self._lock:
+                for name, streams in failed_songs_streams.items():
+                    self._pending[name] = self._pending.get(name, 0) + streams
+                self._pending_streams += failed_streams
+                self._flushed_streams += pending_streams - failed_streams
+                if failed_songs_streams:
+                    self._failed_flushes += 1
+                else:
+                    self._flushes += 1
+                    self._last_flush_latency_ms = latency_ms
+                    self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+            if failed_songs_streams:
+                song_streams_buffer_logger.warning(
+                    f"{failed_streams} song streams were not stored, retrying on next flush"
+                )
+                return False
+            song_streams_buffer_logger.debug(
+                f"Stored {pending_streams} streams of {len(pending)} songs "
+                f"in {latency_ms:.2f}ms"
+            )
+            return True
+
+    def get_stats(self) -> SongStreamsBufferStats:
+        """Get buffer usage stats
+
+        Returns:
+            SongStreamsBufferStats: the buffer stats
+        """
+        with self._lock:
+            return SongStreamsBufferStats(
+                pending_streams=self._pending_streams,
+                pending_songs=len(self._pending),
+                flushed_streams=self._flushed_streams,
+                flushes=self._flushes,
+                failed_flushes=self._failed_flushes,
+                last_flush_latency_ms=self._last_flush_latency_ms,
+                max_flush_latency_ms=self._max_flush_latency_ms,
+            )
+
+    def _run(self) -> None:
+        """Flush pending streams every interval or when the buffer is full until stopped"""
+        while not self._is_stopping:
+            self._wake_up.wait(self.flush_interval_ms / 1000)
+            self._wake_up.clear()
+            self.flush()
+
+
+SongStreamsBuffer = _SongStreamsBuffer(
+    flush_interval_ms=float(
+        getattr(PropertiesManager, AppConfig.SONG_STREAMS_FLUSH_INTERVAL_MS, 0) or 0
+    ),
+    flush_max_events=int(
+        getattr(PropertiesManager, AppConfig.SONG_STREAMS_FLUSH_MAX_EVENTS, 0) or 0
+    ),
+)
+
+metrics_service.register_metrics_provider(
+    "song_streams_buffer", lambda: asdict(SongStreamsBuffer.get_stats())
+)
@@ -0,0 +1,196 @@
+"""
+Song upload pipeline
+
+Uploaded song files are read in chunks from the request temporary file. Every chunk\
+    is hashed, checked against the upload size limit and fed to the MP3 duration\
+    parser before being stored, and the file format is sniffed from the first chunk,\
+    so non-audio and oversize files are rejected without reading them whole. Memory\
+    stays bounded by the chunk size whatever the file size
+"""
+
+import hashlib
+from collections.abc import AsyncIterator
+
+from fastapi import UploadFile
+
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_SONG_UPLOAD
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.song.base_song_schema import (
+    SongBadFileException,
+    SongFileTooLargeException,
+)
+from app.spotify_electron.utils.audio_management.audio_format_utils import (
+    AUDIO_FORMAT_SNIFF_BYTES,
+    AudioFormat,
+    get_audio_format,
+)
+from app.spotify_electron.utils.audio_management.audio_management_utils import (
+    AudioDecoder,
+    get_duration_result,
+    get_song_duration_seconds_async,
+)
+from app.spotify_electron.utils.audio_management.mp3_header_utils import (
+    MP3DurationParser,
+)
+
+song_upload_logger = SpotifyElectronLogger(LOGGING_SONG_UPLOAD).getLogger()
+
+DEFAULT_UPLOAD_CHUNK_BYTES = 255 * 1024
+"""GridFS default chunk size, every chunk read is stored as a single GridFS chunk"""
+
+SONG_UPLOAD_MAX_BYTES = int(
+    getattr(PropertiesManager, AppConfig.SONG_UPLOAD_MAX_BYTES, 0) or 0
+)
+SONG_UPLOAD_CHUNK_BYTES = int(
+    getattr(PropertiesManager, AppConfig.SONG_UPLOAD_CHUNK_BYTES, 0)
+    or DEFAULT_UPLOAD_CHUNK_BYTES
+)
+
+
+class SongUpload:
+    """Inspects an uploaded song file while it's read in chunks"""
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int = SONG_UPLOAD_MAX_BYTES,
+        chunk_size: int = SONG_UPLOAD_CHUNK_BYTES,
+    ) -> None:
+        self.name = name
+        """Song name"""
+        self.max_bytes = max_bytes
+        """Max bytes of the file, 0 disables the limit"""
+        self.chunk_size = chunk_size
+        """Bytes read at once"""
+        self.size = 0
+        """Bytes read"""
+        self.audio_format: AudioFormat | None = None
+        """File format, known once the first chunk is read"""
+        self._head = bytearray()
+        self._hash = hashlib.sha256()
+        self._duration_parser = MP3DurationParser()
+        self._mp3_duration: float | None = None
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the bytes read"""
+        return self._hash.hexdigest()
+
+    async def read_chunks(self, file: UploadFile) -> AsyncIterator[bytes]:
+        """Read the file in chunks, inspecting them as they are read
+
+        Args:
+            file (UploadFile): the uploaded file
+
+        Raises:
+            SongFileTooLargeException: the file exceeds the upload size limit
+            SongBadFileException: the file is not an audio file
+
+        Yields:
+            bytes: the file chunks
+        """
+        if file.size is not None:
+            self._check_size(file.size)
+        await file.seek(0)
+        while chunk := await file.read(self.chunk_size):
+            self._inspect(chunk)
+            yield chunk
+        self._finish()
+
+    async def read(self, file: UploadFile) -> bytes:
+        """Read the whole file, inspecting it in chunks
+
+        Args:
+            file (UploadFile): the uploaded file
+
+        Raises:
+            SongFileTooLargeException: the file exceeds the upload size limit
+            SongBadFileException: the file is not an audio file
+
+        Returns:
+            bytes: the file
+        """
+        return b"".join([chunk async for chunk in self.read_chunks(file)])
+
+    async def get_duration_seconds(self, file: UploadFile) -> int:
+        """Get the song duration once the file was read
+
+        Args:
+            file (UploadFile): the uploaded file, only read again if its duration\
+                cannot be parsed from the MP3 headers
+
+        Returns:
+            int: the duration in seconds, defaulted to 0 if not a song file
+        """
+        if self._mp3_duration is not None:
+            AudioDecoder.record_header_parsed()
+            return get_duration_result(self.name, self._mp3_duration)
+        if self.size == 0:
+            return get_duration_result(self.name, None)
+        await file.seek(0)
+        return await get_song_duration_seconds_async(self.name, await file.read())
+
+    def _inspect(self, chunk: bytes) -> None:
+        """Inspect the next chunk of the file
+
+        Args:
+            chunk (bytes): the chunk
+
+        Raises:
+            SongFileTooLargeException: the file exceeds the upload size limit
+            SongBadFileException: the file is not an audio file
+        """
+        self.size += len(chunk)
+        self._check_size(self.size)
+        self._hash.update(chunk)
+        if self.audio_format is None:
+            self._head += chunk[: AUDIO_FORMAT_SNIFF_BYTES - len(self._head)]
+            if len(self._head) >= AUDIO_FORMAT_SNIFF_BYTES:
+                self._sniff_audio_format()
+        if self.audio_format in (None, AudioFormat.MP3):
+            self._duration_parser.update(chunk)
+
+    def _finish(self) -> None:
+        """Inspect the end of the file. Empty files have no format to sniff and are\
+            stored without a duration
+
+        Raises:
+            SongBadFileException: the file is not an audio file
+        """
+        if self.audio_format is None and self.size > 0:
+            self._sniff_audio_format()
+        if self.audio_format == AudioFormat.MP3:
+            self._mp3_duration = self._duration_parser.finish()
+        song_upload_logger.debug(
+            f"Song file {self.name} read, {self.size} bytes, format {self.audio_format}, "
+            f"sha256 {self.content_hash}"
+        )
+
+    def _sniff_audio_format(self) -> None:
+        """Get the file format from its first bytes
+
+        Raises:
+            SongBadFileException: the file is not an audio file
+        """
+        self.audio_format = get_audio_format(bytes(self._head))
+        self._head.clear()
+        if self.audio_format is None:
+            song_upload_logger.warning(f"Song file {self.name} is not an audio file")
+            raise SongBadFileException
+
+    def _check_size(self, size: int) -> None:
+        """Check a file size against the upload size limit
+
+        Args:
+            size (int): the file size
+
+        Raises:
+            SongFileTooLargeException: the file exceeds the upload size limit
+        """
+        if 0 < self.max_bytes < size:
+            song_upload_logger.warning(
+                f"Song file {self.name} exceeds the upload size limit of {self.max_bytes}"
+            )
+            raise SongFileTooLargeException
@@ -3,3 +3,5 @@ Constants for Stream service
 """
 
 SONG_STREAMING_BUFFER_SIZE = 64_000
+SONG_CONTENT_TYPE = "audio/mp3"
+MAX_STREAM_RANGES = 16
@@ -2,10 +2,11 @@
 Stream controller for handling song audio streaming
 """
 
+import asyncio
+
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import StreamingResponse
 from starlette.status import (
-    HTTP_206_PARTIAL_CONTENT,
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
@@ -32,25 +33,32 @@ router = APIRouter(
 
 @router.get("/{name}", response_model=None)
 async def stream_song(name: str, request: Request) -> StreamingResponse | Response:
-    """Streams song audio
+    """Streams song audio. Supports single and multiple byte ranges and\
+        conditional requests with ETag and Last-Modified validators
 
     Args:
         name (str): song name
         request (Request): incoming request
     """
     try:
-        range_header = request.headers.get("range")
+        stream_audio_content = await asyncio.to_thread(
+            stream_service.get_stream_audio_data,
+            request.headers.get("range"),
+            name,
+            request.headers.get("if-none-match"),
+            request.headers.get("if-range"),
+        )
 
-        stream_audio_content = stream_service.get_stream_audio_data(range_header, name)
+        if stream_audio_content.song_data is None:
+            return Response(
+                status_code=stream_audio_content.status_code,
+                headers=stream_audio_content.headers,
+            )
 
         return StreamingResponse(
-            stream_service.stream_audio(
-                song_data=stream_audio_content.song_data,
-                start=stream_audio_content.start,
-                end=stream_audio_content.end,
-            ),
+            stream_service.stream_audio_content(stream_audio_content),
             headers=stream_audio_content.headers,
-            status_code=HTTP_206_PARTIAL_CONTENT,
+            status_code=stream_audio_content.status_code,
         )
     except SongBadNameException:
         return Response(
@@ -67,13 +75,43 @@ async def stream_song(name: str, request: Request) -> StreamingResponse | Respon
             status_code=HTTP_404_NOT_FOUND,
             content=PropertiesMessagesManager.songDataNotFound,
         )
-    except InvalidContentRangeStreamException:
+    except InvalidContentRangeStreamException as exception:
         return Response(
             status_code=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
             content=PropertiesMessagesManager.streamInvalidRangeHeader,
+            headers={"content-range": f"bytes */{exception.file_size}"}
+            if exception.file_size is not None
+            else None,
         )
     except (Exception, StreamServiceException):
         return Response(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
             content=PropertiesMessagesManager.commonInternalServerError,
         )
+
+
+@router.head("/{name}", response_model=None)
+async def head_stream_song(name: str, request: Request) -> Response:
+    """Get song audio headers such as length and ETag without streaming it
+
+    Args:
+        name (str): song name
+        request (Request): incoming request
+    """
+    try:
+        stream_audio_content = await asyncio.to_thread(
+            stream_service.get_stream_audio_metadata,
+            name,
+            request.headers.get("if-none-match"),
+        )
+
+        return Response(
+            status_code=stream_audio_content.status_code,
+            headers=stream_audio_content.headers,
+        )
+    except SongBadNameException:
+        return Response(status_code=HTTP_400_BAD_REQUEST)
+    except (SongNotFoundException, SongDataNotFoundException):
+        return Response(status_code=HTTP_404_NOT_FOUND)
+    except (Exception, StreamServiceException):
+        return Response(status_code=HTTP_500_INTERNAL_SERVER_ERROR)
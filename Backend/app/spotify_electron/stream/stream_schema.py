@@ -2,7 +2,9 @@
 Stream schema for domain model
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from gridfs import GridOut
 
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
 
@@ -11,14 +13,18 @@ from app.exceptions.base_exceptions_schema import SpotifyElectronException
 class StreamAudioContent:
     """Content data for streaming audio"""
 
-    start: int
-    """Request start byte"""
-    end: int
-    """Request end byte"""
+    status_code: int
+    """Response status code"""
     headers: dict[str, str]
     """Response headers"""
-    song_data: bytes
-    """Song data from start-end bytes"""
+    song_data: bytes | memoryview | GridOut | None
+    """Cached song data, song data mapped from disk or song data file, only the\
+        requested ranges are read from the file while streaming. None when the\
+        client copy is still valid or only headers were requested"""
+    ranges: list[tuple[int, int]] = field(default_factory=list)
+    """Requested start and end bytes, inclusive"""
+    multipart_boundary: str | None = None
+    """Boundary between ranges when more than one range is requested"""
 
 
 class StreamServiceException(SpotifyElectronException):
@@ -35,5 +41,7 @@ class InvalidContentRangeStreamException(SpotifyElectronException):
 
     ERROR = "Invalid content range for streaming"
 
-    def __init__(self):
+    def __init__(self, file_size: int | None = None):
+        self.file_size = file_size
+        """Size of the requested song data, if known"""
         super().__init__(self.ERROR)
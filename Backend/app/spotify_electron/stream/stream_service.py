@@ -3,8 +3,16 @@
 Based on: https://github.com/fastapi/fastapi/issues/1240#issuecomment-1312294359
 """
 
+import asyncio
+import uuid
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
 
+from gridfs import GridOut
+from starlette.status import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_304_NOT_MODIFIED
+
+import app.spotify_electron.song.blob.song_repository as song_repository
 import app.spotify_electron.song.blob.song_service as song_service
 from app.logging.logging_constants import LOGGING_STREAM_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
@@ -12,9 +20,14 @@ from app.spotify_electron.song.base_song_schema import (
     SongBadNameException,
     SongNotFoundException,
     SongRepositoryException,
+    SongServiceException,
 )
 from app.spotify_electron.song.blob.song_schema import SongDataNotFoundException
-from app.spotify_electron.stream.stream_constants import SONG_STREAMING_BUFFER_SIZE
+from app.spotify_electron.stream.stream_constants import (
+    MAX_STREAM_RANGES,
+    SONG_CONTENT_TYPE,
+    SONG_STREAMING_BUFFER_SIZE,
+)
 from app.spotify_electron.stream.stream_schema import (
     InvalidContentRangeStreamException,
     StreamAudioContent,
@@ -24,58 +37,317 @@ from app.spotify_electron.stream.stream_schema import (
 stream_service_logger = SpotifyElectronLogger(LOGGING_STREAM_SERVICE).getLogger()
 
 
-async def stream_audio(song_data: bytes, start: int, end: int) -> AsyncGenerator[bytes, None]:
-    """Yield chunks of song data from start to end
+async def stream_audio(
+    song_data: bytes | memoryview | GridOut, start: int, end: int
+) -> AsyncGenerator[bytes, None]:
+    """Yield chunks of song data from start to end. When the song data is not cached\
+        only the GridFS chunks that cover the requested range are read, one at a time\
+        and outside the event loop
 
     Args:
-        song_data (bytes): song data
+        song_data (bytes | memoryview | GridOut): cached song data, song data mapped\
+            from disk or song data file
         start (int): start byte
-        end (int): end byte
+        end (int): end byte, inclusive
 
     Yields:
         AsyncGenerator[bytes, None]: yield chunk bytes from requested range
     """
-    # Ensure we don't exceed the end limit
-    effective_end = min(end, len(song_data))
+    if not isinstance(song_data, GridOut):
+        # mapped song data is only copied one buffer at a time when sent
+        for i in range(start, end + 1, SONG_STREAMING_BUFFER_SIZE):
+            yield bytes(song_data[i : min(i + SONG_STREAMING_BUFFER_SIZE, end + 1)])
+        return
+
+    song_data_chunks = song_service.get_song_data_range(song_data, start, end)
+
+    while (chunk := await asyncio.to_thread(next, song_data_chunks, None)) is not None:
+        for i in range(0, len(chunk), SONG_STREAMING_BUFFER_SIZE):
+            yield chunk[i : i + SONG_STREAMING_BUFFER_SIZE]
+
+
+async def stream_audio_content(
+    stream_audio_content: StreamAudioContent,
+) -> AsyncGenerator[bytes, None]:
+    """Yield the requested ranges of song data, multiple ranges are delimited\
+        as multipart/byteranges parts
+
+    Args:
+        stream_audio_content (StreamAudioContent): the audio data for streaming
+
+    Yields:
+        AsyncGenerator[bytes, None]: yield chunk bytes from requested ranges
+    """
+    song_data = stream_audio_content.song_data
+    if song_data is None:
+        return
+
+    boundary = stream_audio_content.multipart_boundary
+    if boundary is None:
+        for start, end in stream_audio_content.ranges:
+            async for chunk in stream_audio(song_data, start, end):
+                yield chunk
+        return
+
+    file_size = _get_file_size(song_data)
+    for start, end in stream_audio_content.ranges:
+        yield _get_multipart_part_header(boundary, start, end, file_size)
+        async for chunk in stream_audio(song_data, start, end):
+            yield chunk
+    yield _get_multipart_end(boundary)
+
+
+def _get_file_size(song_data: bytes | memoryview | GridOut) -> int:
+    """Get song data size
+
+    Args:
+        song_data (bytes | memoryview | GridOut): cached song data, song data mapped\
+            from disk or song data file
+
+    Returns:
+        int: song data size in bytes
+    """
+    return song_data.length if isinstance(song_data, GridOut) else len(song_data)
+
+
+def _get_multipart_part_header(boundary: str, start: int, end: int, file_size: int) -> bytes:
+    """Get the header preceding a range inside a multipart/byteranges body
+
+    Args:
+        boundary (str): multipart boundary
+        start (int): start byte
+        end (int): end byte, inclusive
+        file_size (int): file size
+
+    Returns:
+        bytes: the part header
+    """
+    return (
+        f"\r\n--{boundary}\r\n"
+        f"Content-Type: {SONG_CONTENT_TYPE}\r\n"
+        f"Content-Range: bytes {start}-{end}/{file_size}\r\n\r\n"
+    ).encode()
+
+
+def _get_multipart_end(boundary: str) -> bytes:
+    """Get the closing delimiter of a multipart/byteranges body
+
+    Args:
+        boundary (str): multipart boundary
 
-    for i in range(start, effective_end, SONG_STREAMING_BUFFER_SIZE):
-        yield song_data[i : i + SONG_STREAMING_BUFFER_SIZE]
+    Returns:
+        bytes: the closing delimiter
+    """
+    return f"\r\n--{boundary}--\r\n".encode()
 
 
-def _get_range_header(range_header: str | None, file_size: int) -> tuple[int, int]:
-    """Get range headers
+def _get_ranges(range_header: str, file_size: int) -> list[tuple[int, int]]:
+    """Get requested byte ranges. Ranges ending past the file are shortened and\
+        overlapping or adjacent ranges are merged
 
     Args:
-        range_header (str | None): range content header [bytes 1000-1499/1500]
+        range_header (str): range header [bytes=0-499,1000-1499,-500]
         file_size (int): file size
 
     Raises:
-        InvalidContentRangeStreamException: invalid content range for streaming
+        InvalidContentRangeStreamException: invalid or not satisfiable range
 
     Returns:
-        tuple[int, int]: start, end byte position
+        list[tuple[int, int]]: start, end byte positions, inclusive
     """
+    unit, _, range_set = range_header.partition("=")
+    if unit.strip().lower() != "bytes":
+        raise InvalidContentRangeStreamException(file_size)
+
+    ranges: list[tuple[int, int]] = []
     try:
-        if range_header is None:
-            raise InvalidContentRangeStreamException
-        h = range_header.replace("bytes=", "").split("-")
-        start = int(h[0]) if h[0] != "" else 0
-        end = int(h[1]) if h[1] != "" else file_size - 1
+        for range_spec in range_set.split(","):
+            first, separator, last = range_spec.strip().partition("-")
+            if not separator:
+                raise InvalidContentRangeStreamException(file_size)
+            if first == "":
+                suffix_length = int(last)
+                if suffix_length > 0 and file_size > 0:
+                    ranges.append((max(file_size - suffix_length, 0), file_size - 1))
+                continue
+
+            start = int(first)
+            end = int(last) if last != "" else file_size - 1
+            if start > end:
+                raise InvalidContentRangeStreamException(file_size)
+            if start < file_size:
+                ranges.append((start, min(end, file_size - 1)))
     except ValueError:
-        raise InvalidContentRangeStreamException
+        raise InvalidContentRangeStreamException(file_size)
+
+    if not ranges:
+        raise InvalidContentRangeStreamException(file_size)
+    return _merge_ranges(ranges)
+
+
+def _merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent byte ranges
+
+    Args:
+        ranges (list[tuple[int, int]]): start, end byte positions, inclusive
+
+    Returns:
+        list[tuple[int, int]]: sorted non overlapping ranges
+    """
+    merged_ranges: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged_ranges and start <= merged_ranges[-1][1] + 1:
+            last_start, last_end = merged_ranges[-1]
+            merged_ranges[-1] = (last_start, max(last_end, end))
+        else:
+            merged_ranges.append((start, end))
+    return merged_ranges
+
+
+def _get_etag(song_data_file: GridOut) -> str:
+    """Get the entity tag of the song data, its stored checksum or the GridFS file id\
+        when there is none. Both change when the song is uploaded with other data
+
+    Args:
+        song_data_file (GridOut): song data file
+
+    Returns:
+        str: the strong entity tag
+    """
+    checksum = song_repository.get_song_data_checksum(song_data_file)
+    return f'"{checksum[1] if checksum else song_data_file._id}"'
+
+
+def _get_last_modified(song_data_file: GridOut) -> datetime:
+    """Get the upload date of the song data as an aware datetime truncated to seconds
+
+    Args:
+        song_data_file (GridOut): song data file
+
+    Returns:
+        datetime: the song data upload date
+    """
+    upload_date = song_data_file.upload_date
+    if upload_date.tzinfo is None:
+        upload_date = upload_date.replace(tzinfo=UTC)
+    return upload_date.replace(microsecond=0)
+
+
+def _is_etag_in(etag: str, if_none_match: str) -> bool:
+    """Returns if the entity tag is inside an If-None-Match header, using weak comparison
+
+    Args:
+        etag (str): entity tag
+        if_none_match (str): If-None-Match header
+
+    Returns:
+        bool: if the entity tag matches
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
 
-    if start > end or start < 0 or end > file_size - 1:
-        raise InvalidContentRangeStreamException
-    return start, end
 
+def _is_if_range_valid(if_range: str, etag: str, last_modified: datetime) -> bool:
+    """Returns if the If-Range validator matches the current song data, using strong\
+        comparison for entity tags
 
-def get_stream_audio_data(range_header: str | None, name: str) -> StreamAudioContent:
-    """Gets stream audio data
+    Args:
+        if_range (str): If-Range header, an entity tag or an HTTP date
+        etag (str): entity tag
+        last_modified (datetime): song data upload date
+
+    Returns:
+        bool: if the requested ranges can be served
+    """
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag
+    try:
+        return parsedate_to_datetime(if_range) == last_modified
+    except (TypeError, ValueError):
+        return False
+
+
+def _get_headers(etag: str, last_modified: datetime) -> dict[str, str]:
+    """Get the response headers shared by every stream response
 
     Args:
-        range_header (str | None): range content header [bytes 1000-1499/1500]\
+        etag (str): entity tag
+        last_modified (datetime): song data upload date
+
+    Returns:
+        dict[str, str]: the response headers
+    """
+    return {
+        "accept-ranges": "bytes",
+        "content-encoding": "identity",
+        "etag": etag,
+        "last-modified": format_datetime(last_modified, usegmt=True),
+        "access-control-expose-headers": (
+            "Content-type, Accept-ranges, Content-length, "
+            "Content-range, Content-encoding, ETag, Last-Modified"
+        ),
+    }
+
+
+def _set_content_headers(
+    headers: dict[str, str], ranges: list[tuple[int, int]], file_size: int
+) -> tuple[int, list[tuple[int, int]], str | None]:
+    """Set content headers for the requested ranges. Requests without ranges or\
+        with too many ranges get the whole song
+
+    Args:
+        headers (dict[str, str]): response headers
+        ranges (list[tuple[int, int]]): requested start, end byte positions, inclusive
+        file_size (int): file size
+
+    Returns:
+        tuple[int, list[tuple[int, int]], str | None]: status code, ranges to be\
+            streamed and multipart boundary if more than one range is streamed
+    """
+    if not ranges or len(ranges) > MAX_STREAM_RANGES:
+        headers["content-type"] = SONG_CONTENT_TYPE
+        headers["content-length"] = str(file_size)
+        return HTTP_200_OK, [(0, file_size - 1)] if file_size > 0 else [], None
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        headers["content-type"] = SONG_CONTENT_TYPE
+        headers["content-length"] = str(end - start + 1)
+        headers["content-range"] = f"bytes {start}-{end}/{file_size}"
+        return HTTP_206_PARTIAL_CONTENT, ranges, None
+
+    multipart_boundary = uuid.uuid4().hex
+    content_length = len(_get_multipart_end(multipart_boundary)) + sum(
+        len(_get_multipart_part_header(multipart_boundary, start, end, file_size))
+        + end
+        - start
+        + 1
+        for start, end in ranges
+    )
+    headers["content-type"] = f"multipart/byteranges; boundary={multipart_boundary}"
+    headers["content-length"] = str(content_length)
+    return HTTP_206_PARTIAL_CONTENT, ranges, multipart_boundary
+
+
+def get_stream_audio_data(
+    range_header: str | None,
+    name: str,
+    if_none_match: str | None = None,
+    if_range: str | None = None,
+) -> StreamAudioContent:
+    """Gets stream audio data. Requests without range get the whole song, a single\
+        range is returned as partial content and multiple ranges as multipart/byteranges
+
+    Args:
+        range_header (str | None): range header [bytes=0-499,1000-1499,-500]\
          https://developer.mozilla.org/en-US/docs/Web/HTTP/Range_requests
         name (str): song name
+        if_none_match (str | None, optional): If-None-Match header. Defaults to None.
+        if_range (str | None, optional): If-Range header. Defaults to None.
 
     Raises:
         SongBadNameException: invalid song name
@@ -88,26 +360,38 @@ def get_stream_audio_data(range_header: str | None, name: str) -> StreamAudioCon
         StreamAudioContent: the needed audio data for streaming
     """
     try:
-        song_data = song_service.get_song_data(name)
-        file_size = len(song_data)
+        song_data_file = song_service.get_song_data_file(name)
+        file_size = song_data_file.length
+        etag = _get_etag(song_data_file)
+        last_modified = _get_last_modified(song_data_file)
+        headers = _get_headers(etag, last_modified)
+
+        if if_none_match is not None and _is_etag_in(etag, if_none_match):
+            return StreamAudioContent(
+                status_code=HTTP_304_NOT_MODIFIED, headers=headers, song_data=None
+            )
+
+        if range_header is not None and (
+            if_range is None or _is_if_range_valid(if_range, etag, last_modified)
+        ):
+            ranges = _get_ranges(range_header, file_size)
+        else:
+            ranges = []
+
+        status_code, ranges, multipart_boundary = _set_content_headers(
+            headers, ranges, file_size
+        )
+
+        song_data = song_service.get_song_stream_data(name, song_data_file)
         stream_service_logger.info(f"Streaming song {name}")
 
-        headers = {
-            "content-type": "audio/mp3",
-            "accept-ranges": "bytes",
-            "content-encoding": "identity",
-            "access-control-expose-headers": (
-                "Content-type, Accept-ranges, Content-length, "
-                "Content-range, Content-encoding"
-            ),
-        }
-
-        start, end = _get_range_header(range_header, file_size)
-        size = end - start + 1
-        headers["Content-length"] = str(size)
-        headers["Content-range"] = f"bytes {start}-{end}/{file_size}"
-
-        return StreamAudioContent(song_data=song_data, headers=headers, start=start, end=end)
+        return StreamAudioContent(
+            status_code=status_code,
+            headers=headers,
+            song_data=song_data,
+            ranges=ranges,
+            multipart_boundary=multipart_boundary,
+        )
     except SongBadNameException as exception:
         stream_service_logger.exception(f"Bad Song Name Parameter: {name}")
         raise SongBadNameException from exception
@@ -121,14 +405,72 @@ def get_stream_audio_data(range_header: str | None, name: str) -> StreamAudioCon
         stream_service_logger.exception(
             f"Invalid content range {range_header} for song {name}"
         )
-        raise InvalidContentRangeStreamException from exception
+        raise InvalidContentRangeStreamException(exception.file_size) from exception
     except SongRepositoryException as exception:
         stream_service_logger.exception(
             f"Unexpected error in Song Repository getting song data: {name}"
         )
         raise StreamServiceException from exception
+    except SongServiceException as exception:
+        stream_service_logger.exception(
+            f"Unexpected error in Song Service getting song data: {name}"
+        )
+        raise StreamServiceException from exception
     except Exception as exception:
         stream_service_logger.exception(
             f"Unexpected error in Stream Service streaming song: {name}"
         )
         raise StreamServiceException from exception
+
+
+def get_stream_audio_metadata(
+    name: str, if_none_match: str | None = None
+) -> StreamAudioContent:
+    """Gets stream audio headers for a HEAD request. Only the GridFS file metadata\
+        is read, the song data is never fetched
+
+    Args:
+        name (str): song name
+        if_none_match (str | None, optional): If-None-Match header. Defaults to None.
+
+    Raises:
+        SongBadNameException: invalid song name
+        SongNotFoundException: song not found
+        SongDataNotFoundException: song data doesn't exists
+        StreamServiceException: unexpected error while getting stream audio metadata
+
+    Returns:
+        StreamAudioContent: the audio headers for streaming without song data
+    """
+    try:
+        song_data_file = song_service.get_song_data_file(name)
+        etag = _get_etag(song_data_file)
+        headers = _get_headers(etag, _get_last_modified(song_data_file))
+
+        if if_none_match is not None and _is_etag_in(etag, if_none_match):
+            return StreamAudioContent(
+                status_code=HTTP_304_NOT_MODIFIED, headers=headers, song_data=None
+            )
+
+        headers["content-type"] = SONG_CONTENT_TYPE
+        headers["content-length"] = str(song_data_file.length)
+        return StreamAudioContent(status_code=HTTP_200_OK, headers=headers, song_data=None)
+    except SongBadNameException as exception:
+        stream_service_logger.exception(f"Bad Song Name Parameter: {name}")
+        raise SongBadNameException from exception
+    except SongNotFoundException as exception:
+        stream_service_logger.exception(f"Song not found: {name}")
+        raise SongNotFoundException from exception
+    except SongDataNotFoundException as exception:
+        stream_service_logger.exception(f"Song data not found: {name}")
+        raise SongDataNotFoundException from exception
+    except SongServiceException as exception:
+        stream_service_logger.exception(
+            f"Unexpected error in Song Service getting song data metadata: {name}"
+        )
+        raise StreamServiceException from exception
+    except Exception as exception:
+        stream_service_logger.exception(
+            f"Unexpected error in Stream Service getting song metadata: {name}"
+        )
+        raise StreamServiceException from exception
@@ -2,11 +2,9 @@
 Artist controller for handling incoming HTTP Requests
 """
 
-import json
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from fastapi.encoders import jsonable_encoder
+from fastapi import APIRouter, Depends, Header
 from fastapi.responses import Response
 from starlette.status import (
     HTTP_200_OK,
@@ -15,14 +13,19 @@ from starlette.status import (
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 import app.spotify_electron.user.artist.artist_service as artist_service
 import app.spotify_electron.utils.json_converter.json_converter_utils as json_converter_utils
-from app.auth.auth_schema import TokenData, UserUnauthorizedException
+from app.auth.auth_schema import (
+    PasswordHasherBusyException,
+    TokenData,
+    UserUnauthorizedException,
+)
 from app.auth.JWTBearer import JWTBearer
 from app.common.PropertiesMessagesManager import PropertiesMessagesManager
-from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.exceptions.base_exceptions_schema import BadParameterException, JsonEncodeException
 from app.spotify_electron.song.base_song_schema import SongBadNameException
 from app.spotify_electron.user.user.user_schema import (
     UserAlreadyExistsException,
@@ -30,6 +33,7 @@ from app.spotify_electron.user.user.user_schema import (
     UserNotFoundException,
     UserServiceException,
 )
+from app.spotify_electron.utils.pagination.pagination_utils import DEFAULT_PAGE_LIMIT
 
 router = APIRouter(
     prefix="/artists",
@@ -38,7 +42,7 @@ router = APIRouter(
 
 
 @router.get("/{name}")
-def get_artist(
+async def get_artist(
     name: str,
     token: Annotated[TokenData | None, Depends(JWTBearer())],
 ) -> Response:
@@ -48,7 +52,7 @@ def get_artist(
         name (str): artist name
     """
     try:
-        artist = artist_service.get_artist(name)
+        artist = await artist_service.get_artist_async(name)
         artist_json = json_converter_utils.get_json_from_model(artist)
 
         return Response(artist_json, media_type="application/json", status_code=HTTP_200_OK)
@@ -101,6 +105,11 @@ def create_artist(
             status_code=HTTP_404_NOT_FOUND,
             content=PropertiesMessagesManager.artistNotFound,
         )
+    except PasswordHasherBusyException:
+        return Response(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            content=PropertiesMessagesManager.userCreateBusy,
+        )
     except (Exception, UserServiceException):
         return Response(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
@@ -111,16 +120,45 @@ def create_artist(
 @router.get("/")
 def get_artists(
     token: Annotated[TokenData | None, Depends(JWTBearer())],
+    limit: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
+    accept: Annotated[str | None, Header()] = None,
 ) -> Response:
-    """Get all artists"""
+    """Get a page of artists sorted by name
+
+    Args:
+        limit (int | None): max artists returned, every artist is returned if\
+            neither a limit nor a cursor are requested
+        cursor (str | None): cursor of the page, returned in the X-Next-Cursor header\
+            of the previous page
+        stream (bool): stream every artist after the cursor instead of a page,\
+            as newline delimited json if accepted by the client
+    """
     try:
-        artists = artist_service.get_all_artists()
-        artists_dict = {}
-        artists_dict["artists"] = jsonable_encoder(artists)
+        if stream or (limit is None and cursor is None):
+            return json_converter_utils.get_streaming_response_from_models(
+                artist_service.get_all_artists_stream(cursor), "artists", accept
+            )
 
-        artists_json = json.dumps(artists_dict)
+        artists = artist_service.get_all_artists(
+            DEFAULT_PAGE_LIMIT if limit is None else limit, cursor
+        )
+        artists_json = json_converter_utils.get_json_with_iterable_field_from_model(
+            artists.items, "artists"
+        )
 
-        return Response(artists_json, media_type="application/json", status_code=HTTP_200_OK)
+        return Response(
+            artists_json,
+            media_type="application/json",
+            status_code=HTTP_200_OK,
+            headers=artists.get_headers(),
+        )
+    except BadParameterException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.commonBadParameter,
+        )
     except UserBadNameException:
         return Response(
             status_code=HTTP_400_BAD_REQUEST,
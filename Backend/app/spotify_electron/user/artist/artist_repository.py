@@ -2,6 +2,11 @@
 Artist repository for managing persisted data
 """
 
+from collections.abc import Iterator
+
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
 import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
 from app.logging.logging_constants import LOGGING_ARTIST_REPOSITORY
 from app.logging.logging_schema import SpotifyElectronLogger
@@ -10,6 +15,7 @@ from app.spotify_electron.user.artist.artist_schema import (
     get_artist_dao_from_document,
 )
 from app.spotify_electron.user.user.user_schema import (
+    UserAlreadyExistsException,
     UserCreateException,
     UserNotFoundException,
     UserRepositoryException,
@@ -19,6 +25,11 @@ from app.spotify_electron.user.validations.base_user_repository_validations impo
     validate_user_exists,
     validate_user_update,
 )
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    PAGE_SORT_FIELD,
+    get_keyset_query,
+)
+from app.spotify_electron.utils.search.search_utils import get_search_fields
 
 artist_repository_logger = SpotifyElectronLogger(LOGGING_ARTIST_REPOSITORY).getLogger()
 
@@ -52,6 +63,37 @@ def get_user(name: str) -> ArtistDAO:
         return artist_dao
 
 
+def get_artists_by_names(names: list[str]) -> list[ArtistDAO]:
+    """Get multiple artists by name in a single query
+
+    Args:
+        names (list[str]): artist names
+
+    Raises:
+        UserRepositoryException: unexpected error while getting artists
+
+    Returns:
+        list[ArtistDAO]: the artists found, in the requested names order
+    """
+    if not names:
+        return []
+    try:
+        artists = user_collection_provider.get_artist_collection().find(
+            {"name": {"$in": list(set(names))}}
+        )
+        artists_by_name = {
+            artist["name"]: get_artist_dao_from_document(artist) for artist in artists
+        }
+    except Exception as exception:
+        artist_repository_logger.exception(f"Error getting Artists {names} from database")
+        raise UserRepositoryException from exception
+    else:
+        missing_names = [name for name in names if name not in artists_by_name]
+        if missing_names:
+            artist_repository_logger.warning(f"Artists not found: {missing_names}")
+        return [artists_by_name[name] for name in names if name in artists_by_name]
+
+
 def create_artist(name: str, photo: str, password: bytes, current_date: str) -> None:
     """Create artist
 
@@ -62,6 +104,7 @@ def create_artist(name: str, photo: str, password: bytes, current_date: str) ->
         current_date (str): formatted creation date
 
     Raises:
+        UserAlreadyExistsException: a user with the same name already exists
         UserRepositoryException: unexpected error while creating user
     """
     try:
@@ -74,10 +117,16 @@ def create_artist(name: str, photo: str, password: bytes, current_date: str) ->
             "playlists": [],
             "playback_history": [],
             "uploaded_songs": [],
+            "total_streams": 0,
         }
-        result = user_collection_provider.get_artist_collection().insert_one(artist)
+        result = user_collection_provider.get_artist_collection().insert_one(
+            {**artist, **get_search_fields(name)}
+        )
 
         validate_user_create(result)
+    except DuplicateKeyError as exception:
+        artist_repository_logger.exception(f"Artist {name} already exists in database")
+        raise UserAlreadyExistsException from exception
     except UserCreateException as exception:
         artist_repository_logger.exception(f"Error inserting Artist {artist} in database")
         raise UserRepositoryException from exception
@@ -90,26 +139,33 @@ def create_artist(name: str, photo: str, password: bytes, current_date: str) ->
         artist_repository_logger.info(f"Artist added to repository: {artist}")
 
 
-def get_all_artists() -> list[ArtistDAO]:
-    """Get all artists
+def get_all_artists(limit: int | None, after_name: str | None = None) -> Iterator[ArtistDAO]:
+    """Get artists sorted by name. Artists are read lazily from the database
+
+    Args:
+        limit (int | None): max artists returned, None returns every artist
+        after_name (str | None, optional): only return artists whose name comes after\
+            this one. Defaults to None.
 
     Raises:
         UserRepositoryException: unexpected error getting all artists
 
-    Returns:
-        list[ArtistDAO]: a list with all artists
+    Yields:
+        ArtistDAO: the artists
     """
     try:
-        artists = [
-            get_artist_dao_from_document(artist)
-            for artist in user_collection_provider.get_artist_collection().find()
-        ]
+        artists = (
+            user_collection_provider.get_artist_collection()
+            .find(get_keyset_query({}, after_name))
+            .sort(PAGE_SORT_FIELD, ASCENDING)
+        )
+        if limit is not None:
+            artists = artists.limit(limit)
+        for artist in artists:
+            yield get_artist_dao_from_document(artist)
     except Exception as exception:
-        artist_repository_logger.exception("Error getting all artists names from database")
+        artist_repository_logger.exception("Error getting all artists from database")
         raise UserRepositoryException from exception
-    else:
-        artist_repository_logger.info("All artists names retrieved successfully")
-        return artists
 
 
 def add_song_to_artist(artist_name: str, song_name: str) -> None:
@@ -139,19 +195,24 @@ def add_song_to_artist(artist_name: str, song_name: str) -> None:
         raise UserRepositoryException from exception
 
 
-def delete_song_from_artist(artist_name: str, song_name: str) -> None:
-    """Delete song from artist
+def delete_song_from_artist(artist_name: str, song_name: str, song_streams: int) -> None:
+    """Delete song from artist and subtract its streams from the artist total streams
 
     Args:
         artist_name (str): artist name
         song_name (str): song name
+        song_streams (int): streams of the deleted song
 
     Raises:
         UserRepositoryException: unexpected error deleting song from artist
     """
     try:
         result = user_collection_provider.get_artist_collection().update_one(
-            {"name": artist_name}, {"$pull": {"uploaded_songs": song_name}}
+            {"name": artist_name},
+            {
+                "$pull": {"uploaded_songs": song_name},
+                "$inc": {"total_streams": -song_streams},
+            },
         )
         validate_user_update(result)
     except UserCreateException as exception:
@@ -181,3 +242,124 @@ def get_artist_song_names(artist_name: str) -> list[str]:
     )
 
     return artist_data["uploaded_songs"]  # type: ignore
+
+
+def increase_total_streams(artists_streams: dict[str, int]) -> None:
+    """Increase total streams of multiple artists in a single bulk write
+
+    Args:
+        artists_streams (dict[str, int]): streams to add by artist name
+
+    Raises:
+        UserRepositoryException: unexpected error increasing artists total streams
+    """
+    if not artists_streams:
+        return
+    try:
+        user_collection_provider.get_artist_collection().bulk_write(
+            [
+                UpdateOne({"name": artist_name}, {"$inc": {"total_streams": streams}})
+                for artist_name, streams in artists_streams.items()
+            ],
+            ordered=False,
+        )
+    except Exception as exception:
+        artist_repository_logger.exception(
+            f"Unexpected error increasing artists {list(artists_streams)} total streams "
+            "in database"
+        )
+        raise UserRepositoryException from exception
+
+
+def get_total_streams(artist_name: str) -> int:
+    """Get artist total streams
+
+    Args:
+        artist_name (str): artist name
+
+    Raises:
+        UserNotFoundException: artist was not found
+        UserRepositoryException: unexpected error getting artist total streams
+
+    Returns:
+        int: the artist total streams
+    """
+    try:
+        artist = user_collection_provider.get_artist_collection().find_one(
+            {"name": artist_name}, {"total_streams": 1, "_id": 0}
+        )
+        validate_user_exists(artist)
+    except UserNotFoundException as exception:
+        raise UserNotFoundException from exception
+    except Exception as exception:
+        artist_repository_logger.exception(
+            f"Unexpected error getting artist {artist_name} total streams in database"
+        )
+        raise UserRepositoryException from exception
+    else:
+        return artist.get("total_streams", 0)  # type: ignore
+
+
+def get_all_artist_names(without_total_streams: bool = False) -> list[str]:
+    """Get all artist names
+
+    Args:
+        without_total_streams (bool, optional): only get the artists created before\
+            their total streams were stored. Defaults to False.
+
+    Raises:
+        UserRepositoryException: unexpected error getting all artist names
+
+    Returns:
+        list[str]: the artist names
+    """
+    query = {"total_streams": {"$exists": False}} if without_total_streams else {}
+    try:
+        artists = user_collection_provider.get_artist_collection().find(
+            query, {"name": 1, "_id": 0}
+        )
+        artist_names = [artist["name"] for artist in artists]
+    except Exception as exception:
+        artist_repository_logger.exception("Error getting all artist names from database")
+        raise UserRepositoryException from exception
+    else:
+        return artist_names
+
+
+def set_total_streams(
+    total_streams: dict[str, int], without_total_streams: bool = False
+) -> int:
+    """Overwrite the total streams of multiple artists in a single bulk write
+
+    Args:
+        total_streams (dict[str, int]): total streams by artist name
+        without_total_streams (bool, optional): only set the total streams of the artists\
+            that still don't store them. Defaults to False.
+
+    Raises:
+        UserRepositoryException: unexpected error setting artists total streams
+
+    Returns:
+        int: the number of artists whose total streams changed
+    """
+    if not total_streams:
+        return 0
+    query = {"total_streams": {"$exists": False}} if without_total_streams else {}
+    try:
+        result = user_collection_provider.get_artist_collection().bulk_write(
+            [
+                UpdateOne({"name": artist_name, **query}, {"$set": {"total_streams": streams}})
+                for artist_name, streams in total_streams.items()
+            ],
+            ordered=False,
+        )
+    except Exception as exception:
+        artist_repository_logger.exception(
+            "Unexpected error setting artists total streams in database"
+        )
+        raise UserRepositoryException from exception
+    else:
+        artist_repository_logger.info(
+            f"Total streams of {result.modified_count} artists updated"
+        )
+        return result.modified_count
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from app.spotify_electron.user.user.user_schema import UserDAO, UserDTO
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
 @dataclass
@@ -13,13 +14,16 @@ class ArtistDAO(UserDAO):
     """Represents artist data in the persistence layer"""
 
     uploaded_songs: list[str]
+    total_streams: int
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class ArtistDTO(UserDTO):
     """Represents artist data in the endpoints transfer layer"""
 
     uploaded_songs: list[str]
+    total_streams: int
 
 
 def get_artist_dao_from_document(document: dict[str, Any]) -> ArtistDAO:
@@ -43,6 +47,8 @@ def get_artist_dao_from_document(document: dict[str, Any]) -> ArtistDAO:
         playlists=document["playlists"],
         saved_playlists=document["saved_playlists"],
         uploaded_songs=document["uploaded_songs"],
+        # artists created before the counter existed have it set by the repair job
+        total_streams=document.get("total_streams", 0),
     )
 
 
@@ -66,4 +72,5 @@ def get_artist_dto_from_dao(artist_dao: ArtistDAO) -> ArtistDTO:
         register_date=artist_dao.register_date,
         saved_playlists=artist_dao.saved_playlists,
         uploaded_songs=artist_dao.uploaded_songs,
+        total_streams=artist_dao.total_streams,
     )
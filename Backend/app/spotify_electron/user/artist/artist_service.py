@@ -2,6 +2,8 @@
 Artist service for handling business logic
 """
 
+from collections.abc import Iterator
+
 import app.auth.auth_service as auth_service
 import app.spotify_electron.song.base_song_service as base_song_service
 import app.spotify_electron.user.artist.artist_repository as artist_repository
@@ -9,9 +11,13 @@ import app.spotify_electron.user.artist.validations.artist_service_validations a
 import app.spotify_electron.user.base_user_repository as base_user_repository
 import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
 import app.spotify_electron.user.validations.base_user_service_validations as base_user_service_validations  # noqa: E501
-from app.auth.auth_schema import UserUnauthorizedException
+from app.auth.auth_schema import PasswordHasherBusyException, UserUnauthorizedException
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.exceptions.base_exceptions_schema import BadParameterException
 from app.logging.logging_constants import LOGGING_ARTIST_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.song.base_song_schema import (
     SongBadNameException,
     SongMetadataDTO,
@@ -31,7 +37,15 @@ from app.spotify_electron.user.user.user_schema import (
     UserRepositoryException,
     UserServiceException,
 )
+from app.spotify_electron.user.user_type_cache import UserTypeCache
 from app.spotify_electron.utils.date.date_utils import get_current_iso8601_date
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    DEFAULT_PAGE_LIMIT,
+    Page,
+    get_cursor_after_name,
+    get_page,
+    validate_page_limit,
+)
 
 artist_service_logger = SpotifyElectronLogger(LOGGING_ARTIST_SERVICE).getLogger()
 
@@ -82,8 +96,25 @@ def add_song_to_artist(artist_name: str, song_name: str) -> None:
         raise UserServiceException from exception
 
 
+async def add_song_to_artist_async(artist_name: str, song_name: str) -> None:
+    """Add song to artist without blocking the event loop, running add_song_to_artist\
+        in the database executor
+
+    Args:
+        artist_name (str): artist name
+        song_name (str): song name
+
+    Raises:
+        UserBadNameException: user invalid name
+        UserNotFoundException: user doesn't exists
+        SongBadNameException: song invalid name
+        UserServiceException: unexpected error adding song to artist
+    """
+    await DatabaseConnectionManager.run_async(add_song_to_artist, artist_name, song_name)
+
+
 def delete_song_from_artist(artist_name: str, song_name: str) -> None:
-    """Remove song from artist
+    """Remove song from artist and subtract its streams from the artist total streams
 
     Args:
         artist_name (str): artist name
@@ -101,7 +132,9 @@ def delete_song_from_artist(artist_name: str, song_name: str) -> None:
 
         artist_service_validations.validate_user_should_be_artist(artist_name)
 
-        artist_repository.delete_song_from_artist(artist_name, song_name)
+        song_streams = base_song_service.get_song_metadata(song_name).streams
+        artist_repository.delete_song_from_artist(artist_name, song_name, song_streams)
+        SearchEngine.add_streams(SearchItemType.ARTIST, {artist_name: -song_streams})
     except UserBadNameException as exception:
         artist_service_logger.exception(f"Bad Artist Name Parameter: {artist_name}")
         raise UserBadNameException from exception
@@ -178,6 +211,24 @@ def get_artist(artist_name: str) -> ArtistDTO:
         return artist_dto
 
 
+async def get_artist_async(artist_name: str) -> ArtistDTO:
+    """Get artist from name without blocking the event loop, running get_artist in the\
+        database executor
+
+    Args:
+        artist_name (str): the artist name
+
+    Raises:
+        UserBadNameException: invalid user name
+        UserNotFoundException: artist not found
+        UserServiceException: unexpected error while getting artist
+
+    Returns:
+        ArtistDTO: the artist
+    """
+    return await DatabaseConnectionManager.run_async(get_artist, artist_name)
+
+
 def create_artist(user_name: str, photo: str, password: str) -> None:
     """Create artist
 
@@ -189,6 +240,7 @@ def create_artist(user_name: str, photo: str, password: str) -> None:
     Raises:
         UserAlreadyExistsException: if the artist already exists
         UserBadNameException: if the artist name is invalid
+        PasswordHasherBusyException: if too many passwords are waiting to be hashed
         UserServiceException: unexpected error while creating artist
     """
     try:
@@ -205,6 +257,8 @@ def create_artist(user_name: str, photo: str, password: str) -> None:
             current_date=date,
             password=hashed_password,
         )
+        UserTypeCache.invalidate(user_name)
+        SearchEngine.add(SearchItemType.ARTIST, user_name)
         artist_service_logger.info(f"Artist {user_name} created successfully")
     except UserAlreadyExistsException as exception:
         artist_service_logger.exception(f"Artist already exists: {user_name}")
@@ -212,6 +266,9 @@ def create_artist(user_name: str, photo: str, password: str) -> None:
     except UserBadNameException as exception:
         artist_service_logger.exception(f"Bad Artist Name Parameter: {user_name}")
         raise UserBadNameException from exception
+    except PasswordHasherBusyException as exception:
+        artist_service_logger.exception(f"Password hasher busy creating artist: {user_name}")
+        raise PasswordHasherBusyException from exception
     except UserRepositoryException as exception:
         artist_service_logger.exception(
             f"Unexpected error in Artist Repository creating artist: {user_name}"
@@ -224,18 +281,35 @@ def create_artist(user_name: str, photo: str, password: str) -> None:
         raise UserServiceException from exception
 
 
-def get_all_artists() -> list[ArtistDTO]:
-    """Get all artists
+def get_all_artists(
+    limit: int = DEFAULT_PAGE_LIMIT, cursor: str | None = None
+) -> Page[ArtistDTO]:
+    """Get a page of artists sorted by name
+
+    Args:
+        limit (int, optional): max artists returned. Defaults to DEFAULT_PAGE_LIMIT.
+        cursor (str | None, optional): cursor of the page, None for the first page.\
+            Defaults to None.
 
     Raises:
+        BadParameterException: invalid limit or cursor
         UserServiceException: unexpected error getting all artists
 
     Returns:
-        list[ArtistDTO]: the list of all artists
+        Page[ArtistDTO]: the page of artists
     """
     try:
-        artists_dao = artist_repository.get_all_artists()
-        artists_dto = [get_artist_dto_from_dao(artist_dao) for artist_dao in artists_dao]
+        validate_page_limit(limit)
+        after_name = get_cursor_after_name(cursor)
+        artists_dao = artist_repository.get_all_artists(limit + 1, after_name)
+        artists_page = get_page(
+            (get_artist_dto_from_dao(artist_dao) for artist_dao in artists_dao),
+            limit,
+            lambda artist: {"after": artist.name},
+        )
+    except BadParameterException as exception:
+        artist_service_logger.exception(f"Bad artists page parameter: {limit}, {cursor}")
+        raise BadParameterException from exception
     except UserRepositoryException as exception:
         artist_service_logger.exception(
             "Unexpected error in Artist Repository getting all artists"
@@ -247,13 +321,35 @@ def get_all_artists() -> list[ArtistDTO]:
         )
         raise UserServiceException from exception
     else:
-        artist_service_logger.info("All artists retrieved successfully")
-        return artists_dto
+        artist_service_logger.info("Artists page retrieved successfully")
+        return artists_page
+
+
+def get_all_artists_stream(cursor: str | None = None) -> Iterator[ArtistDTO]:
+    """Get every artist after the cursor sorted by name. Artists are read lazily\
+        from the database while the iterator is consumed
+
+    Args:
+        cursor (str | None, optional): cursor of the first page, None to start from the\
+            first artist. Defaults to None.
+
+    Raises:
+        BadParameterException: invalid cursor
+
+    Returns:
+        Iterator[ArtistDTO]: the artists
+    """
+    try:
+        after_name = get_cursor_after_name(cursor)
+    except BadParameterException as exception:
+        artist_service_logger.exception(f"Bad artists cursor: {cursor}")
+        raise BadParameterException from exception
+    artists_dao = artist_repository.get_all_artists(None, after_name)
+    return (get_artist_dto_from_dao(artist_dao) for artist_dao in artists_dao)
 
 
-# TODO make it a dynamic property
 def get_streams_artist(artist_name: str) -> int:
-    """Get artist songs total streams
+    """Get artist songs total streams from the artist precomputed counter
 
     Args:
         user_name (str): artist name
@@ -271,7 +367,7 @@ def get_streams_artist(artist_name: str) -> int:
         base_user_service_validations.validate_user_name_parameter(artist_name)
         artist_service_validations.validate_user_should_be_artist(artist_name)
 
-        return base_song_service.get_artist_streams(artist_name)
+        return artist_repository.get_total_streams(artist_name)
     except UserNotFoundException as exception:
         artist_service_logger.exception(f"Artist not found: {artist_name}")
         raise UserNotFoundException from exception
@@ -298,9 +394,9 @@ def get_streams_artist(artist_name: str) -> int:
         raise UserServiceException from exception
 
 
-# TODO obtain all users in same query
 def get_artists(user_names: list[str]) -> list[ArtistDTO]:
-    """Get artists from a list of names
+    """Get artists from a list of names. Artists are retrieved with one query\
+        regardless of the number of artists
 
     Args:
         user_names (list[str]): the list with the artist names to retrieve
@@ -312,10 +408,8 @@ def get_artists(user_names: list[str]) -> list[ArtistDTO]:
         list[ArtistDTO]: the selected artists
     """
     try:
-        artists: list[ArtistDTO] = []
-        for user_name in user_names:
-            artists.append(get_artist(user_name))
-
+        artists_dao = artist_repository.get_artists_by_names(user_names)
+        artists = [get_artist_dto_from_dao(artist_dao) for artist_dao in artists_dao]
     except UserRepositoryException as exception:
         artist_service_logger.exception(
             f"Unexpected error in User Repository getting users {user_names}"
@@ -415,3 +509,79 @@ def get_artists_songs(artist_name: str) -> list[SongMetadataDTO]:
         raise UserServiceException from exception
     else:
         return artist_songs
+
+
+def increase_streams_artists(artists_streams: dict[str, int]) -> None:
+    """Increase total streams of multiple artists
+
+    Args:
+        artists_streams (dict[str, int]): streams to add by artist name
+
+    Raises:
+        UserServiceException: unexpected error increasing artists total streams
+    """
+    try:
+        artist_repository.increase_total_streams(artists_streams)
+        SearchEngine.add_streams(SearchItemType.ARTIST, artists_streams)
+    except UserRepositoryException as exception:
+        artist_service_logger.exception(
+            f"Unexpected error in Artist Repository increasing artists "
+            f"{list(artists_streams)} streams"
+        )
+        raise UserServiceException from exception
+    except Exception as exception:
+        artist_service_logger.exception(
+            f"Unexpected error in Artist Service increasing artists "
+            f"{list(artists_streams)} streams"
+        )
+        raise UserServiceException from exception
+
+
+def repair_artists_total_streams(without_total_streams: bool = False) -> int:
+    """Recompute every artist total streams from their songs, fixing counters that\
+        drifted from the songs streams
+
+    Args:
+        without_total_streams (bool, optional): only compute the total streams of the\
+            artists created before they were stored. Defaults to False.
+
+    Raises:
+        UserServiceException: unexpected error repairing artists total streams
+
+    Returns:
+        int: the number of artists whose total streams were fixed
+    """
+    try:
+        artist_names = artist_repository.get_all_artist_names(without_total_streams)
+        total_streams = base_song_service.get_artists_streams(artist_names)
+        repaired_artists = artist_repository.set_total_streams(
+            total_streams, without_total_streams
+        )
+    except UserRepositoryException as exception:
+        artist_service_logger.exception(
+            "Unexpected error in Artist Repository repairing artists total streams"
+        )
+        raise UserServiceException from exception
+    except SongServiceException as exception:
+        artist_service_logger.exception(
+            "Unexpected error in Song Service repairing artists total streams"
+        )
+        raise UserServiceException from exception
+    except Exception as exception:
+        artist_service_logger.exception(
+            "Unexpected error in Artist Service repairing artists total streams"
+        )
+        raise UserServiceException from exception
+    else:
+        artist_service_logger.info(f"Total streams of {repaired_artists} artists repaired")
+        return repaired_artists
+
+
+def init_artists_total_streams() -> None:
+    """Compute the total streams of the artists created before they were stored, so\
+        their counters are right without running the repair tool. Artists already\
+        storing them are never overwritten, so every app process can run it on startup"""
+    try:
+        repair_artists_total_streams(without_total_streams=True)
+    except UserServiceException:
+        artist_service_logger.exception("Error computing missing artists total streams")
@@ -3,18 +3,28 @@ User repository for persisted data.
 It uses the collection for the associated user type
 """
 
+from typing import Any
+
 from pymongo.collection import Collection
 
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
 from app.logging.logging_constants import LOGGING_BASE_USERS_REPOSITORY
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.user.user.user_schema import (
+    UserCredentialsDAO,
     UserDeleteException,
     UserGetPasswordException,
     UserRepositoryException,
+    UserType,
 )
 from app.spotify_electron.user.validations.base_user_repository_validations import (
     validate_password_exists,
     validate_user_delete_count,
+    validate_user_update,
+)
+from app.spotify_electron.utils.search.search_utils import (
+    DEFAULT_SEARCH_LIMIT,
+    get_search_query,
 )
 
 base_user_repository_logger = SpotifyElectronLogger(LOGGING_BASE_USERS_REPOSITORY).getLogger()
@@ -104,12 +114,151 @@ def get_user_password(name: str, collection: Collection) -> bytes:
         return password
 
 
-def search_by_name(name: str, collection: Collection) -> list[str]:
+def get_user_credentials(
+    name: str, collections: dict[UserType, Collection]
+) -> UserCredentialsDAO | None:
+    """Get the user type and password of a user in a single query when the database\
+        supports $unionWith
+
+    Args:
+        name (str): user name
+        collections (dict[UserType, Collection]): the collection of every user type
+
+    Raises:
+        UserRepositoryException: unexpected error getting user credentials from database
+
+    Returns:
+        UserCredentialsDAO | None: the user credentials or None if the user doesn't exist
+    """
+    try:
+        document = find_user_document(name, collections, {"_id": 1, "password": 1})
+        if document is None:
+            return None
+        validate_password_exists(document.get("password"))  # type: ignore
+    except UserGetPasswordException as exception:
+        base_user_repository_logger.exception(
+            f"Error getting password from User {name} from database"
+        )
+        raise UserRepositoryException from exception
+    except Exception as exception:
+        base_user_repository_logger.exception(
+            f"Unexpected error getting credentials from User {name} in database"
+        )
+        raise UserRepositoryException from exception
+    else:
+        return UserCredentialsDAO(
+            user_id=str(document["_id"]),
+            user_type=UserType(document["user_type"]),
+            password=document["password"],
+        )
+
+
+def get_user_id(name: str, collections: dict[UserType, Collection]) -> str | None:
+    """Get the id of a user in a single query when the database supports $unionWith.\
+        A recreated user gets a new id
+
+    Args:
+        name (str): user name
+        collections (dict[UserType, Collection]): the collection of every user type
+
+    Raises:
+        UserRepositoryException: unexpected error getting user id from database
+
+    Returns:
+        str | None: the user id or None if the user doesn't exist
+    """
+    try:
+        document = find_user_document(name, collections, {"_id": 1})
+    except Exception as exception:
+        base_user_repository_logger.exception(
+            f"Unexpected error getting id from User {name} in database"
+        )
+        raise UserRepositoryException from exception
+    else:
+        return str(document["_id"]) if document is not None else None
+
+
+def find_user_document(
+    name: str, collections: dict[UserType, Collection], projection: dict[str, int]
+) -> dict[str, Any] | None:
+    """Find a user in any of the user type collections, combining them with $unionWith\
+        when the database supports it
+
+    Args:
+        name (str): user name
+        collections (dict[UserType, Collection]): the collection of every user type
+        projection (dict[str, int]): fields to get, user_type is set to the user type\
+            of the collection the user was found in
+
+    Returns:
+        dict[str, Any] | None: the user document or None if the user doesn't exist
+    """
+    pipelines = {
+        user_type: [
+            {"$match": {"name": name}},
+            {
+                "$project": {
+                    "_id": 0,
+                    **projection,
+                    "user_type": {"$literal": user_type.value},
+                }
+            },
+        ]
+        for user_type in collections
+    }
+    if DatabaseConnectionManager.connection.supports_union_with:
+        first_user_type, *other_user_types = pipelines
+        pipeline = pipelines[first_user_type] + [
+            {
+                "$unionWith": {
+                    "coll": collections[user_type].name,
+                    "pipeline": pipelines[user_type],
+                }
+            }
+            for user_type in other_user_types
+        ]
+        pipeline.append({"$limit": 1})
+        return next(collections[first_user_type].aggregate(pipeline), None)
+    return next(
+        (
+            document
+            for user_type, pipeline in pipelines.items()
+            for document in collections[user_type].aggregate(pipeline)
+        ),
+        None,
+    )
+
+
+def update_user_password(name: str, password: bytes, collection: Collection) -> None:
+    """Update user hashed password
+
+    Args:
+        name (str): user name
+        password (bytes): the hashed password
+        collection (Collection): the database collection
+
+    Raises:
+        UserRepositoryException: unexpected error updating user password
+    """
+    try:
+        result = collection.update_one({"name": name}, {"$set": {"password": password}})
+        validate_user_update(result)
+    except Exception as exception:
+        base_user_repository_logger.exception(
+            f"Error updating password from User {name} in database"
+        )
+        raise UserRepositoryException from exception
+
+
+def search_by_name(
+    name: str, collection: Collection, limit: int = DEFAULT_SEARCH_LIMIT
+) -> list[str]:
     """Get user items that matches a name
 
     Args:
         name (str): name to match
         collection (Collection): user collection
+        limit (int, optional): max user names returned. Defaults to DEFAULT_SEARCH_LIMIT.
 
     Raises:
         UserRepositoryException: unexpected error searching items by name
@@ -118,8 +267,8 @@ def search_by_name(name: str, collection: Collection) -> list[str]:
         list[str]: the list of user names that matched the name
     """
     try:
-        matching_items = collection.find(
-            {"name": {"$regex": name, "$options": "i"}}, {"_id": 0, "name": 1}
+        matching_items = collection.find(get_search_query(name), {"_id": 0, "name": 1}).limit(
+            limit
         )
         return [user["name"] for user in matching_items]
     except Exception as exception:
@@ -135,7 +284,8 @@ def add_playback_history(
     max_number_playback_history_songs: int,
     collection: Collection,
 ) -> None:
-    """Add song playback history to user
+    """Add song playback history to user, keeping only the latest songs.\
+        Done in a single atomic update so concurrent playbacks are not lost
 
     Args:
         user_name (str): user name
@@ -147,17 +297,16 @@ def add_playback_history(
         UserRepositoryException: unexpected error adding song to user playback history
     """
     try:
-        user_data = collection.find_one({"name": user_name})
-
-        playback_history = user_data["playback_history"]  # type: ignore
-
-        if len(playback_history) == max_number_playback_history_songs:
-            playback_history.pop(0)
-
-        playback_history.append(song)
-
         collection.update_one(
-            {"name": user_name}, {"$set": {"playback_history": playback_history}}
+            {"name": user_name},
+            {
+                "$push": {
+                    "playback_history": {
+                        "$each": [song],
+                        "$slice": -max_number_playback_history_songs,
+                    }
+                }
+            },
         )
     except Exception as exception:
         base_user_repository_logger.exception(
@@ -178,15 +327,8 @@ def add_saved_playlist(user_name: str, playlist_name: str, collection: Collectio
         UserRepositoryException: unexpected error adding saved playlist to user
     """
     try:
-        # TODO make in one query
-        user_data = collection.find_one({"name": user_name})
-        saved_playlists = user_data["saved_playlists"]  # type: ignore
-
-        saved_playlists.append(playlist_name)
-
         collection.update_one(
-            {"name": user_name},
-            {"$set": {"saved_playlists": list(set(saved_playlists))}},
+            {"name": user_name}, {"$addToSet": {"saved_playlists": playlist_name}}
         )
     except Exception as exception:
         base_user_repository_logger.exception(
@@ -208,16 +350,9 @@ def delete_saved_playlist(user_name: str, playlist_name: str, collection: Collec
         UserRepositoryException: unexpected error deleting saved playlist from user
     """
     try:
-        user_data = collection.find_one({"name": user_name})
-
-        saved_playlists = user_data["saved_playlists"]  # type: ignore
-
-        if playlist_name in saved_playlists:
-            saved_playlists.remove(playlist_name)
-
-            collection.update_one(
-                {"name": user_name}, {"$set": {"saved_playlists": saved_playlists}}
-            )
+        collection.update_one(
+            {"name": user_name}, {"$pull": {"saved_playlists": playlist_name}}
+        )
     except Exception as exception:
         base_user_repository_logger.exception(
             f"Error deleting saved playlist {playlist_name} from user {user_name} in database"
@@ -237,16 +372,7 @@ def add_playlist_to_owner(user_name: str, playlist_name: str, collection: Collec
         UserRepositoryException: unexpected error adding playlist to its owner
     """
     try:
-        user_data = collection.find_one({"name": user_name})
-
-        playlists = user_data["playlists"]  # type: ignore
-
-        playlists.append(playlist_name)
-
-        collection.update_one(
-            {"name": user_name}, {"$set": {"playlists": list(set(playlists))}}
-        )
-
+        collection.update_one({"name": user_name}, {"$addToSet": {"playlists": playlist_name}})
     except Exception as exception:
         base_user_repository_logger.exception(
             f"Error adding playlist {playlist_name} to owner {user_name} in database"
@@ -268,14 +394,7 @@ def delete_playlist_from_owner(
         UserRepositoryException: unexpected error deleting playlist from owner
     """
     try:
-        user_data = collection.find_one({"name": user_name})
-
-        playlists = user_data["playlists"]  # type: ignore
-
-        if playlist_name in playlists:
-            playlists.remove(playlist_name)
-
-            collection.update_one({"name": user_name}, {"$set": {"playlists": playlists}})
+        collection.update_one({"name": user_name}, {"$pull": {"playlists": playlist_name}})
     except Exception as exception:
         base_user_repository_logger.exception(
             f"Error deleting playlist {playlist_name} from owner {user_name} in database"
@@ -350,6 +469,28 @@ def get_user_playlist_names(user_name: str, collection: Collection) -> list[str]
     return user_data["playlists"]  # type: ignore
 
 
+def get_user_playlist_names_slice(
+    user_name: str, collection: Collection, offset: int, limit: int
+) -> list[str]:
+    """Get a slice of the user created playlist names, only the slice is read\
+        from the database
+
+    Args:
+        user_name (str): user name
+        collection (Collection): user collection
+        offset (int): playlist names skipped
+        limit (int): max playlist names returned
+
+    Returns:
+        list[str]: the playlist names of the slice
+    """
+    user_data = collection.find_one(
+        {"name": user_name}, {"playlists": {"$slice": [offset, limit]}, "_id": 0}
+    )
+
+    return user_data["playlists"]  # type: ignore
+
+
 def get_user_playback_history_names(user_name: str, collection: Collection) -> list[str]:
     """Get user playback history song names
 
@@ -3,6 +3,8 @@ Base User service for handling bussiness logic
 Redirects to the specific user type service for non common logic
 """
 
+from pymongo.collection import Collection
+
 import app.auth.auth_service as auth_service
 import app.spotify_electron.playlist.playlist_service as playlist_service
 import app.spotify_electron.song.base_song_service as base_song_service
@@ -15,6 +17,7 @@ from app.auth.auth_schema import (
     TokenData,
     UserUnauthorizedException,
 )
+from app.exceptions.base_exceptions_schema import BadParameterException
 from app.logging.logging_constants import LOGGING_BASE_USERS_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.playlist.playlist_schema import (
@@ -27,6 +30,8 @@ from app.spotify_electron.playlist.validations.playlist_service_validations impo
     validate_playlist_name_parameter,
     validate_playlist_should_exists,
 )
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.song.base_song_schema import (
     SongBadNameException,
     SongMetadataDTO,
@@ -38,12 +43,21 @@ from app.spotify_electron.song.validations.base_song_service_validations import
 )
 from app.spotify_electron.user.user.user_schema import (
     UserBadNameException,
+    UserCredentialsDAO,
     UserDTO,
     UserNotFoundException,
     UserRepositoryException,
     UserServiceException,
     UserType,
 )
+from app.spotify_electron.user.user_type_cache import UserTypeCache
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    DEFAULT_PAGE_LIMIT,
+    Page,
+    get_cursor_offset,
+    get_page,
+    validate_page_limit,
+)
 from app.spotify_electron.utils.validations.validation_utils import validate_parameter
 
 base_users_service_logger = SpotifyElectronLogger(LOGGING_BASE_USERS_SERVICE).getLogger()
@@ -54,20 +68,49 @@ MAX_NUMBER_PLAYBACK_HISTORY_SONGS = 5
 
 
 def get_user_type(user_name: str) -> UserType:
-    """Get user type
+    """Get user type, resolved at most once per request. Across requests the user type\
+        is reused until the user type cache TTL expires, but only after checking the\
+        user still exists with the same id
 
     Args:
         user_name (str): user name
 
+    Raises:
+        UserNotFoundException: if the user doesn't exists
+
     Returns:
         UserType: the user type/role
     """
     validate_parameter(user_name)
-    base_user_service_validations.validate_user_should_exists(user_name)
 
-    if artist_service.does_artist_exists(user_name):
-        return UserType.ARTIST
-    return UserType.USER
+    user_type = UserTypeCache.get_request_user_type(user_name)
+    if user_type is not None:
+        return user_type
+
+    user_id = base_user_repository.get_user_id(user_name, get_user_type_collections())
+    base_user_service_validations.validate_user_id_exists(user_id)
+
+    user_type = UserTypeCache.get(user_name, user_id)  # type: ignore
+    if user_type is not None:
+        return user_type
+
+    user_type = (
+        UserType.ARTIST if artist_service.does_artist_exists(user_name) else UserType.USER
+    )
+    UserTypeCache.set(user_name, user_id, user_type)  # type: ignore
+    return user_type
+
+
+def get_user_type_collections() -> dict[UserType, Collection]:
+    """Get the collection of every user type
+
+    Returns:
+        dict[UserType, Collection]: the collections by user type
+    """
+    return {
+        UserType.ARTIST: user_collection_provider.get_artist_collection(),
+        UserType.USER: user_collection_provider.get_user_collection(),
+    }
 
 
 def get_user(user_name: str) -> UserDTO:
@@ -98,6 +141,9 @@ def delete_user(user_name: str) -> None:
         base_user_service_validations.validate_user_should_exists(user_name)
         collection = user_collection_provider.get_user_associated_collection(user_name)
         base_user_repository.delete_user(user_name, collection)
+        UserTypeCache.invalidate(user_name)
+        SearchEngine.remove(SearchItemType.USER, user_name)
+        SearchEngine.remove(SearchItemType.ARTIST, user_name)
     except UserBadNameException as exception:
         base_users_service_logger.exception(f"Bad user Parameter: {user_name}")
         raise UserBadNameException from exception
@@ -148,6 +194,73 @@ def get_user_password(user_name: str) -> bytes:
         return password
 
 
+def get_user_credentials(user_name: str) -> UserCredentialsDAO:
+    """Get user type and hashed password with a single query
+
+    Args:
+        user_name (str): the user name
+
+    Raises:
+        UserNotFoundException: if the user doesn't exists
+        UserServiceException: unexpected error while getting user credentials
+
+    Returns:
+        UserCredentialsDAO: the user credentials
+    """
+    try:
+        credentials = base_user_repository.get_user_credentials(
+            user_name, get_user_type_collections()
+        )
+        base_user_service_validations.validate_user_credentials_exists(credentials)
+        UserTypeCache.set(
+            user_name,
+            credentials.user_id,  # type: ignore
+            credentials.user_type,  # type: ignore
+        )
+    except UserNotFoundException as exception:
+        base_users_service_logger.exception(f"User not found: {user_name}")
+        raise UserNotFoundException from exception
+    except UserRepositoryException as exception:
+        base_users_service_logger.exception(
+            f"Unexpected error in User Repository getting credentials from user: {user_name}"
+        )
+        raise UserServiceException from exception
+    except Exception as exception:
+        base_users_service_logger.exception(
+            f"Unexpected error in User Service getting credentials from user: {user_name}"
+        )
+        raise UserServiceException from exception
+    else:
+        return credentials  # type: ignore
+
+
+def update_user_password(user_name: str, password: bytes) -> None:
+    """Update user hashed password
+
+    Args:
+        user_name (str): the user name
+        password (bytes): the hashed password
+
+    Raises:
+        UserServiceException: unexpected error while updating user password
+    """
+    try:
+        collection = user_collection_provider.get_user_associated_collection(user_name)
+        base_user_repository.update_user_password(user_name, password, collection)
+    except UserRepositoryException as exception:
+        base_users_service_logger.exception(
+            f"Unexpected error in User Repository updating password from user: {user_name}"
+        )
+        raise UserServiceException from exception
+    except Exception as exception:
+        base_users_service_logger.exception(
+            f"Unexpected error in User Service updating password from user: {user_name}"
+        )
+        raise UserServiceException from exception
+    else:
+        base_users_service_logger.info(f"Password updated for User: {user_name}")
+
+
 def add_playback_history(user_name: str, song_name: str, token: TokenData) -> None:
     """Add playback history to user
 
@@ -484,31 +597,60 @@ def get_user_relevant_playlists(user_name: str) -> list[PlaylistDTO]:
         return relevant_playlists
 
 
-def get_user_playlists(user_name: str) -> list[PlaylistDTO]:
-    """Get user created playlists
+def get_user_playlists(
+    user_name: str, limit: int | None = DEFAULT_PAGE_LIMIT, cursor: str | None = None
+) -> Page[PlaylistDTO]:
+    """Get a page of the user created playlists, in creation order
 
     Args:
         user_name (str): user name
+        limit (int | None, optional): max playlists returned, None returns every\
+            playlist after the cursor. Defaults to DEFAULT_PAGE_LIMIT.
+        cursor (str | None, optional): cursor of the page, None for the first page.\
+            Defaults to None.
 
     Raises:
         UserBadNameException: invalid user name
+        BadParameterException: invalid limit or cursor
         UserNotFoundException: user not found
         UserServiceException: unexpected error getting playlists created by the user
 
     Returns:
-        list[PlaylistDTO]: the playlists created by the user
+        Page[PlaylistDTO]: the page of playlists created by the user
     """
     try:
         base_user_service_validations.validate_user_name_parameter(user_name)
+        if limit is not None:
+            validate_page_limit(limit)
+        offset = get_cursor_offset(cursor)
         base_user_service_validations.validate_user_should_exists(user_name)
         collection = user_collection_provider.get_user_associated_collection(user_name)
-        user_playlist_names = base_user_repository.get_user_playlist_names(
-            user_name, collection
+        if limit is None:
+            user_playlist_names = base_user_repository.get_user_playlist_names(
+                user_name, collection
+            )[offset:]
+            user_playlist_names_page = Page(list(enumerate(user_playlist_names)), None)
+        else:
+            user_playlist_names = base_user_repository.get_user_playlist_names_slice(
+                user_name, collection, offset, limit + 1
+            )
+            user_playlist_names_page = get_page(
+                enumerate(user_playlist_names, start=offset),
+                limit,
+                lambda playlist_name: {"offset": playlist_name[0] + 1},
+            )
+        user_playlists = Page(
+            playlist_service.get_selected_playlists(
+                [playlist_name for _, playlist_name in user_playlist_names_page.items]
+            ),
+            user_playlist_names_page.next_cursor,
         )
-        user_playlists = playlist_service.get_selected_playlists(user_playlist_names)
     except UserBadNameException as exception:
         base_users_service_logger.exception(f"Bad user Parameter: {user_name}")
         raise UserBadNameException from exception
+    except BadParameterException as exception:
+        base_users_service_logger.exception(f"Bad playlists page parameter: {limit}, {cursor}")
+        raise BadParameterException from exception
     except UserNotFoundException as exception:
         base_users_service_logger.exception(f"User not found: {user_name}")
         raise UserNotFoundException from exception
@@ -2,10 +2,13 @@
 User repository for managing persisted data
 """
 
+from pymongo.errors import DuplicateKeyError
+
 import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
 from app.logging.logging_constants import LOGGING_USER_REPOSITORY
 from app.logging.logging_schema import SpotifyElectronLogger
 from app.spotify_electron.user.user.user_schema import (
+    UserAlreadyExistsException,
     UserCreateException,
     UserDAO,
     UserNotFoundException,
@@ -16,6 +19,7 @@ from app.spotify_electron.user.validations.base_user_repository_validations impo
     validate_user_create,
     validate_user_exists,
 )
+from app.spotify_electron.utils.search.search_utils import get_search_fields
 
 user_repository_logger = SpotifyElectronLogger(LOGGING_USER_REPOSITORY).getLogger()
 
@@ -49,6 +53,35 @@ def get_user(name: str) -> UserDAO:
         return user_dao
 
 
+def get_users_by_names(names: list[str]) -> list[UserDAO]:
+    """Get multiple users by name in a single query
+
+    Args:
+        names (list[str]): user names
+
+    Raises:
+        UserRepositoryException: unexpected error while getting users
+
+    Returns:
+        list[UserDAO]: the users found, in the requested names order
+    """
+    if not names:
+        return []
+    try:
+        users = user_collection_provider.get_user_collection().find(
+            {"name": {"$in": list(set(names))}}
+        )
+        users_by_name = {user["name"]: get_user_dao_from_document(user) for user in users}
+    except Exception as exception:
+        user_repository_logger.exception(f"Error getting Users {names} from database")
+        raise UserRepositoryException from exception
+    else:
+        missing_names = [name for name in names if name not in users_by_name]
+        if missing_names:
+            user_repository_logger.warning(f"Users not found: {missing_names}")
+        return [users_by_name[name] for name in names if name in users_by_name]
+
+
 def create_user(name: str, photo: str, password: bytes, current_date: str) -> None:
     """Create user
 
@@ -59,6 +92,7 @@ def create_user(name: str, photo: str, password: bytes, current_date: str) -> No
         current_date (str): formatted creation date
 
     Raises:
+        UserAlreadyExistsException: a user with the same name already exists
         UserRepositoryException: unexpected error while creating user
     """
     try:
@@ -71,9 +105,14 @@ def create_user(name: str, photo: str, password: bytes, current_date: str) -> No
             "playlists": [],
             "playback_history": [],
         }
-        result = user_collection_provider.get_user_collection().insert_one(user)
+        result = user_collection_provider.get_user_collection().insert_one(
+            {**user, **get_search_fields(name)}
+        )
 
         validate_user_create(result)
+    except DuplicateKeyError as exception:
+        user_repository_logger.exception(f"User {name} already exists in database")
+        raise UserAlreadyExistsException from exception
     except UserCreateException as exception:
         user_repository_logger.exception(f"Error inserting User {user} in database")
         raise UserRepositoryException from exception
@@ -7,6 +7,7 @@ from enum import Enum
 from typing import Any
 
 from app.exceptions.base_exceptions_schema import SpotifyElectronException
+from app.spotify_electron.utils.json_converter.json_encoder_registry import JsonEncoderRegistry
 
 
 @dataclass
@@ -22,6 +23,7 @@ class UserDAO:
     saved_playlists: list[str]
 
 
+@JsonEncoderRegistry.register
 @dataclass
 class UserDTO:
     """Represents user data in the endpoints transfer layer"""
@@ -41,6 +43,15 @@ class UserType(Enum):
     USER = "user"
 
 
+@dataclass
+class UserCredentialsDAO:
+    """Represents the user login credentials in the persistence layer"""
+
+    user_id: str
+    user_type: UserType
+    password: bytes
+
+
 def get_user_dao_from_document(document: dict[str, Any]) -> UserDAO:
     """Get UserDAO from document
 
@@ -7,8 +7,11 @@ import app.spotify_electron.user.base_user_repository as base_user_repository
 import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
 import app.spotify_electron.user.user.user_repository as user_repository
 import app.spotify_electron.user.validations.base_user_service_validations as base_user_service_validations  # noqa: E501
+from app.auth.auth_schema import PasswordHasherBusyException
 from app.logging.logging_constants import LOGGING_USER_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
 from app.spotify_electron.user.user.user_schema import (
     UserAlreadyExistsException,
     UserBadNameException,
@@ -18,6 +21,7 @@ from app.spotify_electron.user.user.user_schema import (
     UserServiceException,
     get_user_dto_from_dao,
 )
+from app.spotify_electron.user.user_type_cache import UserTypeCache
 from app.spotify_electron.utils.date.date_utils import get_current_iso8601_date
 
 user_service_logger = SpotifyElectronLogger(LOGGING_USER_SERVICE).getLogger()
@@ -90,6 +94,7 @@ def create_user(user_name: str, photo: str, password: str) -> None:
     Raises:
         UserAlreadyExistsException: if the user already exists
         UserBadNameException: if the user name is invalid
+        PasswordHasherBusyException: if too many passwords are waiting to be hashed
         UserServiceException: unexpected error while creating user
     """
     try:
@@ -106,6 +111,8 @@ def create_user(user_name: str, photo: str, password: str) -> None:
             current_date=date,
             password=hashed_password,
         )
+        UserTypeCache.invalidate(user_name)
+        SearchEngine.add(SearchItemType.USER, user_name)
         user_service_logger.info(f"User {user_name} created successfully")
     except UserAlreadyExistsException as exception:
         user_service_logger.exception(f"User already exists: {user_name}")
@@ -113,6 +120,9 @@ def create_user(user_name: str, photo: str, password: str) -> None:
     except UserBadNameException as exception:
         user_service_logger.exception(f"Bad User Name Parameter: {user_name}")
         raise UserBadNameException from exception
+    except PasswordHasherBusyException as exception:
+        user_service_logger.exception(f"Password hasher busy creating user: {user_name}")
+        raise PasswordHasherBusyException from exception
     except UserRepositoryException as exception:
         user_service_logger.exception(
             f"Unexpected error in User Repository creating user: {user_name}"
@@ -127,7 +137,8 @@ def create_user(user_name: str, photo: str, password: str) -> None:
 
 # TODO obtain all users in same query
 def get_users(user_names: list[str]) -> list[UserDTO]:
-    """Get users from a list of names
+    """Get users from a list of names. Users are retrieved with one query\
+        regardless of the number of users, missing users are skipped
 
     Args:
         user_names (list[str]): the list with the user names to retrieve
@@ -139,10 +150,8 @@ def get_users(user_names: list[str]) -> list[UserDTO]:
         list[User]: the selected users
     """
     try:
-        users: list[UserDTO] = []
-
-        for user_name in user_names:
-            users.append(get_user(user_name))
+        users_dao = user_repository.get_users_by_names(user_names)
+        users = [get_user_dto_from_dao(user_dao) for user_dao in users_dao]
 
     except UserRepositoryException as exception:
         user_service_logger.exception(
@@ -16,6 +16,7 @@ from starlette.status import (
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 import app.spotify_electron.user.base_user_service as base_user_service
@@ -23,12 +24,13 @@ import app.spotify_electron.user.user.user_service as user_service
 import app.spotify_electron.utils.json_converter.json_converter_utils as json_converter_utils
 from app.auth.auth_schema import (
     BadJWTTokenProvidedException,
+    PasswordHasherBusyException,
     TokenData,
     UserUnauthorizedException,
 )
 from app.auth.JWTBearer import JWTBearer
 from app.common.PropertiesMessagesManager import PropertiesMessagesManager
-from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.exceptions.base_exceptions_schema import BadParameterException, JsonEncodeException
 from app.spotify_electron.playlist.playlist_schema import (
     PlaylistBadNameException,
     PlaylistNotFoundException,
@@ -43,6 +45,7 @@ from app.spotify_electron.user.user.user_schema import (
     UserNotFoundException,
     UserServiceException,
 )
+from app.spotify_electron.utils.pagination.pagination_utils import DEFAULT_PAGE_LIMIT
 
 router = APIRouter(
     prefix="/users",
@@ -131,6 +134,11 @@ def create_user(name: str, photo: str, password: str) -> Response:
             status_code=HTTP_404_NOT_FOUND,
             content=PropertiesMessagesManager.userNotFound,
         )
+    except PasswordHasherBusyException:
+        return Response(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            content=PropertiesMessagesManager.userCreateBusy,
+        )
     except (Exception, UserServiceException):
         return Response(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR,
@@ -349,21 +357,42 @@ def get_user_relevant_playlists(name: str) -> Response:
 
 
 @router.get("/{name}/playlists")
-def get_user_playlists(name: str) -> Response:
-    """Get playlists created by the user
+def get_user_playlists(
+    name: str, limit: int | None = None, cursor: str | None = None
+) -> Response:
+    """Get a page of the playlists created by the user
 
     Args:
         name (str): user name
+        limit (int | None): max playlists returned, every playlist is returned if\
+            neither a limit nor a cursor are requested
+        cursor (str | None): cursor of the page, returned in the X-Next-Cursor header\
+            of the previous page
     """
     try:
-        playlists = base_user_service.get_user_playlists(name)
-        playlists_json = json_converter_utils.get_json_from_model(playlists)
-        return Response(playlists_json, media_type="application/json", status_code=HTTP_200_OK)
+        if limit is None and cursor is None:
+            playlists = base_user_service.get_user_playlists(name, None)
+        else:
+            playlists = base_user_service.get_user_playlists(
+                name, DEFAULT_PAGE_LIMIT if limit is None else limit, cursor
+            )
+        playlists_json = json_converter_utils.get_json_from_model(playlists.items)
+        return Response(
+            playlists_json,
+            media_type="application/json",
+            status_code=HTTP_200_OK,
+            headers=playlists.get_headers(),
+        )
     except UserBadNameException:
         return Response(
             status_code=HTTP_400_BAD_REQUEST,
             content=PropertiesMessagesManager.userBadName,
         )
+    except BadParameterException:
+        return Response(
+            status_code=HTTP_400_BAD_REQUEST,
+            content=PropertiesMessagesManager.commonBadParameter,
+        )
     except UserNotFoundException:
         return Response(
             status_code=HTTP_404_NOT_FOUND,
@@ -0,0 +1,153 @@
+"""
+Cache of resolved user types
+
+Resolving a user type costs a database round trip per user collection. Resolved types are\
+    memoized for the current HTTP request and in a process level cache that expires\
+    after a configurable TTL. Process level entries are only reused for the same user id,\
+    so a user deleted or recreated by another process never keeps its old type.\
+    Entries are invalidated when users are created or deleted
+
+Declares UserTypeCache global object to be accessed from across the app
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
+from app.logging.logging_constants import LOGGING_USER_TYPE_CACHE
+from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.user.user.user_schema import UserType
+
+user_type_cache_logger = SpotifyElectronLogger(LOGGING_USER_TYPE_CACHE).getLogger()
+
+request_user_types: ContextVar[dict[str, UserType] | None] = ContextVar(
+    "request_user_types", default=None
+)
+"""User types resolved during the current request"""
+
+
+class _UserTypeCache:
+    """Request scoped and TTL bounded cache of user types by user name and id"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        """Seconds a user type is reused across requests, 0 disables the process cache"""
+        self.max_entries = max_entries
+        """Max user types cached across requests"""
+        self._entries: OrderedDict[str, tuple[str, UserType, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start_request_scope(self) -> Token[dict[str, UserType] | None]:
+        """Start memoizing user types for the current request
+
+        Returns:
+            Token[dict[str, UserType] | None]: token for ending the request scope
+        """
+        return request_user_types.set({})
+
+    def end_request_scope(self, token: Token[dict[str, UserType] | None]) -> None:
+        """Stop memoizing user types for the current request
+
+        Args:
+            token (Token[dict[str, UserType] | None]): token returned when the scope started
+        """
+        request_user_types.reset(token)
+
+    def get_request_user_type(self, user_name: str) -> UserType | None:
+        """Get user type resolved during the current request
+
+        Args:
+            user_name (str): user name
+
+        Returns:
+            UserType | None: the user type or None if it's not resolved yet
+        """
+        request_cache = request_user_types.get()
+        if request_cache is None:
+            return None
+        return request_cache.get(user_name)
+
+    def get(self, user_name: str, user_id: str) -> UserType | None:
+        """Get cached user type
+
+        Args:
+            user_name (str): user name
+            user_id (str): id of the existing user
+
+        Returns:
+            UserType | None: the user type or None if it's not cached for this user id
+        """
+        request_cache = request_user_types.get()
+        if request_cache is not None and user_name in request_cache:
+            return request_cache[user_name]
+
+        with self._lock:
+            entry = self._entries.get(user_name)
+            if entry is None:
+                return None
+            cached_user_id, user_type, expiration_time = entry
+            if cached_user_id != user_id or expiration_time < time.monotonic():
+                del self._entries[user_name]
+                return None
+
+        if request_cache is not None:
+            request_cache[user_name] = user_type
+        return user_type
+
+    def set(self, user_name: str, user_id: str, user_type: UserType) -> None:
+        """Cache a resolved user type
+
+        Args:
+            user_name (str): user name
+            user_id (str): user id
+            user_type (UserType): the user type
+        """
+        request_cache = request_user_types.get()
+        if request_cache is not None:
+            request_cache[user_name] = user_type
+
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[user_name] = (
+                user_id,
+                user_type,
+                time.monotonic() + self.ttl_seconds,
+            )
+            self._entries.move_to_end(user_name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_name: str) -> None:
+        """Remove cached user type
+
+        Args:
+            user_name (str): user name
+        """
+        request_cache = request_user_types.get()
+        if request_cache is not None:
+            request_cache.pop(user_name, None)
+
+        with self._lock:
+            self._entries.pop(user_name, None)
+        user_type_cache_logger.debug(f"User type of {user_name} invalidated")
+
+    def clear(self) -> None:
+        """Remove all cached user types"""
+        request_cache = request_user_types.get()
+        if request_cache is not None:
+            request_cache.clear()
+
+        with self._lock:
+            self._entries.clear()
+
+
+UserTypeCache = _UserTypeCache(
+    ttl_seconds=float(
+        getattr(PropertiesManager, AppConfig.USER_TYPE_CACHE_TTL_SECONDS, 0) or 0
+    ),
+    max_entries=int(getattr(PropertiesManager, AppConfig.USER_TYPE_CACHE_MAX_ENTRIES, 0) or 0),
+)
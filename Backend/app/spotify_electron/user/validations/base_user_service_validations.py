@@ -8,6 +8,7 @@ from app.exceptions.base_exceptions_schema import BadParameterException
 from app.spotify_electron.user.user.user_schema import (
     UserAlreadyExistsException,
     UserBadNameException,
+    UserCredentialsDAO,
     UserNotFoundException,
 )
 from app.spotify_electron.utils.validations.validation_utils import validate_parameter
@@ -47,6 +48,32 @@ def validate_user_should_exists(user_name: str) -> None:
         raise UserNotFoundException
 
 
+def validate_user_id_exists(user_id: str | None) -> None:
+    """Raises an exception if user id was not found
+
+    Args:
+        user_id (str | None): the user id
+
+    Raises:
+        UserNotFoundException: if the user doesn't exists
+    """
+    if user_id is None:
+        raise UserNotFoundException
+
+
+def validate_user_credentials_exists(credentials: UserCredentialsDAO | None) -> None:
+    """Raises an exception if user credentials were not found
+
+    Args:
+        credentials (UserCredentialsDAO | None): the user credentials
+
+    Raises:
+        UserNotFoundException: if the user doesn't exists
+    """
+    if credentials is None:
+        raise UserNotFoundException
+
+
 def validate_user_should_not_exist(user_name: str) -> None:
     """Raises an exception if the user exists
 
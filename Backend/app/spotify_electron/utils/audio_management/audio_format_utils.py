@@ -0,0 +1,55 @@
+"""
+Audio format utils
+
+Sniffs the format of an audio file from its first bytes
+"""
+
+from enum import StrEnum
+
+from app.spotify_electron.utils.audio_management.mp3_header_utils import find_first_frame
+
+AUDIO_FORMAT_SNIFF_BYTES = 4096
+"""Bytes from the start of a file needed to sniff its format"""
+ADTS_SYNC_MASK = 0xF6
+ADTS_SYNC = 0xF0
+
+
+class AudioFormat(StrEnum):
+    """Audio file formats"""
+
+    MP3 = "mp3"
+    WAV = "wav"
+    OGG = "ogg"
+    FLAC = "flac"
+    AIFF = "aiff"
+    M4A = "m4a"
+    AAC = "aac"
+
+
+def get_audio_format(head: bytes) -> AudioFormat | None:
+    """Get the format of an audio file from its first bytes
+
+    Args:
+        head (bytes): the first AUDIO_FORMAT_SNIFF_BYTES bytes of the file, or the whole\
+            file if it's smaller
+
+    Returns:
+        AudioFormat | None: the format or None if the file is not a known audio format
+    """
+    if head.startswith(b"ID3"):
+        return AudioFormat.MP3
+    if head.startswith(b"RIFF") and head[8:12] == b"WAVE":
+        return AudioFormat.WAV
+    if head.startswith(b"OggS"):
+        return AudioFormat.OGG
+    if head.startswith(b"fLaC"):
+        return AudioFormat.FLAC
+    if head.startswith(b"FORM") and head[8:12] in (b"AIFF", b"AIFC"):
+        return AudioFormat.AIFF
+    if head[4:8] == b"ftyp":
+        return AudioFormat.M4A
+    if head.startswith(b"\xff") and len(head) > 1 and head[1] & ADTS_SYNC_MASK == ADTS_SYNC:
+        return AudioFormat.AAC
+    if find_first_frame(head, 0, len(head)) is not None:
+        return AudioFormat.MP3
+    return None
@@ -1,23 +1,40 @@
 """
 Audio management utils
+
+Song durations are read from the MP3 frame headers, which takes microseconds. Only\
+    files whose headers cannot be parsed are fully decoded, in a process pool so the\
+    decoding doesn't hold the event loop nor compete with it for the GIL
+
+Declares AudioDecoder global object to be accessed from across the app
 """
 
-import base64
+import asyncio
 import io
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 
 import librosa
 
-from app.exceptions.base_exceptions_schema import SpotifyElectronException
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.common.app_schema import AppConfig
+from app.common.PropertiesManager import PropertiesManager
 from app.logging.logging_constants import LOGGING_AUDIO_MANAGEMENT_UTILS
 from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.utils.audio_management.mp3_header_utils import (
+    get_mp3_duration_seconds,
+)
 
 audio_management_utils_logger = SpotifyElectronLogger(
     LOGGING_AUDIO_MANAGEMENT_UTILS
 ).getLogger()
 
+DEFAULT_DECODER_WORKERS = 2
+
 
 def get_song_duration_seconds(name: str, file: bytes) -> int:
-    """Get song duration
+    """Get song duration, blocking until the song headers are parsed or decoded
 
     Args:
         name (str): song name
@@ -26,46 +43,156 @@ def get_song_duration_seconds(name: str, file: bytes) -> int:
     Returns:
         int: the duration in seconds, defaulted to 0 if not a song file
     """
-    try:
-        audio_data, sample_rate = librosa.load(io.BytesIO(file), sr=None)
-        duration = librosa.get_duration(y=audio_data, sr=sample_rate)
+    duration = get_mp3_duration_seconds(file)
+    if duration is None:
+        duration = decode_song_duration_seconds(file)
+    return get_duration_result(name, duration)
 
-    except Exception:
-        # If it's not a sound file
-        audio_management_utils_logger.warning(
-            f"Cannot get song {name} duration, setting duration to default"
-        )
-        duration = 0
 
-    audio_management_utils_logger.debug(f"Song file {name} has a {duration} seconds duration")
-    return int(duration)
+async def get_song_duration_seconds_async(name: str, file: bytes) -> int:
+    """Get song duration without blocking the event loop
+
+    Args:
+        name (str): song name
+        file (bytes): song file
+
+    Returns:
+        int: the duration in seconds, defaulted to 0 if not a song file
+    """
+    duration = await asyncio.to_thread(get_mp3_duration_seconds, file)
+    if duration is None:
+        audio_management_utils_logger.debug(
+            f"Cannot read song {name} duration from its headers, decoding it"
+        )
+        duration = await AudioDecoder.get_duration_seconds_async(file)
+    else:
+        AudioDecoder.record_header_parsed()
+    return get_duration_result(name, duration)
 
 
-def encode_file(name: str, file: bytes) -> str:
-    """Encode file into a string
+def decode_song_duration_seconds(file: bytes) -> float | None:
+    """Get song duration decoding the whole song, runs in the decoder processes
 
     Args:
-        name (str): file name
-        file (bytes): file bytes
-
-    Raises:
-        EncodingFileException: unexpected error encoding file
+        file (bytes): song file
 
     Returns:
-        str: the encoded str
+        float | None: the duration in seconds or None if not a song file
     """
-    # b'ZGF0YSB0byBiZSBlbmNvZGVk'
     try:
-        return str(base64.b64encode(file))
+        audio_data, sample_rate = librosa.load(io.BytesIO(file), sr=None)
+        return librosa.get_duration(y=audio_data, sr=sample_rate)
     except Exception:
-        audio_management_utils_logger.exception(
-            f"Song File with name {name} cannot be encoded"
+        return None
+
+
+def get_duration_result(name: str, duration: float | None) -> int:
+    """Get the stored duration of a song
+
+    Args:
+        name (str): song name
+        duration (float | None): the read duration, None if not a song file
+
+    Returns:
+        int: the duration in seconds, defaulted to 0 if not a song file
+    """
+    if duration is None:
+        # If it's not a sound file
+        audio_management_utils_logger.warning(
+            f"Cannot get song {name} duration, setting duration to default"
         )
-        raise EncodingFileException
+        duration = 0
 
+    audio_management_utils_logger.debug(f"Song file {name} has a {duration} seconds duration")
+    return int(duration)
 
-class EncodingFileException(SpotifyElectronException):
-    """File encoding error"""
 
-    def __init__(self):
-        super().__init__("Error encoding file")
+@dataclass
+class AudioDecoderStats:
+    """Usage stats of the song duration extraction"""
+
+    workers: int
+    """Processes decoding songs"""
+    header_parsed: int
+    """Durations read from the MP3 headers"""
+    decoded: int
+    """Durations read decoding the song"""
+    failed: int
+    """Files that are neither parseable nor decodable"""
+
+
+class _AudioDecoder:
+    """Decodes songs in a process pool to get their duration"""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers if workers > 0 else DEFAULT_DECODER_WORKERS
+        """Processes decoding songs"""
+        self._executor: Executor | None = None
+        self._header_parsed = 0
+        self._decoded = 0
+        self._failed = 0
+        self._lock = threading.Lock()
+
+    async def get_duration_seconds_async(self, file: bytes) -> float | None:
+        """Get song duration decoding it in the process pool
+
+        Args:
+            file (bytes): song file
+
+        Returns:
+            float | None: the duration in seconds or None if not a song file
+        """
+        with self._lock:
+            if self._executor is None:
+                audio_management_utils_logger.info(
+                    f"Starting audio decoder with {self.workers} processes"
+                )
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            executor = self._executor
+        loop = asyncio.get_running_loop()
+        duration = await loop.run_in_executor(executor, decode_song_duration_seconds, file)
+        with self._lock:
+            if duration is None:
+                self._failed += 1
+            else:
+                self._decoded += 1
+        return duration
+
+    def record_header_parsed(self) -> None:
+        """Record a duration read from the MP3 headers"""
+        with self._lock:
+            self._header_parsed += 1
+
+    def shutdown(self) -> None:
+        """Stop the process pool, waiting for the running decodings"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_stats(self) -> AudioDecoderStats:
+        """Get song duration extraction stats
+
+        Returns:
+            AudioDecoderStats: the song duration extraction stats
+        """
+        with self._lock:
+            return AudioDecoderStats(
+                workers=self.workers,
+                header_parsed=self._header_parsed,
+                decoded=self._decoded,
+                failed=self._failed,
+            )
+
+
+AudioDecoder = _AudioDecoder(
+    workers=int(getattr(PropertiesManager, AppConfig.SONG_DURATION_DECODER_WORKERS, 0) or 0)
+)
+
+metrics_service.register_metrics_provider(
+    "audio_decoder", lambda: asdict(AudioDecoder.get_stats())
+)
@@ -0,0 +1,363 @@
+"""
+MP3 header utils
+
+Gets the duration of an MP3 file from its MPEG frame headers without decoding it.\
+    The frame count is read from the Xing/Info or VBRI tag of the first frame when\
+    present, otherwise the frame headers are walked one after another. ID3v2 tags\
+    before the audio and ID3v1 tags after it are skipped. Files can be parsed in\
+    chunks as they are received
+"""
+
+from dataclasses import dataclass
+
+ID3V2_HEADER_SIZE = 10
+ID3V2_FOOTER_FLAG = 0x10
+ID3V1_TAG_SIZE = 128
+FRAME_HEADER_SIZE = 4
+MAX_SYNC_SEARCH_BYTES = 64 * 1024
+"""Bytes searched for the first frame when the audio doesn't start right after the tags"""
+MAX_FRAME_SIZE = 4096
+"""Upper bound of the frame size, bytes buffered past the search to check the next frame"""
+MIN_WALKED_AUDIO_RATIO = 0.9
+"""Share of the audio bytes the frame walk must cover to trust its duration"""
+
+MPEG_1 = 3
+MPEG_2 = 2
+MPEG_2_5 = 0
+LAYER_1 = 3
+LAYER_2 = 2
+LAYER_3 = 1
+MONO_CHANNEL_MODE = 3
+FRAME_SYNC = 0x7FF
+RESERVED_VERSION = 1
+RESERVED_LAYER = 0
+RESERVED_SAMPLE_RATE_INDEX = 3
+INVALID_BITRATE_INDEXES = (0, 0xF)
+
+XING_FRAMES_FLAG = 0x1
+VBRI_OFFSET = 36
+VBRI_FRAMES_OFFSET = 14
+
+BITRATES_KBPS: dict[tuple[bool, int], tuple[int, ...]] = {
+    (True, LAYER_1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, LAYER_2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, LAYER_3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, LAYER_1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, LAYER_2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, LAYER_3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+"""Bitrates by (is MPEG 1, layer) and bitrate index"""
+SAMPLE_RATES: dict[int, tuple[int, int, int]] = {
+    MPEG_1: (44100, 48000, 32000),
+    MPEG_2: (22050, 24000, 16000),
+    MPEG_2_5: (11025, 12000, 8000),
+}
+"""Sample rates by MPEG version and sample rate index"""
+
+
+@dataclass(frozen=True)
+class MP3FrameHeader:
+    """Fields of an MPEG audio frame header"""
+
+    version: int
+    layer: int
+    bitrate_kbps: int
+    sample_rate: int
+    padding: int
+    channel_mode: int
+
+    @property
+    def samples(self) -> int:
+        """Samples per channel decoded from the frame"""
+        if self.layer == LAYER_1:
+            return 384
+        if self.layer == LAYER_3 and self.version != MPEG_1:
+            return 576
+        return 1152
+
+    @property
+    def size(self) -> int:
+        """Frame size in bytes, header included"""
+        if self.layer == LAYER_1:
+            return (12 * self.bitrate_kbps * 1000 // self.sample_rate + self.padding) * 4
+        return self.samples // 8 * self.bitrate_kbps * 1000 // self.sample_rate + self.padding
+
+    @property
+    def side_info_size(self) -> int:
+        """Size of the Layer III side information that follows the header"""
+        is_mono = self.channel_mode == MONO_CHANNEL_MODE
+        if self.version == MPEG_1:
+            return 17 if is_mono else 32
+        return 9 if is_mono else 17
+
+
+def get_mp3_duration_seconds(file: bytes) -> float | None:
+    """Get the duration of an MP3 file from its frame headers
+
+    Args:
+        file (bytes): the MP3 file
+
+    Returns:
+        float | None: the duration in seconds or None if the file is not a valid MP3
+    """
+    duration_parser = MP3DurationParser()
+    duration_parser.update(file)
+    return duration_parser.finish()
+
+
+class MP3DurationParser:
+    """Reads the duration of an MP3 file fed in chunks as they arrive. Only the bytes\
+        searched for the first frame and the ones of the frame being parsed are kept"""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._buffer_offset = 0
+        self._size = 0
+        self._tail = b""
+        self._audio_start: int | None = None
+        self._first_frame_offset: int | None = None
+        self._next_frame_offset = 0
+        self._walked_duration = 0.0
+        self._tag_duration: float | None = None
+        self._is_parsing = True
+
+    @property
+    def needs_more_bytes(self) -> bool:
+        """If the next chunks can change the duration. False once it's read from the tag\
+            of the first frame or the file is known not to be a valid MP3"""
+        return self._tag_duration is None and (
+            self._is_parsing or self._first_frame_offset is not None
+        )
+
+    def update(self, chunk: bytes) -> None:
+        """Parse the next chunk of the file
+
+        Args:
+            chunk (bytes): the chunk
+        """
+        chunk_offset = self._size
+        self._size += len(chunk)
+        self._tail = (self._tail + chunk[-ID3V1_TAG_SIZE:])[-ID3V1_TAG_SIZE:]
+        if not self._is_parsing:
+            return
+        if self._buffer_offset > chunk_offset:
+            chunk = chunk[self._buffer_offset - chunk_offset :]
+        self._buffer += chunk
+        self._parse(is_final=False)
+
+    def finish(self) -> float | None:
+        """Get the duration once the whole file was parsed
+
+        Returns:
+            float | None: the duration in seconds or None if the file is not a valid MP3
+        """
+        if self._is_parsing:
+            self._parse(is_final=True)
+            self._is_parsing = False
+            self._buffer.clear()
+        if self._tag_duration is not None:
+            return self._tag_duration
+        if self._first_frame_offset is None:
+            return None
+
+        audio_end = self._get_audio_end()
+        walked_end = min(self._next_frame_offset, audio_end)
+        audio_size = audio_end - self._first_frame_offset
+        if walked_end - self._first_frame_offset < audio_size * MIN_WALKED_AUDIO_RATIO:
+            return None
+        return self._walked_duration
+
+    def _parse(self, is_final: bool) -> None:
+        """Parse the buffered bytes, keeping the ones needed by the next chunk
+
+        Args:
+            is_final (bool): if the whole file was buffered
+        """
+        if self._audio_start is None:
+            if len(self._buffer) < ID3V2_HEADER_SIZE and not is_final:
+                return
+            self._audio_start = get_id3v2_size(bytes(self._buffer[:ID3V2_HEADER_SIZE]))
+
+        if self._first_frame_offset is None:
+            self._find_first_frame(is_final)
+            if self._first_frame_offset is None:
+                self._discard(self._audio_start)
+                return
+
+        if self._is_parsing:
+            self._walk_frames()
+        self._discard(self._next_frame_offset)
+
+    def _find_first_frame(self, is_final: bool) -> None:
+        """Find the first frame once the searched bytes are buffered, reading its tag
+
+        Args:
+            is_final (bool): if the whole file was buffered
+        """
+        assert self._audio_start is not None
+        search_end = self._audio_start + MAX_SYNC_SEARCH_BYTES
+        if not is_final and self._size < search_end + MAX_FRAME_SIZE:
+            return
+
+        buffer = bytes(self._buffer)
+        end = (self._get_audio_end() if is_final else self._size) - self._buffer_offset
+        first_frame_offset = find_first_frame(
+            buffer, self._audio_start - self._buffer_offset, end
+        )
+        if first_frame_offset is None:
+            self._is_parsing = False
+            return
+
+        first_frame = parse_frame_header(buffer, first_frame_offset)
+        assert first_frame is not None
+        self._first_frame_offset = first_frame_offset + self._buffer_offset
+        self._next_frame_offset = self._first_frame_offset
+        frames = get_tag_frames(buffer, first_frame_offset, first_frame)
+        if frames is not None:
+            self._tag_duration = frames * first_frame.samples / first_frame.sample_rate
+            self._is_parsing = False
+
+    def _walk_frames(self) -> None:
+        """Add the duration of every buffered frame, jumping from one header to the next"""
+        buffer_end = self._buffer_offset + len(self._buffer)
+        while self._next_frame_offset + FRAME_HEADER_SIZE <= buffer_end:
+            frame = parse_frame_header(
+                self._buffer, self._next_frame_offset - self._buffer_offset
+            )
+            if frame is None:
+                self._is_parsing = False
+                return
+            self._walked_duration += frame.samples / frame.sample_rate
+            self._next_frame_offset += frame.size
+
+    def _discard(self, offset: int) -> None:
+        """Discard the buffered bytes before an offset, and the next bytes fed until it
+
+        Args:
+            offset (int): the offset
+        """
+        if not self._is_parsing:
+            self._buffer.clear()
+            return
+        discarded = offset - self._buffer_offset
+        if discarded > 0:
+            del self._buffer[:discarded]
+            self._buffer_offset = offset
+
+    def _get_audio_end(self) -> int:
+        """Get the offset where the audio ends, before the ID3v1 tag if any
+
+        Returns:
+            int: the audio end offset
+        """
+        audio_start = self._audio_start or 0
+        if self._size - audio_start >= ID3V1_TAG_SIZE and self._tail[:3] == b"TAG":
+            return self._size - ID3V1_TAG_SIZE
+        return self._size
+
+
+def get_id3v2_size(file: bytes) -> int:
+    """Get the size of the ID3v2 tag at the start of a file
+
+    Args:
+        file (bytes): the file
+
+    Returns:
+        int: the tag size with its header and footer, 0 if the file has no tag
+    """
+    if len(file) < ID3V2_HEADER_SIZE or file[:3] != b"ID3":
+        return 0
+    size_bytes = file[6:10]
+    if any(size_byte & 0x80 for size_byte in size_bytes):
+        return 0
+    size = 0
+    for size_byte in size_bytes:
+        size = size << 7 | size_byte
+    footer_size = ID3V2_HEADER_SIZE if file[5] & ID3V2_FOOTER_FLAG else 0
+    return ID3V2_HEADER_SIZE + size + footer_size
+
+
+def parse_frame_header(file: bytes, offset: int) -> MP3FrameHeader | None:
+    """Parse the frame header at an offset
+
+    Args:
+        file (bytes): the file
+        offset (int): the header offset
+
+    Returns:
+        MP3FrameHeader | None: the header or None if there's no valid header at the offset
+    """
+    if offset + FRAME_HEADER_SIZE > len(file):
+        return None
+    header = int.from_bytes(file[offset : offset + FRAME_HEADER_SIZE], "big")
+    if header >> 21 != FRAME_SYNC:
+        return None
+    version = header >> 19 & 0x3
+    layer = header >> 17 & 0x3
+    bitrate_index = header >> 12 & 0xF
+    sample_rate_index = header >> 10 & 0x3
+    if (
+        version == RESERVED_VERSION
+        or layer == RESERVED_LAYER
+        or bitrate_index in INVALID_BITRATE_INDEXES
+        or sample_rate_index == RESERVED_SAMPLE_RATE_INDEX
+    ):
+        return None
+    return MP3FrameHeader(
+        version=version,
+        layer=layer,
+        bitrate_kbps=BITRATES_KBPS[(version == MPEG_1, layer)][bitrate_index],
+        sample_rate=SAMPLE_RATES[version][sample_rate_index],
+        padding=header >> 9 & 0x1,
+        channel_mode=header >> 6 & 0x3,
+    )
+
+
+def find_first_frame(file: bytes, start: int, end: int) -> int | None:
+    """Find the first frame, a valid header followed by another valid header
+
+    Args:
+        file (bytes): the file
+        start (int): offset where the search starts
+        end (int): offset where the audio ends
+
+    Returns:
+        int | None: the first frame offset or None if no frame was found
+    """
+    search_end = min(end, start + MAX_SYNC_SEARCH_BYTES)
+    offset = file.find(b"\xff", start, search_end)
+    while offset != -1:
+        frame = parse_frame_header(file, offset)
+        if frame is not None:
+            next_offset = offset + frame.size
+            if next_offset >= end or parse_frame_header(file, next_offset) is not None:
+                return offset
+        offset = file.find(b"\xff", offset + 1, search_end)
+    return None
+
+
+def get_tag_frames(file: bytes, offset: int, frame: MP3FrameHeader) -> int | None:
+    """Get the number of frames stored in the Xing/Info or VBRI tag of the first frame
+
+    Args:
+        file (bytes): the file
+        offset (int): the first frame offset
+        frame (MP3FrameHeader): the first frame header
+
+    Returns:
+        int | None: the number of frames or None if the frame has no tag with it
+    """
+    xing_offset = offset + FRAME_HEADER_SIZE + frame.side_info_size
+    if file[xing_offset : xing_offset + 4] in (b"Xing", b"Info"):
+        flags = int.from_bytes(file[xing_offset + 4 : xing_offset + 8], "big")
+        if flags & XING_FRAMES_FLAG:
+            frames = int.from_bytes(file[xing_offset + 8 : xing_offset + 12], "big")
+            return frames or None
+        return None
+
+    vbri_offset = offset + VBRI_OFFSET
+    if file[vbri_offset : vbri_offset + 4] == b"VBRI":
+        frames_offset = vbri_offset + VBRI_FRAMES_OFFSET
+        frames = int.from_bytes(file[frames_offset : frames_offset + 4], "big")
+        return frames or None
+    return None
@@ -1,21 +1,37 @@
 """
 Json converter utils for building HTTP Json responses from domain objects
+
+Objects are converted into JSON compatible values by the JsonEncoderRegistry,\
+    which uses the encoders generated for the registered DTO dataclasses and falls\
+    back to FastAPI `jsonable_encoder` for any other type
 """
 
 import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any
 
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from app.exceptions.base_exceptions_schema import JsonEncodeException
 from app.logging.logging_constants import LOGGING_HTTP_ENCODE_SERVICE
 from app.logging.logging_schema import SpotifyElectronLogger
+from app.spotify_electron.utils.json_converter.json_encoder_registry import (
+    JsonEncoderRegistry,
+)
 
 http_encode_service_logger = SpotifyElectronLogger(LOGGING_HTTP_ENCODE_SERVICE).getLogger()
 
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_CHUNK_SIZE = 100
+"""Objects encoded into each chunk of a streamed response"""
+JSON_SEPARATORS = (",", ":")
+"""Separators of the encoded json, without whitespace"""
+
 
-def get_json_from_model(object: Any) -> str:
-    """Returns json string from an object
+def get_json_from_model(object: Any) -> bytes:
+    """Returns json bytes from an object
 
     Args:
     ----
@@ -28,14 +44,14 @@ def get_json_from_model(object: Any) -> str:
 
     Returns:
     -------
-        str: the object converted into json string
+        bytes: the object converted into json bytes
 
     """
     return _get_json_from_model(object)
 
 
-def get_json_with_iterable_field_from_model(object: Any, field_name: str) -> str:
-    """Returns a json string that contains an object inside a field name
+def get_json_with_iterable_field_from_model(object: Any, field_name: str) -> bytes:
+    """Returns json bytes that contain an object inside a field name
 
     Args:
     ----
@@ -44,15 +60,15 @@ def get_json_with_iterable_field_from_model(object: Any, field_name: str) -> str
 
     Returns:
     -------
-        str: the json string with the object inside a field name
+        bytes: the json bytes with the object inside a field name
 
     """
     object_dict = {field_name: object}
     return _get_json_from_model(object_dict)
 
 
-def _get_json_from_model(object: Any) -> str:
-    """Returns json string from an object
+def _get_json_from_model(object: Any) -> bytes:
+    """Returns json bytes from an object
 
     Args:
     ----
@@ -65,15 +81,112 @@ def _get_json_from_model(object: Any) -> str:
 
     Returns:
     -------
-        str: the object converted into json string
+        bytes: the object converted into json bytes
 
     """
     try:
-        jsonable_object = jsonable_encoder(object)
-        json_object = json.dumps(jsonable_object)
-        http_encode_service_logger.debug(f"Success encoding object into json: {json_object}")
+        jsonable_object = JsonEncoderRegistry.to_jsonable(object)
+        json_object = json.dumps(jsonable_object, separators=JSON_SEPARATORS).encode()
+        http_encode_service_logger.debug(
+            f"Success encoding object into json: {len(json_object)} bytes"
+        )
     except Exception:
         http_encode_service_logger.exception(f"Error encoding object {object} into json")
         raise JsonEncodeException()
     else:
         return json_object
+
+
+def get_json_array_stream_from_models(
+    objects: Iterable[Any], field_name: str
+) -> Iterator[str]:
+    """Returns the chunks of a json string that contains the objects as an array inside\
+        a field name. Objects are encoded as they are consumed from the iterable
+
+    Args:
+        objects (Iterable[Any]): the objects to be put inside a field name
+        field_name (str): the name of the field name where the objects will be put on
+
+    Raises:
+        JsonEncodeException: if an error occurred while encoding an object \
+            into json string
+
+    Yields:
+        str: the json string chunks
+    """
+    yield f"{{{json.dumps(field_name)}:["
+    separator = ""
+    for chunk in _get_json_chunks_from_models(objects):
+        yield separator + ",".join(chunk)
+        separator = ","
+    yield "]}"
+
+
+def get_ndjson_stream_from_models(objects: Iterable[Any]) -> Iterator[str]:
+    """Returns the chunks of a newline delimited json string with a line per object.\
+        Objects are encoded as they are consumed from the iterable
+
+    Args:
+        objects (Iterable[Any]): the objects that are going to be converted into json lines
+
+    Raises:
+        JsonEncodeException: if an error occurred while encoding an object \
+            into json string
+
+    Yields:
+        str: the json lines chunks
+    """
+    for chunk in _get_json_chunks_from_models(objects):
+        yield "".join(f"{json_object}\n" for json_object in chunk)
+
+
+def get_streaming_response_from_models(
+    objects: Iterable[Any], field_name: str, accept: str | None
+) -> StreamingResponse:
+    """Returns a response that streams the objects as they are consumed from the iterable,\
+        so neither the time to the first byte nor the memory used depend on the number\
+        of objects. Objects are streamed as newline delimited json if the client accepts\
+        it, otherwise as a json array inside a field name
+
+    Args:
+        objects (Iterable[Any]): the objects to stream
+        field_name (str): the name of the field name where the objects will be put on\
+            when streamed as a json array
+        accept (str | None): the request Accept header
+
+    Returns:
+        StreamingResponse: the streaming response
+    """
+    if accept is not None and NDJSON_MEDIA_TYPE in accept:
+        return StreamingResponse(
+            get_ndjson_stream_from_models(objects), media_type=NDJSON_MEDIA_TYPE
+        )
+    return StreamingResponse(
+        get_json_array_stream_from_models(objects, field_name), media_type=JSON_MEDIA_TYPE
+    )
+
+
+def _get_json_chunks_from_models(objects: Iterable[Any]) -> Iterator[list[str]]:
+    """Returns the objects encoded into json strings, grouped in chunks
+
+    Args:
+        objects (Iterable[Any]): the objects to encode
+
+    Raises:
+        JsonEncodeException: if an error occurred while encoding an object \
+            into json string
+
+    Yields:
+        list[str]: up to STREAM_CHUNK_SIZE objects converted into json strings
+    """
+    iterator = iter(objects)
+    while chunk := list(islice(iterator, STREAM_CHUNK_SIZE)):
+        try:
+            json_objects = [
+                json.dumps(JsonEncoderRegistry.to_jsonable(object), separators=JSON_SEPARATORS)
+                for object in chunk
+            ]
+        except Exception:
+            http_encode_service_logger.exception("Error encoding streamed objects into json")
+            raise JsonEncodeException()
+        yield json_objects
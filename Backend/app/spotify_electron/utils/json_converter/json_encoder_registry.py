@@ -0,0 +1,184 @@
+"""
+Registry of JSON encoders generated for DTO dataclasses
+
+The encoder of a registered dataclass is generated once from its fields type hints\
+    and builds the object JSON compatible value with direct attribute accesses,\
+    instead of the reflective walk of FastAPI `jsonable_encoder`. Nested values are\
+    dispatched by their exact type, so subclasses of a registered dataclass and\
+    values of unregistered types fall back to `jsonable_encoder`
+
+Declares _JsonEncoderRegistry global object to be accessed from across the app
+"""
+
+import dataclasses
+import types
+import typing
+from collections.abc import Callable
+from enum import Enum
+from typing import Any, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+
+from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.logging.logging_constants import LOGGING_HTTP_ENCODE_SERVICE
+from app.logging.logging_schema import SpotifyElectronLogger
+
+json_encoder_registry_logger = SpotifyElectronLogger(LOGGING_HTTP_ENCODE_SERVICE).getLogger()
+
+JSON_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+"""Types whose values are already JSON compatible"""
+
+ModelT = TypeVar("ModelT", bound=type)
+
+
+class _JsonEncoderRegistry:
+    """Generates and stores the JSON encoders of DTO dataclasses"""
+
+    def __init__(self) -> None:
+        self._encoders: dict[type, Callable[[Any], Any]] = {}
+
+    def register(self, model_type: ModelT) -> ModelT:
+        """Generate the encoder of a dataclass, can be used as a class decorator
+
+        Args:
+            model_type (ModelT): the dataclass
+
+        Returns:
+            ModelT: the same dataclass
+        """
+        if model_type not in self._encoders:
+            self._encoders[model_type] = self._generate_encoder(model_type)
+        return model_type
+
+    def is_registered(self, model_type: type) -> bool:
+        """Get if a type has a generated encoder
+
+        Args:
+            model_type (type): the type
+
+        Returns:
+            bool: if the type has a generated encoder
+        """
+        return model_type in self._encoders
+
+    def to_jsonable(self, object: Any) -> Any:
+        """Get the JSON compatible value of an object
+
+        Args:
+            object (Any): the object
+
+        Returns:
+            Any: the JSON compatible value
+        """
+        object_type = type(object)
+        if object_type in JSON_PRIMITIVE_TYPES:
+            return object
+        encoder = self._encoders.get(object_type)
+        if encoder is not None:
+            return encoder(object)
+        if object_type is list or object_type is tuple:
+            return [self.to_jsonable(item) for item in object]
+        if object_type is dict:
+            return {key: self.to_jsonable(value) for key, value in object.items()}
+        return jsonable_encoder(object)
+
+    def _generate_encoder(self, model_type: type) -> Callable[[Any], Any]:
+        """Generate the source of a function that builds the JSON compatible dict of\
+            a dataclass and compile it
+
+        Args:
+            model_type (type): the dataclass
+
+        Raises:
+            JsonEncodeException: if the type is not a dataclass
+
+        Returns:
+            Callable[[Any], Any]: the encoder
+        """
+        if not dataclasses.is_dataclass(model_type):
+            json_encoder_registry_logger.error(f"Cannot generate encoder for {model_type}")
+            raise JsonEncodeException()
+
+        namespace: dict[str, Any] = {"_to_jsonable": self.to_jsonable}
+        type_hints = typing.get_type_hints(model_type)
+        items = [
+            f"{field.name!r}: "
+            + self._get_value_source(f"object.{field.name}", type_hints[field.name], namespace)
+            for field in dataclasses.fields(model_type)
+        ]
+        function_name = f"encode_{model_type.__name__}"
+        source = f"def {function_name}(object):\n    return {{{', '.join(items)}}}\n"
+        exec(source, namespace)  # noqa: S102
+        json_encoder_registry_logger.debug(
+            f"JSON encoder generated for {model_type}:\n{source}"
+        )
+        return namespace[function_name]
+
+    def _get_value_source(
+        self, value_source: str, value_type: Any, namespace: dict[str, Any]
+    ) -> str:
+        """Get the source of an expression that builds the JSON compatible value\
+            of a field
+
+        Args:
+            value_source (str): the source of the expression that gets the field value
+            value_type (Any): the field type hint
+            namespace (dict[str, Any]): the encoder namespace
+
+        Returns:
+            str: the source of the expression
+        """
+        if self._is_primitive_type(value_type):
+            return value_source
+
+        origin = typing.get_origin(value_type)
+        arguments = typing.get_args(value_type)
+
+        if origin in (typing.Union, types.UnionType) and type(None) in arguments:
+            (inner_type, *other_types) = (
+                argument for argument in arguments if argument is not type(None)
+            )
+            if not other_types:
+                inner_source = self._get_value_source(value_source, inner_type, namespace)
+                return f"(None if {value_source} is None else {inner_source})"
+
+        if isinstance(value_type, type) and issubclass(value_type, Enum):
+            return f"{value_source}.value"
+
+        if origin in (list, tuple, set, frozenset) and len(arguments) == 1:
+            if self._is_primitive_type(arguments[0]):
+                return f"list({value_source})"
+            item_source = self._get_value_source("item", arguments[0], namespace)
+            return f"[{item_source} for item in {value_source}]"
+
+        if origin is dict and len(arguments) == 2 and arguments[0] is str:  # noqa: PLR2004
+            if self._is_primitive_type(arguments[1]):
+                return f"dict({value_source})"
+            item_source = self._get_value_source("value", arguments[1], namespace)
+            return f"{{key: {item_source} for key, value in {value_source}.items()}}"
+
+        if isinstance(value_type, type) and dataclasses.is_dataclass(value_type):
+            self.register(value_type)
+
+        return f"_to_jsonable({value_source})"
+
+    def _is_primitive_type(self, value_type: Any) -> bool:
+        """Get if the values of a type hint are already JSON compatible
+
+        Args:
+            value_type (Any): the type hint
+
+        Returns:
+            bool: if the values are JSON compatible
+        """
+        if value_type in JSON_PRIMITIVE_TYPES:
+            return True
+        origin = typing.get_origin(value_type)
+        if origin in (typing.Union, types.UnionType):
+            return all(
+                self._is_primitive_type(argument) for argument in typing.get_args(value_type)
+            )
+        return False
+
+
+JsonEncoderRegistry = _JsonEncoderRegistry()
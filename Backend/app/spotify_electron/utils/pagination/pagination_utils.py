@@ -0,0 +1,172 @@
+"""
+Pagination utils
+
+Cursors are opaque to clients. They encode the position where the next page starts\
+    as url safe base64 JSON. List endpoints return the cursor of the next page in the\
+    NEXT_CURSOR_HEADER response header, it's missing on the last page
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+from app.exceptions.base_exceptions_schema import BadParameterException
+
+DEFAULT_PAGE_LIMIT = 50
+"""Items returned by a list page when no limit is requested"""
+MAX_PAGE_LIMIT = 200
+"""Max items that can be requested in a single list page"""
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+"""Response header with the cursor of the next page"""
+PAGE_SORT_FIELD = "name"
+"""Field that sorts the list pages"""
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """Page of a list of items"""
+
+    items: list[T]
+    next_cursor: str | None
+    """Cursor of the next page, None on the last page"""
+
+    def get_headers(self) -> dict[str, str]:
+        """Get the response headers of the page
+
+        Returns:
+            dict[str, str]: the response headers
+        """
+        if self.next_cursor is None:
+            return {}
+        return {NEXT_CURSOR_HEADER: self.next_cursor}
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """Get the cursor of a position
+
+    Args:
+        position (dict[str, Any]): the position where the next page starts
+
+    Returns:
+        str: the cursor
+    """
+    position_json = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(position_json).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Get the position encoded in a cursor
+
+    Args:
+        cursor (str): the cursor
+
+    Raises:
+        BadParameterException: if the cursor is invalid
+
+    Returns:
+        dict[str, Any]: the position where the next page starts
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exception:
+        raise BadParameterException(cursor) from exception
+    if not isinstance(position, dict):
+        raise BadParameterException(cursor)
+    return position
+
+
+def validate_page_limit(limit: int) -> None:
+    """Checks if the page limit is between 1 and MAX_PAGE_LIMIT
+
+    Args:
+        limit (int): max items of the page
+
+    Raises:
+        BadParameterException: if the limit is invalid
+    """
+    if not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise BadParameterException(str(limit))
+
+
+def get_cursor_after_name(cursor: str | None) -> str | None:
+    """Get the name after which a keyset page starts
+
+    Args:
+        cursor (str | None): the page cursor, None for the first page
+
+    Raises:
+        BadParameterException: if the cursor is invalid
+
+    Returns:
+        str | None: the last name of the previous page, None for the first page
+    """
+    if cursor is None:
+        return None
+    after_name = decode_cursor(cursor).get("after")
+    if not isinstance(after_name, str):
+        raise BadParameterException(cursor)
+    return after_name
+
+
+def get_cursor_offset(cursor: str | None) -> int:
+    """Get the offset where a page starts
+
+    Args:
+        cursor (str | None): the page cursor, None for the first page
+
+    Raises:
+        BadParameterException: if the cursor is invalid
+
+    Returns:
+        int: the number of items before the page
+    """
+    if cursor is None:
+        return 0
+    offset = decode_cursor(cursor).get("offset")
+    if not isinstance(offset, int) or offset < 0:
+        raise BadParameterException(cursor)
+    return offset
+
+
+def get_keyset_query(query: dict[str, Any], after_name: str | None) -> dict[str, Any]:
+    """Get the query of a keyset page
+
+    Args:
+        query (dict[str, Any]): the query that filters the items
+        after_name (str | None): the last name of the previous page
+
+    Returns:
+        dict[str, Any]: the query that filters the items after the previous page
+    """
+    if after_name is None:
+        return query
+    return {**query, PAGE_SORT_FIELD: {"$gt": after_name}}
+
+
+def get_page(
+    items: Iterable[T], limit: int, get_next_position: Callable[[T], dict[str, Any]]
+) -> Page[T]:
+    """Get a page from an iterable that yields up to limit + 1 items. The extra item\
+        is only read to know if there's a next page
+
+    Args:
+        items (Iterable[T]): the page items followed by the first one of the next page
+        limit (int): max items of the page
+        get_next_position (Callable[[T], dict[str, Any]]): gets the position where\
+            the next page starts from the last item of the page
+
+    Returns:
+        Page[T]: the page
+    """
+    page_items = list(islice(items, limit + 1))
+    if len(page_items) <= limit:
+        return Page(page_items, None)
+    del page_items[limit:]
+    return Page(page_items, encode_cursor(get_next_position(page_items[-1])))
@@ -0,0 +1,135 @@
+"""
+Search index utils
+
+Searchable documents store a normalized name key and the n-grams of that key.\
+    The n-grams field is indexed, so partial name matches are served from the index\
+    instead of scanning the whole collection with a case insensitive regex
+"""
+
+import re
+import unicodedata
+from typing import Any
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+SEARCH_NAME_FIELD = "search_name"
+"""Document field with the normalized name"""
+SEARCH_TOKENS_FIELD = "search_tokens"
+"""Document field with the n-grams of the normalized name"""
+MAX_SEARCH_TOKEN_LENGTH = 3
+"""Longest n-gram stored, longer queries match every n-gram they contain"""
+DEFAULT_SEARCH_LIMIT = 50
+"""Max items returned by a search"""
+MAX_SEARCH_LIMIT = 100
+"""Max items of a type that can be requested in a single search page"""
+SEARCH_BACKFILL_BATCH_SIZE = 1000
+"""Documents updated per bulk write when backfilling the search fields"""
+
+
+def normalize_search_name(name: str) -> str:
+    """Get the search key of a name, casefolded and without accents
+
+    Args:
+        name (str): the name
+
+    Returns:
+        str: the normalized name
+    """
+    decomposed_name = unicodedata.normalize("NFKD", name)
+    return "".join(
+        character for character in decomposed_name if not unicodedata.combining(character)
+    ).casefold()
+
+
+def get_search_tokens(search_name: str) -> list[str]:
+    """Get every n-gram of a normalized name up to the max token length
+
+    Args:
+        search_name (str): the normalized name
+
+    Returns:
+        list[str]: the distinct n-grams
+    """
+    return list(
+        dict.fromkeys(
+            search_name[start : start + length]
+            for length in range(1, MAX_SEARCH_TOKEN_LENGTH + 1)
+            for start in range(len(search_name) - length + 1)
+        )
+    )
+
+
+def get_search_fields(name: str) -> dict[str, Any]:
+    """Get the search index fields of a document
+
+    Args:
+        name (str): the document name
+
+    Returns:
+        dict[str, Any]: the search fields to store in the document
+    """
+    search_name = normalize_search_name(name)
+    return {
+        SEARCH_NAME_FIELD: search_name,
+        SEARCH_TOKENS_FIELD: get_search_tokens(search_name),
+    }
+
+
+def get_search_query(name: str) -> dict[str, Any]:
+    """Get the query for documents whose name contains the given name.\
+        Short names match a single n-gram, longer names match all of their n-grams\
+        and the candidates are checked against the normalized name
+
+    Args:
+        name (str): the name to match
+
+    Returns:
+        dict[str, Any]: the query
+    """
+    search_name = normalize_search_name(name)
+    if len(search_name) <= MAX_SEARCH_TOKEN_LENGTH:
+        return {SEARCH_TOKENS_FIELD: search_name}
+
+    search_tokens = [
+        token
+        for token in get_search_tokens(search_name)
+        if len(token) == MAX_SEARCH_TOKEN_LENGTH
+    ]
+    return {
+        SEARCH_TOKENS_FIELD: {"$all": search_tokens},
+        SEARCH_NAME_FIELD: {"$regex": re.escape(search_name)},
+    }
+
+
+def backfill_search_fields(collection: Collection) -> int:
+    """Store the search fields on every document of a collection whose\
+        search fields are missing or out of date
+
+    Args:
+        collection (Collection): the searchable collection
+
+    Returns:
+        int: the number of updated documents
+    """
+    updated_documents = 0
+    operations: list[UpdateOne] = []
+    documents = collection.find({}, {"_id": 1, "name": 1, SEARCH_NAME_FIELD: 1})
+    for document in documents:
+        name = document.get("name")
+        if not isinstance(name, str):
+            continue
+        if document.get(SEARCH_NAME_FIELD) == normalize_search_name(name):
+            continue
+        operations.append(
+            UpdateOne({"_id": document["_id"]}, {"$set": get_search_fields(name)})
+        )
+        if len(operations) >= SEARCH_BACKFILL_BATCH_SIZE:
+            result = collection.bulk_write(operations, ordered=False)
+            updated_documents += result.modified_count
+            operations = []
+
+    if operations:
+        result = collection.bulk_write(operations, ordered=False)
+        updated_documents += result.modified_count
+    return updated_documents
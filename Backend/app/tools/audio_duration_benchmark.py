@@ -0,0 +1,174 @@
+"""Audio duration benchmark
+
+Measures the time to get the duration of every MP3 of a corpus reading its frame\
+    headers and decoding it, and the max event loop lag while the durations are read\
+    off the event loop
+
+Commands:
+    help: print script usage
+    benchmark [directory]: read the durations of the MP3 files of `directory`,\
+        tests/assets by default
+
+Steps:
+    1. Go to Backend/
+    2. Run `python -m app.tools.audio_duration_benchmark [(help) | (benchmark [directory])]`
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Callable
+
+from app.spotify_electron.utils.audio_management.audio_management_utils import (
+    AudioDecoder,
+    decode_song_duration_seconds,
+    get_song_duration_seconds_async,
+)
+from app.spotify_electron.utils.audio_management.mp3_header_utils import (
+    get_mp3_duration_seconds,
+)
+
+HELP_COMMAND = "help"
+BENCHMARK_COMMAND = "benchmark"
+
+BENCHMARK_DEFAULT_DIRECTORY = "tests/assets"
+LOOP_LAG_INTERVAL_SECONDS = 0.001
+
+
+def load_corpus(directory: str) -> dict[str, bytes]:
+    """Load the non-empty MP3 files of a directory
+
+    Args:
+        directory (str): the directory
+
+    Returns:
+        dict[str, bytes]: the files by name
+    """
+    corpus: dict[str, bytes] = {}
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.lower().endswith(".mp3"):
+            continue
+        with open(os.path.join(directory, file_name), "rb") as file:
+            data = file.read()
+        if data:
+            corpus[file_name] = data
+    return corpus
+
+
+def time_duration(
+    function: Callable[[bytes], float | None], file: bytes
+) -> tuple[float | None, float]:
+    """Get the duration of a file timing the call
+
+    Args:
+        function (Callable[[bytes], float | None]): the duration function
+        file (bytes): the file
+
+    Returns:
+        tuple[float | None, float]: the duration and the milliseconds it took
+    """
+    start = time.perf_counter()
+    duration = function(file)
+    return duration, (time.perf_counter() - start) * 1000
+
+
+async def measure_loop_lag(corpus: dict[str, bytes]) -> float:
+    """Get the durations of the corpus off the event loop while measuring its lag
+
+    Args:
+        corpus (dict[str, bytes]): the files by name
+
+    Returns:
+        float: the max event loop lag in milliseconds
+    """
+    max_lag = 0.0
+    is_running = True
+
+    async def heartbeat() -> None:
+        nonlocal max_lag
+        while is_running:
+            start = time.perf_counter()
+            await asyncio.sleep(LOOP_LAG_INTERVAL_SECONDS)
+            max_lag = max(max_lag, time.perf_counter() - start - LOOP_LAG_INTERVAL_SECONDS)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    await asyncio.gather(
+        *(get_song_duration_seconds_async(name, file) for name, file in corpus.items())
+    )
+    is_running = False
+    await heartbeat_task
+    return max_lag * 1000
+
+
+def benchmark_audio_duration(directory: str) -> None:
+    """Compare header parsing and decoding over the MP3 files of a directory
+
+    Args:
+        directory (str): the directory
+    """
+    corpus = load_corpus(directory)
+    if not corpus:
+        print(f"No MP3 files found in {directory}")
+        return
+
+    # Warm up the decoder so its import time isn't measured
+    decode_song_duration_seconds(next(iter(corpus.values())))
+
+    print(f"{'file':<30}{'header s':>10}{'decode s':>10}{'header ms':>11}{'decode ms':>11}")
+    header_total = decode_total = 0.0
+    for name, file in corpus.items():
+        header_duration, header_ms = time_duration(get_mp3_duration_seconds, file)
+        decoded_duration, decode_ms = time_duration(decode_song_duration_seconds, file)
+        header_total += header_ms
+        decode_total += decode_ms
+        print(
+            f"{name[:29]:<30}{header_duration or 0:>10.2f}{decoded_duration or 0:>10.2f}"
+            f"{header_ms:>11.3f}{decode_ms:>11.1f}"
+        )
+    print(f"{'total':<50}{header_total:>11.3f}{decode_total:>11.1f}")
+
+    try:
+        max_lag = asyncio.run(measure_loop_lag(corpus))
+    finally:
+        AudioDecoder.shutdown()
+    print(f"Max event loop lag reading the durations off the loop: {max_lag:.1f} ms")
+    print(f"Audio decoder stats: {AudioDecoder.get_stats()}")
+
+
+def print_help() -> None:
+    """Prints script usage"""
+    print(
+        "----------------------------\n"
+        "Commands\n\n"
+        "help: print script usage\n"
+        "benchmark [directory]: compare header parsing and decoding over the MP3 files "
+        f"of {BENCHMARK_DEFAULT_DIRECTORY} by default\n"
+        "----------------------------\n"
+    )
+
+
+def main() -> None:
+    """Handles the script's command-line interface."""
+    if len(sys.argv) <= 1:
+        print("Invalid options. Use help command")
+        return
+
+    command = sys.argv[1]
+
+    if command == HELP_COMMAND:
+        print_help()
+        return
+
+    if command == BENCHMARK_COMMAND:
+        directory = BENCHMARK_DEFAULT_DIRECTORY
+        if len(sys.argv) > 2:  # noqa: PLR2004
+            directory = sys.argv[2]
+        benchmark_audio_duration(directory)
+        return
+
+    print("Invalid command. Use --help")
+
+
+if __name__ == "__main__":
+    main()
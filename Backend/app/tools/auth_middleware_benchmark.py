@@ -0,0 +1,185 @@
+"""JWT auth middleware benchmark
+
+Compares the requests per second of a streaming and a JSON endpoint without auth\
+    middleware, with the previous `BaseHTTPMiddleware` implementation of\
+    CheckJwtAuthMiddleware and with the current raw ASGI implementation
+
+Commands:
+    help: print script usage
+    benchmark [amount]: send `amount` authenticated requests to every endpoint and\
+        middleware, 2000 by default
+
+Steps:
+    1. Go to Backend/
+    2. Run `python -m app.tools.auth_middleware_benchmark [(help) | (benchmark [amount])]`
+"""
+
+import asyncio
+import sys
+import time
+from collections.abc import AsyncGenerator, Callable
+from datetime import timedelta
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.status import HTTP_403_FORBIDDEN
+from starlette.types import ASGIApp
+
+import app.auth.auth_service as auth_service
+from app.middleware.CheckJwtAuthMiddleware import CheckJwtAuthMiddleware
+from app.spotify_electron.user.user.user_schema import UserType
+
+HELP_COMMAND = "help"
+BENCHMARK_COMMAND = "benchmark"
+
+BENCHMARK_DEFAULT_AMOUNT = 2000
+BENCHMARK_CONCURRENCY = 50
+BENCHMARK_STREAM_CHUNKS = 16
+BENCHMARK_STREAM_CHUNK_SIZE = 64 * 1024
+BENCHMARK_STREAM_CHUNK = b"\0" * BENCHMARK_STREAM_CHUNK_SIZE
+BENCHMARK_URLS = ["/stream/song", "/songs/song"]
+
+
+class BaseHTTPCheckJwtAuthMiddleware(BaseHTTPMiddleware):
+    """Previous CheckJwtAuthMiddleware, verifies every token without caching"""
+
+    async def dispatch(self, request: Request, call_next: Callable[[Any], Any]) -> Any:
+        """Blocks the request if its JWT Token is not valid
+
+        Args:
+            request (Request): the incoming request
+            call_next (Callable[[Any], Any]): the method to call next
+
+        Returns:
+            Any: the call next output if request was not blocked
+        """
+        try:
+            auth_service.verify_jwt(request.headers["authorization"].split(" ")[1])
+        except Exception:
+            return Response(status_code=HTTP_403_FORBIDDEN)
+        return await call_next(request)
+
+
+def create_benchmark_app(middleware: type | None) -> ASGIApp:
+    """Create an app with a streaming and a JSON endpoint
+
+    Args:
+        middleware (type | None): the auth middleware or None for no middleware
+
+    Returns:
+        ASGIApp: the app
+    """
+    benchmark_app = FastAPI()
+
+    async def get_stream_chunks() -> AsyncGenerator[bytes, None]:
+        for _ in range(BENCHMARK_STREAM_CHUNKS):
+            yield BENCHMARK_STREAM_CHUNK
+
+    @benchmark_app.get("/stream/{name}")
+    async def stream_song(name: str) -> StreamingResponse:
+        return StreamingResponse(get_stream_chunks(), media_type="audio/mpeg")
+
+    @benchmark_app.get("/songs/{name}")
+    async def get_song(name: str) -> Response:
+        return Response(f'{{"name": "{name}"}}', media_type="application/json")
+
+    if middleware is not None:
+        benchmark_app.add_middleware(middleware)
+    return benchmark_app
+
+
+async def time_requests(benchmark_app: ASGIApp, url: str, amount: int, jwt: str) -> float:
+    """Send concurrent requests to an app
+
+    Args:
+        benchmark_app (ASGIApp): the app
+        url (str): the requested url
+        amount (int): the number of requests
+        jwt (str): the JWT Token sent with every request
+
+    Returns:
+        float: the requests per second
+    """
+    transport = httpx.ASGITransport(app=benchmark_app)  # type: ignore
+    headers = {"authorization": f"Bearer {jwt}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+
+        async def send_requests(requests_amount: int) -> None:
+            for _ in range(requests_amount):
+                response = await client.get(url, headers=headers)
+                assert response.status_code == 200  # noqa: PLR2004
+
+        await send_requests(BENCHMARK_CONCURRENCY)
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                send_requests(amount // BENCHMARK_CONCURRENCY)
+                for _ in range(BENCHMARK_CONCURRENCY)
+            )
+        )
+        return amount / (time.perf_counter() - start)
+
+
+async def benchmark_auth_middleware(amount: int) -> None:
+    """Compare the requests per second of the auth middlewares
+
+    Args:
+        amount (int): the number of requests sent to every endpoint and middleware
+    """
+    jwt = auth_service.create_access_token(
+        {"access_token": "benchmark", "role": UserType.USER.value, "token_type": "bearer"},
+        timedelta(minutes=10),
+    )
+    middlewares: dict[str, type | None] = {
+        "none": None,
+        "base-http": BaseHTTPCheckJwtAuthMiddleware,
+        "asgi": CheckJwtAuthMiddleware,
+    }
+    print(f"{'url':<14}{'middleware':<12}{'requests/s':>12}")
+    for url in BENCHMARK_URLS:
+        for name, middleware in middlewares.items():
+            requests_per_second = await time_requests(
+                create_benchmark_app(middleware), url, amount, jwt
+            )
+            print(f"{url:<14}{name:<12}{requests_per_second:>12.0f}")
+
+
+def print_help() -> None:
+    """Prints script usage"""
+    print(
+        "----------------------------\n"
+        "Commands\n\n"
+        "help: print script usage\n"
+        "benchmark [amount]: compare the requests per second of the auth middlewares "
+        f"over {BENCHMARK_DEFAULT_AMOUNT} requests by default\n"
+        "----------------------------\n"
+    )
+
+
+def main() -> None:
+    """Handles the script's command-line interface."""
+    if len(sys.argv) <= 1:
+        print("Invalid options. Use help command")
+        return
+
+    command = sys.argv[1]
+
+    if command == HELP_COMMAND:
+        print_help()
+        return
+
+    if command == BENCHMARK_COMMAND:
+        amount = BENCHMARK_DEFAULT_AMOUNT
+        if len(sys.argv) > 2:  # noqa: PLR2004
+            amount = int(sys.argv[2])
+        asyncio.run(benchmark_auth_middleware(amount))
+        return
+
+    print("Invalid command. Use --help")
+
+
+if __name__ == "__main__":
+    main()
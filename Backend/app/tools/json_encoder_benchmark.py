@@ -0,0 +1,189 @@
+"""JSON encoder benchmark
+
+Compares the throughput of the encoders generated by the JsonEncoderRegistry with the\
+    previous `jsonable_encoder` + `json.dumps` path when encoding DTO lists
+
+Commands:
+    help: print script usage
+    benchmark [amount]: encode lists of `amount` DTOs of every type, 1000 by default
+
+Steps:
+    1. Go to Backend/
+    2. Run `python -m app.tools.json_encoder_benchmark [(help) | (benchmark [amount])]`
+"""
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+
+import app.spotify_electron.utils.json_converter.json_converter_utils as json_converter_utils
+from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.playlist.playlist_schema import PlaylistDTO
+from app.spotify_electron.search.search_schema import SearchResult
+from app.spotify_electron.song.base_song_schema import SongMetadataDTO
+from app.spotify_electron.user.artist.artist_schema import ArtistDTO
+from app.spotify_electron.user.user.user_schema import UserDTO
+
+HELP_COMMAND = "help"
+BENCHMARK_COMMAND = "benchmark"
+
+BENCHMARK_DEFAULT_AMOUNT = 1000
+BENCHMARK_REPETITIONS = 5
+BENCHMARK_NAMES_AMOUNT = 10
+BENCHMARK_DATE = "2024-11-10T12:00:00"
+
+
+def get_benchmark_models(amount: int) -> dict[str, Any]:
+    """Get the objects encoded by the benchmark
+
+    Args:
+        amount (int): the number of DTOs of every type
+
+    Returns:
+        dict[str, Any]: the objects by name
+    """
+    names = [f"name-{index}" for index in range(BENCHMARK_NAMES_AMOUNT)]
+    songs = [
+        SongMetadataDTO(
+            name=f"song-{index}",
+            photo="https://photo",
+            artist=f"artist-{index}",
+            seconds_duration=index,
+            genre=Genre.POP,
+            streams=index,
+        )
+        for index in range(amount)
+    ]
+    playlists = [
+        PlaylistDTO(
+            name=f"playlist-{index}",
+            photo="https://photo",
+            description="description",
+            upload_date=BENCHMARK_DATE,
+            owner=f"user-{index}",
+            song_names=names,
+        )
+        for index in range(amount)
+    ]
+    users = [
+        UserDTO(
+            name=f"user-{index}",
+            photo="https://photo",
+            register_date=BENCHMARK_DATE,
+            playback_history=names,
+            playlists=names,
+            saved_playlists=names,
+        )
+        for index in range(amount)
+    ]
+    artists = [
+        ArtistDTO(
+            name=f"artist-{index}",
+            photo="https://photo",
+            register_date=BENCHMARK_DATE,
+            playback_history=names,
+            playlists=names,
+            saved_playlists=names,
+            uploaded_songs=names,
+            total_streams=index,
+        )
+        for index in range(amount)
+    ]
+    return {
+        "songs": {"songs": songs},
+        "playlists": {"playlists": playlists},
+        "users": users,
+        "artists": {"artists": artists},
+        "search": SearchResult(artists=artists, playlists=playlists, users=users, songs=songs),
+    }
+
+
+def time_encoder(encode: Callable[[Any], bytes], object: Any) -> float:
+    """Time an encoder, keeping the best of several repetitions
+
+    Args:
+        encode (Callable[[Any], bytes]): the encoder
+        object (Any): the encoded object
+
+    Returns:
+        float: the best time in milliseconds
+    """
+    best_time_ms = float("inf")
+    for _ in range(BENCHMARK_REPETITIONS):
+        start = time.perf_counter()
+        encode(object)
+        best_time_ms = min(best_time_ms, (time.perf_counter() - start) * 1000)
+    return best_time_ms
+
+
+def encode_with_jsonable_encoder(object: Any) -> bytes:
+    """Encode an object with the previous `jsonable_encoder` + `json.dumps` path
+
+    Args:
+        object (Any): the object
+
+    Returns:
+        bytes: the json bytes
+    """
+    return json.dumps(jsonable_encoder(object)).encode()
+
+
+def benchmark_json_encoder(amount: int) -> None:
+    """Compare the generated encoders with the `jsonable_encoder` path
+
+    Args:
+        amount (int): the number of DTOs of every type
+    """
+    print(f"{'model':<12}{'jsonable ms':>14}{'generated ms':>14}{'speedup':>10}")
+    for name, object in get_benchmark_models(amount).items():
+        assert json.loads(encode_with_jsonable_encoder(object)) == json.loads(
+            json_converter_utils.get_json_from_model(object)
+        )
+        jsonable_time_ms = time_encoder(encode_with_jsonable_encoder, object)
+        generated_time_ms = time_encoder(json_converter_utils.get_json_from_model, object)
+        print(
+            f"{name:<12}{jsonable_time_ms:>14.2f}{generated_time_ms:>14.2f}"
+            f"{jsonable_time_ms / generated_time_ms:>9.1f}x"
+        )
+
+
+def print_help() -> None:
+    """Prints script usage"""
+    print(
+        "----------------------------\n"
+        "Commands\n\n"
+        "help: print script usage\n"
+        "benchmark [amount]: compare the generated JSON encoders with jsonable_encoder "
+        f"over {BENCHMARK_DEFAULT_AMOUNT} DTOs of every type by default\n"
+        "----------------------------\n"
+    )
+
+
+def main() -> None:
+    """Handles the script's command-line interface."""
+    if len(sys.argv) <= 1:
+        print("Invalid options. Use help command")
+        return
+
+    command = sys.argv[1]
+
+    if command == HELP_COMMAND:
+        print_help()
+        return
+
+    if command == BENCHMARK_COMMAND:
+        amount = BENCHMARK_DEFAULT_AMOUNT
+        if len(sys.argv) > 2:  # noqa: PLR2004
+            amount = int(sys.argv[2])
+        benchmark_json_encoder(amount)
+        return
+
+    print("Invalid command. Use --help")
+
+
+if __name__ == "__main__":
+    main()
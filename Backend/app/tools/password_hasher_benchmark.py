@@ -0,0 +1,139 @@
+"""Password hasher benchmark
+
+Measures the password verifications per second, the CPU bound part of a login, of\
+    bcrypt running inline and in the thread and process executors of the PasswordHasher
+
+Commands:
+    help: print script usage
+    benchmark [amount]: verify `amount` passwords with every executor, 200 by default
+
+Steps:
+    1. Go to Backend/
+    2. Run `python -m app.tools.password_hasher_benchmark [(help) | (benchmark [amount])]`
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import bcrypt
+
+from app.auth.password_hasher import (
+    PROCESS_EXECUTOR,
+    THREAD_EXECUTOR,
+    PasswordHasher,
+    _PasswordHasher,
+)
+
+HELP_COMMAND = "help"
+BENCHMARK_COMMAND = "benchmark"
+
+BENCHMARK_DEFAULT_AMOUNT = 200
+BENCHMARK_PASSWORD = "benchmark-password"
+
+
+async def time_verifications(password_hasher: _PasswordHasher, amount: int) -> float:
+    """Verify passwords concurrently in a password hasher
+
+    Args:
+        password_hasher (_PasswordHasher): the password hasher
+        amount (int): the number of verifications
+
+    Returns:
+        float: the verifications per second
+    """
+    hashed_password = password_hasher.hash_password(BENCHMARK_PASSWORD)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            password_hasher.verify_password_async(BENCHMARK_PASSWORD, hashed_password)
+            for _ in range(amount)
+        )
+    )
+    elapsed_seconds = time.perf_counter() - start
+    assert all(results)
+    return amount / elapsed_seconds
+
+
+def time_inline_verifications(amount: int) -> float:
+    """Verify passwords one after another in the calling thread
+
+    Args:
+        amount (int): the number of verifications
+
+    Returns:
+        float: the verifications per second
+    """
+    hashed_password = bcrypt.hashpw(
+        BENCHMARK_PASSWORD.encode(), bcrypt.gensalt(PasswordHasher.rounds)
+    )
+    start = time.perf_counter()
+    for _ in range(amount):
+        assert bcrypt.checkpw(BENCHMARK_PASSWORD.encode(), hashed_password)
+    return amount / (time.perf_counter() - start)
+
+
+async def benchmark_password_hasher(amount: int) -> None:
+    """Compare the verifications per second of every executor
+
+    Args:
+        amount (int): the number of verifications with every executor
+    """
+    cores = os.cpu_count() or 1
+    print(f"bcrypt rounds: {PasswordHasher.rounds}, CPU cores: {cores}")
+    print(f"{'executor':<10}{'workers':>9}{'logins/s':>12}{'per core':>12}")
+
+    logins_per_second = time_inline_verifications(amount)
+    print(f"{'inline':<10}{1:>9}{logins_per_second:>12.1f}{logins_per_second:>12.1f}")
+
+    for executor in (THREAD_EXECUTOR, PROCESS_EXECUTOR):
+        password_hasher = _PasswordHasher(
+            rounds=PasswordHasher.rounds, executor=executor, workers=cores, max_queue_depth=0
+        )
+        try:
+            logins_per_second = await time_verifications(password_hasher, amount)
+        finally:
+            password_hasher.shutdown()
+        print(
+            f"{executor:<10}{cores:>9}{logins_per_second:>12.1f}"
+            f"{logins_per_second / cores:>12.1f}"
+        )
+
+
+def print_help() -> None:
+    """Prints script usage"""
+    print(
+        "----------------------------\n"
+        "Commands\n\n"
+        "help: print script usage\n"
+        "benchmark [amount]: compare the password verifications per second of every "
+        f"executor over {BENCHMARK_DEFAULT_AMOUNT} passwords by default\n"
+        "----------------------------\n"
+    )
+
+
+def main() -> None:
+    """Handles the script's command-line interface."""
+    if len(sys.argv) <= 1:
+        print("Invalid options. Use help command")
+        return
+
+    command = sys.argv[1]
+
+    if command == HELP_COMMAND:
+        print_help()
+        return
+
+    if command == BENCHMARK_COMMAND:
+        amount = BENCHMARK_DEFAULT_AMOUNT
+        if len(sys.argv) > 2:  # noqa: PLR2004
+            amount = int(sys.argv[2])
+        asyncio.run(benchmark_password_hasher(amount))
+        return
+
+    print("Invalid command. Use --help")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Repair artists total streams
+
+Artists keep a precomputed total of their songs streams. The counter is updated\
+    alongside every song stream, a failure between both updates leaves it out of sync.
+This script recomputes every artist counter from their songs streams
+
+Commands:
+    help: print script usage
+    repair: recompute artists total streams
+
+Steps:
+    1. Go to Backend/
+    2. Run `python -m app.tools.repair_artist_streams [(help) | (repair)]`
+"""
+
+import asyncio
+import sys
+
+import app.spotify_electron.user.artist.artist_service as artist_service
+from app.__main__ import app, lifespan_handler
+
+HELP_COMMAND = "help"
+REPAIR_COMMAND = "repair"
+
+
+async def repair_artist_streams() -> None:
+    """Recompute artists total streams from their songs"""
+    async with lifespan_handler(app):
+        repaired_artists = artist_service.repair_artists_total_streams()
+        print(f"Total streams of {repaired_artists} artists repaired")
+
+
+def print_help() -> None:
+    """Prints script usage"""
+    print(
+        "----------------------------\n"
+        "Commands\n\n"
+        "help: print script usage\n"
+        "repair: recompute artists total streams from their songs\n"
+        "----------------------------\n"
+    )
+
+
+def main() -> None:
+    """Handles the script's command-line interface."""
+    if len(sys.argv) <= 1:
+        print("Invalid options. Use help command")
+        return
+
+    command = sys.argv[1]
+
+    if command == HELP_COMMAND:
+        print_help()
+        return
+
+    if command == REPAIR_COMMAND:
+        asyncio.run(repair_artist_streams())
+        return
+
+    print("Invalid command. Use --help")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Search index maintenance
+
+Songs, playlists, users and artists store a normalized name and its n-grams to serve\
+    the search by name from an index. Documents created before the search index\
+    existed don't have those fields and won't be found until they are backfilled
+
+Commands:
+    help: print script usage
+    backfill: store the search fields on existing documents
+    benchmark [amount]: compare the search index with a regex scan over a temporary\
+        collection of `amount` documents, 100000 by default
+    benchmark-engine [amount]: report the in-memory search engine build time, memory\
+        footprint and query latency for `amount` names, 100000 by default
+
+Steps:
+    1. Go to Backend/
+    2. Run `python -m app.tools.search_index [(help) | (backfill) | (benchmark [amount])\
+        | (benchmark-engine [amount])]`
+"""
+
+import asyncio
+import random
+import string
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import app.spotify_electron.search.search_service as search_service
+from app.__main__ import app, lifespan_handler
+from app.database.database_indexes import SEARCH_INDEXES, create_index
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.spotify_electron.search.search_engine import SearchEngine, _SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
+from app.spotify_electron.utils.search.search_utils import (
+    DEFAULT_SEARCH_LIMIT,
+    get_search_fields,
+    get_search_query,
+)
+
+HELP_COMMAND = "help"
+BACKFILL_COMMAND = "backfill"
+BENCHMARK_COMMAND = "benchmark"
+BENCHMARK_ENGINE_COMMAND = "benchmark-engine"
+
+BENCHMARK_COLLECTION_NAME = "search_benchmark"
+BENCHMARK_DEFAULT_AMOUNT = 100_000
+BENCHMARK_INSERT_BATCH_SIZE = 10_000
+BENCHMARK_REPETITIONS = 5
+BENCHMARK_MAX_STREAMS = 1_000_000
+BENCHMARK_QUERIES = ["a", "so", "lov", "night", "Canción", "midnigth", "zzzzq"]
+BENCHMARK_WORDS = [
+    "love", "night", "song", "canción", "dream", "fire", "heart", "summer",
+    "rain", "city", "blue", "river", "light", "road", "wild", "golden",
+]  # fmt: skip
+
+
+async def backfill_search_index() -> None:
+    """Store the search fields on existing documents"""
+    async with lifespan_handler(app):
+        updated_documents = search_service.backfill_search_index()
+        print(f"Search fields stored on {updated_documents} documents")
+
+
+def get_benchmark_name(index: int) -> str:
+    """Get a random item name for the benchmark
+
+    Args:
+        index (int): item index, keeps the names unique
+
+    Returns:
+        str: the item name
+    """
+    words = random.sample(BENCHMARK_WORDS, k=2)
+    suffix = "".join(random.choices(string.ascii_letters, k=4))
+    return f"{words[0].title()} {words[1]} {suffix}{index}"
+
+
+def time_query(run_query: Callable[[], list[Any]]) -> tuple[float, int]:
+    """Time a query, keeping the best of several repetitions
+
+    Args:
+        run_query (Callable[[], list[Any]]): runs the query and returns its results
+
+    Returns:
+        tuple[float, int]: the best time in milliseconds and the number of results
+    """
+    best_time_ms = float("inf")
+    results_amount = 0
+    for _ in range(BENCHMARK_REPETITIONS):
+        start = time.perf_counter()
+        results_amount = len(run_query())
+        best_time_ms = min(best_time_ms, (time.perf_counter() - start) * 1000)
+    return best_time_ms, results_amount
+
+
+async def benchmark_search_index(amount: int) -> None:
+    """Compare the search index with the case insensitive regex scan
+
+    Args:
+        amount (int): the number of documents in the benchmark collection
+    """
+    async with lifespan_handler(app):
+        collection = DatabaseConnectionManager.connection.connection[BENCHMARK_COLLECTION_NAME]
+        collection.drop()
+        try:
+            print(f"Inserting {amount} documents into {BENCHMARK_COLLECTION_NAME}")
+            for batch_start in range(0, amount, BENCHMARK_INSERT_BATCH_SIZE):
+                batch_end = min(batch_start + BENCHMARK_INSERT_BATCH_SIZE, amount)
+                documents = []
+                for index in range(batch_start, batch_end):
+                    name = get_benchmark_name(index)
+                    documents.append({"name": name, **get_search_fields(name)})
+                collection.insert_many(documents, ordered=False)
+            for index in SEARCH_INDEXES:
+                create_index(collection, index, replace=False)
+
+            print(f"{'query':<10}{'regex ms':>12}{'index ms':>12}{'results':>10}")
+            for query in BENCHMARK_QUERIES:
+                regex_time_ms, _ = time_query(
+                    lambda query=query: list(
+                        collection.find(
+                            {"name": {"$regex": query, "$options": "i"}}, {"_id": 0, "name": 1}
+                        ).limit(DEFAULT_SEARCH_LIMIT)
+                    )
+                )
+                index_time_ms, results_amount = time_query(
+                    lambda query=query: list(
+                        collection.find(get_search_query(query), {"_id": 0, "name": 1}).limit(
+                            DEFAULT_SEARCH_LIMIT
+                        )
+                    )
+                )
+                print(
+                    f"{query:<10}{regex_time_ms:>12.2f}{index_time_ms:>12.2f}"
+                    f"{results_amount:>10}"
+                )
+        finally:
+            collection.drop()
+
+
+def benchmark_search_engine(amount: int) -> None:
+    """Report the search engine build time, memory footprint and query latency
+
+    Args:
+        amount (int): the number of indexed names
+    """
+    items = [
+        (get_benchmark_name(index), random.randint(0, BENCHMARK_MAX_STREAMS))
+        for index in range(amount)
+    ]
+
+    def create_search_engine() -> _SearchEngine:
+        return _SearchEngine(
+            is_enabled=True,
+            min_similarity=SearchEngine.min_similarity,
+            streams_weight=SearchEngine.streams_weight,
+        )
+
+    search_engine = create_search_engine()
+    search_engine.build({SearchItemType.SONG: items})
+
+    tracemalloc.start()
+    create_search_engine().build({SearchItemType.SONG: items})
+    memory_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = search_engine.get_stats()
+    print(f"Indexed names: {stats.items}")
+    print(f"Indexed trigrams: {stats.trigrams}")
+    print(f"Posting list entries: {stats.postings}")
+    print(f"Build time: {stats.build_time_ms:.2f} ms")
+    print(f"Memory footprint: {memory_bytes / 2**20:.2f} MiB")
+
+    print(f"{'query':<10}{'engine ms':>12}{'results':>10}")
+    for query in BENCHMARK_QUERIES:
+        search_time_ms, results_amount = time_query(
+            lambda query=query: search_engine.search(
+                query, {SearchItemType.SONG: DEFAULT_SEARCH_LIMIT}
+            )[SearchItemType.SONG]
+        )
+        print(f"{query:<10}{search_time_ms:>12.3f}{results_amount:>10}")
+
+
+def print_help() -> None:
+    """Prints script usage"""
+    print(
+        "----------------------------\n"
+        "Commands\n\n"
+        "help: print script usage\n"
+        "backfill: store the search fields on existing documents\n"
+        "benchmark [amount]: compare the search index with a regex scan "
+        f"over {BENCHMARK_DEFAULT_AMOUNT} documents by default\n"
+        "benchmark-engine [amount]: report the in-memory search engine build time, "
+        f"memory footprint and query latency for {BENCHMARK_DEFAULT_AMOUNT} names by default\n"
+        "----------------------------\n"
+    )
+
+
+def main() -> None:
+    """Handles the script's command-line interface."""
+    if len(sys.argv) <= 1:
+        print("Invalid options. Use help command")
+        return
+
+    command = sys.argv[1]
+
+    if command == HELP_COMMAND:
+        print_help()
+        return
+
+    if command == BACKFILL_COMMAND:
+        asyncio.run(backfill_search_index())
+        return
+
+    amount = BENCHMARK_DEFAULT_AMOUNT
+    if len(sys.argv) > 2:  # noqa: PLR2004
+        amount = int(sys.argv[2])
+
+    if command == BENCHMARK_COMMAND:
+        asyncio.run(benchmark_search_index(amount))
+        return
+
+    if command == BENCHMARK_ENGINE_COMMAND:
+        benchmark_search_engine(amount)
+        return
+
+    print("Invalid command. Use --help")
+
+
+if __name__ == "__main__":
+    main()
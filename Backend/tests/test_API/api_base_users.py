@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi.testclient import TestClient
 from httpx import Response
 
@@ -46,8 +48,8 @@ def get_user_playlist_names(name: str, headers: dict[str, str]) -> Response:
     return client.get(f"/users/{name}/playlist_names", headers=headers)
 
 
-def get_user_playlists(name: str, headers: dict[str, str]) -> Response:
-    return client.get(f"/users/{name}/playlists", headers=headers)
+def get_user_playlists(name: str, headers: dict[str, str], **params: Any) -> Response:
+    return client.get(f"/users/{name}/playlists", params=params, headers=headers)
 
 
 def get_user_playback_history(user_name: str, headers: dict[str, str]) -> Response:
@@ -0,0 +1,10 @@
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from app.__main__ import app
+
+client = TestClient(app)
+
+
+def get_metrics(headers: dict[str, str]) -> Response:
+    return client.get("/metrics/", headers=headers)
@@ -8,3 +8,7 @@ client = TestClient(app)
 
 def stream_song(name: str, headers: dict[str, str]) -> Response:
     return client.get(f"/stream/{name}", headers=headers)
+
+
+def head_stream_song(name: str, headers: dict[str, str]) -> Response:
+    return client.head(f"/stream/{name}", headers=headers)
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi.testclient import TestClient
 from httpx import Response
 
@@ -39,8 +41,8 @@ def update_artist(  # noqa: PLR0913
     return client.put(url, json=payload, headers={**file_type_header, **headers})
 
 
-def get_artists(headers: dict[str, str]) -> Response:
-    return client.get("/artists/", headers=headers)
+def get_artists(headers: dict[str, str], **params: Any) -> Response:
+    return client.get("/artists/", params=params, headers=headers)
 
 
 def get_artist_streams(name: str, headers: dict[str, str]) -> Response:
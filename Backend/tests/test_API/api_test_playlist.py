@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi.testclient import TestClient
 from httpx import Response
 
@@ -50,5 +52,5 @@ def delete_playlist(name: str) -> Response:
     return client.delete(f"/playlists/{name}")
 
 
-def get_all_playlists(headers: dict[str, str]) -> Response:
-    return client.get("/playlists/", headers=headers)
+def get_all_playlists(headers: dict[str, str], **params: Any) -> Response:
+    return client.get("/playlists/", params=params, headers=headers)
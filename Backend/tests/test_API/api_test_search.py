@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi.testclient import TestClient
 from httpx import Response
 
@@ -6,5 +8,5 @@ from app.__main__ import app
 client = TestClient(app)
 
 
-def get_search_by_name(name: str, headers: dict[str, str]) -> Response:
-    return client.get(f"/search/?name={name}", headers=headers)
+def get_search_by_name(name: str, headers: dict[str, str], **params: Any) -> Response:
+    return client.get("/search/", params={"name": name, **params}, headers=headers)
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi.testclient import TestClient
 from httpx import Response
 
@@ -33,10 +35,10 @@ def increase_song_streams(name: str, headers: dict[str, str]) -> Response:
     return client.patch(patch_url, headers=headers)
 
 
-def get_songs_by_genre(genre: str, headers: dict[str, str]) -> Response:
+def get_songs_by_genre(genre: str, headers: dict[str, str], **params: Any) -> Response:
     get_url = f"/songs/genres/{genre}"
 
-    return client.get(get_url, headers=headers)
+    return client.get(get_url, params=params, headers=headers)
 
 
 def get_song_metadata(name: str, headers: dict[str, str]) -> Response:
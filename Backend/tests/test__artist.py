@@ -19,6 +19,10 @@ from test_API.api_test_artist import (
     get_artists,
 )
 
+import app.spotify_electron.user.artist.artist_service as artist_service
+import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
+from app.spotify_electron.song.song_streams_buffer import SongStreamsBuffer
+from app.spotify_electron.utils.pagination.pagination_utils import NEXT_CURSOR_HEADER
 from tests.test_API.api_test_song import create_song, delete_song, increase_song_streams
 from tests.test_API.api_test_user import create_user, delete_user
 from tests.test_API.api_token import get_user_jwt_header
@@ -124,6 +128,33 @@ def test_get_artists_correct():
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_get_artists_paginated(clear_test_data_db):
+    artist_names = ["8232392323623823723a", "8232392323623823723b", "8232392323623823723c"]
+    photo = "https://photo"
+    password = "hola"
+
+    for artist_name in artist_names:
+        res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+        assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_names[0], password=password)
+
+    res_get_artists = get_artists(headers=jwt_headers, limit=2)
+    assert res_get_artists.status_code == HTTP_200_OK
+    assert [artist["name"] for artist in res_get_artists.json()["artists"]] == artist_names[:2]
+
+    res_get_artists = get_artists(
+        headers=jwt_headers, limit=2, cursor=res_get_artists.headers[NEXT_CURSOR_HEADER]
+    )
+    assert res_get_artists.status_code == HTTP_200_OK
+    assert [artist["name"] for artist in res_get_artists.json()["artists"]] == artist_names[2:]
+    assert NEXT_CURSOR_HEADER not in res_get_artists.headers
+
+    for artist_name in artist_names:
+        res_delete_artist = delete_user(name=artist_name)
+        assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
 def test_get_total_streams_artist_correct(clear_test_data_db):
     song_name = "8232392323623823723989"
     song_name_2 = "82323923236238237239892"
@@ -163,6 +194,7 @@ def test_get_total_streams_artist_correct(clear_test_data_db):
 
     res_increase_streams_song = increase_song_streams(name=song_name_2, headers=jwt_headers)
     assert res_increase_streams_song.status_code == HTTP_204_NO_CONTENT
+    SongStreamsBuffer.flush()
 
     res_get_total_streams_artist = get_artist_streams(artista, headers=jwt_headers)
     assert res_get_total_streams_artist.status_code == HTTP_200_OK
@@ -178,6 +210,126 @@ def test_get_total_streams_artist_correct(clear_test_data_db):
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_get_artists_bulk_total_streams(clear_test_data_db):
+    song_name = "8232392323623823723989"
+    file_path = "tests/assets/song.mp3"
+    artista = "8232392323623823723"
+    artista_2 = "82323923236238237232"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "hola"
+
+    res_create_artist = create_artist(name=artista, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    res_create_artist = create_artist(name=artista_2, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artista, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=file_path,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    res_increase_streams_song = increase_song_streams(name=song_name, headers=jwt_headers)
+    assert res_increase_streams_song.status_code == HTTP_204_NO_CONTENT
+    SongStreamsBuffer.flush()
+
+    artists = artist_service.get_artists([artista_2, "missing-artist", artista])
+    assert [artist.name for artist in artists] == [artista_2, artista]
+    assert artists[0].total_streams == 0
+    assert artists[1].total_streams == 1
+
+    res_get_artists = get_artists(headers=jwt_headers)
+    assert res_get_artists.status_code == HTTP_200_OK
+    artists_total_streams = {
+        artist["name"]: artist["total_streams"] for artist in res_get_artists.json()["artists"]
+    }
+    assert artists_total_streams[artista] == 1
+    assert artists_total_streams[artista_2] == 0
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artista)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artista_2)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_artist_total_streams_counter(clear_test_data_db):
+    song_name = "8232392323623823723989"
+    song_name_2 = "82323923236238237239892"
+    file_path = "tests/assets/song.mp3"
+    artista = "8232392323623823723"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "hola"
+
+    res_create_artist = create_artist(name=artista, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artista, password=password)
+
+    for name in (song_name, song_name_2):
+        res_create_song = create_song(
+            name=name,
+            file_path=file_path,
+            genre=genre,
+            photo=photo,
+            headers=jwt_headers,
+        )
+        assert res_create_song.status_code == HTTP_201_CREATED
+
+    for name in (song_name, song_name, song_name_2):
+        res_increase_streams_song = increase_song_streams(name=name, headers=jwt_headers)
+        assert res_increase_streams_song.status_code == HTTP_204_NO_CONTENT
+    SongStreamsBuffer.flush()
+
+    expected_artist_total_streams = 3
+    res_get_artist = get_artist(name=artista, headers=jwt_headers)
+    assert res_get_artist.status_code == HTTP_200_OK
+    assert res_get_artist.json()["total_streams"] == expected_artist_total_streams
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_get_total_streams_artist = get_artist_streams(artista, headers=jwt_headers)
+    assert res_get_total_streams_artist.status_code == HTTP_200_OK
+    assert res_get_total_streams_artist.json()["streams"] == 1
+
+    user_collection_provider.get_artist_collection().update_one(
+        {"name": artista}, {"$set": {"total_streams": 100}}
+    )
+    assert artist_service.repair_artists_total_streams() == 1
+    assert artist_service.get_artist(artista).total_streams == 1
+    assert artist_service.repair_artists_total_streams() == 0
+
+    user_collection_provider.get_artist_collection().update_one(
+        {"name": artista}, {"$unset": {"total_streams": ""}}
+    )
+    artist_service.init_artists_total_streams()
+    assert artist_service.get_artist(artista).total_streams == 1
+
+    user_collection_provider.get_artist_collection().update_one(
+        {"name": artista}, {"$set": {"total_streams": 100}}
+    )
+    artist_service.init_artists_total_streams()
+    assert artist_service.get_artist(artista).total_streams == 100  # noqa: PLR2004
+
+    res_delete_song = delete_song(song_name_2)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artista)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
 def test_get_artist_songs_correct():
     song_name = "8232392323623823723989"
     song_name_2 = "82323923236238237239892"
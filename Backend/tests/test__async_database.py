@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+import mongomock
+import pytest
+from gridfs import GridFS
+from mongomock.gridfs import enable_gridfs_integration
+from pytest import fixture
+from starlette.status import HTTP_201_CREATED, HTTP_202_ACCEPTED
+
+import app.spotify_electron.playlist.playlist_service as playlist_service
+import app.spotify_electron.user.artist.artist_service as artist_service
+from app.database.async_database_schema import AsyncCollection, AsyncCursor, AsyncGridFS
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.spotify_electron.playlist.playlist_schema import PlaylistNotFoundException
+from app.spotify_electron.user.user.user_schema import UserNotFoundException
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_playlist import create_playlist, delete_playlist
+from tests.test_API.api_test_user import delete_user
+from tests.test_API.api_token import get_user_jwt_header
+
+DOCUMENTS = 25
+BATCH_SIZE = 10
+
+
+@fixture(scope="module")
+def executor():
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test-database")
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@fixture
+def collection(executor: ThreadPoolExecutor) -> AsyncCollection:
+    mongo_collection = mongomock.MongoClient().db.collection
+    mongo_collection.insert_many(
+        [{"name": str(index), "index": index} for index in range(DOCUMENTS)]
+    )
+    return AsyncCollection(mongo_collection, executor)
+
+
+def test_async_collection_operations(collection: AsyncCollection):
+    async def run_operations():
+        assert (await collection.find_one({"name": "3"}, {"_id": 0})) == {
+            "name": "3",
+            "index": 3,
+        }
+        assert await collection.find_one({"name": "missing"}) is None
+        assert await collection.count_documents({}) == DOCUMENTS
+
+        await collection.insert_one({"name": "new", "index": DOCUMENTS})
+        result = await collection.update_one({"name": "new"}, {"$set": {"index": -1}})
+        assert result.modified_count == 1
+        result = await collection.update_many({"index": {"$lt": 0}}, {"$set": {"index": -2}})
+        assert result.modified_count == 1
+        result = await collection.delete_one({"name": "new"})
+        assert result.deleted_count == 1
+
+        return await collection.count_documents({})
+
+    assert asyncio.run(run_operations()) == DOCUMENTS
+
+
+def test_async_cursor_fetches_in_batches(
+    collection: AsyncCollection, executor: ThreadPoolExecutor
+):
+    mongo_collection = collection.collection
+    cursor = AsyncCursor(
+        lambda: mongo_collection.find({}, {"_id": 0}).sort("index", 1), executor, BATCH_SIZE
+    )
+    fetch_batch = cursor._fetch_batch
+    batch_sizes = []
+
+    def count_fetch_batch():
+        batch = fetch_batch()
+        batch_sizes.append(len(batch))
+        return batch
+
+    cursor._fetch_batch = count_fetch_batch  # type: ignore
+
+    documents = asyncio.run(cursor.to_list())
+
+    assert [document["index"] for document in documents] == list(range(DOCUMENTS))
+    assert batch_sizes == [BATCH_SIZE, BATCH_SIZE, DOCUMENTS - 2 * BATCH_SIZE]
+
+
+def test_async_cursor_find_aggregate_and_length(collection: AsyncCollection):
+    async def run_queries():
+        found = await collection.find({"index": {"$gte": 20}}).to_list()
+        limited = await collection.find({}).to_list(3)
+        aggregated = [
+            document
+            async for document in collection.aggregate([{"$match": {"index": {"$lt": 2}}}])
+        ]
+        return found, limited, aggregated
+
+    found, limited, aggregated = asyncio.run(run_queries())
+
+    assert len(found) == DOCUMENTS - 20  # noqa: PLR2004
+    assert len(limited) == 3  # noqa: PLR2004
+    assert sorted(document["index"] for document in aggregated) == [0, 1]
+
+
+def test_async_gridfs_put_find_and_delete(executor: ThreadPoolExecutor):
+    enable_gridfs_integration()
+    gridfs = AsyncGridFS(GridFS(mongomock.MongoClient().db, "song"), executor)
+
+    async def run_operations():
+        file_id = await gridfs.put(b"song-data", name="song")
+        song_file = await gridfs.find_one({"name": "song"})
+        data = song_file.read()
+        await gridfs.delete(file_id)
+        return data, await gridfs.find_one({"name": "song"})
+
+    data, deleted_file = asyncio.run(run_operations())
+
+    assert data == b"song-data"
+    assert deleted_file is None
+
+
+def test_async_services_run_sync_services_in_database_executor(trigger_app_startup):
+    name = "async-database-playlist"
+    owner = "async-database-artist"
+    password = "password"
+
+    assert create_artist(owner, "https://photo", password).status_code == HTTP_201_CREATED
+    jwt_headers = get_user_jwt_header(username=owner, password=password)
+    res_create_playlist = create_playlist(
+        name=name, descripcion="description", photo="https://photo", headers=jwt_headers
+    )
+    assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    assert asyncio.run(playlist_service.get_playlist_async(name)) == (
+        playlist_service.get_playlist(name)
+    )
+    assert asyncio.run(artist_service.get_artist_async(owner)) == artist_service.get_artist(
+        owner
+    )
+    assert asyncio.run(
+        DatabaseConnectionManager.run_async(threading.current_thread)
+    ).name.startswith("database")
+
+    assert delete_playlist(name).status_code == HTTP_202_ACCEPTED
+    with pytest.raises(PlaylistNotFoundException):
+        asyncio.run(playlist_service.get_playlist_async(name))
+
+    assert delete_user(owner).status_code == HTTP_202_ACCEPTED
+    with pytest.raises(UserNotFoundException):
+        asyncio.run(artist_service.get_artist_async(owner))
+
+
+def test_run_async_keeps_caller_context_variables(trigger_app_startup):
+    context_variable: ContextVar[str] = ContextVar("context_variable", default="")
+
+    async def run_with_context_variable():
+        context_variable.set("request")
+        return await DatabaseConnectionManager.run_async(context_variable.get)
+
+    assert asyncio.run(run_with_context_variable()) == "request"
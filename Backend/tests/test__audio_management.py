@@ -0,0 +1,131 @@
+import asyncio
+import io
+import wave
+
+import pytest
+
+from app.spotify_electron.utils.audio_management.audio_management_utils import (
+    _AudioDecoder,
+    get_song_duration_seconds,
+)
+from app.spotify_electron.utils.audio_management.mp3_header_utils import (
+    MP3DurationParser,
+    get_id3v2_size,
+    get_mp3_duration_seconds,
+)
+
+SONG_PATH = "tests/assets/song_4_seconds.mp3"
+
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+"""MPEG 1 Layer III, 128 kbps, 44100 Hz, stereo"""
+FRAME_SIZE = 417
+FRAME_SAMPLES = 1152
+SAMPLE_RATE = 44100
+FRAMES = 100
+XING_OFFSET = 36
+VBRI_OFFSET = 36
+
+
+def create_frame(payload: bytes = b"") -> bytes:
+    return (FRAME_HEADER + payload).ljust(FRAME_SIZE, b"\x00")
+
+
+def create_id3v2_tag(size: int) -> bytes:
+    syncsafe_size = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + syncsafe_size + b"\x01" * size
+
+
+def get_frames_duration(frames: int) -> float:
+    return frames * FRAME_SAMPLES / SAMPLE_RATE
+
+
+def test_mp3_duration_walks_cbr_frames():
+    file = create_frame() * FRAMES
+
+    assert get_mp3_duration_seconds(file) == pytest.approx(get_frames_duration(FRAMES))
+
+
+def test_mp3_duration_skips_id3_tags():
+    id3v1_tag = b"TAG".ljust(128, b"\x00")
+    file = create_id3v2_tag(1000) + create_frame() * FRAMES + id3v1_tag
+
+    assert get_id3v2_size(file) == 1010  # noqa: PLR2004
+    assert get_mp3_duration_seconds(file) == pytest.approx(get_frames_duration(FRAMES))
+
+
+@pytest.mark.parametrize("tag", [b"Xing", b"Info"])
+def test_mp3_duration_reads_xing_frames(tag: bytes):
+    xing_frames = 5000
+    xing_tag = tag + (1).to_bytes(4, "big") + xing_frames.to_bytes(4, "big")
+    first_frame = create_frame(b"\x00" * (XING_OFFSET - 4) + xing_tag)
+    file = first_frame + create_frame() * FRAMES
+
+    assert get_mp3_duration_seconds(file) == pytest.approx(get_frames_duration(xing_frames))
+
+
+def test_mp3_duration_reads_vbri_frames():
+    vbri_frames = 3000
+    vbri_tag = b"VBRI" + b"\x00" * 10 + vbri_frames.to_bytes(4, "big")
+    first_frame = create_frame(b"\x00" * (VBRI_OFFSET - 4) + vbri_tag)
+    file = first_frame + create_frame() * FRAMES
+
+    assert get_mp3_duration_seconds(file) == pytest.approx(get_frames_duration(vbri_frames))
+
+
+def test_mp3_duration_of_song_asset_matches_decoded_duration():
+    with open(SONG_PATH, "rb") as file:
+        song_file = file.read()
+
+    duration = get_mp3_duration_seconds(song_file)
+
+    assert duration is not None
+    assert int(duration) == 4  # noqa: PLR2004
+    assert get_song_duration_seconds("song", song_file) == 4  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 64 * 1024])
+def test_mp3_duration_parser_parses_chunks(chunk_size: int):
+    with open(SONG_PATH, "rb") as file:
+        song_file = file.read()
+    cbr_file = create_id3v2_tag(100000) + create_frame() * FRAMES
+    for file in (song_file, cbr_file):
+        duration_parser = MP3DurationParser()
+        for offset in range(0, len(file), chunk_size):
+            duration_parser.update(file[offset : offset + chunk_size])
+
+        assert duration_parser.finish() == pytest.approx(get_mp3_duration_seconds(file))
+        assert not duration_parser._buffer
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        b"",
+        b"not a song" * 1000,
+        create_frame() + b"\x00" * FRAME_SIZE * FRAMES,
+    ],
+)
+def test_mp3_duration_of_invalid_file_is_none(file: bytes):
+    assert get_mp3_duration_seconds(file) is None
+
+
+def test_audio_decoder_decodes_files_without_mp3_headers():
+    wav_file = io.BytesIO()
+    with wave.open(wav_file, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(b"\x00\x00" * 8000 * 2)
+    audio_decoder = _AudioDecoder(workers=1)
+
+    try:
+        duration = asyncio.run(audio_decoder.get_duration_seconds_async(wav_file.getvalue()))
+        invalid_duration = asyncio.run(audio_decoder.get_duration_seconds_async(b"not a song"))
+    finally:
+        audio_decoder.shutdown()
+
+    assert duration == pytest.approx(2)
+    assert invalid_duration is None
+    stats = audio_decoder.get_stats()
+    assert stats.decoded == 1
+    assert stats.failed == 1
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from pytest import fixture
 from starlette.status import (
@@ -5,15 +7,19 @@ from starlette.status import (
     HTTP_201_CREATED,
     HTTP_202_ACCEPTED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
 )
 
+import app.spotify_electron.user.base_user_repository as base_user_repository
+import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
 from app.auth.auth_schema import BadJWTTokenProvidedException
 from app.spotify_electron.user.base_user_service import (
     MAX_NUMBER_PLAYBACK_HISTORY_SONGS,
 )
 from app.spotify_electron.user.user.user_schema import UserType
+from app.spotify_electron.utils.pagination.pagination_utils import NEXT_CURSOR_HEADER
 from tests.test_API.api_base_users import (
     delete_playlist_saved,
     get_user_playback_history,
@@ -215,6 +221,64 @@ def test_patch_playback_history_user_correct_insert_6_songs(clear_test_data_db):
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_concurrent_user_list_updates_are_not_lost(clear_test_data_db):
+    name = "8232392323623823723"
+    password = "hola"
+    photo = "https://photo"
+    concurrent_clients = 20
+    updates_per_client = 10
+    concurrent_updates = concurrent_clients * updates_per_client
+
+    res_create_user = create_user(name=name, password=password, photo=photo)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    collection = user_collection_provider.get_user_collection()
+    song_names = [f"song-{i}" for i in range(concurrent_updates)]
+    playlist_names = [f"playlist-{i}" for i in range(concurrent_updates)]
+    barrier = threading.Barrier(concurrent_clients)
+
+    def update_user_lists(client: int) -> None:
+        barrier.wait()
+        for i in range(client, concurrent_updates, concurrent_clients):
+            base_user_repository.add_playback_history(
+                name, song_names[i], concurrent_updates, collection
+            )
+            base_user_repository.add_saved_playlist(name, playlist_names[i], collection)
+            base_user_repository.add_playlist_to_owner(name, playlist_names[i], collection)
+
+    threads = [
+        threading.Thread(target=update_user_lists, args=(client,))
+        for client in range(concurrent_clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    user_data = collection.find_one({"name": name})
+    assert sorted(user_data["playback_history"]) == sorted(song_names)  # type: ignore
+    assert sorted(user_data["saved_playlists"]) == sorted(playlist_names)  # type: ignore
+    assert sorted(user_data["playlists"]) == sorted(playlist_names)  # type: ignore
+
+    threads = [
+        threading.Thread(
+            target=base_user_repository.delete_saved_playlist,
+            args=(name, playlist_name, collection),
+        )
+        for playlist_name in playlist_names[::2]
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    user_data = collection.find_one({"name": name})
+    assert sorted(user_data["saved_playlists"]) == sorted(playlist_names[1::2])  # type: ignore
+
+    res_delete_user = delete_user(name=name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
 def test_patch_saved_playlist_user_correct(clear_test_data_db):
     playlist_name = "playlist"
     user_name = "8232392323623823723"
@@ -920,6 +984,56 @@ def test_get_artist_playlists_correct():
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_get_user_playlists_paginated():
+    playlist_names = ["playlist-a", "playlist-b", "playlist-c"]
+    user_name = "user-name"
+    description = "description"
+    password = "pass"
+    photo = "https://photo"
+
+    res_create_user = create_user(name=user_name, password=password, photo=photo)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    jwt_headers_user = get_user_jwt_header(username=user_name, password=password)
+
+    for playlist_name in playlist_names:
+        res_create_playlist = create_playlist(
+            playlist_name, description, photo, jwt_headers_user
+        )
+        assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    res_get_user_playlists = get_user_playlists(user_name, jwt_headers_user, limit=2)
+    assert res_get_user_playlists.status_code == HTTP_200_OK
+    found_playlist_names = [playlist["name"] for playlist in res_get_user_playlists.json()]
+    assert len(found_playlist_names) == 2  # noqa: PLR2004
+
+    res_get_user_playlists = get_user_playlists(
+        user_name,
+        jwt_headers_user,
+        limit=2,
+        cursor=res_get_user_playlists.headers[NEXT_CURSOR_HEADER],
+    )
+    assert res_get_user_playlists.status_code == HTTP_200_OK
+    found_playlist_names.extend(playlist["name"] for playlist in res_get_user_playlists.json())
+    assert NEXT_CURSOR_HEADER not in res_get_user_playlists.headers
+    assert sorted(found_playlist_names) == playlist_names
+
+    res_get_user_playlists = get_user_playlists(user_name, jwt_headers_user)
+    assert res_get_user_playlists.status_code == HTTP_200_OK
+    assert [playlist["name"] for playlist in res_get_user_playlists.json()] == playlist_names
+    assert NEXT_CURSOR_HEADER not in res_get_user_playlists.headers
+
+    res_get_user_playlists = get_user_playlists(user_name, jwt_headers_user, cursor="invalid")
+    assert res_get_user_playlists.status_code == HTTP_400_BAD_REQUEST
+
+    for playlist_name in playlist_names:
+        res_delete_playlist = delete_playlist(playlist_name)
+        assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_user = delete_user(user_name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
 def test_get_user_playlists_user_not_found():
     user_name = "user-name"
     artist_name = "artist-name"
@@ -0,0 +1,91 @@
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pytest import fixture
+from starlette.status import HTTP_200_OK, HTTP_403_FORBIDDEN
+
+import app.auth.auth_service as auth_service
+from app.middleware.CheckJwtAuthMiddleware import CheckJwtAuthMiddleware
+from app.spotify_electron.user.user.user_schema import UserType
+
+STREAM_CHUNK = b"chunk"
+STREAM_CHUNKS = 3
+
+
+@fixture(scope="module")
+def client() -> TestClient:
+    middleware_app = FastAPI()
+
+    async def get_stream_chunks() -> AsyncGenerator[bytes, None]:
+        for _ in range(STREAM_CHUNKS):
+            yield STREAM_CHUNK
+
+    @middleware_app.get("/stream/{name}")
+    async def stream_song(name: str) -> StreamingResponse:
+        return StreamingResponse(get_stream_chunks())
+
+    @middleware_app.get("/health/")
+    async def get_health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    @middleware_app.post("/login/token/{token}")
+    async def login_user_with_token(token: str) -> dict[str, str]:
+        return {"token": token}
+
+    middleware_app.add_middleware(CheckJwtAuthMiddleware)
+    return TestClient(middleware_app)
+
+
+@fixture(scope="module")
+def jwt() -> str:
+    return auth_service.create_access_token(
+        {"access_token": "user", "role": UserType.USER.value, "token_type": "bearer"},
+        timedelta(minutes=5),
+    )
+
+
+def test_check_jwt_auth_middleware_authorization_header(client: TestClient, jwt: str):
+    response = client.get("/stream/song", headers={"authorization": f"Bearer {jwt}"})
+
+    assert response.status_code == HTTP_200_OK
+    assert response.content == STREAM_CHUNK * STREAM_CHUNKS
+
+
+def test_check_jwt_auth_middleware_cookie(client: TestClient, jwt: str):
+    cookie = f'theme=dark; jwt="Bearer {jwt}"'
+    response = client.get("/stream/song", headers={"cookie": cookie})
+
+    assert response.status_code == HTTP_200_OK
+
+
+def test_check_jwt_auth_middleware_invalid_jwt(client: TestClient, jwt: str):
+    assert client.get("/stream/song").status_code == HTTP_403_FORBIDDEN
+    assert (
+        client.get("/stream/song", headers={"authorization": jwt}).status_code
+        == HTTP_403_FORBIDDEN
+    )
+    assert (
+        client.get(
+            "/stream/song", headers={"authorization": f"Bearer {jwt}invalid"}
+        ).status_code
+        == HTTP_403_FORBIDDEN
+    )
+
+
+def test_check_jwt_auth_middleware_bypassed_urls(client: TestClient):
+    assert client.get("/health/").status_code == HTTP_200_OK
+    assert client.post("/login/token/value").status_code == HTTP_200_OK
+
+
+def test_check_jwt_auth_middleware_bypass_request():
+    middleware = CheckJwtAuthMiddleware(FastAPI())
+
+    assert middleware.bypass_request("GET", "/docs")
+    assert middleware.bypass_request("POST", "/login/token/value")
+    assert middleware.bypass_request("DELETE", "/songs/song")
+    assert not middleware.bypass_request("GET", "/login/token/value")
+    assert not middleware.bypass_request("GET", "/songs/song")
+    assert not middleware.bypass_request("GET", "/metrics/")
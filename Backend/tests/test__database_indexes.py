@@ -0,0 +1,317 @@
+import asyncio
+from typing import Any
+
+import pytest
+from pymongo.errors import OperationFailure
+from pytest import MonkeyPatch, fixture
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_204_NO_CONTENT,
+)
+
+import app.spotify_electron.playlist.playlist_repository as playlist_repository
+import app.spotify_electron.song.base_song_repository as base_song_repository
+import app.spotify_electron.song.blob.song_repository as song_repository
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+from app.database import database_indexes
+from app.database.database_indexes import (
+    DATABASE_INDEXES,
+    NAME_INDEX,
+    get_indexes_drift,
+    get_query_index,
+)
+from app.database.database_schema import DatabaseCollection
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.database.DatabaseTestingConnection import DatabaseTestingConnection
+from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.playlist.playlist_schema import PlaylistAlreadyExistsException
+from app.spotify_electron.song.base_song_schema import SongAlreadyExistsException
+from tests.test_API.api_base_users import patch_history_playback, patch_playlist_saved
+from tests.test_API.api_stream import stream_song
+from tests.test_API.api_test_artist import (
+    create_artist,
+    get_artist,
+    get_artist_songs,
+    get_artist_streams,
+    get_artists,
+)
+from tests.test_API.api_test_playlist import (
+    create_playlist,
+    delete_playlist,
+    get_all_playlists,
+    get_playlist,
+)
+from tests.test_API.api_test_search import get_search_by_name
+from tests.test_API.api_test_song import (
+    create_song,
+    delete_song,
+    get_song,
+    get_song_metadata,
+    get_songs_by_genre,
+    increase_song_streams,
+)
+from tests.test_API.api_test_user import create_user, delete_user, get_user
+from tests.test_API.api_token import get_user_jwt_header
+
+SONG_PATH = "tests/assets/song_4_seconds.mp3"
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+class RecordingCollection:
+    """Collection that records the filters of the queries sent to it"""
+
+    def __init__(
+        self,
+        collection: Any,
+        collection_name: DatabaseCollection,
+        queries: list[tuple[DatabaseCollection, dict[str, Any]]],
+    ) -> None:
+        self._collection = collection
+        self._collection_name = collection_name
+        self._queries = queries
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._collection, name)
+        if name not in RECORDED_METHODS:
+            return attribute
+
+        def record_query(argument: Any = None, *args: Any, **kwargs: Any) -> Any:
+            for query in get_queries(name, argument):
+                self._queries.append((self._collection_name, dict(query or {})))
+            return attribute(argument, *args, **kwargs)
+
+        return record_query
+
+
+RECORDED_METHODS = {
+    "find",
+    "find_one",
+    "count_documents",
+    "update_one",
+    "update_many",
+    "delete_one",
+    "aggregate",
+    "bulk_write",
+}
+
+
+def get_queries(method: str, argument: Any) -> list[Any]:
+    if method == "aggregate":
+        return [stage["$match"] for stage in argument[:1] if "$match" in stage]
+    if method == "bulk_write":
+        return [getattr(request, "_filter", None) for request in argument]
+    return [argument]
+
+
+def test_create_indexes_applies_registry():
+    database_indexes.create_indexes()
+
+    indexes_drift = get_indexes_drift()
+
+    assert {drift.collection for drift in indexes_drift} == set(DATABASE_INDEXES)
+    assert [drift for drift in indexes_drift if drift.has_drift] == []
+
+
+def test_create_indexes_is_idempotent():
+    collection = DatabaseConnectionManager.get_collection_connection(DatabaseCollection.USER)
+    database_indexes.create_indexes()
+    index_information = collection.index_information()
+
+    database_indexes.create_indexes()
+
+    assert collection.index_information() == index_information
+
+
+def test_create_indexes_rebuilds_changed_indexes_and_reports_extra_indexes():
+    collection = DatabaseConnectionManager.get_collection_connection(
+        DatabaseCollection.PLAYLIST
+    )
+    collection.drop_index(NAME_INDEX.name)
+    collection.create_index(NAME_INDEX.get_keys(), name=NAME_INDEX.name)
+    collection.create_index([("photo", 1)])
+
+    drift = next(
+        drift
+        for drift in get_indexes_drift()
+        if drift.collection == get_collection_name(collection)
+    )
+    assert drift.missing == [NAME_INDEX.name]
+    assert drift.extra == ["photo_1"]
+
+    database_indexes.create_indexes()
+    collection.drop_index("photo_1")
+
+    assert collection.index_information()[NAME_INDEX.name]["unique"]
+    assert not any(drift.has_drift for drift in get_indexes_drift())
+
+
+def test_create_indexes_keeps_index_when_unique_values_are_duplicated():
+    collection = DatabaseConnectionManager.get_collection_connection(
+        DatabaseCollection.PLAYLIST
+    )
+    collection.drop_index(NAME_INDEX.name)
+    collection.create_index(NAME_INDEX.get_keys(), name=NAME_INDEX.name)
+    collection.insert_many([{"name": "duplicated-playlist"}, {"name": "duplicated-playlist"}])
+
+    database_indexes.create_indexes()
+
+    index_information = collection.index_information()[NAME_INDEX.name]
+    assert not index_information.get("unique", False)
+    assert list(index_information["key"]) == NAME_INDEX.get_keys()
+
+    collection.delete_many({"name": "duplicated-playlist"})
+    database_indexes.create_indexes()
+    assert collection.index_information()[NAME_INDEX.name]["unique"]
+
+
+def test_create_index_restores_index_when_rebuild_fails():
+    collection = DatabaseConnectionManager.get_collection_connection(
+        DatabaseCollection.PLAYLIST
+    )
+    collection.drop_index(NAME_INDEX.name)
+    collection.create_index(NAME_INDEX.get_keys(), name=NAME_INDEX.name)
+    existing_index = collection.index_information()[NAME_INDEX.name]
+
+    class UniqueIndexFailingCollection:
+        """Collection that fails building unique indexes"""
+
+        name = collection.name
+
+        def __getattr__(self, name: str) -> Any:
+            return getattr(collection, name)
+
+        def create_index(self, keys: Any, **options: Any) -> str:
+            """Create an index unless it's unique"""
+            if options.get("unique"):
+                raise OperationFailure("E11000")
+            return collection.create_index(keys, **options)
+
+    with pytest.raises(OperationFailure):
+        database_indexes.create_index(
+            UniqueIndexFailingCollection(),  # type: ignore
+            NAME_INDEX,
+            existing_index,
+        )
+
+    assert collection.index_information()[NAME_INDEX.name] == existing_index
+    database_indexes.create_indexes()
+
+
+def test_create_playlist_duplicated_name_raises_already_exists():
+    name = "index-duplicated-playlist"
+    playlist_repository.create_playlist(name, "photo", "date", "description", "owner", [])
+
+    with pytest.raises(PlaylistAlreadyExistsException):
+        playlist_repository.create_playlist(name, "photo", "date", "description", "owner", [])
+
+    playlist_repository.delete_playlist(name)
+
+
+def test_create_song_duplicated_name_raises_already_exists_without_orphan_chunks():
+    name = "index-duplicated-song"
+    with open(SONG_PATH, "rb") as file:
+        song_file = file.read()
+    song_repository.create_song(name, "artist", 4, Genre.POP, "photo", song_file)
+    chunks_collection = song_collection_provider.get_gridfs_song_chunks_collection()
+    chunks = chunks_collection.count_documents({})
+
+    async def upload_song():
+        async with song_repository.open_song_upload_stream_async(
+            name=name, artist="artist", genre=Genre.POP, photo="photo"
+        ) as upload_stream:
+            await upload_stream.write(song_file)
+
+    with pytest.raises(SongAlreadyExistsException):
+        asyncio.run(upload_song())
+
+    assert chunks_collection.count_documents({}) == chunks
+    base_song_repository.delete_song(name)
+
+
+def test_repository_queries_are_served_by_registry(monkeypatch: MonkeyPatch):
+    queries: list[tuple[DatabaseCollection, dict[str, Any]]] = []
+    get_collection_connection = DatabaseTestingConnection.get_collection_connection
+
+    def get_recording_collection_connection(cls, collection_name: DatabaseCollection):
+        return RecordingCollection(
+            get_collection_connection(collection_name), collection_name, queries
+        )
+
+    monkeypatch.setattr(
+        DatabaseTestingConnection,
+        "get_collection_connection",
+        classmethod(get_recording_collection_connection),
+    )
+
+    artist = "index-artist"
+    user = "index-user"
+    song = "index-song"
+    playlist = "index-playlist"
+    password = "password"
+
+    assert create_artist(artist, "photo", password).status_code == HTTP_201_CREATED
+    assert create_user(user, "photo", password).status_code == HTTP_201_CREATED
+    artist_headers = get_user_jwt_header(username=artist, password=password)
+    user_headers = get_user_jwt_header(username=user, password=password)
+
+    assert create_song(song, SONG_PATH, "Pop", "photo", artist_headers).status_code == (
+        HTTP_201_CREATED
+    )
+    assert get_song(song, user_headers).status_code == HTTP_200_OK
+    assert get_song_metadata(song, user_headers).status_code == HTTP_200_OK
+    assert get_songs_by_genre("Pop", user_headers).status_code == HTTP_200_OK
+    assert get_songs_by_genre("Pop", user_headers, limit=1).status_code == HTTP_200_OK
+    assert increase_song_streams(song, user_headers).status_code == HTTP_204_NO_CONTENT
+    assert stream_song(song, user_headers).status_code == HTTP_200_OK
+    assert patch_history_playback(user, song, user_headers).status_code == HTTP_204_NO_CONTENT
+
+    assert create_playlist(playlist, "description", "photo", user_headers).status_code == (
+        HTTP_201_CREATED
+    )
+    assert get_playlist(playlist, user_headers).status_code == HTTP_200_OK
+    assert get_all_playlists(user_headers, limit=1).status_code == HTTP_200_OK
+    assert patch_playlist_saved(artist, playlist, artist_headers).status_code == (
+        HTTP_204_NO_CONTENT
+    )
+
+    assert get_user(user, user_headers).status_code == HTTP_200_OK
+    assert get_artist(artist, user_headers).status_code == HTTP_200_OK
+    assert get_artists(user_headers, limit=1).status_code == HTTP_200_OK
+    assert get_artist_songs(artist, user_headers).status_code == HTTP_200_OK
+    assert get_artist_streams(artist, user_headers).status_code == HTTP_200_OK
+    assert get_search_by_name("index", user_headers).status_code == HTTP_200_OK
+
+    assert delete_playlist(playlist).status_code == HTTP_202_ACCEPTED
+    assert delete_song(song).status_code == HTTP_202_ACCEPTED
+    assert delete_user(user).status_code == HTTP_202_ACCEPTED
+    assert delete_user(artist).status_code == HTTP_202_ACCEPTED
+
+    filtered_queries = [(name, query) for name, query in queries if query]
+    assert filtered_queries
+    unindexed_queries = [
+        (name, query)
+        for name, query in filtered_queries
+        if get_query_index(name, query) is None
+    ]
+    assert unindexed_queries == []
+
+
+def test_update_playlist_name_queries_are_served_by_registry():
+    # mongomock doesn't support positional updates of string arrays, so the filters
+    # of update_playlist_name are checked without running it
+    for collection_name in (DatabaseCollection.USER, DatabaseCollection.ARTIST):
+        assert get_query_index(collection_name, {"saved_playlists": "playlist"})
+        assert get_query_index(collection_name, {"playlists": "playlist"})
+    assert get_query_index(DatabaseCollection.PLAYLIST, {"photo": "photo"}) is None
+
+
+def get_collection_name(collection: Any) -> DatabaseCollection:
+    return DatabaseCollection(
+        collection.name.removeprefix(DatabaseTestingConnection.TESTING_COLLECTION_NAME_PREFIX)
+    )
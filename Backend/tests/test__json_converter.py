@@ -0,0 +1,128 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.exceptions.base_exceptions_schema import JsonEncodeException
+from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.playlist.playlist_schema import PlaylistDTO
+from app.spotify_electron.search.search_schema import SearchResult
+from app.spotify_electron.song.base_song_schema import SongMetadataDTO
+from app.spotify_electron.user.artist.artist_schema import ArtistDTO
+from app.spotify_electron.user.user.user_schema import UserDTO
+from app.spotify_electron.utils.json_converter.json_converter_utils import (
+    STREAM_CHUNK_SIZE,
+    get_json_array_stream_from_models,
+    get_json_from_model,
+    get_ndjson_stream_from_models,
+)
+from app.spotify_electron.utils.json_converter.json_encoder_registry import (
+    JsonEncoderRegistry,
+)
+
+
+@dataclass
+class Item:
+    """Streamed item"""
+
+    name: str
+    streams: int
+
+
+def test_json_array_stream():
+    items = [Item(f"item-{index}", index) for index in range(STREAM_CHUNK_SIZE + 1)]
+
+    json_string = "".join(get_json_array_stream_from_models(iter(items), "items"))
+
+    assert json.loads(json_string) == {
+        "items": [{"name": item.name, "streams": item.streams} for item in items]
+    }
+    assert json.loads("".join(get_json_array_stream_from_models([], "items"))) == {"items": []}
+
+
+def test_ndjson_stream():
+    items = [Item(f"item-{index}", index) for index in range(STREAM_CHUNK_SIZE + 1)]
+
+    json_lines = "".join(get_ndjson_stream_from_models(iter(items))).splitlines()
+
+    assert [json.loads(json_line) for json_line in json_lines] == [
+        {"name": item.name, "streams": item.streams} for item in items
+    ]
+
+
+def test_stream_reads_objects_lazily():
+    consumed_items = 0
+
+    def get_items():
+        nonlocal consumed_items
+        while True:
+            consumed_items += 1
+            yield Item("item", consumed_items)
+
+    stream = get_ndjson_stream_from_models(get_items())
+    next(stream)
+
+    assert consumed_items == STREAM_CHUNK_SIZE
+
+
+def test_stream_encoding_error():
+    stream = get_ndjson_stream_from_models([object()])
+
+    with pytest.raises(JsonEncodeException):
+        next(stream)
+
+
+@dataclass
+class NestedItem:
+    """Item with nested values"""
+
+    genre: Genre | None
+    items: list[Item]
+    items_by_name: dict[str, Item]
+    date: datetime
+
+
+def test_registered_dtos_match_jsonable_encoder():
+    names = ["name-1", "name-2"]
+    song = SongMetadataDTO("song", "https://photo", "artist", 10, Genre.POP, 1)
+    playlist = PlaylistDTO("playlist", "https://photo", "description", "date", "user", names)
+    user = UserDTO("user", "https://photo", "date", names, names, names)
+    artist = ArtistDTO("artist", "https://photo", "date", names, names, names, names, 2)
+    search_result = SearchResult(
+        artists=[artist],
+        playlists=[playlist],
+        users=[user],
+        songs=[song],
+        next_cursors={"songs": "cursor", "users": None},
+    )
+
+    for model in [song, playlist, user, artist, search_result, {"songs": [song]}]:
+        if not isinstance(model, dict):
+            assert JsonEncoderRegistry.is_registered(type(model))
+        assert json.loads(get_json_from_model(model)) == jsonable_encoder(model)
+
+
+def test_generated_encoder_nested_values():
+    JsonEncoderRegistry.register(NestedItem)
+    nested_item = NestedItem(
+        genre=None,
+        items=[Item("item", 1)],
+        items_by_name={"item": Item("item", 1)},
+        date=datetime(2024, 1, 1),
+    )
+
+    assert JsonEncoderRegistry.is_registered(Item)
+    assert JsonEncoderRegistry.to_jsonable(nested_item) == jsonable_encoder(nested_item)
+
+    nested_item.genre = Genre.ROCK
+    assert JsonEncoderRegistry.to_jsonable(nested_item)["genre"] == Genre.ROCK.value
+
+
+def test_unregistered_types_fall_back_to_jsonable_encoder():
+    unregistered_item = {"date": datetime(2024, 1, 1), "values": {1, 2}}
+
+    assert JsonEncoderRegistry.to_jsonable(unregistered_item) == jsonable_encoder(
+        unregistered_item
+    )
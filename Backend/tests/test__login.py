@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from pytest import fixture
 from starlette.status import (
@@ -6,8 +8,12 @@ from starlette.status import (
     HTTP_202_ACCEPTED,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
+import app.spotify_electron.user.base_user_service as base_user_service
+from app.auth.password_hasher import PasswordHasher
+from app.spotify_electron.user.user.user_schema import UserNotFoundException, UserType
 from tests.test_API.api_login import post_login, post_login_jwt
 from tests.test_API.api_test_artist import create_artist
 from tests.test_API.api_test_user import create_user, delete_user
@@ -115,6 +121,95 @@ def test_login_user_with_jwt_user_not_found(clear_test_data_db):
     assert res_login_user_jwt.status_code == HTTP_404_NOT_FOUND
 
 
+def test_login_rehashes_password_with_new_cost(clear_test_data_db):
+    user_name = "8232392323623823723"
+    password = "hola"
+    photo = "https://photo"
+
+    res_create_user = create_user(name=user_name, password=password, photo=photo)
+    assert res_create_user.status_code == HTTP_201_CREATED
+    assert not PasswordHasher.needs_rehash(base_user_service.get_user_password(user_name))
+
+    configured_rounds = PasswordHasher.rounds
+    PasswordHasher.rounds = 4
+    try:
+        res_login_user = post_login(user_name, password)
+        assert res_login_user.status_code == HTTP_200_OK
+        assert base_user_service.get_user_password(user_name).startswith(b"$2b$04$")
+
+        res_login_user = post_login(user_name, password)
+        assert res_login_user.status_code == HTTP_200_OK
+    finally:
+        PasswordHasher.rounds = configured_rounds
+
+    res_delete_user = delete_user(user_name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+def test_login_password_hasher_busy(clear_test_data_db):
+    user_name = "8232392323623823723"
+    password = "hola"
+    photo = "https://photo"
+
+    res_create_user = create_user(name=user_name, password=password, photo=photo)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    configured_max_queue_depth = PasswordHasher.max_queue_depth
+    PasswordHasher.max_queue_depth = 1
+    try:
+        running_job = PasswordHasher._submit(time.sleep, 0.5)
+        res_login_user = post_login(user_name, password)
+        assert res_login_user.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        running_job.result()
+    finally:
+        PasswordHasher.max_queue_depth = configured_max_queue_depth
+
+    res_delete_user = delete_user(user_name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+@pytest.mark.parametrize("create_function", [create_user, create_artist])
+def test_sign_up_password_hasher_busy(clear_test_data_db, create_function):
+    user_name = "8232392323623823723"
+    password = "hola"
+    photo = "https://photo"
+
+    configured_max_queue_depth = PasswordHasher.max_queue_depth
+    PasswordHasher.max_queue_depth = 1
+    try:
+        running_job = PasswordHasher._submit(time.sleep, 0.5)
+        res_create_user = create_function(user_name, photo, password)
+        assert res_create_user.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        running_job.result()
+    finally:
+        PasswordHasher.max_queue_depth = configured_max_queue_depth
+
+    with pytest.raises(UserNotFoundException):
+        base_user_service.get_user(user_name)
+
+
+def test_get_user_credentials(clear_test_data_db):
+    user_name = "8232392323623823723"
+    artista = "artista"
+    password = "hola"
+    photo = "https://photo"
+
+    assert create_user(name=user_name, password=password, photo=photo).status_code == (
+        HTTP_201_CREATED
+    )
+    assert create_artist(name=artista, password=password, photo=photo).status_code == (
+        HTTP_201_CREATED
+    )
+
+    user_credentials = base_user_service.get_user_credentials(user_name)
+    assert user_credentials.user_type == UserType.USER
+    assert user_credentials.password == base_user_service.get_user_password(user_name)
+    assert base_user_service.get_user_credentials(artista).user_type == UserType.ARTIST
+
+    with pytest.raises(UserNotFoundException):
+        base_user_service.get_user_credentials("user-not-found")
+
+
 # executes after all tests
 @pytest.fixture()
 def clear_test_data_db():
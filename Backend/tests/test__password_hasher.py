@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import pytest
+
+from app.auth.auth_schema import PasswordHasherBusyException
+from app.auth.password_hasher import PROCESS_EXECUTOR, THREAD_EXECUTOR, _PasswordHasher
+
+TEST_HASH_ROUNDS = 4
+
+
+@pytest.mark.parametrize("executor", [THREAD_EXECUTOR, PROCESS_EXECUTOR])
+def test_password_hasher_hash_and_verify(executor: str):
+    password_hasher = _PasswordHasher(
+        rounds=TEST_HASH_ROUNDS, executor=executor, workers=1, max_queue_depth=0
+    )
+    try:
+        hashed_password = password_hasher.hash_password("password")
+
+        assert password_hasher.verify_password("password", hashed_password)
+        assert not password_hasher.verify_password("other-password", hashed_password)
+        assert asyncio.run(password_hasher.verify_password_async("password", hashed_password))
+        assert password_hasher.get_stats().completed == 4  # noqa: PLR2004
+    finally:
+        password_hasher.shutdown()
+
+
+def test_password_hasher_rejects_jobs_beyond_queue_depth():
+    password_hasher = _PasswordHasher(
+        rounds=TEST_HASH_ROUNDS, executor=THREAD_EXECUTOR, workers=1, max_queue_depth=1
+    )
+    try:
+        running_job = password_hasher._submit(time.sleep, 0.2)
+
+        with pytest.raises(PasswordHasherBusyException):
+            password_hasher.hash_password("password")
+
+        running_job.result()
+        assert password_hasher.hash_password("password")
+        stats = password_hasher.get_stats()
+        assert stats.rejected == 1
+        assert stats.pending == 0
+    finally:
+        password_hasher.shutdown()
+
+
+def test_password_hasher_releases_slot_when_submit_fails():
+    password_hasher = _PasswordHasher(
+        rounds=TEST_HASH_ROUNDS, executor=THREAD_EXECUTOR, workers=1, max_queue_depth=1
+    )
+    try:
+        assert password_hasher.hash_password("password")
+        password_hasher._executor.shutdown()  # type: ignore
+
+        with pytest.raises(RuntimeError):
+            password_hasher.hash_password("password")
+
+        assert password_hasher.get_stats().pending == 0
+    finally:
+        password_hasher.shutdown()
+
+
+def test_password_hasher_needs_rehash():
+    password_hasher = _PasswordHasher(
+        rounds=TEST_HASH_ROUNDS, executor=THREAD_EXECUTOR, workers=1, max_queue_depth=0
+    )
+    try:
+        hashed_password = password_hasher.hash_password("password")
+        assert not password_hasher.needs_rehash(hashed_password)
+
+        password_hasher.rounds = TEST_HASH_ROUNDS + 1
+        assert password_hasher.needs_rehash(hashed_password)
+        assert password_hasher.needs_rehash(b"invalid")
+    finally:
+        password_hasher.shutdown()
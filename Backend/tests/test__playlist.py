@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 
 import pytest
@@ -7,15 +8,21 @@ from starlette.status import (
     HTTP_201_CREATED,
     HTTP_202_ACCEPTED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_405_METHOD_NOT_ALLOWED,
 )
 
+from app.spotify_electron.utils.pagination.pagination_utils import (
+    NEXT_CURSOR_HEADER,
+    encode_cursor,
+)
 from tests.test_API.api_base_users import patch_playlist_saved
 from tests.test_API.api_test_artist import create_artist
 from tests.test_API.api_test_playlist import (
     create_playlist,
     delete_playlist,
+    get_all_playlists,
     get_playlist,
     get_playlists,
     update_playlist,
@@ -279,3 +286,106 @@ def test_get_playlists():
 
     res_delete_artist = delete_user(owner)
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_get_all_playlists_paginated():
+    owner = "usuarioprueba834783478923489734298"
+    photo = "photo"
+    descripcion = "descripcion"
+    password = "password"
+    playlist_names = ["8232392323623823723a", "8232392323623823723b", "8232392323623823723c"]
+
+    res_create_artist = create_artist(owner, photo, password)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=owner, password=password)
+
+    for playlist_name in playlist_names:
+        res_create_playlist = create_playlist(
+            name=playlist_name, descripcion=descripcion, photo=photo, headers=jwt_headers
+        )
+        assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    found_playlist_names = []
+    params = {"limit": 2}
+    while True:
+        res_get_all_playlists = get_all_playlists(jwt_headers, **params)
+        assert res_get_all_playlists.status_code == HTTP_200_OK
+        page_playlist_names = [
+            playlist["name"] for playlist in res_get_all_playlists.json()["playlists"]
+        ]
+        assert len(page_playlist_names) <= params["limit"]
+        found_playlist_names.extend(page_playlist_names)
+        if NEXT_CURSOR_HEADER not in res_get_all_playlists.headers:
+            break
+        params["cursor"] = res_get_all_playlists.headers[NEXT_CURSOR_HEADER]
+
+    assert found_playlist_names == sorted(found_playlist_names)
+    assert set(playlist_names) <= set(found_playlist_names)
+
+    # clients that don't request pages get every playlist
+    res_get_all_playlists = get_all_playlists(jwt_headers)
+    assert res_get_all_playlists.status_code == HTTP_200_OK
+    assert NEXT_CURSOR_HEADER not in res_get_all_playlists.headers
+    assert [
+        playlist["name"] for playlist in res_get_all_playlists.json()["playlists"]
+    ] == found_playlist_names
+
+    res_get_all_playlists = get_all_playlists(jwt_headers, limit=0)
+    assert res_get_all_playlists.status_code == HTTP_400_BAD_REQUEST
+
+    res_get_all_playlists = get_all_playlists(jwt_headers, cursor="invalid")
+    assert res_get_all_playlists.status_code == HTTP_400_BAD_REQUEST
+
+    for playlist_name in playlist_names:
+        res_delete_playlist = delete_playlist(playlist_name)
+        assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(owner)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_get_all_playlists_stream():
+    owner = "usuarioprueba834783478923489734298"
+    photo = "photo"
+    descripcion = "descripcion"
+    password = "password"
+    playlist_names = ["8232392323623823723a", "8232392323623823723b", "8232392323623823723c"]
+
+    res_create_artist = create_artist(owner, photo, password)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=owner, password=password)
+
+    for playlist_name in playlist_names:
+        res_create_playlist = create_playlist(
+            name=playlist_name, descripcion=descripcion, photo=photo, headers=jwt_headers
+        )
+        assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    res_get_all_playlists = get_all_playlists(jwt_headers, stream=True)
+    assert res_get_all_playlists.status_code == HTTP_200_OK
+    found_playlist_names = [
+        playlist["name"] for playlist in res_get_all_playlists.json()["playlists"]
+    ]
+    assert set(playlist_names) <= set(found_playlist_names)
+
+    res_get_all_playlists = get_all_playlists(
+        {**jwt_headers, "Accept": "application/x-ndjson"},
+        stream=True,
+        cursor=encode_cursor({"after": playlist_names[0]}),
+    )
+    assert res_get_all_playlists.status_code == HTTP_200_OK
+    assert res_get_all_playlists.headers["content-type"] == "application/x-ndjson"
+    found_playlist_names = [
+        json.loads(json_line)["name"] for json_line in res_get_all_playlists.text.splitlines()
+    ]
+    assert playlist_names[0] not in found_playlist_names
+    assert set(playlist_names[1:]) <= set(found_playlist_names)
+
+    for playlist_name in playlist_names:
+        res_delete_playlist = delete_playlist(playlist_name)
+        assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(owner)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
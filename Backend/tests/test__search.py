@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 from pytest import fixture
 from starlette.status import (
@@ -7,6 +9,20 @@ from starlette.status import (
     HTTP_400_BAD_REQUEST,
 )
 
+import app.spotify_electron.search.search_repository as search_repository
+import app.spotify_electron.search.search_service as search_service
+from app.database.DatabaseConnectionManager import DatabaseConnectionManager
+from app.spotify_electron.playlist.providers.playlist_collection_provider import (
+    get_playlist_collection,
+)
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
+from app.spotify_electron.utils.search.search_utils import (
+    SEARCH_NAME_FIELD,
+    SEARCH_TOKENS_FIELD,
+    get_search_query,
+    normalize_search_name,
+)
 from tests.test_API.api_test_playlist import create_playlist, delete_playlist
 from tests.test_API.api_test_search import get_search_by_name
 from tests.test_API.api_test_user import create_user, delete_user
@@ -67,6 +83,262 @@ def test_get_search_by_name_invalid_name(clear_test_data_db):
     assert res_delete_user.status_code == HTTP_202_ACCEPTED
 
 
+def test_get_search_by_name_ignores_case_and_accents(clear_test_data_db, monkeypatch):
+    monkeypatch.setattr(SearchEngine, "is_enabled", False)
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "password"
+    playlist_name = "playlist"
+
+    res_create_user = create_user(name, photo, password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=name, password=password)
+
+    res_create_playlist = create_playlist(
+        name=playlist_name,
+        descripcion="descripcion",
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    for search_name in ["PLÁY", "laylis", "pl"]:
+        res_search_by_name = get_search_by_name(search_name, jwt_headers)
+        assert res_search_by_name.status_code == HTTP_200_OK
+        assert res_search_by_name.json()["playlists"][0]["name"] == playlist_name
+
+    res_search_by_name = get_search_by_name("playlistx", jwt_headers)
+    assert res_search_by_name.status_code == HTTP_200_OK
+    assert res_search_by_name.json()["playlists"] == []
+
+    res_delete_playlist = delete_playlist(name=playlist_name)
+    assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_user = delete_user(name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+def test_search_query_matches_contained_names():
+    assert normalize_search_name("Canción ÉXITO") == "cancion exito"
+
+    assert get_search_query("Ab") == {SEARCH_TOKENS_FIELD: "ab"}
+    assert get_search_query("Ción") == {
+        SEARCH_TOKENS_FIELD: {"$all": ["cio", "ion"]},
+        SEARCH_NAME_FIELD: {"$regex": "cion"},
+    }
+
+
+def test_backfill_search_index(clear_test_data_db, monkeypatch):
+    monkeypatch.setattr(SearchEngine, "is_enabled", False)
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "password"
+    playlist_name = "playlist"
+
+    res_create_user = create_user(name, photo, password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=name, password=password)
+
+    res_create_playlist = create_playlist(
+        name=playlist_name,
+        descripcion="descripcion",
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    get_playlist_collection().update_one(
+        {"name": playlist_name}, {"$unset": {SEARCH_NAME_FIELD: "", SEARCH_TOKENS_FIELD: ""}}
+    )
+    res_search_by_name = get_search_by_name(playlist_name, jwt_headers)
+    assert res_search_by_name.status_code == HTTP_200_OK
+    assert res_search_by_name.json()["playlists"] == []
+
+    assert search_service.backfill_search_index() == 1
+    assert search_service.backfill_search_index() == 0
+
+    res_search_by_name = get_search_by_name(playlist_name, jwt_headers)
+    assert res_search_by_name.status_code == HTTP_200_OK
+    assert res_search_by_name.json()["playlists"][0]["name"] == playlist_name
+
+    res_delete_playlist = delete_playlist(name=playlist_name)
+    assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_user = delete_user(name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+@pytest.mark.parametrize("is_search_engine_enabled", [True, False])
+def test_get_search_by_name_paginated(
+    clear_test_data_db, monkeypatch, is_search_engine_enabled
+):
+    monkeypatch.setattr(SearchEngine, "is_enabled", is_search_engine_enabled)
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "password"
+    playlist_names = ["playlist a", "playlist b", "playlist c"]
+
+    res_create_user = create_user(name, photo, password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=name, password=password)
+
+    for playlist_name in playlist_names:
+        res_create_playlist = create_playlist(
+            name=playlist_name,
+            descripcion="descripcion",
+            photo=photo,
+            headers=jwt_headers,
+        )
+        assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    found_playlist_names = []
+    playlists_cursor = None
+    for _ in playlist_names:
+        params = {"playlists_limit": 2, "users_limit": 1}
+        if playlists_cursor is not None:
+            params["playlists_cursor"] = playlists_cursor
+        res_search_by_name = get_search_by_name("playlist", jwt_headers, **params)
+        assert res_search_by_name.status_code == HTTP_200_OK
+        assert len(res_search_by_name.json()["playlists"]) <= 2  # noqa: PLR2004
+        found_playlist_names.extend(
+            playlist["name"] for playlist in res_search_by_name.json()["playlists"]
+        )
+        playlists_cursor = res_search_by_name.json()["next_cursors"]["playlists"]
+        if playlists_cursor is None:
+            break
+
+    assert sorted(found_playlist_names) == playlist_names
+    assert playlists_cursor is None
+
+    for playlist_name in playlist_names:
+        res_delete_playlist = delete_playlist(name=playlist_name)
+        assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_delete_user = delete_user(name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+def test_get_search_by_name_invalid_page(clear_test_data_db):
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "password"
+
+    res_create_user = create_user(name, photo, password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=name, password=password)
+
+    res_search_by_name = get_search_by_name("playlist", jwt_headers, songs_limit=0)
+    assert res_search_by_name.status_code == HTTP_400_BAD_REQUEST
+
+    res_search_by_name = get_search_by_name("playlist", jwt_headers, songs_cursor="invalid")
+    assert res_search_by_name.status_code == HTTP_400_BAD_REQUEST
+
+    res_delete_user = delete_user(name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+class UnionWithCollection:
+    """Collection that records the aggregations sent to it and runs their $unionWith\
+        stages over the other searchable collections"""
+
+    def __init__(
+        self,
+        collection: Any,
+        collections: dict[str, "UnionWithCollection"],
+        pipelines: list[list[dict[str, Any]]],
+    ) -> None:
+        self.collection = collection
+        self.name = collection.name
+        self.collections = collections
+        self.pipelines = pipelines
+        collections[self.name] = self
+
+    def aggregate(self, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run an aggregation, appending the documents of every $unionWith stage"""
+        self.pipelines.append(pipeline)
+        union_stages = [stage["$unionWith"] for stage in pipeline if "$unionWith" in stage]
+        own_stages = [stage for stage in pipeline if "$unionWith" not in stage]
+        documents = list(self.collection.aggregate(own_stages))
+        for union_stage in union_stages:
+            documents.extend(
+                self.collections[union_stage["coll"]].collection.aggregate(
+                    union_stage["pipeline"]
+                )
+            )
+        return documents
+
+
+def test_search_items_by_name_with_union_with(clear_test_data_db, monkeypatch):
+    name = "8232392323623823723"
+    password = "password"
+    playlist_name = "playlist"
+
+    res_create_user = create_user(name, "https://photo", password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+    jwt_headers = get_user_jwt_header(username=name, password=password)
+    res_create_playlist = create_playlist(
+        name=playlist_name, descripcion="descripcion", photo="photo", headers=jwt_headers
+    )
+    assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    limits = {item_type: 10 for item_type in SearchItemType}
+    expected_search_items = {
+        search_name: search_repository.search_items_by_name(search_name, limits, {})
+        for search_name in [name, playlist_name]
+    }
+
+    collections: dict[str, UnionWithCollection] = {}
+    pipelines: list[list[dict[str, Any]]] = []
+    searchable_collections = {
+        item_type: (UnionWithCollection(collection, collections, pipelines), streams_field)
+        for item_type, (
+            collection,
+            streams_field,
+        ) in search_repository.get_searchable_collections_by_type().items()
+    }
+    monkeypatch.setattr(
+        search_repository,
+        "get_searchable_collections_by_type",
+        lambda: searchable_collections,
+    )
+    monkeypatch.setattr(DatabaseConnectionManager.connection, "supports_union_with", True)
+
+    for search_name, search_items in expected_search_items.items():
+        assert search_repository.search_items_by_name(search_name, limits, {}) == search_items
+
+    assert expected_search_items[name].users[0].name == name
+    assert expected_search_items[playlist_name].playlists[0].name == playlist_name
+    assert len(pipelines) == len(expected_search_items)
+    first_item_type, *other_item_types = limits
+    for search_name, pipeline in zip(expected_search_items, pipelines, strict=True):
+        first_pipeline = search_repository.get_search_pipeline(
+            first_item_type, search_name, 10, None
+        )
+        assert pipeline[: len(first_pipeline)] == first_pipeline
+        assert pipeline[len(first_pipeline) :] == [
+            {
+                "$unionWith": {
+                    "coll": searchable_collections[item_type][0].name,
+                    "pipeline": search_repository.get_search_pipeline(
+                        item_type, search_name, 10, None
+                    ),
+                }
+            }
+            for item_type in other_item_types
+        ]
+
+    # mongomock doesn't support $unionWith
+    monkeypatch.undo()
+    res_delete_playlist = delete_playlist(name=playlist_name)
+    assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+    res_delete_user = delete_user(name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
 # executes after all tests
 @pytest.fixture()
 def clear_test_data_db():
@@ -0,0 +1,234 @@
+import threading
+
+from pytest import fixture
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+)
+
+from app.spotify_electron.search.search_engine import (
+    SearchEngine,
+    _SearchEngine,
+    get_name_trigrams,
+)
+from app.spotify_electron.search.search_schema import SearchItemType
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_playlist import create_playlist, delete_playlist
+from tests.test_API.api_test_search import get_search_by_name
+from tests.test_API.api_test_user import delete_user
+from tests.test_API.api_token import get_user_jwt_header
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+def test_name_trigrams():
+    assert get_name_trigrams("Ño ÁB") == ["  n", " no", "no ", "  a", " ab", "ab "]
+    assert get_name_trigrams("Ño ab", is_prefix=True) == ["  n", " no", "no ", "  a", " ab"]
+    assert get_name_trigrams("Ño ab ", is_prefix=True) == get_name_trigrams("Ño ab")
+
+
+def test_search_engine_matches_prefixes_and_typos():
+    search_engine = _SearchEngine(is_enabled=True, min_similarity=0.5, streams_weight=0.2)
+    search_engine.build(
+        {
+            SearchItemType.SONG: [("Midnight City", 0), ("Canción de amor", 0)],
+            SearchItemType.ARTIST: [("Midnight Riders", 0)],
+        }
+    )
+
+    results = search_engine.search("midni", {item_type: 10 for item_type in SearchItemType})
+    assert results[SearchItemType.SONG] == ["Midnight City"]
+    assert results[SearchItemType.ARTIST] == ["Midnight Riders"]
+    assert results[SearchItemType.PLAYLIST] == []
+
+    assert search_engine.search("midnigth", {item_type: 10 for item_type in SearchItemType})[
+        SearchItemType.SONG
+    ] == ["Midnight City"]
+    assert search_engine.search("CANCION", {item_type: 10 for item_type in SearchItemType})[
+        SearchItemType.SONG
+    ] == ["Canción de amor"]
+    assert (
+        search_engine.search("zzz", {item_type: 10 for item_type in SearchItemType})[
+            SearchItemType.SONG
+        ]
+        == []
+    )
+
+
+def test_search_engine_ranks_by_streams():
+    search_engine = _SearchEngine(is_enabled=True, min_similarity=0.5, streams_weight=0.2)
+    search_engine.build({SearchItemType.SONG: [("Love song", 10), ("Love story", 10)]})
+    assert search_engine.search("love", {item_type: 10 for item_type in SearchItemType})[
+        SearchItemType.SONG
+    ] == [
+        "Love song",
+        "Love story",
+    ]
+
+    search_engine.add_streams(SearchItemType.SONG, {"Love story": 1000})
+    assert search_engine.search("love", {item_type: 10 for item_type in SearchItemType})[
+        SearchItemType.SONG
+    ] == [
+        "Love story",
+        "Love song",
+    ]
+    assert search_engine.search("love", {item_type: 1 for item_type in SearchItemType})[
+        SearchItemType.SONG
+    ] == ["Love story"]
+
+
+def test_search_engine_incremental_updates():
+    search_engine = _SearchEngine(is_enabled=True, min_similarity=0.5, streams_weight=0.2)
+    search_engine.build({})
+
+    search_engine.add(SearchItemType.PLAYLIST, "summer hits")
+    assert search_engine.search("summer", {item_type: 10 for item_type in SearchItemType})[
+        SearchItemType.PLAYLIST
+    ] == ["summer hits"]
+
+    search_engine.rename(SearchItemType.PLAYLIST, "summer hits", "winter hits")
+    assert (
+        search_engine.search("summer", {item_type: 10 for item_type in SearchItemType})[
+            SearchItemType.PLAYLIST
+        ]
+        == []
+    )
+    assert search_engine.search("winter", {item_type: 10 for item_type in SearchItemType})[
+        SearchItemType.PLAYLIST
+    ] == ["winter hits"]
+
+    search_engine.remove(SearchItemType.PLAYLIST, "winter hits")
+    assert (
+        search_engine.search("winter", {item_type: 10 for item_type in SearchItemType})[
+            SearchItemType.PLAYLIST
+        ]
+        == []
+    )
+
+    stats = search_engine.get_stats()
+    assert stats.is_ready
+    assert stats.items == 0
+    assert stats.removed_items == 2  # noqa: PLR2004
+
+
+def test_search_engine_refresh_finds_items_changed_by_other_processes():
+    search_engine = _SearchEngine(is_enabled=True, min_similarity=0.5, streams_weight=0.2)
+    search_engine.build({SearchItemType.SONG: [("old song", 0)]})
+    stored_songs = [("new song", 0)]
+
+    def loader() -> dict[SearchItemType, list[tuple[str, int]]]:
+        # changes made by this process while the stored items are loaded
+        search_engine.add(SearchItemType.SONG, "local song")
+        search_engine.rename(SearchItemType.SONG, "new song", "renamed song")
+        return {SearchItemType.SONG: stored_songs}
+
+    search_engine.start(loader)
+    assert search_engine.refresh()
+
+    limits = {SearchItemType.SONG: 10}
+    assert search_engine.search("old", limits)[SearchItemType.SONG] == []
+    assert search_engine.search("local", limits)[SearchItemType.SONG] == ["local song"]
+    assert search_engine.search("renamed", limits)[SearchItemType.SONG] == ["renamed song"]
+    assert search_engine.get_stats().refreshes == 1
+
+
+def test_search_engine_failed_refresh_keeps_index():
+    search_engine = _SearchEngine(is_enabled=True, min_similarity=0.5, streams_weight=0.2)
+    search_engine.build({SearchItemType.SONG: [("song", 0)]})
+
+    def loader() -> dict[SearchItemType, list[tuple[str, int]]]:
+        raise ConnectionError
+
+    search_engine.start(loader)
+
+    assert not search_engine.refresh()
+    assert search_engine.search("song", {SearchItemType.SONG: 10})[SearchItemType.SONG] == [
+        "song"
+    ]
+    assert search_engine.get_stats().failed_refreshes == 1
+
+
+def test_search_engine_refreshes_in_background():
+    search_engine = _SearchEngine(
+        is_enabled=True, min_similarity=0.5, streams_weight=0.2, refresh_interval_seconds=0.01
+    )
+    search_engine.build({})
+    refreshed = threading.Event()
+
+    def loader() -> dict[SearchItemType, list[tuple[str, int]]]:
+        refreshed.set()
+        return {SearchItemType.SONG: [("song", 0)]}
+
+    search_engine.start(loader)
+    assert refreshed.wait(5)
+    search_engine.stop()
+
+    assert search_engine.search("song", {SearchItemType.SONG: 10})[SearchItemType.SONG] == [
+        "song"
+    ]
+
+
+def test_search_engine_disabled_is_not_ready():
+    search_engine = _SearchEngine(is_enabled=False, min_similarity=0.5, streams_weight=0.2)
+    search_engine.build({SearchItemType.SONG: [("song", 0)]})
+    search_engine.add(SearchItemType.SONG, "other song")
+
+    assert not search_engine.is_ready
+    assert search_engine.get_stats().items == 0
+
+
+def test_search_by_name_from_search_engine(clear_test_data_db):
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "password"
+    playlist_name = "playlist"
+
+    assert SearchEngine.is_ready
+
+    res_create_artist = create_artist(name, photo, password)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=name, password=password)
+
+    res_create_playlist = create_playlist(
+        name=playlist_name,
+        descripcion="descripcion",
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_playlist.status_code == HTTP_201_CREATED
+
+    res_search_by_name = get_search_by_name("playlsit", jwt_headers)
+    assert res_search_by_name.status_code == HTTP_200_OK
+    assert res_search_by_name.json()["playlists"][0]["name"] == playlist_name
+
+    res_delete_playlist = delete_playlist(name=playlist_name)
+    assert res_delete_playlist.status_code == HTTP_202_ACCEPTED
+
+    res_search_by_name = get_search_by_name("playlsit", jwt_headers)
+    assert res_search_by_name.status_code == HTTP_200_OK
+    assert res_search_by_name.json()["playlists"] == []
+
+    res_delete_user = delete_user(name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+    res_search_by_name = get_search_by_name("82323923", jwt_headers)
+    assert res_search_by_name.status_code == HTTP_200_OK
+    assert res_search_by_name.json()["artists"] == []
+
+
+@fixture()
+def clear_test_data_db():
+    name = "8232392323623823723"
+
+    delete_user(name)
+    delete_playlist("playlist")
+
+    yield
+
+    delete_user(name)
+    delete_playlist("playlist")
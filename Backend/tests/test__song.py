@@ -11,7 +11,13 @@ from starlette.status import (
     HTTP_422_UNPROCESSABLE_ENTITY,
 )
 
+import app.spotify_electron.song.base_song_repository as base_song_repository
+import app.spotify_electron.song.base_song_service as base_song_service
 from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.search.search_engine import SearchEngine
+from app.spotify_electron.search.search_schema import SearchItemType
+from app.spotify_electron.song.song_streams_buffer import SongStreamsBuffer
+from app.spotify_electron.utils.pagination.pagination_utils import NEXT_CURSOR_HEADER
 from tests.test_API.api_test_artist import create_artist, get_artist
 from tests.test_API.api_test_song import (
     create_song,
@@ -309,6 +315,7 @@ def test_patch_number_plays_cancion_correct(clear_test_data_db):
 
     res_increase_streams_song = increase_song_streams(name=song_name, headers=jwt_headers)
     assert res_increase_streams_song.status_code == HTTP_204_NO_CONTENT
+    SongStreamsBuffer.flush()
 
     res_get_song = get_song(name=song_name, headers=jwt_headers)
     assert res_get_song.status_code == HTTP_200_OK
@@ -325,6 +332,53 @@ def test_patch_number_plays_cancion_correct(clear_test_data_db):
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_patch_number_of_plays_indexed_song_skips_database(
+    clear_test_data_db, monkeypatch: pytest.MonkeyPatch
+):
+    song_name = "8232392323623823723989"
+    file_path = "tests/assets/song.mp3"
+    artista = "artista"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "hola"
+
+    res_create_artist = create_artist(name=artista, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artista, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=file_path,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+    assert SearchEngine.contains(SearchItemType.SONG, song_name)
+
+    def validate_song_should_exists(name: str) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(
+        base_song_service, "validate_song_should_exists", validate_song_should_exists
+    )
+    res_increase_streams_song = increase_song_streams(name=song_name, headers=jwt_headers)
+    assert res_increase_streams_song.status_code == HTTP_204_NO_CONTENT
+    SongStreamsBuffer.flush()
+    monkeypatch.undo()
+
+    res_get_song = get_song(name=song_name, headers=jwt_headers)
+    assert res_get_song.status_code == HTTP_200_OK
+    assert res_get_song.json()["streams"] == 1
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artista)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
 def test_patch_number_of_plays_song_not_found(clear_test_data_db):
     song_name = "8232392323623823723989"
     artista = "artista"
@@ -487,6 +541,54 @@ def test_get_cancion_by_genre(clear_test_data_db):
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_get_songs_by_genre_paginated(clear_test_data_db):
+    song_names = ["8232392323623823723989a", "8232392323623823723989b"]
+    file_path = "tests/assets/song.mp3"
+    artista = "artista"
+    genre = "Rock"
+    photo = "https://photo"
+    password = "hola"
+
+    res_create_artist = create_artist(name=artista, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artista, password=password)
+
+    for song_name in song_names:
+        res_create_song = create_song(
+            name=song_name,
+            file_path=file_path,
+            genre=genre,
+            photo=photo,
+            headers=jwt_headers,
+        )
+        assert res_create_song.status_code == HTTP_201_CREATED
+
+    res_get_song_by_genre = get_songs_by_genre(genre=genre, headers=jwt_headers, limit=1)
+    assert res_get_song_by_genre.status_code == HTTP_200_OK
+    assert [song["name"] for song in res_get_song_by_genre.json()["songs"]] == song_names[:1]
+
+    res_get_song_by_genre = get_songs_by_genre(
+        genre=genre,
+        headers=jwt_headers,
+        limit=1,
+        cursor=res_get_song_by_genre.headers[NEXT_CURSOR_HEADER],
+    )
+    assert res_get_song_by_genre.status_code == HTTP_200_OK
+    assert [song["name"] for song in res_get_song_by_genre.json()["songs"]] == song_names[1:]
+    assert NEXT_CURSOR_HEADER not in res_get_song_by_genre.headers
+
+    res_get_song_by_genre = get_songs_by_genre(genre=genre, headers=jwt_headers, limit=1000)
+    assert res_get_song_by_genre.status_code == HTTP_400_BAD_REQUEST
+
+    for song_name in song_names:
+        res_delete_song = delete_song(song_name)
+        assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artista)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
 def test_get_cancion_by_genre_bad_genre(clear_test_data_db):
     genre = "RockInventado"
 
@@ -506,6 +608,43 @@ def test_get_cancion_by_genre_bad_genre(clear_test_data_db):
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
 
 
+def test_get_songs_metadata_by_names_keeps_order_and_reports_missing(clear_test_data_db):
+    song_name = "8232392323623823723989"
+    file_path = "tests/assets/song.mp3"
+    artista = "artista"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "hola"
+    missing_song_name = "missing-song"
+
+    res_create_artist = create_artist(name=artista, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artista, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=file_path,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    songs_metadata = base_song_repository.get_songs_metadata_by_names(
+        [song_name, missing_song_name, song_name]
+    )
+    assert [song.name for song in songs_metadata.songs] == [song_name, song_name]
+    assert songs_metadata.songs[0].artist == artista
+    assert songs_metadata.missing_names == [missing_song_name]
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artista)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
 @pytest.fixture()
 def clear_test_data_db():
     song_name = "8232392323623823723989"
@@ -0,0 +1,187 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from pytest import fixture
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_403_FORBIDDEN,
+)
+
+import app.spotify_electron.song.blob.song_repository as song_repository
+from app.spotify_electron.song.blob.song_data_cache import SongDataCache, _SongDataCache
+from app.spotify_electron.song.blob.song_data_cache_loader import SongDataCacheLoader
+from tests.test_API.api_metrics import get_metrics
+from tests.test_API.api_stream import stream_song
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_song import create_song, delete_song
+from tests.test_API.api_test_user import create_user, delete_user
+from tests.test_API.api_token import get_user_jwt_header
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+def create_song_data_file(file_id: str, length: int = 4) -> SimpleNamespace:
+    return SimpleNamespace(_id=file_id, length=length)
+
+
+def test_song_data_cache_evicts_least_recently_used():
+    song_data_cache = _SongDataCache(max_bytes=10, max_entry_bytes=10)
+
+    song_data_files = [create_song_data_file(f"id-{index}") for index in range(3)]
+
+    song_data_cache.get_or_load("song-1", song_data_files[0], lambda: b"1111")
+    song_data_cache.get_or_load("song-2", song_data_files[1], lambda: b"2222")
+    assert song_data_cache.get(song_data_files[0]) == b"1111"
+
+    song_data_cache.get_or_load("song-3", song_data_files[2], lambda: b"3333")
+
+    assert song_data_cache.get(song_data_files[1]) is None
+    assert song_data_cache.get(song_data_files[0]) == b"1111"
+    assert song_data_cache.get(song_data_files[2]) == b"3333"
+
+    expected_entries = 2
+    expected_bytes = 8
+    stats = song_data_cache.get_stats()
+    assert stats.evictions == 1
+    assert stats.entries == expected_entries
+    assert stats.current_bytes == expected_bytes
+
+
+def test_song_data_cache_does_not_store_big_entries():
+    song_data_cache = _SongDataCache(max_bytes=10, max_entry_bytes=4)
+
+    assert not song_data_cache.is_cacheable(5)
+    song_data_file = create_song_data_file("id", length=5)
+    assert song_data_cache.get_or_load("song", song_data_file, lambda: b"55555") == b"55555"
+    assert song_data_cache.get(song_data_file) is None
+
+
+def test_song_data_cache_single_flight_load():
+    song_data_cache = _SongDataCache(max_bytes=10, max_entry_bytes=10)
+    song_data_file = create_song_data_file("id")
+    loads = []
+
+    def loader() -> bytes:
+        loads.append(1)
+        time.sleep(0.2)
+        return b"data"
+
+    concurrent_requests = 5
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                song_data_cache.get_or_load("song", song_data_file, loader)
+            )
+        )
+        for _ in range(concurrent_requests)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert results == [b"data"] * concurrent_requests
+
+    stats = song_data_cache.get_stats()
+    assert stats.misses == 1
+    assert stats.hits == concurrent_requests - 1
+
+
+def test_song_data_cache_invalidate_while_loading_is_not_stored():
+    song_data_cache = _SongDataCache(max_bytes=10, max_entry_bytes=10)
+
+    song_data_file = create_song_data_file("id")
+
+    def loader() -> bytes:
+        song_data_cache.invalidate("song")
+        return b"data"
+
+    assert song_data_cache.get_or_load("song", song_data_file, loader) == b"data"
+    assert song_data_cache.get(song_data_file) is None
+
+
+def test_song_data_cache_does_not_serve_data_of_previous_song_file():
+    song_data_cache = _SongDataCache(max_bytes=10, max_entry_bytes=10)
+    song_data_file = create_song_data_file("id")
+    reuploaded_song_data_file = create_song_data_file("reuploaded-id", length=3)
+    song_data_cache.get_or_load("song", song_data_file, lambda: b"data")
+
+    song_data = song_data_cache.get_or_load("song", reuploaded_song_data_file, lambda: b"new")
+
+    assert song_data == b"new"
+    assert song_data_cache.get(song_data_file) is None
+    assert song_data_cache.get(reuploaded_song_data_file) == b"new"
+    assert song_data_cache.get_stats().current_bytes == len(b"new")
+
+
+def test_song_data_cache_does_not_store_data_not_matching_the_file_length():
+    song_data_cache = _SongDataCache(max_bytes=10, max_entry_bytes=10)
+    song_data_file = create_song_data_file("id", length=8)
+
+    assert song_data_cache.get_or_load("song", song_data_file, lambda: b"data") == b"data"
+    assert song_data_cache.get(song_data_file) is None
+
+
+def test_delete_song_invalidates_song_data_cache():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+    song_path = "tests/assets/song_4_seconds.mp3"
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=song_path,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, "Range": "bytes=0-99"})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+    song_data_file = song_repository.get_song_data(song_name)
+    SongDataCacheLoader.load(song_name, song_data_file).result()
+    assert SongDataCache.get(song_data_file) is not None
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+    assert SongDataCache.get(song_data_file) is None
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_song_data_cache_stats_in_metrics():
+    user_name = "8232392323623823723"
+    password = "hola"
+    res_create_user = create_user(user_name, "https://photo", password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    assert get_metrics(headers={}).status_code == HTTP_403_FORBIDDEN
+
+    jwt_headers = get_user_jwt_header(username=user_name, password=password)
+    response = get_metrics(headers=jwt_headers)
+    assert response.status_code == HTTP_200_OK
+    res_delete_user = delete_user(user_name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+    song_data_cache_metrics = response.json()["song_data_cache"]
+    assert song_data_cache_metrics["max_bytes"] == SongDataCache.max_bytes
+    for counter in ("hits", "misses", "evictions", "entries", "current_bytes"):
+        assert counter in song_data_cache_metrics
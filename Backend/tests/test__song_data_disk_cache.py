@@ -0,0 +1,244 @@
+import hashlib
+import os
+
+import pytest
+from gridfs import GridOut
+from pytest import fixture
+from starlette.status import (
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_206_PARTIAL_CONTENT,
+)
+
+import app.spotify_electron.song.blob.song_repository as song_repository
+import app.spotify_electron.song.blob.song_service as song_service
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+from app.spotify_electron.song.blob.song_data_cache import SongDataCache
+from app.spotify_electron.song.blob.song_data_cache_loader import SongDataCacheLoader
+from app.spotify_electron.song.blob.song_data_disk_cache import (
+    TEMPORARY_FILE_SUFFIX,
+    SongDataDiskCache,
+    _SongDataDiskCache,
+)
+from tests.test_API.api_stream import stream_song
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_song import create_song, delete_song
+from tests.test_API.api_test_user import delete_user
+from tests.test_API.api_token import get_user_jwt_header
+
+SONG_PATH = "tests/assets/song_4_seconds.mp3"
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+@fixture
+def song_data_disk_cache(tmp_path, monkeypatch: pytest.MonkeyPatch) -> _SongDataDiskCache:
+    monkeypatch.setattr(SongDataDiskCache, "directory", str(tmp_path))
+    monkeypatch.setattr(SongDataDiskCache, "max_bytes", 10**7)
+    return SongDataDiskCache
+
+
+def _put_song_data(name: str, song_data: bytes, **kwargs):
+    gridfs_collection = song_collection_provider.get_gridfs_song_collection()
+    gridfs_collection.put(song_data, name=name, **kwargs)
+    return song_repository.get_song_data(name)
+
+
+def _delete_song_data(name: str) -> None:
+    gridfs_collection = song_collection_provider.get_gridfs_song_collection()
+    gridfs_collection.delete(song_repository.get_song_data(name)._id)
+
+
+def _load_song_data(song_data_file):
+    return lambda: song_repository.get_song_data_range(
+        song_data_file, 0, song_data_file.length - 1
+    )
+
+
+def test_song_data_disk_cache_serves_mapped_song_data(tmp_path):
+    song_name = "song-disk-cache"
+    with open(SONG_PATH, "rb") as file:
+        song_bytes = file.read()
+
+    song_data_disk_cache = _SongDataDiskCache(directory=str(tmp_path), max_bytes=10**7)
+    song_data_file = _put_song_data(song_name, song_bytes)
+
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, _load_song_data(song_data_file)
+    )
+    assert isinstance(song_data, memoryview)
+    assert song_data == song_bytes
+    assert os.listdir(tmp_path) == [str(song_data_file._id)]
+
+    def loader_not_expected():
+        raise AssertionError
+
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, loader_not_expected
+    )
+    assert song_data == song_bytes
+
+    stats = song_data_disk_cache.get_stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.current_bytes == len(song_bytes)
+
+    _delete_song_data(song_name)
+
+
+def test_song_data_disk_cache_reupload_is_not_served_stale(tmp_path):
+    song_name = "song-disk-cache-reupload"
+    song_data_disk_cache = _SongDataDiskCache(directory=str(tmp_path), max_bytes=10**7)
+
+    song_data_file = _put_song_data(song_name, b"old song data")
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, _load_song_data(song_data_file)
+    )
+    assert song_data == b"old song data"
+    _delete_song_data(song_name)
+
+    song_data_file = _put_song_data(song_name, b"new song data")
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, _load_song_data(song_data_file)
+    )
+    assert song_data == b"new song data"
+
+    _delete_song_data(song_name)
+
+
+def test_song_data_disk_cache_evicts_least_recently_used(tmp_path):
+    song_data_disk_cache = _SongDataDiskCache(directory=str(tmp_path), max_bytes=10)
+
+    song_data_files = [
+        _put_song_data(f"song-disk-cache-{i}", f"{i}{i}{i}{i}".encode()) for i in range(3)
+    ]
+    for song_data_file in song_data_files:
+        song_data_disk_cache.get_or_load(
+            song_data_file.name, song_data_file, _load_song_data(song_data_file)
+        )
+
+    expected_entries = 2
+    stats = song_data_disk_cache.get_stats()
+    assert stats.evictions == 1
+    assert stats.entries == expected_entries
+    assert str(song_data_files[0]._id) not in os.listdir(tmp_path)
+
+    for i in range(3):
+        _delete_song_data(f"song-disk-cache-{i}")
+
+
+def test_song_data_disk_cache_incomplete_write_is_not_stored(tmp_path):
+    song_name = "song-disk-cache-incomplete"
+    song_data_disk_cache = _SongDataDiskCache(directory=str(tmp_path), max_bytes=10**7)
+    song_data_file = _put_song_data(song_name, b"song data")
+
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, lambda: iter([b"song"])
+    )
+
+    assert song_data is None
+    assert os.listdir(tmp_path) == []
+    assert song_data_disk_cache.get_stats().entries == 0
+
+    _delete_song_data(song_name)
+
+
+def test_song_data_disk_cache_checks_stored_checksum(tmp_path):
+    song_name = "song-disk-cache-checksum"
+    song_data_disk_cache = _SongDataDiskCache(directory=str(tmp_path), max_bytes=10**7)
+    song_data_file = _put_song_data(
+        song_name, b"song data", sha256=hashlib.sha256(b"other data").hexdigest()
+    )
+
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, _load_song_data(song_data_file)
+    )
+
+    assert song_data is None
+    assert os.listdir(tmp_path) == []
+    _delete_song_data(song_name)
+
+    song_data_file = _put_song_data(
+        song_name, b"song data", sha256=hashlib.sha256(b"song data").hexdigest()
+    )
+
+    song_data = song_data_disk_cache.get_or_load(
+        song_name, song_data_file, _load_song_data(song_data_file)
+    )
+
+    assert song_data is not None
+    assert bytes(song_data) == b"song data"
+    del song_data
+    _delete_song_data(song_name)
+
+
+def test_song_data_disk_cache_adopts_files_and_removes_unfinished_writes(tmp_path):
+    (tmp_path / "file-id").write_bytes(b"song data")
+    (tmp_path / f"unfinished{TEMPORARY_FILE_SUFFIX}").write_bytes(b"song")
+
+    song_data_disk_cache = _SongDataDiskCache(directory=str(tmp_path), max_bytes=10**7)
+
+    assert os.listdir(tmp_path) == ["file-id"]
+    assert song_data_disk_cache.get_stats().current_bytes == len(b"song data")
+
+
+def test_delete_song_invalidates_song_data_disk_cache(song_data_disk_cache):
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    song_data_file_path = os.path.join(
+        SongDataDiskCache.directory, str(song_repository.get_song_data(song_name)._id)
+    )
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, "Range": "bytes=0-99"})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+    SongDataCacheLoader.load(song_name, song_repository.get_song_data(song_name)).result()
+    assert os.path.exists(song_data_file_path)
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+    assert not os.path.exists(song_data_file_path)
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_song_stream_data_is_cached_in_background(song_data_disk_cache):
+    song_name = "song-disk-cache-background"
+    with open(SONG_PATH, "rb") as file:
+        song_data = file.read()
+    song_data_file = _put_song_data(song_name, song_data)
+
+    try:
+        first_song_data = song_service.get_song_stream_data(song_name, song_data_file)
+        assert isinstance(first_song_data, GridOut)
+
+        SongDataCacheLoader.load(song_name, song_data_file).result()
+
+        cached_song_data = song_service.get_song_stream_data(song_name, song_data_file)
+        assert bytes(cached_song_data) == song_data
+        assert song_data_disk_cache.get(song_data_file) is not None
+    finally:
+        SongDataCache.invalidate(song_name)
+        song_data_disk_cache.invalidate(song_name)
+        _delete_song_data(song_name)
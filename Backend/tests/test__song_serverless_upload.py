@@ -0,0 +1,309 @@
+import asyncio
+import io
+import json
+from collections.abc import Generator
+from datetime import datetime
+
+import pytest
+from fastapi import UploadFile
+from pytest import fixture
+from requests import Response
+from starlette.status import HTTP_201_CREATED, HTTP_202_ACCEPTED
+
+import app.spotify_electron.song.base_song_repository as base_song_repository
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+import app.spotify_electron.song.serverless.song_repository as song_repository
+import app.spotify_electron.song.serverless.song_service as song_service
+import app.spotify_electron.user.artist.artist_service as artist_service
+from app.auth.auth_schema import TokenData
+from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.song.base_song_schema import (
+    SongAlreadyExistsException,
+    SongBadFileException,
+    SongFileTooLargeException,
+    SongNotFoundException,
+    SongUnAuthorizedException,
+)
+from app.spotify_electron.song.serverless import song_serverless_api
+from app.spotify_electron.song.serverless.song_schema import (
+    SongUploadDTO,
+    SongUploadNotFoundException,
+    SongUploadPart,
+)
+from app.spotify_electron.user.user.user_schema import UserType
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_user import delete_user
+
+SONG_PATH = "tests/assets/song_4_seconds.mp3"
+PART_SIZE = 16 * 1024
+
+
+class CloudStorageStandIn:
+    """Local stand-in of the serverless function and the cloud storage multipart\
+        uploads it presigns"""
+
+    def __init__(self) -> None:
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.songs: dict[str, bytes] = {}
+        self.requests = 0
+
+    def create_song_upload(self, song_name: str, parts: int) -> Response:
+        """Start a multipart upload with a url for each part"""
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        part_urls = [f"{upload_id}/{part_number}" for part_number in range(1, parts + 1)]
+        return self.create_response(
+            HTTP_201_CREATED, {"upload_id": upload_id, "part_urls": part_urls}
+        )
+
+    def upload_song_part(self, part_url: str, data: bytes) -> Response:
+        """PUT a part to its presigned url"""
+        self.requests += 1
+        upload_id, part_number = part_url.split("/")
+        self.uploads[upload_id][int(part_number)] = data
+        response = self.create_response(200)
+        response.headers["ETag"] = f'"{upload_id}-{part_number}"'
+        return response
+
+    def complete_song_upload(
+        self, song_name: str, upload_id: str, parts: list[dict]
+    ) -> Response:
+        """Complete a multipart upload joining its parts"""
+        upload = self.uploads.pop(upload_id)
+        self.songs[song_name] = b"".join(upload[part["part_number"]] for part in parts)
+        return self.create_response(
+            HTTP_201_CREATED, {"url": song_name, "size": len(self.songs[song_name])}
+        )
+
+    def abort_song_upload(self, song_name: str, upload_id: str) -> Response:
+        """Abort a multipart upload"""
+        self.uploads.pop(upload_id)
+        return self.create_response(HTTP_202_ACCEPTED)
+
+    def delete_song(self, song_name: str) -> Response:
+        """Delete a song file"""
+        self.songs.pop(song_name)
+        return self.create_response(HTTP_202_ACCEPTED)
+
+    def get_song_file(self, url: str) -> Response:
+        """GET a song file from its presigned url"""
+        response = self.create_response(200)
+        response.raw = io.BytesIO(self.songs[url])
+        return response
+
+    @staticmethod
+    def create_response(status_code: int, body: dict | None = None) -> Response:
+        """Create a response of the serverless function"""
+        response = Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode() if body is not None else b""
+        return response
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+@fixture
+def cloud_storage(monkeypatch: pytest.MonkeyPatch) -> CloudStorageStandIn:
+    cloud_storage = CloudStorageStandIn()
+    for function_name in (
+        "create_song_upload",
+        "upload_song_part",
+        "complete_song_upload",
+        "abort_song_upload",
+        "delete_song",
+        "get_song_file",
+    ):
+        monkeypatch.setattr(
+            song_serverless_api, function_name, getattr(cloud_storage, function_name)
+        )
+    monkeypatch.setattr(song_service, "SONG_UPLOAD_PART_BYTES", PART_SIZE)
+    return cloud_storage
+
+
+@fixture(scope="module")
+def song_file() -> bytes:
+    with open(SONG_PATH, "rb") as file:
+        return file.read()
+
+
+@fixture
+def artist() -> Generator[str, None, None]:
+    artist = "song-serverless-upload-artist"
+    assert create_artist(artist, "photo", "password").status_code == HTTP_201_CREATED
+    yield artist
+    assert delete_user(artist).status_code == HTTP_202_ACCEPTED
+
+
+def get_token(username: str) -> TokenData:
+    return TokenData(username=username, role=UserType.ARTIST, token_type="bearer")
+
+
+def test_create_song_uploads_file_parts(
+    cloud_storage: CloudStorageStandIn, song_file: bytes, artist: str
+):
+    name = "song-serverless-upload"
+    upload_file = UploadFile(file=io.BytesIO(song_file), size=len(song_file))
+
+    asyncio.run(
+        song_service.create_song(name, Genre.POP, "photo", upload_file, get_token(artist))
+    )
+
+    assert cloud_storage.songs[name] == song_file
+    assert cloud_storage.requests == -(-len(song_file) // PART_SIZE)
+    assert not cloud_storage.uploads
+    song = song_repository.get_song(name)
+    assert song.seconds_duration == 4  # noqa: PLR2004
+    assert name in artist_service.get_artist(artist).uploaded_songs
+
+    song_service.delete_song(name)
+
+
+def test_song_upload_from_client(
+    cloud_storage: CloudStorageStandIn, song_file: bytes, artist: str
+):
+    name = "song-serverless-client-upload"
+    token = get_token(artist)
+
+    song_upload = asyncio.run(
+        song_service.create_song_upload(name, Genre.POP, "photo", len(song_file), token)
+    )
+
+    assert song_upload.part_size == PART_SIZE
+    assert name not in artist_service.get_artist(artist).uploaded_songs
+    parts = upload_song_file(song_upload, song_file)
+
+    with pytest.raises(SongUnAuthorizedException):
+        asyncio.run(
+            song_service.complete_song_upload(
+                name, song_upload.upload_id, parts, get_token("other-artist")
+            )
+        )
+    asyncio.run(song_service.complete_song_upload(name, song_upload.upload_id, parts, token))
+
+    assert cloud_storage.songs[name] == song_file
+    assert song_repository.get_song(name).seconds_duration == 4  # noqa: PLR2004
+    assert name in artist_service.get_artist(artist).uploaded_songs
+    with pytest.raises(SongUploadNotFoundException):
+        asyncio.run(song_service.abort_song_upload(name, song_upload.upload_id, token))
+
+    song_service.delete_song(name)
+
+
+def upload_song_file(song_upload: SongUploadDTO, song_file: bytes) -> list[SongUploadPart]:
+    parts = []
+    for part_number, part_url in enumerate(song_upload.part_urls, start=1):
+        offset = (part_number - 1) * PART_SIZE
+        response = song_serverless_api.upload_song_part(
+            part_url, song_file[offset : offset + PART_SIZE]
+        )
+        parts.append(SongUploadPart(part_number=part_number, etag=response.headers["ETag"]))
+    return parts
+
+
+@pytest.mark.parametrize(
+    "uploaded_file, exception",
+    [
+        (b"not a song" * 1000, SongBadFileException),
+        (None, SongFileTooLargeException),
+    ],
+    ids=["not-audio", "too-large"],
+)
+def test_song_upload_from_client_with_invalid_file_is_not_published(  # noqa: PLR0913
+    cloud_storage: CloudStorageStandIn,
+    song_file: bytes,
+    artist: str,
+    monkeypatch: pytest.MonkeyPatch,
+    uploaded_file: bytes | None,
+    exception: type[Exception],
+):
+    name = "song-serverless-invalid-client-upload"
+    token = get_token(artist)
+    song_upload = asyncio.run(
+        song_service.create_song_upload(name, Genre.POP, "photo", len(song_file), token)
+    )
+    monkeypatch.setattr(song_service, "SONG_UPLOAD_MAX_BYTES", len(song_file))
+    # parts are uploaded by the client with any size
+    parts = upload_song_file(song_upload, uploaded_file or song_file * 2)
+
+    with pytest.raises(exception):
+        asyncio.run(
+            song_service.complete_song_upload(name, song_upload.upload_id, parts, token)
+        )
+
+    assert name not in cloud_storage.songs
+    assert not base_song_repository.check_song_exists(name)
+    assert name not in artist_service.get_artist(artist).uploaded_songs
+    with pytest.raises(SongUploadNotFoundException):
+        song_repository.get_song_upload(name, song_upload.upload_id)
+
+
+def test_pending_song_upload_is_not_found(
+    cloud_storage: CloudStorageStandIn, song_file: bytes, artist: str
+):
+    name = "song-serverless-pending-upload"
+    token = get_token(artist)
+
+    song_upload = asyncio.run(
+        song_service.create_song_upload(name, Genre.POP, "photo", len(song_file), token)
+    )
+
+    assert not base_song_repository.check_song_exists(name)
+    with pytest.raises(SongNotFoundException):
+        song_repository.get_song(name)
+    pending_song_upload = song_collection_provider.get_song_upload_collection().find_one(
+        {"name": name}
+    )
+    assert pending_song_upload["upload_id"] == song_upload.upload_id  # type: ignore
+    assert isinstance(pending_song_upload["created_at"], datetime)  # type: ignore
+    with pytest.raises(SongAlreadyExistsException):
+        asyncio.run(
+            song_service.create_song_upload(name, Genre.POP, "photo", len(song_file), token)
+        )
+
+    asyncio.run(song_service.abort_song_upload(name, song_upload.upload_id, token))
+
+
+def test_song_upload_aborted_deletes_song(
+    cloud_storage: CloudStorageStandIn, song_file: bytes, artist: str
+):
+    name = "song-serverless-aborted-upload"
+    token = get_token(artist)
+    song_upload = asyncio.run(
+        song_service.create_song_upload(name, Genre.POP, "photo", len(song_file), token)
+    )
+
+    asyncio.run(song_service.abort_song_upload(name, song_upload.upload_id, token))
+
+    assert not cloud_storage.uploads
+    assert not base_song_repository.check_song_exists(name)
+    with pytest.raises(SongUploadNotFoundException):
+        song_repository.get_song_upload(name, song_upload.upload_id)
+
+
+def test_create_song_with_non_audio_file_aborts_upload(
+    cloud_storage: CloudStorageStandIn, artist: str
+):
+    name = "song-serverless-not-audio"
+    not_song_file = b"not a song" * PART_SIZE
+    upload_file = UploadFile(file=io.BytesIO(not_song_file), size=len(not_song_file))
+
+    with pytest.raises(SongBadFileException):
+        asyncio.run(
+            song_service.create_song(name, Genre.POP, "photo", upload_file, get_token(artist))
+        )
+
+    assert not cloud_storage.uploads
+    assert not cloud_storage.songs
+    assert not base_song_repository.check_song_exists(name)
+
+
+def test_song_upload_parts_limits(cloud_storage: CloudStorageStandIn):
+    assert song_service.get_song_upload_parts("song", 0) == 1
+    assert song_service.get_song_upload_parts("song", PART_SIZE + 1) == 2  # noqa: PLR2004
+    with pytest.raises(SongBadFileException):
+        song_service.get_song_upload_parts("song", -1)
+    with pytest.raises(SongFileTooLargeException):
+        song_service.get_song_upload_parts("song", song_service.SONG_UPLOAD_MAX_BYTES + 1)
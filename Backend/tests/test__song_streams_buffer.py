@@ -0,0 +1,267 @@
+import threading
+
+import pytest
+from pymongo.errors import BulkWriteError
+from pytest import fixture
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_403_FORBIDDEN,
+)
+
+import app.spotify_electron.song.base_song_repository as base_song_repository
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+from app.spotify_electron.song.base_song_schema import SongRepositoryException
+from app.spotify_electron.song.song_streams_buffer import (
+    SongStreamsBuffer,
+    _SongStreamsBuffer,
+)
+from tests.test_API.api_metrics import get_metrics
+from tests.test_API.api_test_user import create_user, delete_user
+from tests.test_API.api_token import get_user_jwt_header
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+class SongCollectionStandIn:
+    """Song collection whose artist lookup or stream updates can fail"""
+
+    def __init__(
+        self, songs_artists: dict[str, str], write_error: Exception | None = None
+    ) -> None:
+        self.songs_artists = songs_artists
+        self.write_error = write_error
+        self.is_lookup_failing = False
+        self.writes: list[list] = []
+
+    def find(self, query: dict, projection: dict) -> list[dict]:
+        """Find the artists of the songs"""
+        if self.is_lookup_failing:
+            raise ConnectionError
+        return [
+            {"name": name, "artist": self.songs_artists[name]}
+            for name in query["name"]["$in"]
+            if name in self.songs_artists
+        ]
+
+    def bulk_write(self, requests: list, ordered: bool) -> None:
+        """Store the stream updates"""
+        self.writes.append(requests)
+        if self.write_error is not None:
+            raise self.write_error
+
+
+def store_flush(flushes: list[dict[str, int]]):
+    def flusher(songs_streams: dict[str, int]) -> dict[str, int]:
+        flushes.append(songs_streams)
+        return {}
+
+    return flusher
+
+
+def test_song_streams_buffer_accumulates_streams_per_song():
+    flushes: list[dict[str, int]] = []
+    song_streams_buffer = _SongStreamsBuffer(flush_interval_ms=60000, flush_max_events=100)
+    song_streams_buffer.start(store_flush(flushes))
+
+    for name in ("song-1", "song-2", "song-1"):
+        song_streams_buffer.add(name)
+
+    expected_pending_streams = 3
+    stats = song_streams_buffer.get_stats()
+    assert stats.pending_streams == expected_pending_streams
+    assert stats.pending_songs == len(["song-1", "song-2"])
+    assert flushes == []
+
+    song_streams_buffer.stop()
+
+    assert flushes == [{"song-1": 2, "song-2": 1}]
+    stats = song_streams_buffer.get_stats()
+    assert stats.pending_streams == 0
+    assert stats.flushed_streams == expected_pending_streams
+    assert stats.flushes == 1
+
+
+def test_song_streams_buffer_flushes_when_full():
+    flushed = threading.Event()
+    flushes: list[dict[str, int]] = []
+
+    def flusher(songs_streams: dict[str, int]) -> dict[str, int]:
+        flushes.append(songs_streams)
+        flushed.set()
+        return {}
+
+    song_streams_buffer = _SongStreamsBuffer(flush_interval_ms=60000, flush_max_events=2)
+    song_streams_buffer.start(flusher)
+
+    song_streams_buffer.add("song")
+    song_streams_buffer.add("song")
+
+    assert flushed.wait(5)
+    assert flushes == [{"song": 2}]
+
+    song_streams_buffer.stop()
+
+
+def test_song_streams_buffer_keeps_streams_of_failed_flush():
+    flushes: list[dict[str, int]] = []
+    is_database_down = True
+
+    def flusher(songs_streams: dict[str, int]) -> dict[str, int]:
+        if is_database_down:
+            raise ConnectionError
+        flushes.append(songs_streams)
+        return {}
+
+    song_streams_buffer = _SongStreamsBuffer(flush_interval_ms=60000, flush_max_events=100)
+    song_streams_buffer.start(flusher)
+
+    song_streams_buffer.add("song")
+    assert not song_streams_buffer.flush()
+    song_streams_buffer.add("song")
+
+    stats = song_streams_buffer.get_stats()
+    assert stats.failed_flushes == 1
+    assert stats.pending_streams == len(["song", "song"])
+
+    is_database_down = False
+    assert song_streams_buffer.flush()
+    assert flushes == [{"song": 2}]
+
+    song_streams_buffer.stop()
+
+
+def test_song_streams_buffer_retries_only_streams_not_stored():
+    flushes: list[dict[str, int]] = []
+
+    def flusher(songs_streams: dict[str, int]) -> dict[str, int]:
+        flushes.append(songs_streams)
+        return {"song-2": songs_streams["song-2"]} if len(flushes) == 1 else {}
+
+    song_streams_buffer = _SongStreamsBuffer(flush_interval_ms=60000, flush_max_events=100)
+    song_streams_buffer.start(flusher)
+    for name in ("song-1", "song-2", "song-2"):
+        song_streams_buffer.add(name)
+
+    assert not song_streams_buffer.flush()
+
+    stats = song_streams_buffer.get_stats()
+    assert stats.failed_flushes == 1
+    assert stats.pending_streams == len(["song-2", "song-2"])
+    assert stats.flushed_streams == 1
+    assert song_streams_buffer.flush()
+    assert flushes == [{"song-1": 1, "song-2": 2}, {"song-2": 2}]
+
+    song_streams_buffer.stop()
+
+
+def test_increase_songs_streams_failed_artist_lookup_stores_nothing(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    song_collection = SongCollectionStandIn({"song": "artist"})
+    song_collection.is_lookup_failing = True
+    monkeypatch.setattr(
+        song_collection_provider, "get_song_collection", lambda: song_collection
+    )
+
+    with pytest.raises(SongRepositoryException):
+        base_song_repository.increase_songs_streams({"song": 1})
+
+    assert song_collection.writes == []
+
+
+def test_increase_songs_streams_returns_only_rejected_updates(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    write_error = BulkWriteError({"writeErrors": [{"index": 1, "code": 1, "errmsg": ""}]})
+    song_collection = SongCollectionStandIn(
+        {"song-1": "artist", "song-2": "artist"}, write_error
+    )
+    monkeypatch.setattr(
+        song_collection_provider, "get_song_collection", lambda: song_collection
+    )
+
+    songs_streams_increase = base_song_repository.increase_songs_streams(
+        {"song-1": 1, "song-2": 2}
+    )
+
+    assert songs_streams_increase.failed_songs_streams == {"song-2": 2}
+    assert songs_streams_increase.artists_streams == {"artist": 1}
+
+
+def test_increase_songs_streams_interrupted_write_is_not_retried(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    song_collection = SongCollectionStandIn({"song": "artist"}, ConnectionError())
+    monkeypatch.setattr(
+        song_collection_provider, "get_song_collection", lambda: song_collection
+    )
+
+    songs_streams_increase = base_song_repository.increase_songs_streams({"song": 1})
+
+    assert songs_streams_increase.failed_songs_streams == {}
+    assert len(song_collection.writes) == 1
+
+
+def test_increase_songs_streams_drops_missing_songs(monkeypatch: pytest.MonkeyPatch):
+    song_collection = SongCollectionStandIn({"song-1": "artist"})
+    monkeypatch.setattr(
+        song_collection_provider, "get_song_collection", lambda: song_collection
+    )
+
+    songs_streams_increase = base_song_repository.increase_songs_streams(
+        {"song-1": 1, "song-2": 2}
+    )
+
+    assert songs_streams_increase.failed_songs_streams == {}
+    assert songs_streams_increase.artists_streams == {"artist": 1}
+    assert len(song_collection.writes[0]) == 1
+
+    songs_streams_increase = base_song_repository.increase_songs_streams({"song-2": 2})
+
+    assert songs_streams_increase.artists_streams == {}
+    assert len(song_collection.writes) == 1
+
+
+def test_song_streams_buffer_disabled_stores_every_stream():
+    flushes: list[dict[str, int]] = []
+    song_streams_buffer = _SongStreamsBuffer(flush_interval_ms=0, flush_max_events=100)
+    song_streams_buffer.start(store_flush(flushes))
+
+    song_streams_buffer.add("song")
+    song_streams_buffer.add("song")
+
+    assert flushes == [{"song": 1}, {"song": 1}]
+
+
+def test_song_streams_buffer_stats_in_metrics():
+    user_name = "8232392323623823723"
+    password = "hola"
+    res_create_user = create_user(user_name, "https://photo", password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    assert get_metrics(headers={}).status_code == HTTP_403_FORBIDDEN
+
+    jwt_headers = get_user_jwt_header(username=user_name, password=password)
+    response = get_metrics(headers=jwt_headers)
+    assert response.status_code == HTTP_200_OK
+    res_delete_user = delete_user(user_name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+    song_streams_buffer_metrics = response.json()["song_streams_buffer"]
+    assert song_streams_buffer_metrics["pending_streams"] == (
+        SongStreamsBuffer.get_stats().pending_streams
+    )
+    for counter in (
+        "pending_songs",
+        "flushed_streams",
+        "flushes",
+        "failed_flushes",
+        "last_flush_latency_ms",
+        "max_flush_latency_ms",
+    ):
+        assert counter in song_streams_buffer_metrics
@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import io
+import math
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+from pytest import fixture
+from starlette.status import (
+    HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
+    HTTP_400_BAD_REQUEST,
+)
+
+import app.spotify_electron.song.base_song_repository as base_song_repository
+import app.spotify_electron.song.blob.song_repository as song_repository
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+from app.spotify_electron.genre.genre_schema import Genre
+from app.spotify_electron.song.base_song_schema import (
+    SongBadFileException,
+    SongFileTooLargeException,
+)
+from app.spotify_electron.song.song_upload import DEFAULT_UPLOAD_CHUNK_BYTES, SongUpload
+from app.spotify_electron.utils.audio_management.audio_format_utils import AudioFormat
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_song import create_song, delete_song
+from tests.test_API.api_test_user import delete_user
+from tests.test_API.api_token import get_user_jwt_header
+
+SONG_PATH = "tests/assets/song_4_seconds.mp3"
+CHUNK_SIZE = 1000
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+@fixture(scope="module")
+def song_file() -> bytes:
+    with open(SONG_PATH, "rb") as file:
+        return file.read()
+
+
+def create_upload_file(data: bytes, size: int | None = None) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), size=size)
+
+
+def test_song_upload_reads_inspected_chunks(song_file: bytes):
+    song_upload = SongUpload("song", max_bytes=0, chunk_size=CHUNK_SIZE)
+    upload_file = create_upload_file(song_file)
+
+    async def read_upload():
+        chunks = [chunk async for chunk in song_upload.read_chunks(upload_file)]
+        return chunks, await song_upload.get_duration_seconds(upload_file)
+
+    chunks, duration = asyncio.run(read_upload())
+
+    assert b"".join(chunks) == song_file
+    assert max(len(chunk) for chunk in chunks) == CHUNK_SIZE
+    assert song_upload.size == len(song_file)
+    assert song_upload.audio_format == AudioFormat.MP3
+    assert song_upload.content_hash == hashlib.sha256(song_file).hexdigest()
+    assert duration == 4  # noqa: PLR2004
+
+
+def test_song_upload_rejects_non_audio_file_on_first_chunk():
+    song_upload = SongUpload("song", max_bytes=0, chunk_size=CHUNK_SIZE * 10)
+    upload_file = create_upload_file(b"not a song" * CHUNK_SIZE * 10)
+
+    async def read_upload():
+        return [chunk async for chunk in song_upload.read_chunks(upload_file)]
+
+    with pytest.raises(SongBadFileException):
+        asyncio.run(read_upload())
+
+    assert song_upload.size == CHUNK_SIZE * 10
+
+
+@pytest.mark.parametrize("size", [None, 5 * CHUNK_SIZE])
+def test_song_upload_rejects_oversize_file(song_file: bytes, size: int | None):
+    song_upload = SongUpload("song", max_bytes=2 * CHUNK_SIZE, chunk_size=CHUNK_SIZE)
+
+    with pytest.raises(SongFileTooLargeException):
+        asyncio.run(song_upload.read(create_upload_file(song_file, size)))
+
+    assert song_upload.size <= 3 * CHUNK_SIZE
+
+
+def test_song_upload_stream_stores_chunks_and_fields(song_file: bytes):
+    name = "song-upload-stream"
+    artist = "song-upload-artist"
+    password = "password"
+    assert create_artist(artist, "photo", password).status_code == HTTP_201_CREATED
+    jwt_headers = get_user_jwt_header(username=artist, password=password)
+
+    res_create_song = create_song(name, SONG_PATH, "Pop", "photo", jwt_headers)
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    files_collection = song_collection_provider.get_song_collection()
+    document = files_collection.find_one({"name": name})
+    assert document["duration"] == 4  # noqa: PLR2004
+    assert document["sha256"] == hashlib.sha256(song_file).hexdigest()
+    assert document["length"] == len(song_file)
+    chunks_collection = song_collection_provider.get_gridfs_song_chunks_collection()
+    assert chunks_collection.count_documents({"files_id": document["_id"]}) == math.ceil(
+        len(song_file) / DEFAULT_UPLOAD_CHUNK_BYTES
+    )
+
+    assert delete_song(name).status_code == HTTP_202_ACCEPTED
+    assert delete_user(artist).status_code == HTTP_202_ACCEPTED
+
+
+def test_create_song_rejects_non_audio_file(tmp_path: Path):
+    name = "song-upload-not-audio"
+    artist = "song-upload-not-audio-artist"
+    password = "password"
+    file_path = tmp_path / "song.mp3"
+    file_path.write_bytes(b"not a song" * CHUNK_SIZE)
+    assert create_artist(artist, "photo", password).status_code == HTTP_201_CREATED
+    jwt_headers = get_user_jwt_header(username=artist, password=password)
+
+    res_create_song = create_song(name, str(file_path), "Pop", "photo", jwt_headers)
+
+    assert res_create_song.status_code == HTTP_400_BAD_REQUEST
+    assert not base_song_repository.check_song_exists(name)
+    assert delete_user(artist).status_code == HTTP_202_ACCEPTED
+
+
+def test_song_upload_stream_aborted_leaves_no_chunks(song_file: bytes):
+    name = "song-upload-aborted"
+    chunks_collection = song_collection_provider.get_gridfs_song_chunks_collection()
+    chunks = chunks_collection.count_documents({})
+
+    async def write_and_fail():
+        async with song_repository.open_song_upload_stream_async(
+            name=name, artist="artist", genre=Genre.POP, photo="photo"
+        ) as upload_stream:
+            await upload_stream.write(song_file * 3)
+            raise SongFileTooLargeException
+
+    with pytest.raises(SongFileTooLargeException):
+        asyncio.run(write_and_fail())
+
+    assert chunks_collection.count_documents({}) == chunks
+    assert not base_song_repository.check_song_exists(name)
@@ -1,15 +1,21 @@
+import hashlib
 import os
 
 from pytest import fixture
 from starlette.status import (
+    HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_202_ACCEPTED,
     HTTP_206_PARTIAL_CONTENT,
+    HTTP_304_NOT_MODIFIED,
     HTTP_404_NOT_FOUND,
     HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
 )
 
-from tests.test_API.api_stream import stream_song
+import app.spotify_electron.song.blob.song_repository as song_repository
+import app.spotify_electron.song.providers.song_collection_provider as song_collection_provider
+from app.spotify_electron.song.blob.song_data_cache import SongDataCache
+from tests.test_API.api_stream import head_stream_song, stream_song
 from tests.test_API.api_test_artist import create_artist
 from tests.test_API.api_test_song import create_song, delete_song
 from tests.test_API.api_test_user import create_user, delete_user
@@ -25,7 +31,7 @@ SONG_PATH = "tests/assets/song_4_seconds.mp3"
 SONG_BYTES_SIZE = os.path.getsize(SONG_PATH)
 
 
-def test_stream_controller_song_invalid_range_no_range_header():
+def test_stream_controller_song_no_range_header_whole_song():
     song_name = "song-name"
     artist_name = "artist-name"
     genre = "Pop"
@@ -47,7 +53,12 @@ def test_stream_controller_song_invalid_range_no_range_header():
     assert res_create_song.status_code == HTTP_201_CREATED
 
     res_stream_song = stream_song(song_name, jwt_headers)
-    assert res_stream_song.status_code == HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert res_stream_song.status_code == HTTP_200_OK
+    assert int(res_stream_song.headers["Content-length"]) == SONG_BYTES_SIZE
+    assert "Content-range" not in res_stream_song.headers
+
+    with open(SONG_PATH, "rb") as file:
+        assert res_stream_song.content == file.read()
 
     res_delete_song = delete_song(song_name)
     assert res_delete_song.status_code == HTTP_202_ACCEPTED
@@ -77,10 +88,11 @@ def test_stream_controller_song_invalid_range_greater_than_file_size():
     )
     assert res_create_song.status_code == HTTP_201_CREATED
 
-    byte_range_headers = {"Range": f"bytes=0-{SONG_BYTES_SIZE+10}"}
+    byte_range_headers = {"Range": f"bytes={SONG_BYTES_SIZE+10}-"}
 
     res_stream_song = stream_song(song_name, {**jwt_headers, **byte_range_headers})
     assert res_stream_song.status_code == HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert res_stream_song.headers["content-range"] == f"bytes */{SONG_BYTES_SIZE}"
 
     res_delete_song = delete_song(song_name)
     assert res_delete_song.status_code == HTTP_202_ACCEPTED
@@ -183,3 +195,310 @@ def test_stream_controller_song_range_correct():
 
     res_delete_artist = delete_user(artist_name)
     assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_stream_controller_song_range_content_correct():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    start_requested_bytes = 1000
+    end_requested_bytes = SONG_BYTES_SIZE - 1
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    byte_range_headers = {"Range": f"bytes={start_requested_bytes}-{end_requested_bytes}"}
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, **byte_range_headers})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+
+    with open(SONG_PATH, "rb") as file:
+        song_bytes = file.read()
+    assert (
+        res_stream_song.content == song_bytes[start_requested_bytes : end_requested_bytes + 1]
+    )
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_stream_controller_song_range_end_greater_than_file_size():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    byte_range_headers = {"Range": f"bytes=100-{SONG_BYTES_SIZE+10}"}
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, **byte_range_headers})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+    assert (
+        res_stream_song.headers["Content-range"]
+        == f"bytes 100-{SONG_BYTES_SIZE - 1}/{SONG_BYTES_SIZE}"
+    )
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_stream_controller_song_suffix_range():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    suffix_length = 500
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    byte_range_headers = {"Range": f"bytes=-{suffix_length}"}
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, **byte_range_headers})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+    assert (
+        res_stream_song.headers["Content-range"]
+        == f"bytes {SONG_BYTES_SIZE - suffix_length}-{SONG_BYTES_SIZE - 1}/{SONG_BYTES_SIZE}"
+    )
+
+    with open(SONG_PATH, "rb") as file:
+        assert res_stream_song.content == file.read()[-suffix_length:]
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_stream_controller_song_multiple_ranges():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    byte_range_headers = {"Range": "bytes=0-99,1000-1499,-100"}
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, **byte_range_headers})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+
+    content_type, _, boundary = res_stream_song.headers["Content-type"].partition(
+        "; boundary="
+    )
+    assert content_type == "multipart/byteranges"
+    assert int(res_stream_song.headers["Content-length"]) == len(res_stream_song.content)
+
+    with open(SONG_PATH, "rb") as file:
+        song_bytes = file.read()
+
+    parts = res_stream_song.content.split(f"--{boundary}".encode())[1:-1]
+    expected_ranges = [(0, 99), (1000, 1499), (SONG_BYTES_SIZE - 100, SONG_BYTES_SIZE - 1)]
+    assert len(parts) == len(expected_ranges)
+    for part, (start, end) in zip(parts, expected_ranges, strict=True):
+        part_headers, _, part_data = part.partition(b"\r\n\r\n")
+        assert f"Content-Range: bytes {start}-{end}/{SONG_BYTES_SIZE}".encode() in part_headers
+        assert part_data.removesuffix(b"\r\n") == song_bytes[start : end + 1]
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_stream_controller_song_conditional_requests():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, "Range": "bytes=0-99"})
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+    etag = res_stream_song.headers["ETag"]
+    with open(SONG_PATH, "rb") as file:
+        assert etag == f'"{hashlib.sha256(file.read()).hexdigest()}"'
+
+    res_stream_song = stream_song(song_name, {**jwt_headers, "If-None-Match": etag})
+    assert res_stream_song.status_code == HTTP_304_NOT_MODIFIED
+    assert res_stream_song.headers["ETag"] == etag
+    assert res_stream_song.content == b""
+
+    res_stream_song = stream_song(
+        song_name, {**jwt_headers, "Range": "bytes=0-99", "If-Range": etag}
+    )
+    assert res_stream_song.status_code == HTTP_206_PARTIAL_CONTENT
+
+    res_stream_song = stream_song(
+        song_name, {**jwt_headers, "Range": "bytes=0-99", "If-Range": '"outdated"'}
+    )
+    assert res_stream_song.status_code == HTTP_200_OK
+    assert int(res_stream_song.headers["Content-length"]) == SONG_BYTES_SIZE
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_head_stream_controller_song_metadata_only():
+    song_name = "song-name"
+    artist_name = "artist-name"
+    genre = "Pop"
+    photo = "https://photo"
+    password = "artist-pass"
+
+    res_create_artist = create_artist(name=artist_name, password=password, photo=photo)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=artist_name, password=password)
+
+    res_create_song = create_song(
+        name=song_name,
+        file_path=SONG_PATH,
+        genre=genre,
+        photo=photo,
+        headers=jwt_headers,
+    )
+    assert res_create_song.status_code == HTTP_201_CREATED
+
+    res_head_stream_song = head_stream_song(song_name, jwt_headers)
+    assert res_head_stream_song.status_code == HTTP_200_OK
+    assert int(res_head_stream_song.headers["Content-length"]) == SONG_BYTES_SIZE
+    assert res_head_stream_song.headers["Accept-ranges"] == "bytes"
+    assert res_head_stream_song.content == b""
+    assert SongDataCache.get(song_repository.get_song_data(song_name)) is None
+
+    etag = res_head_stream_song.headers["ETag"]
+    res_stream_song = stream_song(song_name, {**jwt_headers, "Range": "bytes=0-99"})
+    assert res_stream_song.headers["ETag"] == etag
+
+    res_head_stream_song = head_stream_song(song_name, {**jwt_headers, "If-None-Match": etag})
+    assert res_head_stream_song.status_code == HTTP_304_NOT_MODIFIED
+
+    res_delete_song = delete_song(song_name)
+    assert res_delete_song.status_code == HTTP_202_ACCEPTED
+
+    res_delete_artist = delete_user(artist_name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_head_stream_controller_song_not_found():
+    user_name = "user-name"
+    photo = "https://photo"
+    password = "user-pass"
+
+    res_create_user = create_user(name=user_name, password=password, photo=photo)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    jwt_headers = get_user_jwt_header(username=user_name, password=password)
+
+    res_head_stream_song = head_stream_song("song-name", jwt_headers)
+    assert res_head_stream_song.status_code == HTTP_404_NOT_FOUND
+
+    res_delete_user = delete_user(user_name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
+def test_song_repository_get_song_data_range_multiple_chunks():
+    song_name = "song-name-chunks"
+    chunk_size = 1000
+    start_requested_bytes = 1500
+    end_requested_bytes = 4200
+    expected_chunks = 4
+
+    with open(SONG_PATH, "rb") as file:
+        song_bytes = file.read()
+
+    gridfs_collection = song_collection_provider.get_gridfs_song_collection()
+    file_id = gridfs_collection.put(song_bytes, name=song_name, chunkSize=chunk_size)
+
+    song_data = song_repository.get_song_data(song_name)
+    chunks = list(
+        song_repository.get_song_data_range(
+            song_data, start_requested_bytes, end_requested_bytes
+        )
+    )
+
+    assert len(chunks) == expected_chunks
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+    assert b"".join(chunks) == song_bytes[start_requested_bytes : end_requested_bytes + 1]
+
+    gridfs_collection.delete(file_id)
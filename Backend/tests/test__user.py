@@ -101,6 +101,26 @@ def test_delete_user_invalid_name(clear_test_data_db):
     assert res_delete_user.status_code == HTTP_405_METHOD_NOT_ALLOWED
 
 
+def test_get_users_bulk(clear_test_data_db):
+    name = "8232392323623823723"
+    name_2 = "82323923236238237232"
+    photo = "https://photo"
+    password = "hola"
+
+    res_create_user = create_user(name=name, photo=photo, password=password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    res_create_user = create_user(name=name_2, photo=photo, password=password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    users = user_service.get_users([name_2, "missing-user", name])
+    assert [user.name for user in users] == [name_2, name]
+    assert user_service.get_users([]) == []
+
+    res_delete_user = delete_user(name=name_2)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+
+
 def test_check_encrypted_password_correct():
     name = "8232392323623823723"
     photo = "https://photo"
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+from pytest import fixture
+from starlette.status import HTTP_201_CREATED, HTTP_202_ACCEPTED
+
+import app.spotify_electron.user.base_user_repository as base_user_repository
+import app.spotify_electron.user.base_user_service as base_user_service
+import app.spotify_electron.user.providers.user_collection_provider as user_collection_provider
+from app.spotify_electron.user.user.user_schema import UserNotFoundException, UserType
+from app.spotify_electron.user.user_type_cache import UserTypeCache, _UserTypeCache
+from tests.test_API.api_test_artist import create_artist
+from tests.test_API.api_test_user import create_user, delete_user
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+def test_user_type_cache_expires_after_ttl():
+    user_type_cache = _UserTypeCache(ttl_seconds=0.1, max_entries=10)
+
+    user_type_cache.set("user", "id", UserType.ARTIST)
+    assert user_type_cache.get("user", "id") == UserType.ARTIST
+
+    time.sleep(0.2)
+    assert user_type_cache.get("user", "id") is None
+
+
+def test_user_type_cache_evicts_oldest_entries():
+    user_type_cache = _UserTypeCache(ttl_seconds=60, max_entries=2)
+
+    user_type_cache.set("user-1", "id-1", UserType.USER)
+    user_type_cache.set("user-2", "id-2", UserType.USER)
+    user_type_cache.set("user-3", "id-3", UserType.ARTIST)
+
+    assert user_type_cache.get("user-1", "id-1") is None
+    assert user_type_cache.get("user-2", "id-2") == UserType.USER
+    assert user_type_cache.get("user-3", "id-3") == UserType.ARTIST
+
+
+def test_user_type_cache_ignores_recreated_users():
+    user_type_cache = _UserTypeCache(ttl_seconds=60, max_entries=10)
+
+    user_type_cache.set("user", "old-id", UserType.ARTIST)
+    assert user_type_cache.get("user", "new-id") is None
+    assert user_type_cache.get("user", "old-id") is None
+
+
+def test_user_type_cache_request_scope():
+    user_type_cache = _UserTypeCache(ttl_seconds=0, max_entries=10)
+
+    token = user_type_cache.start_request_scope()
+    user_type_cache.set("user", "id", UserType.ARTIST)
+    assert user_type_cache.get_request_user_type("user") == UserType.ARTIST
+
+    user_type_cache.invalidate("user")
+    assert user_type_cache.get_request_user_type("user") is None
+
+    user_type_cache.set("user", "id", UserType.ARTIST)
+    user_type_cache.end_request_scope(token)
+    assert user_type_cache.get_request_user_type("user") is None
+    assert user_type_cache.get("user", "id") is None
+
+
+def test_user_type_cache_invalidated_on_delete_and_create():
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "hola123"
+
+    res_create_user = create_user(name=name, photo=photo, password=password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+
+    assert base_user_service.get_user_type(name) == UserType.USER
+    user_id = get_user_id(name)
+    assert UserTypeCache.get(name, user_id) == UserType.USER
+
+    res_delete_user = delete_user(name=name)
+    assert res_delete_user.status_code == HTTP_202_ACCEPTED
+    assert UserTypeCache.get(name, user_id) is None
+
+    res_create_artist = create_artist(name=name, photo=photo, password=password)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+
+    assert base_user_service.get_user_type(name) == UserType.ARTIST
+
+    res_delete_artist = delete_user(name=name)
+    assert res_delete_artist.status_code == HTTP_202_ACCEPTED
+
+
+def test_user_type_cache_checks_user_exists():
+    name = "8232392323623823723"
+    photo = "https://photo"
+    password = "hola123"
+
+    res_create_user = create_user(name=name, photo=photo, password=password)
+    assert res_create_user.status_code == HTTP_201_CREATED
+    assert base_user_service.get_user_type(name) == UserType.USER
+
+    # users deleted and recreated by another process, without invalidating this cache
+    user_collection_provider.get_user_collection().delete_one({"name": name})
+    with pytest.raises(UserNotFoundException):
+        base_user_service.get_user_type(name)
+
+    res_create_artist = create_artist(name=name, photo=photo, password=password)
+    assert res_create_artist.status_code == HTTP_201_CREATED
+    assert base_user_service.get_user_type(name) == UserType.ARTIST
+    user_collection_provider.get_artist_collection().delete_one({"name": name})
+    user_collection_provider.get_user_collection().insert_one(
+        {"name": name, "photo": photo, "register_date": "", "password": b"hola123"}
+    )
+    assert base_user_service.get_user_type(name) == UserType.USER
+    user_collection_provider.get_user_collection().delete_one({"name": name})
+    UserTypeCache.clear()
+
+
+def get_user_id(name: str) -> str:
+    user_id = base_user_repository.get_user_id(
+        name, base_user_service.get_user_type_collections()
+    )
+    assert user_id is not None
+    return user_id
@@ -0,0 +1,108 @@
+import time
+from datetime import timedelta
+
+import pytest
+from pytest import fixture
+
+import app.auth.auth_service as auth_service
+import app.spotify_electron.metrics.metrics_service as metrics_service
+from app.auth.auth_schema import JWTValidationException, TokenData, VerifiedToken
+from app.auth.verified_token_cache import VerifiedTokenCache, _VerifiedTokenCache
+from app.spotify_electron.user.user.user_schema import UserType
+
+
+@fixture(scope="module", autouse=True)
+def set_up(trigger_app_startup):
+    pass
+
+
+@fixture(autouse=True)
+def clear_verified_token_cache():
+    VerifiedTokenCache.clear()
+    yield
+    VerifiedTokenCache.clear()
+
+
+def create_token(expires_delta: timedelta = timedelta(minutes=5)) -> str:
+    return auth_service.create_access_token(
+        {"access_token": "user", "role": UserType.USER.value, "token_type": "bearer"},
+        expires_delta,
+    )
+
+
+def get_verified_token(expiration_time: float) -> VerifiedToken:
+    return VerifiedToken(
+        token_data=TokenData(username="user", role=UserType.USER, token_type="bearer"),
+        expiration_time=expiration_time,
+    )
+
+
+def test_verify_jwt_returns_token_data_and_expiration():
+    token = create_token()
+
+    verified_token = auth_service.verify_jwt(token)
+
+    assert verified_token.token_data.username == "user"
+    assert verified_token.token_data.role == UserType.USER.value
+    assert verified_token.expiration_time > time.time()
+
+
+def test_verify_jwt_invalid_token():
+    with pytest.raises(JWTValidationException):
+        auth_service.verify_jwt(create_token() + "invalid")
+
+    with pytest.raises(JWTValidationException):
+        auth_service.verify_jwt(create_token(timedelta(minutes=-5)))
+
+
+def test_get_verified_jwt_token_data_verifies_once():
+    token = create_token()
+
+    first_token_data = auth_service.get_verified_jwt_token_data(token)
+    second_token_data = auth_service.get_verified_jwt_token_data(token)
+
+    assert first_token_data == second_token_data
+    stats = VerifiedTokenCache.get_stats()
+    assert stats.hits >= 1
+    assert stats.entries == 1
+    metrics = metrics_service.get_metrics()["verified_token_cache"]
+    assert metrics["verifications"] >= 1
+    assert metrics["verify_time_ms"] > 0
+
+
+def test_get_verified_jwt_token_data_invalid_token_not_cached():
+    with pytest.raises(JWTValidationException):
+        auth_service.get_verified_jwt_token_data(create_token() + "invalid")
+
+    assert VerifiedTokenCache.get_stats().entries == 0
+
+
+def test_verified_token_cache_drops_expired_tokens():
+    verified_token_cache = _VerifiedTokenCache(max_entries=10)
+
+    verified_token_cache.set("token", get_verified_token(time.time() - 1))
+
+    assert verified_token_cache.get("token") is None
+    assert verified_token_cache.get_stats().entries == 0
+
+
+def test_verified_token_cache_evicts_oldest_tokens():
+    verified_token_cache = _VerifiedTokenCache(max_entries=2)
+    expiration_time = time.time() + 60
+
+    verified_token_cache.set("token-1", get_verified_token(expiration_time))
+    verified_token_cache.set("token-2", get_verified_token(expiration_time))
+    verified_token_cache.set("token-3", get_verified_token(expiration_time))
+
+    assert verified_token_cache.get("token-1") is None
+    assert verified_token_cache.get("token-2") is not None
+    assert verified_token_cache.get("token-3") is not None
+    assert verified_token_cache.get_stats().hit_rate == 2 / 3
+
+
+def test_verified_token_cache_disabled():
+    verified_token_cache = _VerifiedTokenCache(max_entries=0)
+
+    verified_token_cache.set("token", get_verified_token(time.time() + 60))
+
+    assert verified_token_cache.get("token") is None
@@ -14,3 +14,7 @@ CLOUDFRONT_DISTRIBUTION_DOMAIN_NAME = "DomainName"
 # SPOTIFY ELECTRON
 
 BUCKET_BASE_PATH = "canciones/"
+SONG_CONTENT_TYPE = "audio/mpeg"
+SONG_UPLOAD_URL_EXPIRATION_SECONDS = 3600
+SONG_UPLOAD_LIFECYCLE_RULE_ID = "abort-incomplete-song-uploads"
+SONG_UPLOAD_ABORT_DAYS = 1
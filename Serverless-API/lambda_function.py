@@ -2,11 +2,12 @@
 Lambda function for handling Song Cloud resources
 """
 
-import base64
 import json
+import logging
 import os
 
 import boto3
+from botocore.exceptions import ClientError
 
 from constants import (
     BUCKET_BASE_PATH,
@@ -16,6 +17,10 @@ from constants import (
     CLOUDFRONT_DISTRIBUTION_DOMAIN_NAME,
     DISTRIBUTION_ID_ENV_PATH,
     S3,
+    SONG_CONTENT_TYPE,
+    SONG_UPLOAD_ABORT_DAYS,
+    SONG_UPLOAD_LIFECYCLE_RULE_ID,
+    SONG_UPLOAD_URL_EXPIRATION_SECONDS,
 )
 
 s3 = boto3.resource(S3)
@@ -23,12 +28,50 @@ s3_client = boto3.client(S3)
 song_bucket = s3.Bucket(os.getenv(BUCKET_NAME_ENV_PATH))
 distribution_id = os.getenv(DISTRIBUTION_ID_ENV_PATH)
 cloudfront_client = boto3.client(CLOUDFRONT)
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
 
 cloudfront_domain_name = cloudfront_client.get_distribution(Id=distribution_id)[
     CLOUDFRONT_DISTRIBUTION
 ][CLOUDFRONT_DISTRIBUTION_DOMAIN_NAME]
 
 
+def ensure_song_upload_lifecycle_rule() -> None:
+    """Add to the bucket lifecycle the rule that aborts the incomplete multipart\
+        uploads of song files, keeping the rules already configured
+    """
+    try:
+        rules = s3_client.get_bucket_lifecycle_configuration(Bucket=song_bucket.name)[
+            "Rules"
+        ]
+    except ClientError as error:
+        if error.response["Error"]["Code"] != "NoSuchLifecycleConfiguration":
+            raise
+        rules = []
+    if any(rule.get("ID") == SONG_UPLOAD_LIFECYCLE_RULE_ID for rule in rules):
+        return
+
+    rules.append(
+        {
+            "ID": SONG_UPLOAD_LIFECYCLE_RULE_ID,
+            "Filter": {"Prefix": BUCKET_BASE_PATH},
+            "Status": "Enabled",
+            "AbortIncompleteMultipartUpload": {
+                "DaysAfterInitiation": SONG_UPLOAD_ABORT_DAYS
+            },
+        }
+    )
+    s3_client.put_bucket_lifecycle_configuration(
+        Bucket=song_bucket.name, LifecycleConfiguration={"Rules": rules}
+    )
+
+
+try:
+    ensure_song_upload_lifecycle_rule()
+except ClientError:
+    logger.exception("Error configuring the abort of incomplete song uploads")
+
+
 def get_cloudfront_url(resource_path: str) -> str:
     """Get cloudfront URL for a given resource
 
@@ -44,6 +87,82 @@ def get_cloudfront_url(resource_path: str) -> str:
     return cloudfront_url
 
 
+def get_song_key(song_name: str) -> str:
+    """Get the bucket key of a song
+
+    Args:
+        song_name (str): the song name
+
+    Returns:
+        str: the bucket key of the song file
+    """
+    return f"{BUCKET_BASE_PATH}{song_name}.mp3"
+
+
+def create_song_upload(song_name: str, parts: int) -> dict:
+    """Start a multipart upload of a song file and presign the upload of its parts.\
+        The client uploads the binary parts straight to the bucket with PUT requests
+
+    Args:
+        song_name (str): the song name
+        parts (int): the number of parts of the file
+
+    Returns:
+        dict: the upload id and the presigned URL of each part, in order
+    """
+    song_key = get_song_key(song_name)
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=song_bucket.name, Key=song_key, ContentType=SONG_CONTENT_TYPE
+    )["UploadId"]
+    part_urls = [
+        s3_client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": song_bucket.name,
+                "Key": song_key,
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+            },
+            ExpiresIn=SONG_UPLOAD_URL_EXPIRATION_SECONDS,
+        )
+        for part_number in range(1, parts + 1)
+    ]
+    return {"upload_id": upload_id, "part_urls": part_urls}
+
+
+def complete_song_upload(song_name: str, upload_id: str, parts: list[dict]) -> dict:
+    """Complete the multipart upload of a song file. The size of the stored file\
+        is returned, the parts are uploaded by the client with any size
+
+    Args:
+        song_name (str): the song name
+        upload_id (str): the upload id
+        parts (list[dict]): the uploaded parts with their part_number and etag
+
+    Returns:
+        dict: a presigned URL to read the song file and its size in bytes
+    """
+    song_key = get_song_key(song_name)
+    s3_client.complete_multipart_upload(
+        Bucket=song_bucket.name,
+        Key=song_key,
+        UploadId=upload_id,
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": int(part["part_number"]), "ETag": part["etag"]}
+                for part in parts
+            ]
+        },
+    )
+    url = s3_client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": song_bucket.name, "Key": song_key},
+        ExpiresIn=SONG_UPLOAD_URL_EXPIRATION_SECONDS,
+    )
+    size = s3_client.head_object(Bucket=song_bucket.name, Key=song_key)["ContentLength"]
+    return {"url": url, "size": size}
+
+
 def get_http_method_from_event(event) -> str:
     """Get HTTP method ( GET, POST...) from incoming event.
 
@@ -82,8 +201,20 @@ def lambda_handler(event, context) -> dict:
             }
 
         elif http_method == "DELETE":
+            upload_id = event["queryStringParameters"].get("upload_id")
+            if upload_id:
+                s3_client.abort_multipart_upload(
+                    Bucket=song_bucket.name,
+                    Key=get_song_key(song_name),
+                    UploadId=upload_id,
+                )
+                return {
+                    "statusCode": 202,
+                    "body": json.dumps({"details": "Song upload aborted successfully"}),
+                }
+
             s3_client.delete_object(
-                Bucket=song_bucket.name, Key=f"{BUCKET_BASE_PATH}{song_name}.mp3"
+                Bucket=song_bucket.name, Key=get_song_key(song_name)
             )
             return {
                 "statusCode": 202,
@@ -91,23 +222,29 @@ def lambda_handler(event, context) -> dict:
             }
 
         elif http_method == "POST":
-            song_key = f"{BUCKET_BASE_PATH}{song_name}.mp3"
-            body_str = event["body"]
-            body_dict = json.loads(body_str)
-            song_data = body_dict.get("file")
-            encoded_data = song_data.split("'")[1]
-
-            decoded_bytes = base64.b64decode(encoded_data)
+            parts = int(event["queryStringParameters"]["partes"])
+            if parts < 1:
+                return {
+                    "statusCode": 400,
+                    "body": json.dumps(
+                        {"error": "A song upload needs one part or more"}
+                    ),
+                }
+            return {
+                "statusCode": 201,
+                "body": json.dumps(create_song_upload(song_name, parts)),
+            }
 
-            s3_client.put_object(
-                Body=decoded_bytes, Bucket=song_bucket.name, Key=song_key
-            )
+        elif http_method == "PUT":
+            upload_id = event["queryStringParameters"]["upload_id"]
+            parts = json.loads(event["body"])["parts"]
             return {
                 "statusCode": 201,
-                "body": json.dumps({"details": "Song upload successfully"}),
+                "body": json.dumps(complete_song_upload(song_name, upload_id, parts)),
             }
 
     except Exception as e:
+        logger.exception("Error handling song request")
         return {
             "statusCode": 500,
             "body": json.dumps({"error": str(e)}),
@@ -0,0 +1,182 @@
+import importlib
+import json
+import sys
+from collections.abc import Generator
+
+import boto3
+import pytest
+import requests
+from moto import mock_aws
+
+from constants import BUCKET_BASE_PATH, BUCKET_NAME_ENV_PATH, DISTRIBUTION_ID_ENV_PATH
+
+BUCKET_NAME = "songs-bucket"
+MIN_PART_SIZE = 5 * 1024 * 1024
+"""Min size of every part of a multipart upload but the last one"""
+
+
+@pytest.fixture
+def lambda_function(monkeypatch: pytest.MonkeyPatch) -> Generator:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        boto3.client("s3").create_bucket(Bucket=BUCKET_NAME)
+        distribution = boto3.client("cloudfront").create_distribution(
+            DistributionConfig={
+                "CallerReference": "songs",
+                "Origins": {
+                    "Quantity": 1,
+                    "Items": [
+                        {
+                            "Id": "songs",
+                            "DomainName": f"{BUCKET_NAME}.s3.amazonaws.com",
+                            "S3OriginConfig": {"OriginAccessIdentity": ""},
+                        }
+                    ],
+                },
+                "DefaultCacheBehavior": {
+                    "TargetOriginId": "songs",
+                    "ViewerProtocolPolicy": "allow-all",
+                },
+                "Comment": "songs",
+                "Enabled": True,
+            }
+        )
+        monkeypatch.setenv(BUCKET_NAME_ENV_PATH, BUCKET_NAME)
+        monkeypatch.setenv(DISTRIBUTION_ID_ENV_PATH, distribution["Distribution"]["Id"])
+        sys.modules.pop("lambda_function", None)
+        yield importlib.import_module("lambda_function")
+        sys.modules.pop("lambda_function", None)
+
+
+def create_event(method: str, parameters: dict, body: dict | None = None) -> dict:
+    return {
+        "httpMethod": method,
+        "queryStringParameters": parameters,
+        "body": json.dumps(body) if body is not None else None,
+    }
+
+
+def get_song_object(name: str):
+    return boto3.client("s3").get_object(
+        Bucket=BUCKET_NAME, Key=f"{BUCKET_BASE_PATH}{name}.mp3"
+    )
+
+
+def test_song_upload_with_presigned_part_urls(lambda_function):
+    name = "song"
+    song_parts = [b"\x01" * MIN_PART_SIZE, b"\x02" * 1000]
+
+    response = lambda_function.lambda_handler(
+        create_event("POST", {"nombre": name, "partes": str(len(song_parts))}), None
+    )
+
+    assert response["statusCode"] == 201
+    upload = json.loads(response["body"])
+    assert len(upload["part_urls"]) == len(song_parts)
+
+    parts = []
+    for part_number, (part_url, song_part) in enumerate(
+        zip(upload["part_urls"], song_parts, strict=True), start=1
+    ):
+        part_response = requests.put(part_url, data=song_part, timeout=10)
+        assert part_response.status_code == 200
+        parts.append(
+            {"part_number": part_number, "etag": part_response.headers["ETag"]}
+        )
+
+    response = lambda_function.lambda_handler(
+        create_event(
+            "PUT", {"nombre": name, "upload_id": upload["upload_id"]}, {"parts": parts}
+        ),
+        None,
+    )
+
+    assert response["statusCode"] == 201
+    song_file = b"".join(song_parts)
+    assert json.loads(response["body"])["size"] == len(song_file)
+    song_object = get_song_object(name)
+    assert song_object["Body"].read() == song_file
+    assert song_object["ContentType"] == "audio/mpeg"
+    read_response = requests.get(json.loads(response["body"])["url"], timeout=10)
+    assert read_response.content == song_file
+
+
+def test_song_upload_aborted_leaves_no_song(lambda_function):
+    name = "song-aborted"
+    response = lambda_function.lambda_handler(
+        create_event("POST", {"nombre": name, "partes": "1"}), None
+    )
+    upload = json.loads(response["body"])
+    requests.put(upload["part_urls"][0], data=b"\x01" * 1000, timeout=10)
+
+    response = lambda_function.lambda_handler(
+        create_event("DELETE", {"nombre": name, "upload_id": upload["upload_id"]}), None
+    )
+
+    assert response["statusCode"] == 202
+    assert (
+        not boto3.client("s3").list_multipart_uploads(Bucket=BUCKET_NAME).get("Uploads")
+    )
+    with pytest.raises(boto3.client("s3").exceptions.NoSuchKey):
+        get_song_object(name)
+
+
+def test_song_upload_without_parts_is_rejected(lambda_function):
+    response = lambda_function.lambda_handler(
+        create_event("POST", {"nombre": "song", "partes": "0"}), None
+    )
+
+    assert response["statusCode"] == 400
+
+
+def test_delete_song(lambda_function):
+    name = "song-deleted"
+    boto3.client("s3").put_object(
+        Bucket=BUCKET_NAME, Key=f"{BUCKET_BASE_PATH}{name}.mp3", Body=b"song"
+    )
+
+    response = lambda_function.lambda_handler(
+        create_event("DELETE", {"nombre": name}), None
+    )
+
+    assert response["statusCode"] == 202
+    with pytest.raises(boto3.client("s3").exceptions.NoSuchKey):
+        get_song_object(name)
+
+
+def test_get_song_url(lambda_function):
+    response = lambda_function.lambda_handler(
+        create_event("GET", {"nombre": "song"}), None
+    )
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["url"].endswith(f"/{BUCKET_BASE_PATH}song.mp3")
+
+
+def test_incomplete_song_uploads_are_aborted_by_bucket_lifecycle(lambda_function):
+    s3_client = boto3.client("s3")
+    rules = s3_client.get_bucket_lifecycle_configuration(Bucket=BUCKET_NAME)["Rules"]
+
+    assert [rule["AbortIncompleteMultipartUpload"] for rule in rules] == [
+        {"DaysAfterInitiation": 1}
+    ]
+
+    other_rule = {
+        "ID": "expire-logs",
+        "Filter": {"Prefix": "logs/"},
+        "Status": "Enabled",
+        "Expiration": {"Days": 30},
+    }
+    s3_client.put_bucket_lifecycle_configuration(
+        Bucket=BUCKET_NAME, LifecycleConfiguration={"Rules": [other_rule]}
+    )
+    lambda_function.ensure_song_upload_lifecycle_rule()
+    lambda_function.ensure_song_upload_lifecycle_rule()
+
+    rules = s3_client.get_bucket_lifecycle_configuration(Bucket=BUCKET_NAME)["Rules"]
+    assert [rule["ID"] for rule in rules] == [
+        "expire-logs",
+        "abort-incomplete-song-uploads",
+    ]